@@ -1,5 +1,7 @@
 from .buddies import TheReader
+from .frozen import FrozenConfig
+from .shared import SharedReader
 from .cli import cli
 
 __version__ = "0.1.7"
-__all__ = ["TheReader", "cli"] 
\ No newline at end of file
+__all__ = ["TheReader", "FrozenConfig", "SharedReader", "cli"]
@@ -0,0 +1,123 @@
+from typing import Any, Dict, Iterable, Tuple, Union
+from .deps import normalize_key
+
+
+def compile_path(reader: Any, path: str) -> str:
+    """Valide un chemin pointé et le ramène à une clé de la configuration.
+
+    Les crochets sont normalisés (``a.b[0]`` -> ``a.b.0``) et un préfixe
+    virtuel (``add_prefix``) est retiré.
+
+    Raises:
+        ValueError: Si le chemin est vide ou mal formé (``a..b``)
+    """
+    if (not isinstance(path, str) or not path or ".." in path
+            or path.startswith(".") or path.endswith(".")):
+        raise ValueError(f"Chemin invalide: {path!r}")
+    key = normalize_key(path)
+    if key.split(".")[0] in reader._cfg:
+        # Une clé réelle reste prioritaire sur un préfixe de même nom
+        return key
+    for prefix in reader.__dict__.get("_prefixes") or ():
+        if key == prefix:
+            return ""
+        if key.startswith(prefix + "."):
+            return key[len(prefix) + 1:]
+    return key
+
+
+class PathAccessor:
+    """Accesseur compilé vers une clé pointée d'un ``TheReader``.
+
+    Le chemin est validé une seule fois; la valeur résolue est ensuite
+    conservée tant que la configuration n'a pas changé (même objet ``cfg``,
+    même version: ``reader[key] = ...`` ou ``refresh_env()`` la font avancer).
+    Une lecture est alors deux comparaisons, sans découpage ni parcours.
+    La valeur retournée est partagée avec le cache et ne doit pas être modifiée.
+    """
+
+    __slots__ = ("path", "key", "_reader", "_state", "_cfg", "_version", "_value")
+
+    def __init__(self, reader: Any, path: str):
+        self.path = path
+        self.key = compile_path(reader, path)
+        self._reader = reader
+        # __dict__ du lecteur: lu directement, sans son __getattribute__
+        self._state = object.__getattribute__(reader, "__dict__")
+        self._cfg = None
+        self._version = None
+        self._value = None
+        # Vérifier que la clé existe
+        self._load()
+
+    def _load(self) -> Any:
+        reader = self._reader
+        value = reader.resolve(self.key or None)
+        # Après resolve(): les groupes différés sont chargés
+        self._cfg = self._state["_cfg"]
+        self._version = self._state.get("_version", 0)
+        self._value = value
+        return value
+
+    def __call__(self) -> Any:
+        state = self._state
+        if state["_cfg"] is self._cfg and state.get("_version", 0) == self._version:
+            return self._value
+        return self._load()
+
+    get = __call__
+
+    def __repr__(self):
+        return f"PathAccessor({self.path!r})"
+
+
+class PathBundle:
+    """Groupe d'accesseurs lus en un seul appel (chemins critiques des requêtes).
+
+    La version de la configuration n'est vérifiée qu'une fois pour tout le
+    groupe; les valeurs sont retournées dans l'ordre des chemins.
+    """
+
+    __slots__ = ("accessors", "paths", "_state", "_cfg", "_version", "_values")
+
+    def __init__(self, reader: Any, paths: Iterable[Union[str, PathAccessor]]):
+        accessors = []
+        for path in paths:
+            if isinstance(path, PathAccessor):
+                if path._reader is not reader:
+                    raise ValueError(f"{path!r} a été compilé pour un autre lecteur")
+                accessors.append(path)
+            else:
+                accessors.append(PathAccessor(reader, path))
+        self.accessors: Tuple[PathAccessor, ...] = tuple(accessors)
+        self.paths: Tuple[str, ...] = tuple(accessor.path for accessor in accessors)
+        self._state = object.__getattribute__(reader, "__dict__")
+        self._cfg = None
+        self._version = None
+        self._values: Tuple[Any, ...] = ()
+        self._load()
+
+    def _load(self) -> Tuple[Any, ...]:
+        self._values = tuple(accessor() for accessor in self.accessors)
+        self._cfg = self._state["_cfg"]
+        self._version = self._state.get("_version", 0)
+        return self._values
+
+    def __call__(self) -> Tuple[Any, ...]:
+        state = self._state
+        if state["_cfg"] is self._cfg and state.get("_version", 0) == self._version:
+            return self._values
+        return self._load()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Retourne ``{chemin: valeur}`` dans l'ordre des chemins."""
+        return dict(zip(self.paths, self()))
+
+    def __len__(self):
+        return len(self.accessors)
+
+    def __iter__(self):
+        return iter(self.accessors)
+
+    def __repr__(self):
+        return f"PathBundle({list(self.paths)!r})"
@@ -0,0 +1,181 @@
+import contextlib
+import io
+import json
+import os
+import shlex
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Pool actif pendant un ``buddy batch`` (None: un lecteur par commande)
+_ACTIVE_POOL: Optional["ReaderPool"] = None
+
+
+class ReaderPool:
+    """Lecteurs ``TheReader`` partagés entre les commandes d'un même lot.
+
+    Un lecteur est créé au premier usage d'un triplet (configuration,
+    répertoire, overrides) puis réutilisé: la composition Hydra, la
+    promotion des secrets et le graphe des dépendances ne sont faits qu'une
+    fois pour tout le lot. Les fichiers modifiés pendant le lot ne sont pas
+    relus.
+    """
+
+    def __init__(self):
+        self._readers: Dict[Tuple, Any] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, config_name: str, path: Optional[str] = None,
+            overrides: Sequence[str] = ()) -> Any:
+        """Retourne le lecteur partagé pour cette configuration (créé au premier appel)."""
+        from .buddies import TheReader
+
+        key = (config_name, os.path.abspath(path or ".hydra-conf"), tuple(overrides))
+        with self._lock:
+            reader = self._readers.get(key)
+            if reader is None:
+                self.misses += 1
+                reader = self._readers[key] = TheReader(config_name, overrides=list(overrides), path=path)
+            else:
+                self.hits += 1
+                # Un lecteur partagé repart toujours de la racine
+                reader.start()
+                reader.cursor = reader.cfg
+        return reader
+
+    def __len__(self):
+        return len(self._readers)
+
+    def clear(self):
+        """Oublie les lecteurs du pool."""
+        with self._lock:
+            self._readers.clear()
+
+
+def open_reader(config_name: str, path: Optional[str] = None, overrides: Sequence[str] = ()) -> Any:
+    """Crée un ``TheReader``, ou le reprend du pool actif pendant un lot."""
+    if _ACTIVE_POOL is not None:
+        return _ACTIVE_POOL.get(config_name, path, overrides)
+    from .buddies import TheReader
+    return TheReader(config_name, overrides=list(overrides), path=path)
+
+
+@contextlib.contextmanager
+def pooled(pool: Optional[ReaderPool] = None) -> Iterator[ReaderPool]:
+    """Active un pool de lecteurs partagés le temps du bloc."""
+    global _ACTIVE_POOL
+    previous, _ACTIVE_POOL = _ACTIVE_POOL, pool if pool is not None else ReaderPool()
+    try:
+        yield _ACTIVE_POOL
+    finally:
+        _ACTIVE_POOL = previous
+
+
+def parse_request(line: str) -> Optional[Dict[str, Any]]:
+    """Interprète une ligne du lot.
+
+    Une ligne est soit une commande (``get config database.host``, le
+    préfixe ``buddy`` étant facultatif), soit une requête JSON
+    ``{"id": ..., "command": "get", "args": ["config", "database.host"]}``.
+    Les lignes vides et les commentaires (``#``) sont ignorés.
+
+    Returns:
+        dict: ``{"id": ..., "argv": [...]}``, ou None pour une ligne ignorée
+
+    Raises:
+        ValueError: Si la ligne est mal formée
+    """
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    if line.startswith("{"):
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Requête JSON invalide: {e}") from None
+        command = request.get("command")
+        args = request.get("args", [])
+        if not isinstance(command, str) or not isinstance(args, list):
+            raise ValueError("Une requête JSON doit contenir 'command' (texte) et 'args' (liste)")
+        return {"id": request.get("id"), "argv": [command, *(str(arg) for arg in args)]}
+    argv = shlex.split(line)
+    if argv and argv[0] == "buddy":
+        argv = argv[1:]
+    if not argv:
+        return None
+    return {"id": None, "argv": argv}
+
+
+def capture(func: Callable, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    """Appelle ``func`` en capturant ses sorties et en isolant ses erreurs.
+
+    Les erreurs (y compris ``sys.exit``) sont rapportées dans le résultat
+    au lieu d'être propagées.
+
+    Returns:
+        dict: ``exit_code``, ``output`` et ``error`` (sortie d'erreur)
+    """
+    import click
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    code = 0
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            # Code de sortie retourné (ex: click sans standalone_mode pour --help)
+            returned = func(*args, **kwargs)
+            if isinstance(returned, int):
+                code = returned
+        except SystemExit as e:
+            if isinstance(e.code, int):
+                code = e.code
+            elif e.code is not None:
+                code = 1
+                stderr.write(f"{e.code}\n")
+        except click.ClickException as e:
+            code = e.exit_code
+            stderr.write(f"Erreur: {e.format_message()}\n")
+        except click.Abort:
+            code = 1
+            stderr.write("Interrompu\n")
+        except Exception as e:
+            code = 1
+            stderr.write(f"{type(e).__name__}: {e}\n")
+    return {"exit_code": code, "output": stdout.getvalue(), "error": stderr.getvalue()}
+
+
+def execute(command: Any, argv: List[str]) -> Dict[str, Any]:
+    """Exécute une commande click dans le processus courant, sorties capturées (voir ``capture``)."""
+    return capture(command.main, argv, prog_name="buddy", standalone_mode=False)
+
+
+def run_batch(command: Any, lines: Iterable[str], fail_fast: bool = False,
+              pool: Optional[ReaderPool] = None) -> Iterator[Dict[str, Any]]:
+    """Exécute les lignes d'un lot avec des lecteurs partagés, un résultat par commande.
+
+    Args:
+        command: Groupe click qui exécute chaque commande (``cli``)
+        lines: Lignes du lot (fichier ou entrée standard)
+        fail_fast: S'arrêter après la première commande en échec
+        pool: Pool de lecteurs à utiliser (nouveau pool si omis)
+
+    Yields:
+        dict: ``line``, ``id``, ``argv``, ``exit_code``, ``output`` et ``error``
+    """
+    with pooled(pool):
+        for number, line in enumerate(lines, start=1):
+            try:
+                request = parse_request(line)
+            except ValueError as e:
+                result = {"id": None, "argv": None, "exit_code": 2, "output": "", "error": f"{e}\n"}
+            else:
+                if request is None:
+                    continue
+                if request["argv"][0] == "batch":
+                    result = {**request, "exit_code": 2, "output": "",
+                              "error": "La commande batch ne peut pas être imbriquée\n"}
+                else:
+                    result = {**request, **execute(command, request["argv"])}
+            yield {"line": number, **result}
+            if fail_fast and result["exit_code"] != 0:
+                return
@@ -1,45 +1,154 @@
-from hydra import initialize, compose
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 import os
-from omegaconf import OmegaConf, DictConfig
+from omegaconf import OmegaConf, DictConfig, ListConfig
 import copy
 import asyncio  
-import hydra
-from hydra.core.global_hydra import GlobalHydra
+import warnings
+from collections import OrderedDict
+from .session import ComposeSession, get_session
+from .merkle import MerkleTree, config_value
+from .deps import DependencyGraph, InterpolationCycleError, normalize_key, related_keys
+from .accessor import PathAccessor, PathBundle
+from .manifest import get_manifest
+from .schema import SchemaError, compile_schema, raw_value, registered_schemas
+
+# Cache des compositions Hydra de base, partagé par tous les lecteurs du processus:
+# (moteur, racines, empreinte du bundle, nom de configuration, overrides de groupes)
+#   -> (fichiers utilisés, empreinte de ces fichiers, DictConfig composée en lecture seule,
+#       configurations dérivées par overrides de valeurs, en lecture seule)
+_COMPOSE_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+COMPOSE_CACHE_SIZE = 64
+# Configurations dérivées conservées par base (points d'un balayage)
+DERIVED_CACHE_SIZE = 16
+
+def clear_compose_cache(root: Optional[str] = None):
+    """Vide le cache des compositions.
+
+    Args:
+        root: Ne retirer que les compositions qui utilisent ce répertoire (toutes si omis)
+    """
+    if root is None:
+        _COMPOSE_CACHE.clear()
+        return
+    root = os.path.abspath(root)
+    for key in [key for key in _COMPOSE_CACHE if root in key[1]]:
+        _COMPOSE_CACHE.pop(key, None)
+
+def _source_stamps(roots: tuple, config_paths: tuple) -> tuple:
+    """Date de modification et taille de chaque fichier d'une composition, dans chaque racine.
+
+    L'empreinte change si un fichier utilisé est modifié ou supprimé, ou si
+    un fichier de même nom apparaît dans une racine prioritaire.
+    """
+    stamps = []
+    for config_path in config_paths:
+        for root in roots:
+            try:
+                info = os.stat(os.path.join(root, f"{config_path}.yaml"))
+            except OSError:
+                stamps.append(None)
+            else:
+                stamps.append((info.st_mtime_ns, info.st_size))
+    return tuple(stamps)
+
+def _env_snapshot(names) -> tuple:
+    """Valeurs courantes (None si absente) des variables d'environnement données."""
+    return tuple(os.environ.get(name) for name in names)
+
+def _replaced(data: Any, parts: List[str], value: Any) -> Any:
+    """Copie de ``data`` où seule la branche menant à ``parts`` est recopiée."""
+    if not parts:
+        return value
+    head = int(parts[0]) if isinstance(data, list) else parts[0]
+    copied = list(data) if isinstance(data, list) else dict(data)
+    copied[head] = _replaced(data[head], parts[1:], value)
+    return copied
+
+# Valeur absente (distincte de None) pour les recherches de clés préfixées
+_NOT_PREFIXED = object()
+
+class _PrefixNamespace:
+    """Niveau intermédiaire d'un préfixe pointé (``dev`` pour le préfixe ``dev.eu``)."""
+
+    __slots__ = ("_reader", "_path")
+
+    def __init__(self, reader: "TheReader", path: str):
+        self._reader = reader
+        self._path = path
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._reader._prefixed(f"{self._path}.{key}")
+        if value is _NOT_PREFIXED:
+            raise KeyError(f"{self._path}.{key}")
+        return value
+
+    def __getattr__(self, key: str) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(f"L'attribut '{self._path}.{key}' n'existe pas")
+
+    def __repr__(self):
+        return f"_PrefixNamespace({self._path!r})"
 
 class TheReader:
-    def __init__(self, cfg_name: str = "config"):
+    def __init__(self, cfg_name: str = "config", overrides: Optional[List[str]] = None,
+                 path: Optional[str] = None, lazy: bool = False, prefetch_secrets: bool = True,
+                 schemas: Optional[Dict[str, type]] = None, engine: str = "hydra"):
         """Initialise un lecteur de configuration.
         
         Args:
             cfg_name: Nom de la configuration à charger
+            overrides: Overrides Hydra (ex: ``["database=prod", "api.timeout=10"]``)
+            path: Répertoire de configuration (défaut: .hydra-conf du répertoire courant),
+                ou fichier écrit par ``buddy bundle`` (moteur ``"bundle"``, sans Hydra)
+            lazy: Ne charger chaque groupe de premier niveau qu'au premier accès
+            prefetch_secrets: Précharger en arrière-plan les secrets ``${secret:...}`` référencés
+            schemas: Schémas (dataclass ou attrs) par groupe, en plus de ceux de ``register_schema``
+            engine: Moteur de composition, ``"hydra"`` ou ``"native"`` (sans Hydra, voir ``NativeSession``)
+
+        Raises:
+            SchemaError: Si une section ne respecte pas le schéma de son groupe
         """
         # Liste des chemins de recherche supplémentaires (après le chemin principal)
         self.config_paths = []
         
-        # Chemin principal (utilisé pour initialize)
-        self.primary_path = ".hydra-conf"
+        # Chemin principal (absolu, racine de la session de composition)
+        self.primary_path = os.path.abspath(path or ".hydra-conf")
         
         self.cfg_name = cfg_name
-        
-        # Initialiser Hydra et charger la configuration
-        self._initialize_hydra()
+        self.overrides = list(overrides or [])
+        self.prefetch_secrets = prefetch_secrets
+        # Un bundle est un fichier: il impose la composition native depuis le bundle
+        self.engine = "bundle" if os.path.isfile(self.primary_path) else engine
+        self.schemas = {**registered_schemas(), **(schemas or {})}
         
         try:
-            self.cfg = self._load_config(cfg_name)
-            
-            # Promouvoir les secrets au niveau racine
-            self._promote_secrets()
+            if lazy:
+                # Groupes enregistrés, chargés au premier accès
+                self._load_lazy(cfg_name)
+            else:
+                # Charger la configuration via la session de composition
+                self.cfg = self._load_config(cfg_name)
+                
+                # Promouvoir les secrets au niveau racine
+                self._promote_secrets()
             
         except Exception as e:
+            if self.overrides or self.engine == "bundle":
+                # Le repli YAML ignorerait silencieusement les overrides, et lit des répertoires
+                raise
             # En cas d'erreur, essayer de charger directement le fichier yaml
             import yaml
             
             # Rechercher le fichier dans les répertoires courants
-            search_paths = [self.primary_path] + self.config_paths + [os.getcwd()]
+            search_paths = [os.path.abspath(path) for path in [self.primary_path, *self.config_paths, os.getcwd()]]
             for path in search_paths:
                 config_file = os.path.join(path, f"{cfg_name}.yaml")
-                if os.path.exists(config_file):
+                # Le répertoire courant n'est pas une racine de configuration:
+                # son inventaire n'est pas enregistré sur disque
+                manifest = get_manifest(path, persist=path != search_paths[-1])
+                if manifest.isfile(config_file):
                     with open(config_file, 'r') as f:
                         self.cfg = OmegaConf.create(yaml.safe_load(f))
                     # Promouvoir les secrets ici aussi
@@ -48,39 +157,568 @@ class TheReader:
             else:
                 raise ValueError(f"Configuration '{cfg_name}' introuvable dans {search_paths}")
         
+        # Erreurs de type signalées au chargement plutôt qu'à l'usage
+        self._validate_schemas()
+        
         self.context = []
-        self.cursor = self.cfg
+        self.cursor = self._cfg
+        
+        # Signaler les cycles d'interpolation dès le chargement (le graphe
+        # exige la configuration complète: pas en mode différé)
+        if not self.pending_groups:
+            cycles = self.dependency_graph.cycles()
+            if cycles:
+                warnings.warn(str(InterpolationCycleError(cycles)), stacklevel=2)
+        
+        # Un seul lot par fournisseur, pendant que l'appelant poursuit
+        if prefetch_secrets:
+            self._prefetch_secrets(self._cfg)
 
-    def _initialize_hydra(self):
-        """Initialise Hydra avec le chemin principal."""
-        from hydra.core.config_store import ConfigStore
-        from hydra.core.hydra_config import HydraConfig
-        import sys
-        if GlobalHydra().is_initialized():
-            GlobalHydra.instance().clear()
-        # HydraConfig.instance().set_config(OmegaConf.create({
-        #     "runtime": {
-        #         "python_version": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
-        #     }
-        # }))
-        # Initialiser avec le chemin principal
-        hydra.initialize(config_path=self.primary_path, version_base=None)
+    @property
+    def cfg(self) -> DictConfig:
+        """Configuration composée; les groupes encore différés sont chargés."""
+        if self.__dict__.get("_pending"):
+            self._materialize(*self._pending)
+        return self._cfg
+
+    @cfg.setter
+    def cfg(self, value: DictConfig):
+        self.__dict__["_cfg"] = value
+        # Une configuration remplacée n'a plus de groupes différés
+        self.__dict__.pop("_pending", None)
+
+    @property
+    def pending_groups(self) -> List[str]:
+        """Groupes de premier niveau enregistrés mais pas encore chargés (mode ``lazy``)."""
+        return list(self.__dict__.get("_pending") or ())
+
+    @classmethod
+    def from_cfg(cls, cfg: DictConfig, cfg_name: str = "config", primary_path: str = ".hydra-conf"):
+        """Construit un lecteur autour d'une configuration déjà composée.
+
+        Args:
+            cfg: Configuration composée (par Hydra ou autre)
+            cfg_name: Nom de la configuration
+            primary_path: Répertoire de configuration d'origine
+
+        Returns:
+            TheReader: Lecteur prêt à l'emploi, secrets promus
+        """
+        reader = cls.__new__(cls)
+        reader.config_paths = []
+        reader.primary_path = os.path.abspath(primary_path)
+        reader.cfg_name = cfg_name
+        reader.overrides = []
+        reader.engine = "hydra"
+        reader.schemas = registered_schemas()
+        reader.cfg = cfg
+        reader._promote_secrets()
+        reader._validate_schemas()
+        reader.context = []
+        reader.cursor = reader.cfg
+        return reader
+
+    @property
+    def session(self) -> ComposeSession:
+        """Session de composition propre aux racines de ce lecteur.
+        
+        Aucune modification de ``GlobalHydra`` ni du répertoire courant: des
+        lecteurs sur des racines différentes peuvent coexister et composer
+        depuis plusieurs threads.
+        """
+        return get_session(self.primary_path, self.config_paths, engine=self.__dict__.get("engine", "hydra"))
 
     def _load_config(self, cfg_name: str) -> DictConfig:
         """Charge la configuration depuis le fichier avec chemins supplémentaires.
         
+        La composition Hydra de base (configuration + overrides de groupes) est
+        mise en cache avec la date et la taille des fichiers utilisés: elle est
+        recomposée dès que l'un d'eux change. Sans overrides de valeurs, la base
+        est partagée telle quelle, en lecture seule (copiée à la première
+        modification, voir ``_writable``). Avec des overrides de valeurs, ils
+        sont appliqués sans recomposer à une copie de la base, mise en cache
+        avec la base sous la liste de ces overrides et partagée de la même façon.
+        
+        La copie porte sur tout l'arbre: chaque nœud OmegaConf, feuilles
+        comprises, référence son parent (résolution des interpolations,
+        drapeaux hérités), si bien qu'une configuration dérivée ne peut partager
+        aucun nœud avec la base. ``copy.deepcopy`` est la construction la plus
+        rapide mesurée (deux fois moins coûteuse que ``OmegaConf.create`` depuis
+        un conteneur, voir ``python -m scripts.benchmarks overrides``).
+        
         Args:
             cfg_name: Nom de la configuration
             
         Returns:
             Configuration chargée
         """
-        # Construire les overrides pour les chemins supplémentaires
-        path_overrides = [f"+config_path={path}" for path in self.config_paths]
+        group_overrides, value_overrides = self._split_overrides(self.overrides)
         
-        # Composer la configuration avec les overrides
-        return hydra.compose(config_name=cfg_name, overrides=path_overrides)
-    
+        session = self.session
+        # Un bundle reconstruit (autre empreinte des sources) ne partage pas les entrées de l'ancien
+        key = (type(session).__name__, session.roots, getattr(session, "tree", None), cfg_name, tuple(group_overrides))
+        sources = getattr(session, "source_roots", session.roots)
+        entry = _COMPOSE_CACHE.get(key)
+        if entry is not None and _source_stamps(sources, entry[0]) != entry[1]:
+            # Fichiers source modifiés depuis la composition
+            entry = None
+        if entry is None:
+            # Empreinte relevée avant de composer: une écriture concurrente
+            # invalide l'entrée au lieu d'être masquée
+            config_paths = tuple(default.config_path for default in session.defaults_list(cfg_name, group_overrides))
+            stamps = _source_stamps(sources, config_paths)
+            # Composer la configuration avec les overrides de groupes
+            base = session.compose(cfg_name, group_overrides)
+            OmegaConf.set_readonly(base, True)
+            entry = _COMPOSE_CACHE[key] = (config_paths, stamps, base, OrderedDict())
+            if len(_COMPOSE_CACHE) > COMPOSE_CACHE_SIZE:
+                _COMPOSE_CACHE.popitem(last=False)
+        else:
+            _COMPOSE_CACHE.move_to_end(key)
+        
+        base, derived = entry[2], entry[3]
+        if not value_overrides:
+            return base
+        delta = tuple(override.input_line for override in value_overrides)
+        cfg = derived.get(delta)
+        if cfg is not None:
+            derived.move_to_end(delta)
+            return cfg
+        # Les nœuds OmegaConf référencent leur parent: copie complète (voir plus haut)
+        cfg = copy.deepcopy(base)
+        OmegaConf.set_readonly(cfg, None)
+        session.apply_overrides(value_overrides, cfg)
+        OmegaConf.set_readonly(cfg, True)
+        derived[delta] = cfg
+        if len(derived) > DERIVED_CACHE_SIZE:
+            derived.popitem(last=False)
+        return cfg
+
+    def _writable(self):
+        """Remplace la composition partagée avec le cache par une copie privée avant une modification."""
+        cfg = self._cfg
+        if not OmegaConf.is_readonly(cfg):
+            return
+        copied = copy.deepcopy(cfg)
+        OmegaConf.set_readonly(copied, None)
+        self.cfg = copied
+
+        # Les caches dérivés restent valides: mêmes valeurs
+        tree = getattr(self, "_merkle", None)
+        if tree is not None and tree.source is cfg:
+            self._merkle = MerkleTree(tree.root, source=copied, pristine=tree.pristine)
+        graph = getattr(self, "_deps", None)
+        if graph is not None and graph.source is cfg:
+            graph.source = copied
+        resolution = getattr(self, "_resolution", None)
+        if resolution is not None and resolution[0] is cfg:
+            self._resolution = (copied, dict(resolution[1]))
+        cursor = copied
+        for key in self.context:
+            cursor = cursor[key]
+        self.cursor = cursor
+
+    def _load_lazy(self, cfg_name: str):
+        """Prépare une composition différée de la configuration.
+
+        Les entrées de la liste des defaults placées à la racine ou sous
+        ``secrets`` (nécessaires à la promotion des secrets) sont chargées
+        immédiatement. Les autres sont enregistrées par clé de premier niveau,
+        avec les contributions des entrées racine à cette clé, dans l'ordre de
+        fusion Hydra: une entrée ultérieure surcharge toujours les précédentes.
+        Une réservation ``None`` conserve la position de chaque clé différée.
+
+        Args:
+            cfg_name: Nom de la configuration
+        """
+        group_overrides, value_overrides = self._split_overrides(self.overrides)
+        session = self.session
+        pending: Dict[str, tuple] = {}
+        cfg = OmegaConf.create()
+        for default in session.defaults_list(cfg_name, group_overrides):
+            head = (default.package or "").split(".")[0]
+            if head not in ("", "secrets"):
+                if head not in pending:
+                    # Contribution déjà fusionnée par une entrée précédente
+                    sources = [OmegaConf.masked_copy(cfg, [head])] if head in cfg else []
+                    pending[head] = (sources, [])
+                    cfg[head] = None
+                pending[head][0].append(default)
+                continue
+            loaded = session.load_default(default)
+            for key in [key for key in loaded if key in pending]:
+                pending[key][0].append(OmegaConf.masked_copy(loaded, [key]))
+            cfg.merge_with(OmegaConf.masked_copy(loaded, [key for key in loaded if key not in pending]))
+        OmegaConf.set_struct(cfg, True)
+
+        eager = []
+        for override in value_overrides:
+            head = override.key_or_group.split(".")[0]
+            (pending[head][1] if head in pending else eager).append(override)
+        if eager:
+            session.apply_overrides(eager, cfg)
+
+        self.cfg = cfg
+        self._promote_secrets()
+        self._pending = pending
+        # Les groupes référencés par les entrées racine sont nécessaires à leur résolution
+        raw = OmegaConf.to_container(self._cfg, resolve=False)
+        self._materialize(*{target.split(".")[0] for target in DependencyGraph.build(raw).referrers})
+
+    def _materialize(self, *keys: str):
+        """Charge et fusionne les groupes différés ``keys`` (et ceux qu'ils référencent)."""
+        pending = self.__dict__.get("_pending")
+        todo = [key for key in keys if pending and key in pending]
+        while todo:
+            key = todo.pop()
+            if key not in pending:
+                continue
+            sources, overrides = pending[key]
+            merged = OmegaConf.create()
+            for source in sources:
+                merged.merge_with(source if isinstance(source, DictConfig) else self.session.load_default(source))
+            OmegaConf.set_struct(merged, True)
+            if overrides:
+                self.session.apply_overrides(overrides, merged)
+            section = OmegaConf.to_container(merged, resolve=False).get(key)
+
+            # Même traitement que _promote_secrets, limité à cette section
+            if isinstance(section, dict):
+                self._handle_special_interpolations(section)
+            secrets = self._cfg.get("secrets") if "secrets" in self._cfg else None
+            if isinstance(secrets, DictConfig) and key in secrets:
+                values = OmegaConf.to_container(secrets, resolve=False)[key]
+                if section is None:
+                    section = values
+                elif isinstance(section, dict) and isinstance(values, dict):
+                    for name, value in values.items():
+                        section.setdefault(name, value)
+
+            self._cfg[key] = section
+            del pending[key]
+            self._validate_schemas(key)
+            if getattr(self, "prefetch_secrets", False):
+                self._prefetch_secrets({key: section})
+            todo.extend(target.split(".")[0] for target in DependencyGraph.build({key: section}).referrers)
+
+    def _prefetch_secrets(self, data: Any):
+        """Lance le chargement en arrière-plan des secrets ``${secret:...}`` référencés."""
+        from .providers import has_providers, prefetch
+
+        if has_providers():
+            if isinstance(data, DictConfig):
+                data = OmegaConf.to_container(data, resolve=False)
+            prefetch(data)
+
+    def _split_overrides(self, overrides: List[str]):
+        """Sépare les overrides de groupes (composition) des overrides de valeurs.
+        
+        Returns:
+            tuple: (overrides de groupes en texte, overrides de valeurs analysés)
+        """
+        if not overrides:
+            return [], []
+        session = self.session
+        group_overrides, value_overrides = [], []
+        for override in session.parse_overrides(overrides):
+            group = override.key_or_group
+            is_group = (
+                override.package is not None
+                or override.is_sweep_override()
+                or group.split("/")[0] == "hydra"
+                or session.group_exists(group)
+            )
+            if is_group:
+                group_overrides.append(override.input_line)
+            else:
+                value_overrides.append(override)
+        return group_overrides, value_overrides
+
+    def _validate_schemas(self, *keys: str):
+        """Valide en une passe les sections liées à un schéma (toutes, ou celles sous ``keys``).
+
+        Chaque section est lue une fois, sans résolution (``raw_value``): les
+        interpolations ne sont vérifiées qu'à la conversion (``typed()``). Les
+        groupes différés sont validés à leur chargement, les groupes absents
+        ignorés.
+
+        Raises:
+            SchemaError: Avec toutes les erreurs trouvées, pas seulement la première
+        """
+        schemas = self.__dict__.get("schemas")
+        if not schemas:
+            return
+        pending = self.__dict__.get("_pending") or ()
+        cfg = self._cfg
+        sections: Dict[str, Any] = {}
+        errors = []
+        for group, schema in schemas.items():
+            head, *rest = group.split(".")
+            if (keys and head not in keys) or head in pending or head not in cfg:
+                continue
+            if head not in sections:
+                sections[head] = raw_value(cfg._get_node(head))
+            section = sections[head]
+            for part in rest:
+                if not isinstance(section, dict) or part not in section:
+                    break
+                section = section[part]
+            else:
+                errors.extend(compile_schema(schema).errors(section, group))
+        if errors:
+            raise SchemaError(errors)
+
+    def typed(self, group: str, schema: Optional[type] = None) -> Any:
+        """Retourne une section résolue sous forme d'instance de son schéma.
+
+        Args:
+            group: Chemin pointé de la section (ex: ``"database"``)
+            schema: Schéma à utiliser (défaut: celui lié au groupe)
+
+        Raises:
+            KeyError: Si aucun schéma n'est lié au groupe ou si la section n'existe pas
+            SchemaError: Si les valeurs résolues ne respectent pas le schéma
+        """
+        if schema is None:
+            schema = (self.__dict__.get("schemas") or {})[group]
+        return compile_schema(schema).convert(self.resolve(group), group)
+
+    def with_overrides(self, overrides: List[str]) -> "TheReader":
+        """Retourne un nouveau lecteur avec des overrides supplémentaires.
+        
+        La composition de base est partagée via le cache: seuls les chemins
+        modifiés par les nouveaux overrides de valeurs sont appliqués.
+        
+        Args:
+            overrides: Overrides ajoutés à ceux du lecteur courant
+            
+        Returns:
+            TheReader: Nouveau lecteur, le lecteur courant n'est pas modifié
+        """
+        reader = copy.copy(self)
+        reader.config_paths = list(self.config_paths)
+        reader.overrides = self.overrides + list(overrides)
+        reader.cfg = reader._load_config(self.cfg_name)
+        reader._promote_secrets()
+        reader._validate_schemas()
+        reader.context = []
+        reader.cursor = reader.cfg
+
+        # Dériver l'empreinte du parent: seuls les chemins surchargés changent
+        tree = getattr(self, "_merkle", None)
+        group_overrides, value_overrides = self._split_overrides(list(overrides))
+        if tree is not None and tree.source is self.cfg and tree.pristine and not group_overrides:
+            for override in value_overrides:
+                parts = override.key_or_group.split(".")
+                paths = [parts]
+                if parts[0] == "secrets" and len(parts) > 1:
+                    # Chemin promu à la racine par _promote_secrets
+                    paths.append(parts[1:])
+                for path in paths:
+                    tree = tree.updated(path, config_value(reader.cfg, path))
+            reader._merkle = MerkleTree(tree.root, source=reader.cfg)
+        return reader
+
+    def provenance(self) -> dict:
+        """Retourne le fichier source de chaque clé feuille de la configuration.
+
+        Les clés promues depuis ``secrets`` héritent de la source de leur
+        secret; les clés modifiées par un override de valeur sont rattachées
+        à cet override.
+
+        Returns:
+            dict: Chemin pointé -> source (ex: ``"database/prod"``, ``"override:api.timeout=5"``)
+        """
+        group_overrides, value_overrides = self._split_overrides(self.overrides)
+        sources = self.session.provenance(self.cfg_name, group_overrides)
+        for path, source in list(sources.items()):
+            if path.startswith("secrets."):
+                sources.setdefault(path[len("secrets."):], source)
+        for override in value_overrides:
+            prefix = override.key_or_group
+            for path in [p for p in sources if p == prefix or p.startswith(prefix + ".")]:
+                sources[path] = f"override:{override.input_line}"
+            sources.setdefault(prefix, f"override:{override.input_line}")
+        return sources
+
+    @property
+    def dependency_graph(self) -> DependencyGraph:
+        """Graphe des dépendances entre interpolations de la configuration.
+        
+        Construit au chargement, mis à jour par ``reader[key] = value`` et
+        reconstruit si la configuration est rechargée.
+        """
+        graph = getattr(self, "_deps", None)
+        if graph is None or graph.source is not self.cfg:
+            graph = DependencyGraph.build(OmegaConf.to_container(self.cfg, resolve=False), source=self.cfg)
+            self._deps = graph
+        return graph
+
+    def dependents(self, path: str) -> List[str]:
+        """Liste les valeurs interpolées qui dépendent, même indirectement, d'une clé.
+
+        Args:
+            path: Chemin pointé (ex: ``"services.rabbitmq.password"``)
+
+        Returns:
+            list: Chemins des valeurs à réévaluer si cette clé change
+        """
+        return sorted(self.dependency_graph.dependents(path))
+
+    def resolution_order(self) -> List[str]:
+        """Retourne les valeurs interpolées dans l'ordre topologique de résolution.
+
+        Raises:
+            InterpolationCycleError: Si les interpolations forment un cycle
+        """
+        return self.dependency_graph.order()
+
+    def resolve(self, path: Optional[str] = None) -> Any:
+        """Retourne la valeur résolue d'une clé, mise en cache.
+
+        Une affectation ``reader[key] = value`` n'invalide que les valeurs
+        qui dépendent de la clé modifiée. Chaque valeur en cache est associée
+        aux seules variables d'environnement dont elle dépend (``oc.env``,
+        même indirectement) et n'est réévaluée que si l'une d'elles a changé.
+        Les valeurs retournées sont partagées avec le cache et ne doivent pas
+        être modifiées.
+
+        Args:
+            path: Chemin pointé, configuration complète si omis
+
+        Raises:
+            KeyError: Si la clé n'existe pas
+        """
+        resolution = getattr(self, "_resolution", None)
+        if resolution is None or resolution[0] is not self.cfg:
+            resolution = self._resolution = (self.cfg, {})
+        cache = resolution[1]
+        key = normalize_key(path or "")
+        entry = cache.get(key)
+        if entry is None:
+            names = tuple(sorted(self.dependency_graph.environment_of(key)))
+            entry = cache[key] = (names, _env_snapshot(names), self._resolve_node(key, path))
+        elif entry[1] != _env_snapshot(entry[0]):
+            entry = self._refresh_entry(key, entry)
+        return entry[2]
+
+    def _resolve_node(self, key: str, path: Optional[str] = None) -> Any:
+        absent = object()
+        node = OmegaConf.select(self.cfg, key, default=absent) if key else self.cfg
+        if node is absent:
+            raise KeyError(path if path is not None else key)
+        if isinstance(node, (DictConfig, ListConfig)):
+            node = OmegaConf.to_container(node, resolve=True)
+        return node
+
+    def _refresh_entry(self, key: str, entry: tuple) -> tuple:
+        """Réévalue une valeur en cache dont des variables d'environnement ont changé.
+
+        Pour une section, seules les valeurs qui dépendent des variables
+        modifiées sont réévaluées, dans une copie de la section en cache.
+        """
+        names, snapshot, value = entry
+        current = _env_snapshot(names)
+        changed = [name for name, old, new in zip(names, snapshot, current) if old != new]
+        graph = self.dependency_graph
+        stale = graph.env_dependents(changed)
+        prefix = key + "." if key else ""
+        if key in stale or not isinstance(value, (dict, list)) or any(
+                key.startswith(path + ".") for path in stale):
+            value = self._resolve_node(key)
+        else:
+            for path in sorted(p for p in stale if p.startswith(prefix)):
+                parts = path[len(prefix):].split(".")
+                value = _replaced(value, parts, self._resolve_node(path))
+        entry = self._resolution[1][key] = (names, current, value)
+        return entry
+
+    def refresh_env(self) -> List[str]:
+        """Réévalue les valeurs en cache dont les variables d'environnement ont changé.
+
+        Les valeurs qui ne dépendent d'aucune variable modifiée sont conservées.
+
+        Returns:
+            list: Chemins des valeurs en cache réévaluées
+        """
+        resolution = getattr(self, "_resolution", None)
+        if resolution is None or resolution[0] is not self.cfg:
+            return []
+        refreshed = []
+        for key, entry in list(resolution[1].items()):
+            if entry[1] != _env_snapshot(entry[0]):
+                self._refresh_entry(key, entry)
+                refreshed.append(key)
+        if refreshed:
+            self._bump_version()
+        return sorted(refreshed)
+
+    def _bump_version(self):
+        """Fait avancer la version lue par les accesseurs compilés (``path()``)."""
+        self.__dict__["_version"] = self.__dict__.get("_version", 0) + 1
+
+    def path(self, path: str) -> "PathAccessor":
+        """Compile un chemin pointé en accesseur réutilisable.
+
+        Le chemin est validé et découpé une seule fois; l'accesseur conserve
+        la valeur résolue tant que la configuration ne change pas, et la
+        relit (via ``resolve()``) après ``reader[key] = ...``,
+        ``refresh_env()`` ou remplacement de ``cfg``.
+
+        Args:
+            path: Chemin pointé (ex: ``"api.retry.max_attempts"``)
+
+        Returns:
+            PathAccessor: appeler ``accessor()`` pour lire la valeur
+
+        Raises:
+            ValueError: Si le chemin est mal formé
+            KeyError: Si la clé n'existe pas
+        """
+        return PathAccessor(self, path)
+
+    def paths(self, *paths) -> "PathBundle":
+        """Compile plusieurs chemins (ou accesseurs) pour les lire en un seul appel.
+
+        Returns:
+            PathBundle: ``bundle()`` retourne le tuple des valeurs,
+            ``bundle.as_dict()`` le dictionnaire ``{chemin: valeur}``
+        """
+        return PathBundle(self, paths)
+
+    def _invalidate(self, paths):
+        """Retire du cache de résolution les valeurs liées aux chemins donnés."""
+        cache = self._resolution[1]
+        cached = sorted(cache)
+        for path in paths:
+            for key in related_keys(path, cache, cached):
+                cache.pop(key, None)
+
+    def fingerprint(self, path: Optional[str] = None) -> str:
+        """Retourne l'empreinte stable (arbre de Merkle) de la configuration.
+
+        L'empreinte porte sur la configuration non résolue et ne dépend pas de
+        l'ordre des clés. L'arbre est construit au premier appel puis mis à
+        jour le long des seuls chemins modifiés par ``reader[key] = value`` ou
+        ``with_overrides``. Les modifications faites directement sur ``cfg``
+        ne sont pas suivies.
+
+        Args:
+            path: Chemin pointé d'un sous-arbre (ex: ``"database"``), racine si omis
+
+        Returns:
+            str: Empreinte hexadécimale
+
+        Raises:
+            KeyError: Si le chemin n'existe pas
+        """
+        tree = getattr(self, "_merkle", None)
+        if tree is None or tree.source is not self.cfg:
+            tree = MerkleTree.build(OmegaConf.to_container(self.cfg, resolve=False), source=self.cfg)
+            tree.pristine = getattr(self, "_edited_cfg", None) is not self.cfg
+            self._merkle = tree
+        return tree.fingerprint(path)
+
     def _promote_secrets(self):
         """Promeut les valeurs des secrets au niveau racine et gère les cas spéciaux."""
         if 'secrets' in self.cfg:
@@ -88,7 +726,7 @@ class TheReader:
             config_dict = OmegaConf.to_container(self.cfg, resolve=False)
             
             # Traiter les interpolations Hydra spéciales
-            self._handle_special_interpolations(config_dict)
+            changed = self._handle_special_interpolations(config_dict)
             
             # Parcourir toutes les sections de secrets
             if 'secrets' in config_dict and isinstance(config_dict['secrets'], dict):
@@ -96,18 +734,27 @@ class TheReader:
                     if section not in config_dict:
                         # Ajouter la section à la racine si elle n'existe pas déjà
                         config_dict[section] = values
+                        changed = True
                     elif isinstance(values, dict) and isinstance(config_dict[section], dict):
                         # Fusion si les deux sont des dictionnaires
                         for k, v in values.items():
                             if k not in config_dict[section]:
                                 config_dict[section][k] = v
+                                changed = True
             
-            # Reconvertir en OmegaConf
-            self.cfg = OmegaConf.create(config_dict)
+            # Reconvertir en OmegaConf (seulement si nécessaire: la configuration
+            # courante, et les caches qui y sont attachés, restent valides sinon)
+            if changed:
+                self.cfg = OmegaConf.create(config_dict)
 
     def _handle_special_interpolations(self, config_dict):
-        """Remplace les interpolations Hydra problématiques par leurs valeurs réelles."""
+        """Remplace les interpolations Hydra problématiques par leurs valeurs réelles.
+        
+        Returns:
+            bool: True si au moins une valeur a été remplacée
+        """
         import sys
+        replaced = []
         
         def process_dict(d):
             for key, value in list(d.items()):
@@ -119,6 +766,7 @@ class TheReader:
                     # Remplacer les interpolations Hydra connues
                     if value == "${hydra:runtime.python_version}":
                         d[key] = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+                        replaced.append(key)
                     # Ajouter d'autres cas spéciaux au besoin
         
         def process_list(lst):
@@ -130,9 +778,11 @@ class TheReader:
                 elif isinstance(item, str):
                     if item == "${hydra:runtime.python_version}":
                         lst[i] = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+                        replaced.append(i)
         
         # Lancer le traitement récursif
         process_dict(config_dict)
+        return bool(replaced)
 
     def update_path(self, path: str):
         """Met à jour le chemin principal de recherche des configurations.
@@ -140,37 +790,27 @@ class TheReader:
         Args:
             path: Nouveau chemin principal
         """
-        prev_dir = None
-        self.primary_path = path
+        # Racine absolue: pas de changement de répertoire courant
+        self.primary_path = os.path.abspath(path)
+        # Fichiers du nouveau répertoire possiblement créés depuis la dernière lecture
+        get_manifest(self.primary_path).invalidate()
+        clear_compose_cache(self.primary_path)
         
         try:
-            # Réinitialiser Hydra avec le nouveau chemin
-            if GlobalHydra().is_initialized():
-                GlobalHydra.instance().clear()
-            
-            # S'assurer que le chemin est relatif comme l'exige Hydra
-            if os.path.isabs(path):
-                prev_dir = os.getcwd()
-                os.chdir(os.path.dirname(path))
-                self.primary_path = os.path.basename(path)
-            
-            # Essayer d'initialiser Hydra
-            hydra.initialize(config_path=self.primary_path, version_base=None)
+            # Composer avec la session du nouveau chemin
             self.cfg = self._load_config(self.cfg_name)
             
             # Promouvoir les secrets
             self._promote_secrets()
-            
-            # Revenir au répertoire précédent si nécessaire
-            if prev_dir:
-                os.chdir(prev_dir)
         
         except Exception as e:
             # Solution de secours: charger directement les fichiers YAML
             import yaml
             
+            path = self.primary_path
+            manifest = get_manifest(path)
             config_file = os.path.join(path, f"{self.cfg_name}.yaml")
-            if os.path.exists(config_file):
+            if manifest.isfile(config_file):
                 with open(config_file, 'r') as f:
                     self.cfg = OmegaConf.create(yaml.safe_load(f))
                 
@@ -183,15 +823,14 @@ class TheReader:
                         if isinstance(default, dict):
                             for group, name in default.items():
                                 subconfig_file = os.path.join(path, group, f"{name}.yaml")
-                                if os.path.exists(subconfig_file):
+                                if manifest.isfile(subconfig_file):
                                     with open(subconfig_file, 'r') as f:
                                         self.cfg[group] = OmegaConf.create(yaml.safe_load(f))
             else:
                 raise ValueError(f"Configuration '{self.cfg_name}' introuvable dans {path}")
-            
-            # Revenir au répertoire précédent si nécessaire
-            if prev_dir:
-                os.chdir(prev_dir)
+        
+        # Même contrôle qu'au chargement initial
+        self._validate_schemas()
         
         self.cursor = self.cfg
         self.context = []
@@ -216,22 +855,58 @@ class TheReader:
         self.context = []
 
     def walk(self,*args:list[str])->None:
+        if not self.context and args and self._prefixed(args[0]) is self._cfg:
+            # walk("dev", "database") avec le préfixe virtuel "dev"
+            args = args[1:]
         self.context.extend(args)
+        if self.context:
+            self._materialize(self.context[0])
         self.cursor = self.get_context()
         return self
 
     def __setitem__(self, key:str, value:DictConfig ) -> None:
+        self._writable()
         if self.context:
             self.cursor[key] = value
         else:
             self.cfg[key] = value
 
+        # Cette configuration ne correspond plus à celle chargée
+        self._edited_cfg = self.cfg
+        self._bump_version()
+        parts = [*self.context, key]
+        value = config_value(self.cfg, parts)
+
+        # Mettre à jour l'empreinte le long du chemin modifié uniquement
+        tree = getattr(self, "_merkle", None)
+        if tree is not None and tree.source is self.cfg:
+            self._merkle = tree.updated(parts, value)
+
+        # Mettre à jour le graphe et n'invalider que les valeurs résolues
+        # qui dépendent (transitivement) du chemin modifié
+        path = ".".join(str(part) for part in parts)
+        graph = getattr(self, "_deps", None)
+        if graph is not None and graph.source is self.cfg:
+            graph.update(path, value)
+        resolution = getattr(self, "_resolution", None)
+        if resolution is not None and resolution[0] is self.cfg:
+            self._invalidate({path} | self.dependency_graph.dependents(path))
+
     def __getitem__(self, key:str) -> DictConfig:
         if self.context:
             return self.cursor[key]
         else:
-            return self.cfg[key]
+            value = self._prefixed(key)
+            if value is not _NOT_PREFIXED:
+                return value
+            self._materialize(key)
+            return self._cfg[key]
     def get(self, key:str)->DictConfig:
+        if not self.context:
+            value = self._prefixed(key)
+            if value is not _NOT_PREFIXED:
+                return value
+            self._materialize(key)
         return self.cursor[key]
 
     def __getattribute__(self, key: str) -> DictConfig:
@@ -247,6 +922,12 @@ class TheReader:
             if context:
                 for ctx_key in context:
                     cursor = getattr(cursor, ctx_key)
+            else:
+                value = object.__getattribute__(self, '_prefixed')(key)
+                if value is not _NOT_PREFIXED:
+                    return value
+                # Groupe différé (mode lazy): chargé au premier accès
+                object.__getattribute__(self, '_materialize')(key)
             
             if key in cursor:
                 return getattr(cursor, key)
@@ -258,41 +939,172 @@ class TheReader:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        self.cursor = self.cfg
+        self.cursor = self._cfg
         self.context = []
 
     def add_prefix(self, prefix:str):
-        """
-        Decorator that adds a prefix to all configuration keys that do not already start with this prefix.
+        """Décorateur exposant la configuration sous un préfixe virtuel.
+
+        ``reader.dev.database`` et ``reader["dev.database"]`` désignent alors
+        le même nœud que ``reader.database``: aucune clé n'est copiée et le
+        préfixe n'est enregistré qu'une fois, quel que soit le nombre
+        d'appels. Une clé réelle de même nom que le préfixe reste prioritaire.
 
         Args:
-            prefix (str): The prefix to add to the configuration keys.
+            prefix: Préfixe (ex: ``"dev"`` ou ``"dev.eu"``)
 
         Returns:
-            function: The decorator that wraps the original function.
-
-        The decorator modifies the configuration by adding new prefixed keys 
-        while preserving the original keys. The new prefixed keys are added 
-        to the `self.prefixes` list.
+            function: Le décorateur
         """
+        import functools
+
+        prefix = prefix.strip(".")
+        prefixes = self.__dict__.get("_prefixes") or ()
+        if prefix and prefix not in prefixes:
+            # Le préfixe le plus long l'emporte (tuple: non partagé par les copies)
+            self._prefixes = tuple(sorted((*prefixes, prefix), key=len, reverse=True))
+
         def decorator(func):
+            @functools.wraps(func)
             def wrapper(*args, **kwargs):
-                new_keys = []
-                for key, value in self.cfg.items():
-                    if not key.startswith(prefix):
-                        new_key = f"{prefix}.{key}"
-                        self.cfg[new_key] = value
-                        new_keys.append(new_key)
-                self.prefixes.extend(new_keys)
                 return func(*args, **kwargs)
             return wrapper
         return decorator
 
-    
+    @property
+    def prefixes(self) -> List[str]:
+        """Préfixes virtuels enregistrés par ``add_prefix``."""
+        return list(self.__dict__.get("_prefixes") or ())
+
+    def _prefixed(self, key: Any) -> Any:
+        """Nœud désigné par une clé d'un espace de noms virtuel, sans copie.
+
+        Returns:
+            La configuration (préfixe seul), le nœud sous le préfixe, un
+            niveau intermédiaire de préfixe pointé, ou ``_NOT_PREFIXED``
+        """
+        prefixes = self.__dict__.get("_prefixes")
+        if not prefixes or not isinstance(key, str) or key.split(".")[0] in self._cfg:
+            return _NOT_PREFIXED
+        for prefix in prefixes:
+            if key == prefix:
+                return self._cfg
+            if key.startswith(prefix + "."):
+                rest = key[len(prefix) + 1:]
+                self._materialize(rest.split(".")[0])
+                if "." not in rest:
+                    return self._cfg[rest]
+                value = OmegaConf.select(self._cfg, rest, default=_NOT_PREFIXED)
+                if value is _NOT_PREFIXED:
+                    raise KeyError(key)
+                return value
+        if any(prefix.startswith(key + ".") for prefix in prefixes):
+            return _PrefixNamespace(self, key)
+        return _NOT_PREFIXED
 
     def get_cfg(self):
         return self.cfg
-    
+
+    def freeze(self, resolve: bool = True, intern: bool = False):
+        """Compile la configuration en objets figés pour les boucles critiques.
+
+        L'accès ``frozen.api.retry.max_attempts`` se fait ensuite en accès
+        d'attributs Python simples, sans passer par OmegaConf ni
+        ``__getattribute__``. L'objet retourné est un instantané: les
+        modifications ultérieures du reader ne s'y reflètent pas.
+
+        Args:
+            resolve: Résoudre les interpolations avant de figer
+            intern: Partager les sous-arbres identiques avec les autres
+                configurations figées du processus (environnements, locataires)
+
+        Returns:
+            FrozenConfig: Configuration en lecture seule
+        """
+        from .frozen import freeze
+        return freeze(self.cfg, resolve=resolve, intern=intern)
+
+    def publish(self, name: Optional[str] = None, path: Optional[str] = None, resolve: bool = True):
+        """Publie la configuration dans un tampon partagé en lecture seule.
+
+        À appeler dans le processus maître avant le fork: les workers
+        s'attachent ensuite avec ``SharedReader.attach(name=...)`` (ou
+        ``path=...`` pour un fichier mmap) et naviguent dans une seule copie
+        de la configuration, sans la recomposer.
+
+        Args:
+            name: Nom du segment de mémoire partagée (généré si omis)
+            path: Fichier mmap à utiliser à la place de la mémoire partagée
+            resolve: Résoudre les interpolations avant publication
+
+        Returns:
+            SharedSnapshot: Poignée à conserver (``unlink()`` pour libérer)
+        """
+        from .shared import publish
+        return publish(self.cfg, name=name, path=path, resolve=resolve)
+
+    def diff(self, other: "TheReader", resolve: bool = False, mask_secrets: bool = True) -> list:
+        """Compare structurellement cette configuration à celle d'un autre lecteur.
+
+        Les sous-arbres de même empreinte sont ignorés sans être parcourus.
+
+        Args:
+            other: Lecteur à comparer (nouvelle version)
+            resolve: Comparer les configurations résolues
+            mask_secrets: Masquer les valeurs sensibles
+
+        Returns:
+            list: Différences ``{path, change, old, new, old_source, new_source}``
+        """
+        from .diff import diff_trees
+        from .masking import secret_paths
+
+        def sources(reader):
+            try:
+                return reader.provenance()
+            except Exception:
+                # Lecteur hors session (repli YAML, from_cfg): pas de provenance
+                return {}
+
+        secrets = set()
+        if mask_secrets and resolve:
+            # Les valeurs résolues ne montrent plus ${secret:...} ni les références
+            for reader in (self, other):
+                secrets |= secret_paths(OmegaConf.to_container(reader.cfg, resolve=False))
+        return diff_trees(
+            OmegaConf.to_container(self.cfg, resolve=resolve),
+            OmegaConf.to_container(other.cfg, resolve=resolve),
+            mask_secrets=mask_secrets,
+            provenance_a=sources(self),
+            provenance_b=sources(other),
+            secrets=secrets,
+        )
+
+    def export(self, format: str = "json", file=None, resolve: bool = False,
+               mask_secrets: bool = True, prefix: str = ""):
+        """Exporte la configuration par morceaux (json, jsonl, msgpack ou dotenv).
+
+        La sortie est produite au fil du parcours de l'arbre composé, sans
+        passer par YAML ni construire un dictionnaire complet.
+
+        Args:
+            format: ``json``, ``jsonl`` (une feuille par ligne), ``msgpack`` ou ``dotenv``
+            file: Flux où écrire (texte, binaire pour msgpack); sinon un itérateur est retourné
+            resolve: Résoudre les interpolations
+            mask_secrets: Masquer les valeurs sensibles
+            prefix: Préfixe des noms de variables (format ``dotenv``)
+
+        Returns:
+            Iterator: Morceaux ``str`` (``bytes`` pour msgpack), ou None si ``file`` est donné
+        """
+        from .export import export
+
+        chunks = export(self.cfg, format, resolve=resolve, mask_secrets=mask_secrets, prefix=prefix)
+        if file is None:
+            return chunks
+        for chunk in chunks:
+            file.write(chunk)
+
     def __repr__(self):
         return OmegaConf.to_yaml(self.cfg)
     
@@ -300,7 +1112,7 @@ class TheReader:
         return OmegaConf.to_yaml(self.cfg)
     
     def __bool__(self):
-        return bool(self.cfg)
+        return bool(self._cfg)
 
     def get_config_dir(self):
         """Retourne le chemin vers le répertoire de configuration."""
@@ -312,12 +1124,6 @@ class TheReader:
         Returns:
             dict: Configuration complètement résolue
         """
-        # Sauvegarder le répertoire courant si nécessaire
-        original_dir = None
-        if hasattr(self, 'primary_path') and os.path.isabs(self.primary_path):
-            original_dir = os.getcwd()
-            os.chdir(os.path.dirname(self.primary_path))
-        
         try:
             # Promouvoir à nouveau les secrets pour s'assurer que tout est à jour
             self._promote_secrets()
@@ -332,11 +1138,6 @@ class TheReader:
             print(f"Erreur lors de la résolution complète: {e}")
             # Renvoyer la version non résolue
             return OmegaConf.to_container(self.cfg, resolve=False)
-        
-        finally:
-            # Restaurer le répertoire si nécessaire
-            if original_dir:
-                os.chdir(original_dir)
 
     def add_config_path(self, path: str):
         """Ajoute un chemin de recherche supplémentaire.
@@ -348,6 +1149,7 @@ class TheReader:
             self: Pour le chaînage de méthodes
         """
         # S'assurer que le chemin n'est pas déjà dans la liste
+        path = os.path.abspath(path)
         if path != self.primary_path and path not in self.config_paths:
             self.config_paths.append(path)
             
@@ -0,0 +1,236 @@
+import os
+from typing import Any, Dict, List, Optional, Tuple
+from .cache import scan_files, tree_digest
+from .manifest import get_manifest
+from .native import CompositionError, NativeSession, ResultDefault, _Loaded, parse_config
+from .shared import SharedReader, _materialize, publish
+
+BUNDLE_KIND = "buddy-bundle"
+BUNDLE_VERSION = 2
+# Groupe dont les fichiers ne sont pas copiés dans le bundle (sauf include_secrets)
+SECRETS_GROUP = "secrets"
+
+
+def build_bundle(config_dir: str, output: str, include_secrets: bool = False) -> Dict[str, Any]:
+    """Regroupe un répertoire de configuration dans un seul fichier indexé.
+
+    Le bundle contient, dans le format binaire de ``shared.py``:
+
+    - ``files``: chaque fichier YAML déjà analysé (contenu, entrées
+      ``defaults`` brutes, en-tête ``# @package``, empreinte), ou l'erreur
+      d'analyse à lever s'il est utilisé;
+    - ``excluded``: les fichiers du groupe ``secrets``, non copiés: ils
+      sont lus au chargement dans le répertoire source;
+    - ``groups``: les groupes et sous-groupes du répertoire;
+    - ``configs``: pour chaque configuration principale, sa liste des
+      defaults résolue et la provenance de ses clés (sans overrides);
+    - ``tree``: l'empreinte de l'ensemble des fichiers source.
+
+    Args:
+        config_dir: Répertoire de configuration (.hydra-conf)
+        output: Fichier bundle à écrire (remplacé de manière atomique)
+        include_secrets: Copier aussi les fichiers du groupe ``secrets``
+            (le bundle contient alors les secrets en clair)
+
+    Returns:
+        dict: Résumé ``{path, size, files, excluded, configs, errors, tree}``
+    """
+    config_dir = os.path.abspath(config_dir)
+    scanned = scan_files(config_dir)
+    files: Dict[str, Any] = {}
+    excluded: List[str] = []
+    for relpath, (_, _, digest) in scanned.items():
+        if not relpath.endswith(".yaml"):
+            continue
+        config_path = relpath[:-len(".yaml")]
+        if not include_secrets and config_path.startswith(SECRETS_GROUP + "/"):
+            excluded.append(config_path)
+            continue
+        with open(os.path.join(config_dir, *relpath.split("/")), "r", encoding="utf-8") as f:
+            text = f.read()
+        try:
+            data, defaults, header = parse_config(text, config_path)
+        except Exception as e:
+            files[config_path] = {"error": f"{type(e).__name__}: {e}", "digest": digest}
+            continue
+        files[config_path] = {"data": data, "defaults": defaults, "header": header, "digest": digest}
+
+    session = NativeSession(config_dir)
+    configs: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    for name in sorted(path for path in files if "/" not in path):
+        try:
+            defaults = session.defaults_list(name)
+            provenance = session.provenance(name)
+        except Exception as e:
+            # Erreur relevée à la composition depuis le bundle, comme depuis les fichiers
+            errors[name] = str(e)
+            continue
+        configs[name] = {"defaults": [list(default) for default in defaults], "provenance": provenance}
+
+    tree = tree_digest(scanned)
+    snapshot = publish({
+        "kind": BUNDLE_KIND,
+        "version": BUNDLE_VERSION,
+        "source": config_dir,
+        "tree": tree,
+        "groups": get_manifest(config_dir).groups(),
+        "files": files,
+        "excluded": excluded,
+        "configs": configs,
+    }, path=output, resolve=False)
+    return {"path": os.path.abspath(output), "size": snapshot.size, "files": len(files),
+            "excluded": excluded, "configs": sorted(configs), "errors": errors, "tree": tree}
+
+
+class Bundle:
+    """Bundle ouvert en mmap: seules les entrées consultées sont décodées."""
+
+    def __init__(self, path: str):
+        """Ouvre un bundle.
+
+        Args:
+            path: Fichier écrit par ``build_bundle``
+
+        Raises:
+            ValueError: Si le fichier n'est pas un bundle de cette version
+        """
+        self.path = os.path.abspath(path)
+        info = os.stat(self.path)
+        # Fichier ouvert: un bundle reconstruit (remplacé) n'a plus la même empreinte
+        self.stamp = (info.st_ino, info.st_mtime_ns, info.st_size)
+        self._reader = SharedReader.attach(path=self.path)
+        root = self._reader.cfg
+        if root.get("kind") != BUNDLE_KIND or root.get("version") != BUNDLE_VERSION:
+            self.close()
+            raise ValueError(f"'{path}' n'est pas un bundle hydra-buddies (version {BUNDLE_VERSION})")
+        self.source = root["source"]
+        self.tree = root["tree"]
+        self.files = root["files"]
+        self.excluded = set(root["excluded"])
+        self.configs = root["configs"]
+        self.groups = set(root["groups"])
+
+    def is_replaced(self) -> bool:
+        """Indique si le fichier a été réécrit (ou supprimé) depuis l'ouverture."""
+        try:
+            info = os.stat(self.path)
+        except OSError:
+            return True
+        return (info.st_ino, info.st_mtime_ns, info.st_size) != self.stamp
+
+    def load(self, config_path: str) -> Optional[Tuple[Any, list, Optional[str]]]:
+        """Décode un fichier: ``(contenu, entrées defaults brutes, en-tête)``, None s'il est absent.
+
+        Les fichiers exclus du bundle (secrets) sont lus dans le répertoire source.
+
+        Raises:
+            CompositionError: Si le fichier n'avait pas pu être analysé, ou
+                s'il est exclu du bundle et absent du répertoire source
+        """
+        if config_path in self.excluded:
+            source = os.path.join(self.source, *f"{config_path}.yaml".split("/"))
+            try:
+                with open(source, "r", encoding="utf-8") as f:
+                    return parse_config(f.read(), config_path)
+            except FileNotFoundError:
+                raise CompositionError(f"'{config_path}' n'est pas dans le bundle (secrets exclus) "
+                                       f"ni dans {self.source}") from None
+        entry = self.files.get(config_path)
+        if entry is None:
+            return None
+        if "error" in entry:
+            raise CompositionError(f"Dans '{config_path}': {entry['error']}")
+        return _materialize(entry["data"]), _materialize(entry["defaults"]), entry["header"]
+
+    def is_stale(self, config_dir: Optional[str] = None) -> bool:
+        """Indique si les fichiers source ont changé depuis la création du bundle.
+
+        Args:
+            config_dir: Répertoire source (défaut: celui enregistré dans le bundle)
+        """
+        return tree_digest(scan_files(config_dir or self.source)) != self.tree
+
+    def close(self):
+        self._reader.close()
+
+    def __repr__(self):
+        return f"Bundle({self.path!r}, files={len(self.files)})"
+
+
+class BundleSession(NativeSession):
+    """Composition native depuis un bundle (``TheReader(path="config.bundle")``).
+
+    Aucun fichier YAML n'est ouvert, sauf les secrets exclus du bundle
+    (lus dans le répertoire source): le bundle est projeté en mémoire et
+    chaque fichier n'est décodé qu'à son premier usage. Sans overrides de
+    groupes, la liste des defaults et la provenance enregistrées dans le
+    bundle sont utilisées telles quelles.
+    """
+
+    def __init__(self, root: str, extra_roots: Tuple[str, ...] = ()):
+        if extra_roots:
+            raise ValueError("Un bundle ne se combine pas avec des chemins de recherche supplémentaires")
+        super().__init__(root)
+        self.bundle = Bundle(root)
+        options: Dict[str, List[str]] = {}
+        for config_path in (*self.bundle.files, *self.bundle.excluded):
+            group, _, name = config_path.rpartition("/")
+            options.setdefault(group, []).append(name)
+        self._options = options
+
+    @property
+    def tree(self) -> str:
+        """Empreinte des sources du bundle (clé du cache des compositions)."""
+        return self.bundle.tree
+
+    @property
+    def source_roots(self) -> Tuple[str, ...]:
+        """Répertoire où sont lus les secrets exclus (empreinte du cache des compositions)."""
+        return (self.bundle.source,)
+
+    def _find(self, config_path: str) -> Optional[str]:
+        if config_path.endswith(".yaml"):
+            config_path = config_path[:-len(".yaml")]
+        return config_path if config_path in self.bundle.files or config_path in self.bundle.excluded else None
+
+    def group_exists(self, group: str) -> bool:
+        return group in self.bundle.groups
+
+    def group_options(self, group: str) -> List[str]:
+        """Liste les options disponibles pour un groupe."""
+        return sorted(self._options.get(group, ()))
+
+    def list_groups(self, parent: str = "") -> List[str]:
+        """Liste les sous-groupes d'un groupe."""
+        return sorted(group.rsplit("/", 1)[-1] for group in self.bundle.groups
+                      if (group.rsplit("/", 1)[0] if "/" in group else "") == parent)
+
+    def _load(self, config_path: str) -> Optional[_Loaded]:
+        loaded = self._files.get(config_path)
+        if loaded is None or config_path in self.bundle.excluded:
+            # Secrets relus à chaque composition: ils ne sont pas figés dans le bundle
+            decoded = self.bundle.load(config_path)
+            if decoded is None:
+                return None
+            data, raw, header = decoded
+            defaults = [self._entry(config_path, item) for item in raw]
+            loaded = self._files[config_path] = _Loaded(data, defaults, header, None)
+        return loaded
+
+    def _defaults(self, config_name: str, overrides: list):
+        if not overrides:
+            stored = self.bundle.configs.get(config_name)
+            if stored is not None:
+                return [ResultDefault(*default) for default in _materialize(stored["defaults"])], []
+        return super()._defaults(config_name, overrides)
+
+    def provenance(self, config_name: str, overrides: Optional[List[str]] = None) -> Dict[str, str]:
+        """Indique pour chaque clé feuille le fichier qui l'a définie en dernier."""
+        stored = None if overrides else self.bundle.configs.get(config_name)
+        if stored is not None:
+            return stored["provenance"].to_dict()
+        return super().provenance(config_name, overrides)
+
+    def __repr__(self):
+        return f"BundleSession(bundle={self.bundle.path!r})"
@@ -0,0 +1,88 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional
+
+# Répertoire des caches sur disque, placé à côté du répertoire de configuration
+# (et non dedans: Hydra le listerait comme un groupe)
+CACHE_DIRNAME = ".buddy-cache"
+YAML_EXTENSIONS = (".yaml", ".yml")
+
+
+def cache_dir(config_dir: str) -> str:
+    """Retourne le répertoire de cache associé à un répertoire de configuration.
+
+    Exemple: ``/projet/.hydra-conf`` -> ``/projet/.buddy-cache/hydra-conf``
+    """
+    config_dir = os.path.abspath(config_dir)
+    name = os.path.basename(config_dir.rstrip(os.sep)).lstrip(".") or "config"
+    return os.path.join(os.path.dirname(config_dir), CACHE_DIRNAME, name)
+
+
+def cache_path(config_dir: str, filename: str) -> str:
+    """Retourne le chemin d'un fichier de cache (répertoire créé au besoin)."""
+    directory = cache_dir(config_dir)
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, filename)
+
+
+def file_digest(path: str) -> str:
+    """Empreinte du contenu d'un fichier."""
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def scan_files(config_dir: str, previous: Optional[Dict[str, list]] = None) -> Dict[str, list]:
+    """Inventorie les fichiers YAML d'un répertoire de configuration.
+
+    Le contenu n'est relu que pour les fichiers dont la date de modification
+    ou la taille a changé depuis ``previous``.
+
+    Args:
+        config_dir: Répertoire de configuration
+        previous: Inventaire précédent
+
+    Returns:
+        dict: Chemin relatif (``database/prod.yaml``) -> ``[mtime_ns, taille, empreinte]``
+    """
+    previous = previous or {}
+    files = {}
+    for root, dirs, names in os.walk(config_dir):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        for name in sorted(names):
+            if not name.endswith(YAML_EXTENSIONS):
+                continue
+            path = os.path.join(root, name)
+            relpath = os.path.relpath(path, config_dir).replace(os.sep, "/")
+            stat = os.stat(path)
+            known = previous.get(relpath)
+            if known and known[0] == stat.st_mtime_ns and known[1] == stat.st_size:
+                files[relpath] = known
+            else:
+                files[relpath] = [stat.st_mtime_ns, stat.st_size, file_digest(path)]
+    return files
+
+
+def load_json(path: str, default: Any = None) -> Any:
+    """Charge un cache JSON (``default`` s'il est absent ou illisible)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def save_json(path: str, data: Any):
+    """Écrit un cache JSON de manière atomique."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"), default=str)
+    os.replace(tmp_path, path)
+
+
+def tree_digest(files: Dict[str, list]) -> str:
+    """Empreinte globale d'un inventaire produit par ``scan_files``."""
+    digest = hashlib.blake2b(digest_size=16)
+    for relpath in sorted(files):
+        digest.update(f"{relpath}\0{files[relpath][2]}\n".encode("utf-8"))
+    return digest.hexdigest()
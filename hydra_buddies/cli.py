@@ -1,8 +1,9 @@
 import click
 from .buddies import TheReader
+from .batch import open_reader
+from .manifest import get_manifest
 import os
 import shutil
-from cookiecutter.main import cookiecutter
 import yaml
 import re
 
@@ -11,12 +12,55 @@ def cli():
     """Hydra-Buddies CLI - Gestionnaire de configuration"""
     pass
 
+def all_roots_option(func=None, *, paths=(), outputs=()):
+    """Ajoute --all-roots: la commande est exécutée pour chaque .hydra-conf du dépôt
+
+    Args:
+        paths: Paramètres lus (fichiers, répertoires) dont les chemins relatifs
+            sont résolus depuis le projet de chaque racine
+        outputs: Paramètres écrits, résolus de même; un chemin absolu est refusé
+            (toutes les racines écriraient le même fichier)
+    """
+    import functools
+
+    if func is None:
+        return functools.partial(all_roots_option, paths=paths, outputs=outputs)
+
+    @click.option('--all-roots', is_flag=True, help='Exécuter la commande pour chaque .hydra-conf trouvé sous le répertoire courant')
+    @click.option('--root-jobs', type=int, help='Processus pour --all-roots (défaut: nombre de CPU)')
+    @functools.wraps(func)
+    def wrapper(*args, all_roots=False, root_jobs=None, **params):
+        if not all_roots:
+            return func(*args, **params)
+        import sys
+        from .discover import discover, run_on_roots
+
+        for name in outputs:
+            if params.get(name) and os.path.isabs(params[name]):
+                option = '--' + name.replace('_', '-')
+                raise click.UsageError(f"{option} doit être relatif avec --all-roots (résolu depuis le projet de chaque racine)")
+
+        name = click.get_current_context().info_name
+        failed = 0
+        for result in run_on_roots(name, params, discover(os.getcwd()), processes=root_jobs,
+                                   paths=(*paths, *outputs)):
+            click.echo(f"==> {os.path.relpath(result['root'])} <==")
+            click.echo(result['output'], nl=False)
+            if result['error']:
+                click.echo(result['error'], nl=False, err=True)
+            failed += result['exit_code'] != 0
+        if failed:
+            sys.exit(1)
+    return wrapper
+
 @cli.command()
 @click.argument('config_name')
 @click.option('--path', '-p', help='Chemin vers la configuration')
 @click.option('--resolve', '-r', is_flag=True, help='Afficher la configuration complètement résolue')
 @click.option('--debug', '-d', is_flag=True, help='Afficher des informations de débogage')
-def read(config_name, path, resolve, debug):
+@click.option('--hash', 'show_hash', is_flag=True, help='Afficher uniquement l\'empreinte de la configuration')
+@all_roots_option
+def read(config_name, path, resolve, debug, show_hash):
     """Lire une configuration"""
     import os
     import yaml
@@ -24,15 +68,17 @@ def read(config_name, path, resolve, debug):
     from omegaconf import OmegaConf
     
     # Déterminer le chemin de configuration
-    config_dir = path if path else os.path.join(os.getcwd(), '.hydra-conf')
+    config_dir = os.path.abspath(path) if path else os.path.join(os.getcwd(), '.hydra-conf')
     
     if debug:
         click.echo(f"Chemin de configuration: {config_dir}")
     
     # Charger la configuration avec notre TheReader qui est stable
-    reader = TheReader(config_name)
-    if path:
-        reader.update_path(path)
+    reader = open_reader(config_name, path=path)
+    
+    if show_hash:
+        click.echo(reader.fingerprint())
+        return
     
     if resolve:
         try:
@@ -60,7 +106,7 @@ def read(config_name, path, resolve, debug):
                             if group == "secrets" and isinstance(name, list):
                                 for secret_name in name:
                                     secret_file = os.path.join(config_dir, "secrets", f"{secret_name}.yaml")
-                                    if os.path.exists(secret_file):
+                                    if get_manifest(config_dir).isfile(secret_file):
                                         with open(secret_file, 'r') as f:
                                             secret_cfg = OmegaConf.create(yaml.safe_load(f))
                                             # Fusionner manuellement
@@ -88,23 +134,18 @@ def read(config_name, path, resolve, debug):
 @click.argument('config_name')
 @click.argument('key')
 @click.option('--path', '-p', help='Chemin vers la configuration')
+@all_roots_option
 def get(config_name, key, path):
     """Obtenir une valeur spécifique de la configuration"""
     # Normaliser le nom de configuration
     config_name = normalize_config_name(config_name)
     
-    reader = TheReader(config_name)
-    if path:
-        reader.update_path(path)
+    reader = open_reader(config_name, path=path)
     
-    keys = key.split('.')
-    with reader:
-        reader.walk(*keys[:-1])
-        try:
-            value = getattr(reader, keys[-1])
-            click.echo(value)
-        except AttributeError:
-            click.echo(f"Clé '{key}' non trouvée", err=True)
+    try:
+        click.echo(reader.path(key)())
+    except (KeyError, ValueError):
+        click.echo(f"Clé '{key}' non trouvée", err=True)
 
 @cli.command()
 @click.argument('config_name')
@@ -115,6 +156,7 @@ def get(config_name, key, path):
 @click.option('--debug', '-d', is_flag=True, help='Afficher des informations de débogage')
 @click.option('--ref', is_flag=True, help='Afficher les références des sources pour chaque clé')
 @click.option('--raw', is_flag=True, help='Inclure les clés defaults dans le résultat')
+@all_roots_option
 def list_keys(config_name, path, full, values, resolve, debug, ref, raw):
     """Lister toutes les clés disponibles"""
     # Ne pas normaliser le nom ici, cela sera fait dans get_config_filename
@@ -136,9 +178,9 @@ def list_keys(config_name, path, full, values, resolve, debug, ref, raw):
         from omegaconf import OmegaConf
         
         # Déterminer le chemin de configuration
-        config_dir = path if path else os.path.join(os.getcwd(), 'hydra_buddies', '.hydra-conf')
-        if not os.path.isdir(config_dir):
-            config_dir = path if path else os.path.join(os.getcwd(), '.hydra-conf')
+        config_dir = os.path.abspath(path) if path else os.path.join(os.getcwd(), 'hydra_buddies', '.hydra-conf')
+        if not get_manifest(config_dir).isdir(""):
+            config_dir = os.path.abspath(path) if path else os.path.join(os.getcwd(), '.hydra-conf')
         
         if debug:
             click.echo(f"Chemin de configuration: {config_dir}")
@@ -146,7 +188,7 @@ def list_keys(config_name, path, full, values, resolve, debug, ref, raw):
         # Charger le fichier de configuration principal
         config_filename = get_config_filename(config_name)
         config_file = os.path.join(config_dir, config_filename)
-        if not os.path.exists(config_file):
+        if not get_manifest(config_dir).isfile(config_file):
             click.echo(f"Erreur: Fichier de configuration introuvable: {config_file}", err=True)
             return 1
         
@@ -206,7 +248,7 @@ def list_keys(config_name, path, full, values, resolve, debug, ref, raw):
             if debug:
                 click.echo(f"Tentative de chargement de la référence: {ref_path}")
             
-            if os.path.exists(ref_path):
+            if get_manifest(config_dir).isfile(ref_path):
                 with open(ref_path, 'r') as f:
                     content = yaml.safe_load(f)
                     if debug:
@@ -299,7 +341,7 @@ def list_keys(config_name, path, full, values, resolve, debug, ref, raw):
                                 # Charger le fichier correspondant dans le sous-répertoire
                                 ref_file = os.path.join(config_dir, group, f"{sub_option}.yaml")
                                 
-                                if os.path.exists(ref_file):
+                                if get_manifest(config_dir).isfile(ref_file):
                                     if debug:
                                         click.echo(f"  Fichier trouvé: {ref_file}")
                                     with open(ref_file, 'r') as f:
@@ -313,11 +355,11 @@ def list_keys(config_name, path, full, values, resolve, debug, ref, raw):
         
         # Récupérer le contenu du fichier config.yaml pour l'examiner et l'analyser directement
         secrets_dir = os.path.join(config_dir, 'secrets')
-        if os.path.isdir(secrets_dir):
+        if get_manifest(config_dir).isdir(secrets_dir):
             if debug:
                 click.echo("Récupération manuelle des fichiers secrets:")
             
-            for secret_file in os.listdir(secrets_dir):
+            for secret_file in get_manifest(config_dir).listdir(secrets_dir):
                 if secret_file.endswith('.yaml'):
                     secret_name = os.path.splitext(secret_file)[0]
                     secret_path = os.path.join(secrets_dir, secret_file)
@@ -361,9 +403,7 @@ def list_keys(config_name, path, full, values, resolve, debug, ref, raw):
                 click.echo(key)
     else:
         # Pour la version non résolue, utiliser TheReader comme avant
-        reader = TheReader(config_name)
-        if path:
-            reader.update_path(path)
+        reader = open_reader(config_name, path=path)
         
         config = reader.get_cfg()
         
@@ -440,17 +480,328 @@ def list_keys(config_name, path, full, values, resolve, debug, ref, raw):
                 for key in config.keys():
                     click.echo(key)
 
+@cli.command(name='compile')
+@click.argument('config_name')
+@click.option('--output', '-o', default='settings_generated.py', help='Fichier Python à générer')
+@click.option('--path', '-p', help='Chemin vers la configuration')
+@click.option('--stub', '-s', is_flag=True, help='Générer aussi le fichier .pyi')
+@all_roots_option(outputs=('output',))
+def compile_config(config_name, output, path, stub):
+    """Générer un module Python importable à partir de la configuration"""
+    from .compiler import compile_module
+
+    config_dir = os.path.abspath(path) if path else os.path.join(os.getcwd(), '.hydra-conf')
+
+    reader = open_reader(config_name, path=path)
+
+    for written in compile_module(reader, output, stub=stub, config_dir=config_dir):
+        click.echo(f"Fichier généré: {written}")
+
+@cli.command()
+@click.argument('config_names', nargs=-1, required=True)
+@click.option('--group', '-g', 'groups', multiple=True, help='Options d\'un groupe à combiner (ex: database=default,dev,prod)')
+@click.option('--override', '-o', 'overrides', multiple=True, help='Override commun à toutes les combinaisons')
+@click.option('--path', '-p', help='Chemin vers la configuration')
+@click.option('--jobs', '-j', type=int, help='Nombre de processus (défaut: nombre de CPU)')
+@click.option('--no-resolve', is_flag=True, help='Ne pas résoudre les interpolations')
+@click.option('--output', is_flag=True, help='Inclure la configuration obtenue dans chaque résultat')
+@all_roots_option
+def matrix(config_names, groups, overrides, path, jobs, no_resolve, output):
+    """Composer toutes les combinaisons de configurations en parallèle"""
+    import json
+    import sys
+    from .matrix import run_matrix
+
+    group_options = {}
+    for spec in groups:
+        if '=' not in spec:
+            click.echo(f"Groupe invalide: '{spec}' (attendu: groupe=option1,option2)", err=True)
+            sys.exit(2)
+        group, options = spec.split('=', 1)
+        group_options[group] = [option for option in options.split(',') if option]
+
+    config_dir = os.path.abspath(path) if path else os.path.join(os.getcwd(), '.hydra-conf')
+
+    failures = 0
+    for result in run_matrix(config_names, group_options, overrides, config_dir=config_dir,
+                             processes=jobs, resolve=not no_resolve, with_output=output):
+        failures += result["error"] is not None
+        click.echo(json.dumps(result, default=str, ensure_ascii=False))
+
+    if failures:
+        sys.exit(1)
+
+@cli.command()
+@click.argument('config_a')
+@click.argument('config_b')
+@click.option('--path', '-p', help='Chemin vers la configuration')
+@click.option('--path-b', help='Chemin vers la configuration B (défaut: --path)')
+@click.option('--override-a', '-A', 'overrides_a', multiple=True, help='Override appliqué à la configuration A')
+@click.option('--override-b', '-B', 'overrides_b', multiple=True, help='Override appliqué à la configuration B')
+@click.option('--resolve', '-r', is_flag=True, help='Comparer les configurations résolues')
+@click.option('--show-secrets', is_flag=True, help='Ne pas masquer les valeurs sensibles')
+@all_roots_option(paths=('path_b',))
+def diff(config_a, config_b, path, path_b, overrides_a, overrides_b, resolve, show_secrets):
+    """Comparer structurellement deux configurations"""
+    import json
+    import sys
+
+    try:
+        reader_a = open_reader(config_a, path, overrides_a)
+        reader_b = open_reader(config_b, path_b or path, overrides_b)
+    except Exception as e:
+        click.echo(f"Erreur lors du chargement des configurations: {e}", err=True)
+        sys.exit(2)
+
+    changes = reader_a.diff(reader_b, resolve=resolve, mask_secrets=not show_secrets)
+    for change in changes:
+        click.echo(json.dumps(change, default=str, ensure_ascii=False))
+
+    if changes:
+        sys.exit(1)
+
+@cli.command()
+@click.argument('config_name')
+@click.option('--format', '-f', 'fmt', type=click.Choice(['json', 'jsonl', 'msgpack', 'dotenv']),
+              default='json', show_default=True, help='Format de sortie')
+@click.option('--path', '-p', help='Chemin vers la configuration')
+@click.option('--override', '-o', 'overrides', multiple=True, help='Override Hydra (répétable)')
+@click.option('--resolve', '-r', is_flag=True, help='Résoudre les interpolations')
+@click.option('--show-secrets', is_flag=True, help='Ne pas masquer les valeurs sensibles')
+@click.option('--prefix', default='', help='Préfixe des variables (format dotenv)')
+@click.option('--output', type=click.Path(dir_okay=False), help='Fichier de sortie (défaut: sortie standard)')
+@all_roots_option(outputs=('output',))
+def export(config_name, fmt, path, overrides, resolve, show_secrets, prefix, output):
+    """Exporter une configuration en flux (json, jsonl, msgpack, dotenv)"""
+    import sys
+
+    try:
+        reader = open_reader(config_name, path, overrides)
+        chunks = reader.export(fmt, resolve=resolve, mask_secrets=not show_secrets, prefix=prefix)
+        binary = fmt == 'msgpack'
+        if output:
+            with open(output, 'wb' if binary else 'w', encoding=None if binary else 'utf-8') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+        else:
+            stream = sys.stdout.buffer if binary else sys.stdout
+            for chunk in chunks:
+                stream.write(chunk)
+            if fmt == 'json':
+                stream.write('\n')
+            stream.flush()
+    except Exception as e:
+        click.echo(f"Erreur lors de l'export: {e}", err=True)
+        sys.exit(1)
+
+@cli.command()
+@click.argument('pattern')
+@click.option('--path', '-p', help='Chemin vers la configuration')
+@click.option('--kind', '-k', 'kinds', multiple=True, type=click.Choice(['key', 'value', 'ref']),
+              help='Type de correspondance (répétable, défaut: tous)')
+@click.option('--config', '-c', 'configs', multiple=True, help='Restreindre à une configuration (répétable)')
+@click.option('--no-update', is_flag=True, help='Interroger l\'index sans le mettre à jour')
+@click.option('--json', 'as_json', is_flag=True, help='Afficher un résultat JSON par ligne')
+@all_roots_option
+def search(pattern, path, kinds, configs, no_update, as_json):
+    """Rechercher des clés, valeurs ou références dans toutes les configurations"""
+    import json
+    import sys
+    from .search import KINDS, get_index
+
+    config_dir = os.path.abspath(path) if path else os.path.join(os.getcwd(), '.hydra-conf')
+    if not os.path.isdir(config_dir):
+        click.echo(f"Répertoire de configuration introuvable: {config_dir}", err=True)
+        sys.exit(2)
+
+    index = get_index(config_dir)
+    if not no_update:
+        index.update()
+    for name, error in index.errors().items():
+        click.echo(f"Avertissement: '{name}' n'a pas pu être indexée: {error}", err=True)
+
+    results = index.search(pattern, kinds=kinds or KINDS, configs=configs or None)
+    for result in results:
+        if as_json:
+            click.echo(json.dumps(result, default=str, ensure_ascii=False))
+        else:
+            source = f" ({result['source']})" if result['source'] else ""
+            click.echo(f"{result['config']}: {result['path']} = {result['value']}{source}")
+
+    if not results:
+        sys.exit(1)
+
 @cli.command()
-def init():
+@click.argument('source', type=click.File('r'), default='-')
+@click.option('--fail-fast', '-x', is_flag=True, help="S'arrêter à la première commande en échec")
+@click.option('--text', is_flag=True, help='Afficher la sortie brute des commandes au lieu d\'un résultat JSON par ligne')
+def batch(source, fail_fast, text):
+    """Exécuter un lot de commandes (fichier ou entrée standard) dans un seul processus"""
+    import json
+    import sys
+    from .batch import run_batch
+
+    failed = 0
+    for result in run_batch(cli, source, fail_fast=fail_fast):
+        failed += result['exit_code'] != 0
+        if text:
+            click.echo(result['output'], nl=False)
+            if result['error']:
+                click.echo(f"[ligne {result['line']}] {result['error']}", nl=False, err=True)
+        else:
+            click.echo(json.dumps(result, default=str, ensure_ascii=False))
+        sys.stdout.flush()
+
+    if failed:
+        sys.exit(1)
+
+@cli.command(name='discover')
+@click.argument('top', default='.', type=click.Path(exists=True, file_okay=False))
+@click.option('--jobs', '-j', type=int, help='Threads de parcours')
+@click.option('--no-cache', is_flag=True, help='Reparcourir tout le dépôt sans réutiliser le cache')
+@click.option('--json', 'as_json', is_flag=True, help='Afficher un résultat JSON par ligne')
+def discover_roots(top, jobs, no_cache, as_json):
+    """Trouver tous les répertoires .hydra-conf d'un dépôt"""
+    import json
+    import sys
+    from .discover import discover
+
+    roots = discover(top, jobs=jobs, use_cache=not no_cache)
+    for root in roots:
+        if as_json:
+            service = os.path.relpath(os.path.dirname(root), os.path.abspath(top))
+            click.echo(json.dumps({"root": root, "service": service}, ensure_ascii=False))
+        else:
+            click.echo(os.path.relpath(root))
+    click.echo(f"{len(roots)} répertoires de configuration", err=True)
+
+    if not roots:
+        sys.exit(1)
+
+@cli.command()
+@click.option('--path', '-p', help='Chemin vers la configuration')
+@click.option('--jobs', '-j', type=int, help='Nombre de processus (défaut: nombre de CPU, 1 = sans pool)')
+@click.option('--no-cache', is_flag=True, help='Tout revalider sans réutiliser les résultats précédents')
+@click.option('--strict', is_flag=True, help='Échouer aussi sur les avertissements')
+@click.option('--json', 'as_json', is_flag=True, help='Afficher un diagnostic JSON par ligne')
+@all_roots_option
+def validate(path, jobs, no_cache, strict, as_json):
+    """Valider toutes les configurations et options de groupes"""
+    import json
+    import sys
+    from .validate import Validator
+
+    config_dir = os.path.abspath(path) if path else os.path.join(os.getcwd(), '.hydra-conf')
+    if not os.path.isdir(config_dir):
+        click.echo(f"Répertoire de configuration introuvable: {config_dir}", err=True)
+        sys.exit(2)
+
+    validator = Validator(config_dir, use_cache=not no_cache)
+    diagnostics = validator.run(processes=jobs)
+    for diagnostic in diagnostics:
+        if as_json:
+            click.echo(json.dumps(diagnostic, default=str, ensure_ascii=False))
+        else:
+            location = diagnostic['file'] or diagnostic['unit']
+            key = f" {diagnostic['path']}" if diagnostic['path'] else ""
+            click.echo(f"{diagnostic['severity']}: {location}{key} [{diagnostic['code']}] {diagnostic['message']}")
+
+    errors = sum(diagnostic['severity'] == 'error' for diagnostic in diagnostics)
+    warnings = len(diagnostics) - errors
+    click.echo(f"{len(validator.results)} unités, {len(validator.revalidated)} revalidées, "
+               f"{errors} erreurs, {warnings} avertissements", err=True)
+
+    if errors or (strict and warnings):
+        sys.exit(1)
+
+@cli.command()
+@click.option('--path', '-p', help='Chemin vers la configuration')
+@click.option('--output', '-o', default='config.bundle', show_default=True,
+              type=click.Path(dir_okay=False), help='Fichier bundle à écrire')
+@click.option('--check', is_flag=True, help='Vérifier que le bundle existant est à jour, sans le réécrire')
+@click.option('--include-secrets', is_flag=True, help='Copier aussi le groupe secrets dans le bundle (en clair)')
+def bundle(path, output, check, include_secrets):
+    """Regrouper la configuration dans un seul fichier indexé (chargement rapide)"""
+    import sys
+    from .bundle import Bundle, build_bundle
+
+    config_dir = os.path.abspath(path) if path else os.path.join(os.getcwd(), '.hydra-conf')
+    if not os.path.isdir(config_dir):
+        click.echo(f"Répertoire de configuration introuvable: {config_dir}", err=True)
+        sys.exit(2)
+
+    if check:
+        try:
+            existing = Bundle(output)
+        except (OSError, ValueError) as e:
+            click.echo(f"Bundle illisible: {e}", err=True)
+            sys.exit(1)
+        stale = existing.is_stale(config_dir)
+        existing.close()
+        click.echo(f"{output}: {'à reconstruire' if stale else 'à jour'}")
+        sys.exit(1 if stale else 0)
+
+    summary = build_bundle(config_dir, output, include_secrets=include_secrets)
+    if include_secrets:
+        click.echo(f"ATTENTION: {output} contient les secrets en clair: ne pas le publier ni le versionner", err=True)
+    elif summary['excluded']:
+        click.echo(f"{len(summary['excluded'])} fichiers de secrets exclus: lus au chargement dans {config_dir}", err=True)
+    for name, error in summary['errors'].items():
+        click.echo(f"Avertissement: '{name}' ne compose pas, elle sera composée au chargement: {error}", err=True)
+    click.echo(f"Bundle écrit: {summary['path']} ({summary['files']} fichiers, "
+               f"{len(summary['configs'])} configurations, {summary['size'] / 1024:.1f} Kio)")
+
+@cli.command()
+@click.option('--many', type=click.File('r'), help='Fichier listant les répertoires cibles (un par ligne, - pour stdin)')
+@click.option('--template', '-t', type=click.Path(exists=True, file_okay=False),
+              help='Template cookiecutter externe (défaut: template fourni, rendu natif)')
+@click.option('--jobs', '-j', type=int, help="Threads d'écriture avec --many")
+def init(many, template, jobs):
     """Initialiser un répertoire de configuration"""
+    import sys
+    from .scaffold import read_targets, scaffold, scaffold_many
+
+    if many is not None:
+        targets = read_targets(many)
+        if template:
+            results = []
+            for target in targets:
+                try:
+                    os.makedirs(target, exist_ok=True)
+                    _cookiecutter_init(template, os.path.abspath(target))
+                    results.append({"target": target, "error": None})
+                except Exception as e:
+                    results.append({"target": target, "error": str(e)})
+        else:
+            results = scaffold_many(targets, jobs=jobs)
+        failed = [result for result in results if result["error"]]
+        for result in failed:
+            click.echo(f"{result['target']}: {result['error']}", err=True)
+        click.echo(f"{len(results) - len(failed)} répertoires de configuration initialisés, {len(failed)} en échec")
+        if failed:
+            sys.exit(1)
+        return
+
     if os.path.exists(os.path.join(os.getcwd(), '.hydra-conf')):
         click.echo("Un répertoire de configuration existe déjà", err=True)
         return
-    
-    template_path = os.path.join(os.path.dirname(__file__), 'templates', 'hydra_conf')
+
     output_path = os.getcwd()
+    if template:
+        _cookiecutter_init(template, output_path)
+    else:
+        scaffold(output_path)
     
-    # Copier les templates avec cookiecutter
+    click.echo("Répertoire de configuration initialisé avec succès")
+
+def _cookiecutter_init(template_path, output_path):
+    """Rend un template cookiecutter externe dans ``output_path/.hydra-conf``"""
+    from cookiecutter.main import cookiecutter
+    from .scaffold import ensure_gitignore
+
+    if os.path.exists(os.path.join(output_path, '.hydra-conf')):
+        raise FileExistsError(f"Un répertoire de configuration existe déjà: {output_path}")
+
     cookiecutter(
         template_path,
         output_dir=output_path,
@@ -465,22 +816,7 @@ def init():
     if os.path.exists(temp_dir):
         shutil.move(os.path.join(temp_dir, '.hydra-conf'), output_path)
         shutil.rmtree(temp_dir)
-    
-    # Vérifier si le répertoire secret est dans le fichier .gitignore
-    gitignore_path = os.path.join(output_path, '.gitignore')
-    secret_line = '.hydra-conf/secrets/*\n'
-    
-    if os.path.exists(gitignore_path):
-        with open(gitignore_path, 'r') as file:
-            lines = file.readlines()
-            if secret_line not in lines:
-                with open(gitignore_path, 'a') as file:
-                    file.write(secret_line)
-    else:
-        with open(gitignore_path, 'w') as file:
-            file.write(secret_line)
-    
-    click.echo("Répertoire de configuration initialisé avec succès")
+    ensure_gitignore(output_path)
     
 @cli.command()
 @click.argument('name')
@@ -510,17 +846,15 @@ def add_config(name):
     with open(new_config_file, 'w') as f:
         yaml.dump(config_content, f, default_flow_style=False)
     
-    # Parcourir tous les sous-répertoires pour copier default.yaml
+    # Copier default.yaml dans tous les sous-répertoires qui en ont un
+    manifest = get_manifest(config_dir)
     subdirs_copied = 0
-    for root, dirs, files in os.walk(config_dir):
-        for dir_name in dirs:
-            subdir = os.path.join(root, dir_name)
-            default_yaml = os.path.join(subdir, "default.yaml")
-            
-            if os.path.exists(default_yaml):
-                new_yaml = os.path.join(subdir, f"{name}.yaml")
-                shutil.copy2(default_yaml, new_yaml)
-                subdirs_copied += 1
+    for default_yaml in manifest.find("default.yaml"):
+        subdir = os.path.join(config_dir, os.path.dirname(default_yaml))
+        shutil.copy2(os.path.join(config_dir, default_yaml), os.path.join(subdir, f"{name}.yaml"))
+        manifest.invalidate(subdir)
+        subdirs_copied += 1
+    manifest.invalidate()
     
     click.echo(f"Configuration '{name}' créée avec succès.")
     click.echo(f"- Fichier principal: {new_config_file}")
@@ -556,6 +890,7 @@ def remove_config(name, force):
             os.remove(subfile)
         except OSError:
             click.echo(f"Impossible de supprimer {subfile}", err=True)
+    get_manifest(os.path.dirname(config_file)).invalidate()
     
     click.echo(f"Configuration '{name}' supprimée avec succès.")
     click.echo(f"- {len(subconfig_files) + 1} fichiers supprimés au total.")
@@ -575,32 +910,31 @@ def validate_add_config(name, config_dir=None):
     Raises:
         ConfigError: Si la validation échoue
     """
-    if config_dir is None:
-        config_dir = os.path.join(os.getcwd(), '.hydra-conf')
+    config_dir = os.path.abspath(config_dir or '.hydra-conf')
+    manifest = get_manifest(config_dir)
     
-    if not os.path.exists(config_dir):
+    if not manifest.isdir(""):
         raise ConfigError("Aucun répertoire de configuration trouvé. Exécutez 'buddy init' d'abord.")
     
     # Vérifier si cette configuration existe déjà
-    new_config_file = os.path.join(config_dir, f"config_{name}.yaml")
-    if os.path.exists(new_config_file):
+    if manifest.exists(f"config_{name}.yaml"):
         raise ConfigError(f"La configuration '{name}' existe déjà.")
     
     # Vérifier que les fichiers source existent
     default_config = os.path.join(config_dir, "config_default.yaml")
-    if not os.path.exists(default_config):
+    if not manifest.exists("config_default.yaml"):
         default_config = os.path.join(config_dir, "config.yaml")
-        if not os.path.exists(default_config):
+        if not manifest.exists("config.yaml"):
             raise ConfigError("Aucun fichier config_default.yaml ou config.yaml trouvé.")
     
     return default_config
 
 def validate_remove_config(name, config_dir=None):
     """Valide les paramètres pour remove_config et lève des exceptions si nécessaire."""
-    if config_dir is None:
-        config_dir = os.path.join(os.getcwd(), '.hydra-conf')
+    config_dir = os.path.abspath(config_dir or '.hydra-conf')
+    manifest = get_manifest(config_dir)
     
-    if not os.path.exists(config_dir):
+    if not manifest.isdir(""):
         raise ConfigError("Aucun répertoire de configuration trouvé. Exécutez 'buddy init' d'abord.")
     
     # Interdire complètement la suppression de tout ce qui s'appelle "default"
@@ -609,17 +943,11 @@ def validate_remove_config(name, config_dir=None):
     
     # Vérifier si cette configuration existe
     config_file = os.path.join(config_dir, f"config_{name}.yaml")
-    if not os.path.exists(config_file):
+    if not manifest.exists(f"config_{name}.yaml"):
         raise ConfigError(f"La configuration '{name}' n'existe pas.")
     
     # Trouver tous les fichiers associés dans les sous-répertoires
-    subconfig_files = []
-    for root, dirs, files in os.walk(config_dir):
-        for dir_name in dirs:
-            subdir = os.path.join(root, dir_name)
-            subconfig_file = os.path.join(subdir, f"{name}.yaml")
-            if os.path.exists(subconfig_file):
-                subconfig_files.append(subconfig_file)
+    subconfig_files = [os.path.join(config_dir, relpath) for relpath in manifest.find(f"{name}.yaml")]
     
     return (config_file, subconfig_files)
 
@@ -674,6 +1002,8 @@ def resolve_config(config_data, config_dir, debug=False):
     from copy import deepcopy
     from omegaconf import OmegaConf
     
+    # Chemins absolus: l'inventaire lit les chemins relatifs depuis sa racine
+    config_dir = os.path.abspath(config_dir)
     # Copier pour ne pas modifier l'original
     result = deepcopy(config_data)
     
@@ -688,7 +1018,7 @@ def resolve_config(config_data, config_dir, debug=False):
             # Cas 1: Référence simple comme "config"
             if isinstance(item, str):
                 ref_file = os.path.join(config_dir, f"{item}.yaml")
-                if os.path.isfile(ref_file):
+                if get_manifest(config_dir).isfile(ref_file):
                     with open(ref_file, 'r') as f:
                         ref_data = yaml.safe_load(f)
                         if ref_data:
@@ -703,7 +1033,7 @@ def resolve_config(config_data, config_dir, debug=False):
                     # Option simple comme string
                     if isinstance(option, str):
                         ref_file = os.path.join(config_dir, group, f"{option}.yaml")
-                        if os.path.isfile(ref_file):
+                        if get_manifest(config_dir).isfile(ref_file):
                             with open(ref_file, 'r') as f:
                                 group_data = yaml.safe_load(f)
                                 if group_data:
@@ -719,7 +1049,7 @@ def resolve_config(config_data, config_dir, debug=False):
                             
                         for sub_option in option:
                             ref_file = os.path.join(config_dir, group, f"{sub_option}.yaml")
-                            if os.path.isfile(ref_file):
+                            if get_manifest(config_dir).isfile(ref_file):
                                 with open(ref_file, 'r') as f:
                                     sub_data = yaml.safe_load(f)
                                     if sub_data:
@@ -0,0 +1,374 @@
+import bisect
+import hashlib
+import inspect
+import os
+import re
+from typing import Any, Dict, List, Optional
+from omegaconf import OmegaConf, DictConfig
+from .deps import DependencyGraph, normalize_key
+from .masking import is_secret, secret_paths
+
+# Interpolation de variable d'environnement: ${oc.env:VAR} ou ${oc.env:VAR,default}
+ENV_PATTERN = re.compile(r'^oc\.env:([^,}]+)(?:,(.*))?$')
+INTERPOLATION_PATTERN = re.compile(r'\$\{([^${}]+)\}')
+# Caractères remplacés pour dériver un nom de variable d'un chemin (voir env_name)
+ENV_NAME_PATTERN = re.compile(r'[^A-Za-z0-9]+')
+
+# Clés de composition qui n'ont pas leur place dans le module généré
+SKIPPED_KEYS = ("defaults",)
+
+
+def _fingerprint(config_dir):
+    # Recopiée telle quelle dans le module généré (voir generate_module)
+    import hashlib
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(config_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if not name.endswith((".yaml", ".yml")):
+                continue
+            file_path = os.path.join(root, name)
+            digest.update(os.path.relpath(file_path, config_dir).replace(os.sep, "/").encode())
+            with open(file_path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def env_name(path: str) -> str:
+    """Variable d'environnement lue à la place d'un secret écrit en clair.
+
+    La section ``secrets`` et sa copie promue à la racine lisent la même
+    variable. Exemples: ``db.password`` -> ``DB_PASSWORD``,
+    ``secrets.api.token`` -> ``API_TOKEN``
+    """
+    if path.startswith("secrets."):
+        path = path[len("secrets."):]
+    return ENV_NAME_PATTERN.sub("_", path).strip("_").upper()
+
+
+def source_fingerprint(config_dir: str, cfg_name: str = "config") -> str:
+    """Calcule l'empreinte des fichiers YAML d'un répertoire de configuration.
+
+    Args:
+        config_dir: Répertoire de configuration (.hydra-conf)
+        cfg_name: Nom de la configuration compilée
+
+    Returns:
+        str: Empreinte hexadécimale
+    """
+    digest = hashlib.sha256(cfg_name.encode())
+    digest.update(_fingerprint(config_dir).encode())
+    return digest.hexdigest()
+
+
+class _ExpressionBuilder:
+    """Traduit les valeurs de configuration en expressions Python."""
+
+    def __init__(self, cfg: DictConfig):
+        self.cfg = cfg
+        self.raw = OmegaConf.to_container(cfg, resolve=False)
+        # Valeurs ${secret:...} et interpolations qui y mènent: jamais traduites
+        self.secrets = secret_paths(self.raw)
+        # Chemins résolus à l'import du module (voir _RUNTIME_SOURCE)
+        self.runtime: List[str] = []
+        # Secrets écrits en clair: chemin -> variable d'environnement lue à leur place
+        self.environ: Dict[str, str] = {}
+
+    def _is_literal_secret(self, value: Any, path: str) -> bool:
+        return value is not None and value != "???" and is_secret(path, self.secrets)
+
+    def _raw_value(self, dotted: str):
+        node = self.raw
+        for key in dotted.split('.'):
+            if isinstance(node, dict) and key in node:
+                node = node[key]
+            else:
+                raise KeyError(dotted)
+        return node
+
+    def value(self, value: Any, path: str, seen: Optional[set] = None) -> str:
+        """Retourne l'expression Python d'une valeur non résolue."""
+        if isinstance(value, dict):
+            items = ", ".join(
+                f"{key!r}: {self.value(item, f'{path}.{key}', seen)}"
+                for key, item in value.items()
+            )
+            return f"_ro({{{items}}})"
+        if isinstance(value, list):
+            items = "".join(
+                f"{self.value(item, f'{path}[{i}]', seen)}, " for i, item in enumerate(value)
+            )
+            return f"({items})"
+        if isinstance(value, str) and "${" in value:
+            # Une référence à un secret se traduit vers sa cible: lecture de
+            # os.environ, ou _resolve pour ${secret:...} et les résolveurs
+            return self.interpolation(value, path, seen or set())
+        if self._is_literal_secret(value, path):
+            # Jamais recopié dans le module: lu dans l'environnement à l'import
+            self.environ[path] = env_name(path)
+            return f"os.environ[{self.environ[path]!r}]"
+        return repr(value)
+
+    def runtime_tree(self) -> dict:
+        """Configuration non résolue réduite à ce que ``_resolve`` lit.
+
+        Sont conservés les chemins résolus à l'import et, transitivement, les
+        clés qu'ils référencent (``DependencyGraph``); une liste traversée est
+        gardée entière. Les autres valeurs, dont les secrets, ne sont pas
+        recopiées une seconde fois dans le module.
+        """
+        graph = DependencyGraph.build(self.raw)
+        ordered = sorted(graph.references)
+        needed = set()
+        pending = [normalize_key(path) for path in self.runtime]
+        while pending:
+            path = pending.pop()
+            if path in needed:
+                continue
+            needed.add(path)
+            # Ancêtre interpolé (${a.b} avec a = ${x}): sa cible est lue aussi
+            parts = path.split(".")
+            for index in range(1, len(parts)):
+                pending.extend(graph.references.get(".".join(parts[:index]), ()))
+            # Valeurs interpolées de ce sous-arbre: leurs cibles sont lues aussi
+            position = bisect.bisect_left(ordered, path)
+            while position < len(ordered) and (ordered[position] == path or ordered[position].startswith(f"{path}.")):
+                pending.extend(graph.references[ordered[position]])
+                position += 1
+        prefixes = {".".join(path.split(".")[:index]) for path in needed for index in range(1, path.count(".") + 1)}
+
+        def subset(value, path):
+            if path in needed or not isinstance(value, dict):
+                return value
+            children = ((key, f"{path}.{key}" if path else str(key)) for key in value)
+            return {key: subset(value[key], child) for key, child in children
+                    if child in needed or child in prefixes}
+
+        return {key: self.runtime_value(value, str(key)) for key, value in subset(self.raw, "").items()
+                if key not in SKIPPED_KEYS}
+
+    def runtime_value(self, value: Any, path: str) -> Any:
+        """Valeur non résolue embarquée pour ``_resolve``, secrets en clair remplacés par ``oc.env``."""
+        if isinstance(value, dict):
+            return {key: self.runtime_value(item, f"{path}.{key}" if path else str(key))
+                    for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.runtime_value(item, f"{path}[{i}]") for i, item in enumerate(value)]
+        if not (isinstance(value, str) and "${" in value) and self._is_literal_secret(value, path):
+            return f"${{oc.env:{env_name(path)}}}"
+        return value
+
+    def _runtime(self, path: str) -> str:
+        # Jamais de valeur résolue à la compilation: elle figerait l'environnement
+        # (oc.env, secrets) dans le fichier généré
+        self.runtime.append(path)
+        return f"_resolve({path!r})"
+
+    def interpolation(self, value: str, path: str, seen: set) -> str:
+        if "${" in INTERPOLATION_PATTERN.sub("", value):
+            # Interpolations imbriquées: résolues à l'import
+            return self._runtime(path)
+
+        parts = []
+        position = 0
+        try:
+            for match in INTERPOLATION_PATTERN.finditer(value):
+                if match.start() > position:
+                    parts.append(repr(value[position:match.start()]))
+                parts.append(f"str({self.reference(match.group(1), seen)})")
+                position = match.end()
+        except (KeyError, ValueError):
+            # Résolveur personnalisé ou référence relative: résolus à l'import
+            return self._runtime(path)
+        if position < len(value):
+            parts.append(repr(value[position:]))
+
+        if len(parts) == 1:
+            # Interpolation seule: on conserve le type de la cible
+            return parts[0][len("str("):-1]
+        return " + ".join(parts)
+
+    def reference(self, body: str, seen: set) -> str:
+        env = ENV_PATTERN.match(body.strip())
+        if env:
+            var, default = env.groups()
+            var = var.strip()
+            if default is None:
+                return f"os.environ[{var!r}]"
+            default = default.strip()
+            if default == "null":
+                return f"os.environ.get({var!r})"
+            if len(default) >= 2 and default[0] == default[-1] and default[0] in "'\"":
+                default = default[1:-1]
+            return f"os.environ.get({var!r}, {default!r})"
+
+        if ":" in body:
+            # Résolveur personnalisé (secret:..., etc.)
+            raise ValueError(body)
+
+        target = body.strip()
+        if target in seen:
+            raise ValueError(f"Référence circulaire: {target}")
+        return f"({self.value(self._raw_value(target), target, seen | {target})})"
+
+
+# Recopié dans le module généré quand des interpolations doivent être résolues à
+# l'import: OmegaConf et les résolveurs enregistrés (secrets...) sont alors requis
+_RUNTIME_SOURCE = '''
+_RUNTIME = None
+
+
+def _resolve(path):
+    """Résout à l'import une interpolation non traduite (résolveurs, imbrication)."""
+    global _RUNTIME
+    from omegaconf import OmegaConf
+    if _RUNTIME is None:
+        _RUNTIME = OmegaConf.create(_RAW)
+    value = OmegaConf.select(_RUNTIME, path, throw_on_missing=True)
+    return OmegaConf.to_container(value, resolve=True) if OmegaConf.is_config(value) else value
+'''
+
+
+def generate_module(reader, config_dir: Optional[str] = None) -> str:
+    """Génère le code source d'un module Python à partir d'une configuration.
+
+    Les valeurs sont figées en constantes (dictionnaires en lecture seule,
+    tuples), sauf les variables d'environnement (``oc.env``) qui restent des
+    lectures de ``os.environ`` pour ne jamais écrire de secrets sur disque.
+    Un secret écrit en clair (section ``secrets``, clé sensible) devient de
+    même une lecture de la variable dérivée de son chemin (``env_name``):
+    ``os.environ['DB_PASSWORD']`` pour ``db.password``.
+    Les interpolations qui ne se traduisent pas en Python (résolveurs
+    personnalisés comme ``secret``, interpolations imbriquées, références
+    relatives) sont résolues par OmegaConf à l'import du module, à partir de
+    la partie de la configuration non résolue qu'elles lisent (``_RAW``).
+
+    Args:
+        reader: TheReader dont la configuration est compilée
+        config_dir: Répertoire source utilisé pour l'empreinte
+
+    Returns:
+        str: Code source du module
+    """
+    config_dir = os.path.abspath(config_dir or reader.get_config_dir())
+    fingerprint = source_fingerprint(config_dir, reader.cfg_name)
+    builder = _ExpressionBuilder(reader.cfg)
+
+    lines: List[str] = [
+        '"""Configuration générée par `buddy compile` - ne pas modifier."""',
+        "import os",
+        "from types import MappingProxyType as _ro",
+        "",
+        f"__config_name__ = {reader.cfg_name!r}",
+        f"__source__ = {config_dir!r}",
+        f"__fingerprint__ = {fingerprint!r}",
+        "",
+    ]
+
+    constants = []
+    definitions: List[str] = []
+    for key, value in builder.raw.items():
+        if key in SKIPPED_KEYS:
+            continue
+        expression = builder.value(value, str(key))
+        name = str(key).upper()
+        if str(key).isidentifier() and name != "CONFIG":
+            definitions.append(f"{name} = {expression}")
+            constants.append((key, name))
+        else:
+            constants.append((key, expression))
+
+    if builder.runtime:
+        # Partie de la configuration non résolue lue par _resolve, avant les constantes qui l'utilisent
+        lines += [f"_RAW = {builder.runtime_tree()!r}", *_RUNTIME_SOURCE.strip("\n").split("\n"), "", ""]
+    lines += definitions
+
+    items = ", ".join(f"{key!r}: {name}" for key, name in constants)
+    lines += [
+        "",
+        f"CONFIG = _ro({{{items}}})",
+        "",
+        "",
+        inspect.getsource(_fingerprint),
+        "",
+        "def is_stale():",
+        '    """Indique si les fichiers source ont changé depuis la compilation."""',
+        "    import hashlib",
+        "    if not os.path.isdir(__source__):",
+        "        return True",
+        "    digest = hashlib.sha256(__config_name__.encode())",
+        "    digest.update(_fingerprint(__source__).encode())",
+        "    return digest.hexdigest() != __fingerprint__",
+        "",
+        "",
+        'if os.environ.get("BUDDY_CHECK_FINGERPRINT") and is_stale():',
+        "    import warnings",
+        "    warnings.warn(f\"Configuration compilée obsolète: recompiler depuis {__source__}\")",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def _stub_type(value: Any) -> str:
+    if isinstance(value, dict):
+        return "Mapping[str, Any]"
+    if isinstance(value, list):
+        return "Tuple[Any, ...]"
+    if isinstance(value, str) and "${" in value:
+        return "Any"
+    if value is None:
+        return "None"
+    return type(value).__name__
+
+
+def generate_stub(reader) -> str:
+    """Génère le fichier .pyi correspondant au module compilé."""
+    raw = OmegaConf.to_container(reader.cfg, resolve=False)
+    secrets = secret_paths(raw)
+    lines = [
+        "from typing import Any, Mapping, Tuple",
+        "",
+        "__config_name__: str",
+        "__source__: str",
+        "__fingerprint__: str",
+        "",
+    ]
+    for key, value in raw.items():
+        name = str(key).upper()
+        if key in SKIPPED_KEYS or not str(key).isidentifier() or name == "CONFIG":
+            continue
+        literal = not isinstance(value, (dict, list)) and value is not None and "${" not in str(value)
+        # Secret en clair: lu dans os.environ, donc une chaîne
+        lines.append(f"{name}: {'str' if literal and is_secret(str(key), secrets) else _stub_type(value)}")
+    lines += [
+        "CONFIG: Mapping[str, Any]",
+        "",
+        "def is_stale() -> bool: ...",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def compile_module(reader, output: str, stub: bool = False, config_dir: Optional[str] = None) -> List[str]:
+    """Écrit le module compilé (et optionnellement son .pyi) sur disque.
+
+    Args:
+        reader: TheReader à compiler
+        output: Chemin du fichier .py à générer
+        stub: Générer aussi le fichier .pyi
+        config_dir: Répertoire source utilisé pour l'empreinte
+
+    Returns:
+        list: Chemins des fichiers écrits
+    """
+    written = []
+    with open(output, 'w') as f:
+        f.write(generate_module(reader, config_dir))
+    written.append(output)
+
+    if stub:
+        stub_path = os.path.splitext(output)[0] + ".pyi"
+        with open(stub_path, 'w') as f:
+            f.write(generate_stub(reader))
+        written.append(stub_path)
+    return written
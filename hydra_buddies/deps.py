@@ -0,0 +1,295 @@
+import bisect
+import heapq
+import re
+from typing import Any, Dict, Iterable, List, Set
+
+# Interpolations les plus internes: ${a.b}, ${.sibling}, ${oc.select:a.b,défaut}
+INTERPOLATION_PATTERN = re.compile(r"\$\{([^${}]+)\}")
+INDEX_PATTERN = re.compile(r"\[(\d+)\]")
+KEY_PATTERN = re.compile(r"^\.*[A-Za-z_0-9][\w.\-\[\]]*$")
+# Résolveurs dont le premier argument est une clé de la configuration
+KEY_RESOLVERS = ("oc.select",)
+# Variables d'environnement lues par ${oc.env:NOM} et ${oc.env:NOM,défaut}
+ENV_PATTERN = re.compile(r"oc\.env:\s*([A-Za-z_][A-Za-z0-9_]*)")
+
+
+class InterpolationCycleError(ValueError):
+    """Cycle dans les interpolations de la configuration."""
+
+    def __init__(self, cycles: List[List[str]]):
+        self.cycles = cycles
+        described = "; ".join(" -> ".join(cycle + cycle[:1]) for cycle in cycles)
+        super().__init__(f"Cycle d'interpolation détecté: {described}")
+
+
+def normalize_key(key: str) -> str:
+    """Normalise un chemin de clé: ``a.b[0].c`` -> ``a.b.0.c``."""
+    return INDEX_PATTERN.sub(r".\1", key).strip(".")
+
+
+def _absolute(ref: str, path: str) -> str:
+    if not ref.startswith("."):
+        return normalize_key(ref)
+    # ${.x}: frère du nœud, ${..x}: frère du parent, etc.
+    depth = len(ref) - len(ref.lstrip("."))
+    parts = path.split(".")[:-depth] if path else []
+    rest = normalize_key(ref[depth:])
+    return ".".join(parts + ([rest] if rest else []))
+
+
+def references(value: Any, path: str = "") -> Set[str]:
+    """Retourne les clés (absolues) référencées par une valeur brute."""
+    if not isinstance(value, str) or "${" not in value:
+        return set()
+    targets = set()
+    for expression in INTERPOLATION_PATTERN.findall(value):
+        expression = expression.strip()
+        if ":" in expression:
+            resolver, _, args = expression.partition(":")
+            if resolver.strip() not in KEY_RESOLVERS:
+                continue
+            expression = args.split(",", 1)[0].strip()
+        if KEY_PATTERN.match(expression):
+            targets.add(_absolute(expression, path))
+    return targets
+
+
+def env_references(value: Any) -> Set[str]:
+    """Retourne les variables d'environnement lues directement par une valeur brute."""
+    if not isinstance(value, str) or "${" not in value:
+        return set()
+    return set(ENV_PATTERN.findall(value))
+
+
+def related_keys(path: str, keys: Dict[str, Any], ordered: List[str]) -> List[str]:
+    """Clés de ``keys`` liées à ``path``: le chemin lui-même, ses ancêtres et ses descendants.
+
+    Args:
+        path: Chemin pointé
+        keys: Ensemble indexé des clés candidates
+        ordered: Les mêmes clés triées (recherche des descendants par préfixe)
+    """
+    if not path:
+        return list(ordered)
+    parts = path.split(".")
+    found = [ancestor for ancestor in (".".join(parts[:i]) for i in range(1, len(parts) + 1))
+             if ancestor in keys]
+    if "" in keys:
+        found.append("")
+    prefix = path + "."
+    position = bisect.bisect_left(ordered, prefix)
+    while position < len(ordered) and ordered[position].startswith(prefix):
+        found.append(ordered[position])
+        position += 1
+    return found
+
+
+def _flatten(data: Any, prefix: str = ""):
+    if isinstance(data, dict):
+        for key, value in data.items():
+            yield from _flatten(value, f"{prefix}.{key}" if prefix else str(key))
+    elif isinstance(data, list):
+        for index, value in enumerate(data):
+            yield from _flatten(value, f"{prefix}.{index}" if prefix else str(index))
+    elif prefix:
+        yield prefix, data
+
+
+class DependencyGraph:
+    """Graphe des dépendances entre interpolations d'une configuration.
+
+    Chaque valeur interpolée (``database.credentials.username``) pointe vers
+    les clés qu'elle référence (``database.readonly.username``). Une
+    référence à une section dépend de toutes les valeurs de cette section.
+    Les chemins utilisent des points, y compris pour les indices de liste.
+
+    Attributes:
+        references: Valeur interpolée -> clés référencées
+        referrers: Clé référencée -> valeurs interpolées qui la référencent
+        environment: Valeur interpolée -> variables d'environnement lues (``oc.env``)
+        source: Objet de configuration dont le graphe est issu
+    """
+
+    def __init__(self, source: Any = None):
+        self.references: Dict[str, Set[str]] = {}
+        self.referrers: Dict[str, Set[str]] = {}
+        self.environment: Dict[str, Set[str]] = {}
+        self.source = source
+
+    @classmethod
+    def build(cls, data: Any, source: Any = None) -> "DependencyGraph":
+        """Construit le graphe d'une configuration non résolue (conteneur Python)."""
+        return cls.from_leaves(_flatten(data), source)
+
+    @classmethod
+    def from_leaves(cls, leaves: Iterable, source: Any = None) -> "DependencyGraph":
+        """Construit le graphe à partir de paires ``(chemin normalisé, valeur brute)``."""
+        graph = cls(source)
+        for path, value in leaves:
+            graph._add(path, value)
+        return graph
+
+    def _add(self, path: str, value: Any):
+        names = env_references(value)
+        if names:
+            self.environment[path] = names
+        targets = references(value, path)
+        if not targets:
+            return
+        self.references[path] = targets
+        for target in targets:
+            self.referrers.setdefault(target, set()).add(path)
+
+    def _remove(self, path: str):
+        self.environment.pop(path, None)
+        for target in self.references.pop(path, ()):
+            referrers = self.referrers.get(target)
+            if referrers is not None:
+                referrers.discard(path)
+                if not referrers:
+                    del self.referrers[target]
+
+    def update(self, path: str, value: Any):
+        """Remplace le sous-arbre ``path`` par une nouvelle valeur brute."""
+        path = normalize_key(path)
+        for existing in [p for p in {**self.references, **self.environment}
+                         if p == path or p.startswith(path + ".")]:
+            self._remove(existing)
+        if isinstance(value, (dict, list)):
+            for child, leaf in _flatten(value, path):
+                self._add(child, leaf)
+        else:
+            self._add(path, value)
+
+    def dependencies(self, path: str) -> Set[str]:
+        """Clés directement référencées par la valeur ``path``."""
+        return set(self.references.get(normalize_key(path), ()))
+
+    def dependents(self, path: str) -> Set[str]:
+        """Valeurs interpolées qui dépendent, même indirectement, de ``path``."""
+        targets = sorted(self.referrers)
+        found: Set[str] = set()
+        pending = [normalize_key(path)]
+        while pending:
+            for target in related_keys(pending.pop(), self.referrers, targets):
+                for dependent in self.referrers[target]:
+                    if dependent not in found:
+                        found.add(dependent)
+                        pending.append(dependent)
+        return found
+
+    def environment_of(self, path: str) -> Set[str]:
+        """Variables d'environnement dont dépend, même indirectement, la valeur ``path``."""
+        interpolated = {**self.references, **self.environment}
+        ordered = sorted(interpolated)
+        found: Set[str] = set()
+        seen: Set[str] = set()
+        pending = [normalize_key(path)]
+        while pending:
+            for leaf in related_keys(pending.pop(), interpolated, ordered):
+                if leaf not in seen:
+                    seen.add(leaf)
+                    found |= self.environment.get(leaf, set())
+                    pending.extend(self.references.get(leaf, ()))
+        return found
+
+    def env_dependents(self, names: Iterable[str]) -> Set[str]:
+        """Valeurs interpolées qui dépendent, même indirectement, de ces variables d'environnement."""
+        names = set(names)
+        found = {path for path, used in self.environment.items() if used & names}
+        for path in list(found):
+            found |= self.dependents(path)
+        return found
+
+    def _edges(self) -> Dict[str, Set[str]]:
+        """Pour chaque valeur interpolée, les valeurs interpolées dont elle dépend."""
+        interpolated = sorted(self.references)
+        return {
+            path: {
+                other
+                for target in targets
+                for other in related_keys(target, self.references, interpolated)
+            }
+            for path, targets in self.references.items()
+        }
+
+    def cycles(self) -> List[List[str]]:
+        """Retourne les cycles (composantes fortement connexes) du graphe."""
+        edges = self._edges()
+        index: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
+        cycles = []
+
+        def connect(root):
+            # Algorithme de Tarjan, itératif: pas de limite de récursion sur les longues chaînes
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(sorted(edges[root])))]
+            while work:
+                node, children = work[-1]
+                for other in children:
+                    if other not in index:
+                        index[other] = low[other] = len(index)
+                        stack.append(other)
+                        on_stack.add(other)
+                        work.append((other, iter(sorted(edges[other]))))
+                        break
+                    if other in on_stack:
+                        low[node] = min(low[node], index[other])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+                    if low[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        if len(component) > 1 or node in edges[node]:
+                            cycles.append(sorted(component))
+
+        for node in sorted(edges):
+            if node not in index:
+                connect(node)
+        return sorted(cycles)
+
+    def order(self) -> List[str]:
+        """Ordre de résolution: chaque valeur après celles dont elle dépend.
+
+        Raises:
+            InterpolationCycleError: Si les interpolations forment un cycle
+        """
+        edges = self._edges()
+        remaining = {path: set(deps) for path, deps in edges.items()}
+        dependents: Dict[str, Set[str]] = {}
+        for path, deps in edges.items():
+            for dep in deps:
+                dependents.setdefault(dep, set()).add(path)
+
+        ready = [path for path, deps in remaining.items() if not deps]
+        heapq.heapify(ready)
+        ordered = []
+        while ready:
+            path = heapq.heappop(ready)
+            ordered.append(path)
+            for dependent in dependents.get(path, ()):
+                deps = remaining[dependent]
+                deps.discard(path)
+                if not deps:
+                    heapq.heappush(ready, dependent)
+        if len(ordered) != len(edges):
+            raise InterpolationCycleError(self.cycles())
+        return ordered
+
+    def __len__(self):
+        return len(self.references)
+
+    def __iter__(self) -> Iterable[str]:
+        return iter(self.references)
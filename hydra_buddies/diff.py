@@ -0,0 +1,93 @@
+from typing import Any, Dict, Iterable, List, Optional
+from .masking import is_secret, mask, secret_paths
+from .merkle import HashedNode, hash_tree
+
+
+def _join(path: str, key) -> str:
+    if isinstance(key, int):
+        return f"{path}[{key}]"
+    return f"{path}.{key}" if path else str(key)
+
+
+def _source(provenance: Dict[str, str], path: str) -> Optional[str]:
+    if path in provenance:
+        return provenance[path]
+    for candidate, source in provenance.items():
+        if candidate.startswith(path + ".") or candidate.startswith(path + "["):
+            return source
+    return None
+
+
+class _Differ:
+    def __init__(self, mask_secrets: bool, secrets, provenance_a, provenance_b):
+        self.mask_secrets = mask_secrets
+        self.secrets = secrets
+        self.provenance_a = provenance_a or {}
+        self.provenance_b = provenance_b or {}
+        self.changes: List[Dict[str, Any]] = []
+
+    def _masked(self, value: Any, path: str) -> Any:
+        if not self.mask_secrets:
+            return value
+        if isinstance(value, dict):
+            return {key: self._masked(item, _join(path, key)) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._masked(item, _join(path, index)) for index, item in enumerate(value)]
+        return mask(value) if is_secret(path, self.secrets) else value
+
+    def _emit(self, path: str, change: str, old: Any, new: Any):
+        self.changes.append({
+            "path": path,
+            "change": change,
+            "old": self._masked(old, path),
+            "new": self._masked(new, path),
+            "old_source": _source(self.provenance_a, path) if change != "added" else None,
+            "new_source": _source(self.provenance_b, path) if change != "removed" else None,
+        })
+
+    def walk(self, path: str, old: Any, new: Any, old_node: HashedNode, new_node: HashedNode):
+        if old_node.digest == new_node.digest:
+            # Sous-arbres identiques: rien à parcourir
+            return
+        same_kind = (isinstance(old, dict) and isinstance(new, dict)) or (
+            isinstance(old, list) and isinstance(new, list)
+        )
+        if not same_kind:
+            self._emit(path, "changed", old, new)
+            return
+
+        old_keys = old_node.children
+        new_keys = new_node.children
+        for key in old_keys:
+            child_path = _join(path, key)
+            if key not in new_keys:
+                self._emit(child_path, "removed", old[key], None)
+            else:
+                self.walk(child_path, old[key], new[key], old_keys[key], new_keys[key])
+        for key in new_keys:
+            if key not in old_keys:
+                self._emit(_join(path, key), "added", None, new[key])
+
+
+def diff_trees(old: Dict[str, Any], new: Dict[str, Any], mask_secrets: bool = True,
+               provenance_a: Optional[Dict[str, str]] = None,
+               provenance_b: Optional[Dict[str, str]] = None,
+               secrets: Iterable[str] = ()) -> List[Dict[str, Any]]:
+    """Compare structurellement deux configurations.
+
+    Args:
+        old: Première configuration (dictionnaire Python)
+        new: Seconde configuration
+        mask_secrets: Masquer les valeurs sensibles
+        provenance_a: Sources des clés de la première configuration
+        provenance_b: Sources des clés de la seconde configuration
+        secrets: Chemins sensibles supplémentaires (``secret_paths`` des configurations
+            non résolues, quand ``old`` et ``new`` sont résolues)
+
+    Returns:
+        list: Différences ``{path, change, old, new, old_source, new_source}``
+        où ``change`` vaut ``added``, ``removed`` ou ``changed``
+    """
+    differ = _Differ(mask_secrets, secret_paths(old) | secret_paths(new) | set(secrets), provenance_a, provenance_b)
+    differ.walk("", old, new, hash_tree(old), hash_tree(new))
+    return differ.changes
@@ -0,0 +1,227 @@
+import os
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from .cache import CACHE_DIRNAME, load_json, save_json
+
+CONFIG_DIRNAME = ".hydra-conf"
+ROOTS_VERSION = 1
+ROOTS_FILENAME = "roots.json"
+
+# Répertoires jamais parcourus (dépendances, environnements, artefacts)
+PRUNED_DIRS = frozenset({
+    "node_modules", "__pycache__", "site-packages", "venv",
+    "build", "dist", "target", CACHE_DIRNAME,
+})
+
+# Voir manifest.RACY_WINDOW_NS
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def _glob_regex(pattern: str) -> str:
+    """Traduit un motif ``.gitignore`` en expression régulière (sans ancrage)."""
+    regex, index = [], 0
+    while index < len(pattern):
+        if pattern.startswith("**/", index):
+            regex.append("(?:.*/)?")
+            index += 3
+        elif pattern.startswith("/**", index) and index + 3 == len(pattern):
+            regex.append("/.*")
+            index += 3
+        elif pattern[index] == "*":
+            regex.append("[^/]*")
+            index += 1
+        elif pattern[index] == "?":
+            regex.append("[^/]")
+            index += 1
+        else:
+            regex.append(re.escape(pattern[index]))
+            index += 1
+    return "".join(regex)
+
+
+class IgnoreRules:
+    """Règles ``.gitignore`` accumulées depuis la racine du dépôt.
+
+    Seuls les répertoires sont testés: un répertoire ignoré n'est pas
+    parcouru. Les motifs sont relatifs au répertoire de leur fichier
+    ``.gitignore``; ``!motif`` ré-inclut, ``motif/`` ne vise que les
+    répertoires, un motif sans ``/`` s'applique à toute profondeur.
+    """
+
+    def __init__(self, rules: Tuple[tuple, ...] = ()):
+        self.rules = rules
+
+    def extended(self, reldir: str, lines: Sequence[str]) -> "IgnoreRules":
+        """Retourne les règles complétées par le ``.gitignore`` de ``reldir``."""
+        rules = list(self.rules)
+        for line in lines:
+            line = line.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            line = line.rstrip("/")
+            if not line:
+                continue
+            if "/" in line.lstrip("/"):
+                regex = _glob_regex(line.lstrip("/"))
+            elif line.startswith("/"):
+                regex = _glob_regex(line[1:])
+            else:
+                regex = "(?:.*/)?" + _glob_regex(line)
+            rules.append((reldir, re.compile(regex + "$"), negate))
+        return IgnoreRules(tuple(rules)) if len(rules) != len(self.rules) else self
+
+    def ignored(self, relpath: str) -> bool:
+        """Indique si le répertoire ``relpath`` (relatif au dépôt) est ignoré."""
+        result = False
+        for base, regex, negate in self.rules:
+            if base:
+                if not relpath.startswith(base + "/"):
+                    continue
+                relative = relpath[len(base) + 1:]
+            else:
+                relative = relpath
+            if regex.match(relative):
+                result = not negate
+        return result
+
+
+def _scan(top: str, reldir: str, cached: Optional[list]) -> list:
+    """Entrée d'un répertoire: ``[mtime, mtime du .gitignore, sous-répertoires, lignes du .gitignore]``.
+
+    Le répertoire n'est relu que si sa date ou celle de son ``.gitignore`` a changé.
+    """
+    directory = os.path.join(top, *reldir.split("/")) if reldir else top
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        return [None, None, [], []]
+    try:
+        ignore_mtime = os.stat(os.path.join(directory, ".gitignore")).st_mtime_ns
+    except OSError:
+        ignore_mtime = None
+    if cached and cached[0] == mtime and cached[1] == ignore_mtime:
+        return cached
+
+    subdirs = []
+    try:
+        with os.scandir(directory) as scan:
+            for item in scan:
+                # Liens symboliques non suivis (boucles, arbres externes)
+                if item.is_dir(follow_symlinks=False):
+                    subdirs.append(item.name)
+    except OSError:
+        return [None, None, [], []]
+    lines = []
+    if ignore_mtime is not None:
+        try:
+            with open(os.path.join(directory, ".gitignore"), "r", encoding="utf-8", errors="replace") as f:
+                lines = f.readlines()
+        except OSError:
+            pass
+    now = time.time_ns()
+    if now - mtime < RACY_WINDOW_NS or (ignore_mtime is not None and now - ignore_mtime < RACY_WINDOW_NS):
+        mtime = -1
+    return [mtime, ignore_mtime, sorted(subdirs), lines]
+
+
+def discover(top: str = ".", jobs: Optional[int] = None, use_cache: bool = True) -> List[str]:
+    """Recherche tous les répertoires ``.hydra-conf`` d'un dépôt, en parallèle.
+
+    Les répertoires ignorés par un ``.gitignore``, les répertoires cachés et
+    ceux de ``PRUNED_DIRS`` ne sont pas parcourus. La liste des répertoires
+    est conservée dans ``.buddy-cache/roots.json``: un répertoire dont la
+    date (et celle de son ``.gitignore``) n'a pas changé n'est pas relu.
+
+    Args:
+        top: Racine du dépôt
+        jobs: Nombre de threads de parcours (défaut: choix de ``ThreadPoolExecutor``)
+        use_cache: Réutiliser et mettre à jour le cache du parcours
+
+    Returns:
+        list: Chemins absolus des répertoires de configuration, triés
+    """
+    top = os.path.abspath(top)
+    cache_file = os.path.join(top, CACHE_DIRNAME, ROOTS_FILENAME)
+    previous: Dict[str, list] = {}
+    if use_cache:
+        data = load_json(cache_file, {})
+        if data.get("version") == ROOTS_VERSION and data.get("top") == top:
+            previous = data.get("entries", {})
+
+    entries: Dict[str, list] = {}
+    roots = []
+    with ThreadPoolExecutor(jobs) as pool:
+        pending = {pool.submit(_scan, top, "", previous.get("")): ("", IgnoreRules())}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                reldir, rules = pending.pop(future)
+                entry = entries[reldir] = future.result()
+                rules = rules.extended(reldir, entry[3])
+                for name in entry[2]:
+                    child = f"{reldir}/{name}" if reldir else name
+                    if rules.ignored(child):
+                        continue
+                    if name == CONFIG_DIRNAME:
+                        roots.append(os.path.join(top, *child.split("/")))
+                    elif not name.startswith(".") and name not in PRUNED_DIRS:
+                        pending[pool.submit(_scan, top, child, previous.get(child))] = (child, rules)
+
+    if use_cache and entries != previous:
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            save_json(cache_file, {"version": ROOTS_VERSION, "top": top, "entries": entries})
+        except OSError:
+            pass
+    return sorted(roots)
+
+
+def _run_on_root(task) -> Dict[str, Any]:
+    """Exécute une commande du CLI pour une racine (dans un worker)."""
+    import click
+    from .batch import capture
+    from .cli import cli
+
+    name, params, root, paths = task
+    project = os.path.dirname(root)
+    params = {**params, "path": root}
+    for key in paths:
+        # Chemins relatifs au projet de la racine, pas au répertoire courant
+        if params.get(key) and not os.path.isabs(params[key]):
+            params[key] = os.path.join(project, params[key])
+    command = cli.commands[name]
+    with click.Context(command, info_name=name):
+        result = capture(command.callback, **params)
+    return {"root": root, **result}
+
+
+def run_on_roots(name: str, params: Dict[str, Any], roots: Sequence[str],
+                 processes: Optional[int] = None, paths: Sequence[str] = ()) -> Iterator[Dict[str, Any]]:
+    """Exécute une commande du CLI pour chaque racine, dans un pool de processus.
+
+    Args:
+        name: Nom de la commande (``cli.commands``)
+        params: Paramètres de la commande (``path`` est remplacé par chaque racine)
+        roots: Répertoires de configuration
+        processes: Nombre de processus (défaut: nombre de CPU, 1 = sans pool)
+        paths: Paramètres dont les chemins relatifs sont résolus depuis le
+            projet de chaque racine (répertoire parent de ``.hydra-conf``)
+
+    Yields:
+        dict: ``root``, ``exit_code``, ``output`` et ``error``, dans l'ordre des racines
+    """
+    tasks = [(name, params, root, tuple(paths)) for root in roots]
+    if not tasks:
+        return
+    processes = min(processes or os.cpu_count() or 1, len(tasks))
+    if processes <= 1:
+        for task in tasks:
+            yield _run_on_root(task)
+        return
+    with ProcessPoolExecutor(processes) as pool:
+        yield from pool.map(_run_on_root, tasks)
@@ -0,0 +1,204 @@
+import json
+import re
+from typing import Any, Iterator, Set
+from omegaconf import DictConfig, ListConfig, OmegaConf
+from .masking import is_secret, mask, secret_leaves
+
+FORMATS = ("json", "jsonl", "msgpack", "dotenv")
+# Taille des morceaux produits (les jetons sont regroupés avant écriture)
+CHUNK_SIZE = 64 * 1024
+DOTENV_SAFE = re.compile(r"^[A-Za-z0-9_./:@+\-]*$")
+
+
+def _raw_leaves(node: Any, path: str = ""):
+    """Produit les feuilles ``(chemin normalisé, valeur brute)`` d'un arbre OmegaConf, sans le convertir."""
+    if isinstance(node, (DictConfig, ListConfig)):
+        if node._is_none() or node._is_missing() or node._is_interpolation():
+            if path:
+                yield path, node._value()
+            return
+        keys = range(len(node)) if isinstance(node, ListConfig) else node.keys()
+        for key in keys:
+            yield from _raw_leaves(node._get_node(key), f"{path}.{key}" if path else str(key))
+    elif path:
+        yield path, node._value()
+
+
+class _Walker:
+    """Parcourt un arbre OmegaConf nœud par nœud, sans le convertir en entier."""
+
+    def __init__(self, cfg: DictConfig, resolve: bool, mask_secrets: bool):
+        self.resolve = resolve
+        self.mask_secrets = mask_secrets
+        # Chemins sensibles, relevés sur les valeurs brutes (${secret:...} et leurs références)
+        self.known: Set[str] = secret_leaves(_raw_leaves(cfg)) if mask_secrets else set()
+
+    def children(self, node: Any, path: str):
+        """Produit ``(clé, chemin, enfant)``; l'enfant est un conteneur ou une valeur feuille."""
+        if isinstance(node, (DictConfig, ListConfig)):
+            is_list = isinstance(node, ListConfig)
+            keys = range(len(node)) if is_list else node.keys()
+            for key in keys:
+                child_path = f"{path}[{key}]" if is_list else (f"{path}.{key}" if path else str(key))
+                yield key, child_path, self._child(node, key)
+        elif isinstance(node, dict):
+            for key, value in node.items():
+                yield key, f"{path}.{key}" if path else str(key), value
+        else:
+            for index, value in enumerate(node):
+                yield index, f"{path}[{index}]", value
+
+    def _child(self, node, key):
+        child = node._get_node(key)
+        if isinstance(child, (DictConfig, ListConfig)) and not child._is_none() \
+                and not child._is_missing() and not child._is_interpolation():
+            return child
+        if child._is_missing():
+            return "???"
+        if child._is_interpolation():
+            if not self.resolve:
+                return child._value()
+            value = node[key]
+            if isinstance(value, (DictConfig, ListConfig)):
+                return OmegaConf.to_container(value, resolve=True)
+            return value
+        return None if isinstance(child, (DictConfig, ListConfig)) else child._value()
+
+    def leaf(self, path: str, value: Any) -> Any:
+        if self.mask_secrets and is_secret(path, self.known):
+            return mask(value)
+        return value
+
+
+def _is_container(value: Any) -> bool:
+    return isinstance(value, (DictConfig, ListConfig, dict, list))
+
+
+def _json_tokens(walker: _Walker, node: Any, path: str) -> Iterator[str]:
+    is_list = isinstance(node, (ListConfig, list))
+    yield "[" if is_list else "{"
+    first = True
+    for key, child_path, child in walker.children(node, path):
+        if not first:
+            yield ","
+        first = False
+        if not is_list:
+            yield json.dumps(str(key), ensure_ascii=False) + ":"
+        if _is_container(child):
+            yield from _json_tokens(walker, child, child_path)
+        else:
+            yield json.dumps(walker.leaf(child_path, child), default=str, ensure_ascii=False)
+    yield "]" if is_list else "}"
+
+
+def _leaves(walker: _Walker, node: Any, path: str = ""):
+    for key, child_path, child in walker.children(node, path):
+        if _is_container(child) and len(child):
+            yield from _leaves(walker, child, child_path)
+        elif _is_container(child):
+            yield key, child_path, [] if isinstance(child, (ListConfig, list)) else {}
+        else:
+            yield key, child_path, walker.leaf(child_path, child)
+
+
+def _jsonl_tokens(walker: _Walker, cfg: DictConfig) -> Iterator[str]:
+    for _, path, value in _leaves(walker, cfg):
+        yield json.dumps({"path": path, "value": value}, default=str, ensure_ascii=False) + "\n"
+
+
+def dotenv_name(path: str, prefix: str = "") -> str:
+    """Nom de variable d'environnement d'un chemin: ``database.hosts[0]`` -> ``DATABASE__HOSTS__0``."""
+    parts = re.split(r"[.\[\]]+", path.strip("]"))
+    return prefix + "__".join(re.sub(r"\W", "_", part).upper() for part in parts if part)
+
+
+def dotenv_value(value: Any) -> str:
+    """Valeur au format dotenv, entre quotes si nécessaire."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        value = "true" if value else "false"
+    elif isinstance(value, (dict, list)):
+        value = json.dumps(value, default=str, ensure_ascii=False)
+    value = str(value)
+    if DOTENV_SAFE.match(value):
+        return value
+    if "'" not in value and "\n" not in value:
+        # Quotes simples: contenu littéral (pas d'expansion de ${...})
+        return f"'{value}'"
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{escaped}"'
+
+
+def _dotenv_tokens(walker: _Walker, cfg: DictConfig, prefix: str) -> Iterator[str]:
+    for _, path, value in _leaves(walker, cfg):
+        yield f"{dotenv_name(path, prefix)}={dotenv_value(value)}\n"
+
+
+def _msgpack_chunks(walker: _Walker, node: Any, path: str, packer) -> Iterator[bytes]:
+    children = list(walker.children(node, path))
+    if isinstance(node, (ListConfig, list)):
+        yield packer.pack_array_header(len(children))
+    else:
+        yield packer.pack_map_header(len(children))
+    for key, child_path, child in children:
+        if not isinstance(node, (ListConfig, list)):
+            yield packer.pack(key if isinstance(key, (int, float, bool)) else str(key))
+        if _is_container(child):
+            yield from _msgpack_chunks(walker, child, child_path, packer)
+        else:
+            value = walker.leaf(child_path, child)
+            if not isinstance(value, (str, int, float, bool, type(None), bytes)):
+                value = str(value)
+            yield packer.pack(value)
+
+
+def _buffered(tokens, empty):
+    buffer, size = [], 0
+    for token in tokens:
+        buffer.append(token)
+        size += len(token)
+        if size >= CHUNK_SIZE:
+            yield empty.join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield empty.join(buffer)
+
+
+def export(cfg: DictConfig, format: str = "json", resolve: bool = False,
+           mask_secrets: bool = True, prefix: str = "") -> Iterator[Any]:
+    """Sérialise une configuration par morceaux, en parcourant l'arbre composé.
+
+    Aucun dictionnaire intermédiaire de la configuration complète n'est
+    construit: la sortie peut être écrite au fil de l'eau.
+
+    Args:
+        cfg: Configuration composée
+        format: ``json``, ``jsonl`` (une feuille par ligne), ``msgpack`` ou ``dotenv``
+        resolve: Résoudre les interpolations
+        mask_secrets: Masquer les valeurs sensibles
+        prefix: Préfixe des noms de variables (format ``dotenv``)
+
+    Returns:
+        Iterator: Morceaux ``str`` (``bytes`` pour msgpack)
+
+    Raises:
+        ValueError: Si le format est inconnu
+        ImportError: Si le format msgpack est demandé sans le paquet ``msgpack``
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Format d'export inconnu: {format} (formats: {', '.join(FORMATS)})")
+    walker = _Walker(cfg, resolve, mask_secrets)
+    if format == "msgpack":
+        try:
+            import msgpack
+        except ImportError as e:
+            raise ImportError("Le format msgpack nécessite le paquet 'msgpack' (pip install msgpack)") from e
+        return _buffered(_msgpack_chunks(walker, cfg, "", msgpack.Packer(use_bin_type=True)), b"")
+    if format == "json":
+        tokens = _json_tokens(walker, cfg, "")
+    elif format == "jsonl":
+        tokens = _jsonl_tokens(walker, cfg)
+    else:
+        tokens = _dotenv_tokens(walker, cfg, prefix)
+    return _buffered(tokens, "")
@@ -0,0 +1,149 @@
+from typing import Any, Dict, Tuple
+from omegaconf import OmegaConf, DictConfig, ListConfig
+
+
+class FrozenConfig:
+    """Nœud de configuration figé, en lecture seule.
+
+    Chaque forme de nœud (ensemble ordonné de clés) est compilée une seule fois
+    en une sous-classe à ``__slots__`` : l'accès ``noeud.cle`` devient un simple
+    accès d'attribut Python, sans passer par OmegaConf ni par TheReader.
+    Les clés qui ne sont pas des identifiants valides, ainsi que celles qui
+    portent le nom d'un attribut de ``FrozenConfig`` (``keys``, ``get``,
+    ``items``, ``values``, ``to_dict``...), ne deviennent pas des slots et
+    restent accessibles uniquement via ``noeud["cle"]`` : ``noeud.keys`` est
+    toujours la méthode. ``keys()`` et ``items()`` suivent l'ordre de
+    déclaration des clés.
+    """
+
+    __slots__ = ("__extra__",)
+    _fields: Tuple[str, ...] = ()
+    # Toutes les clés du nœud, dans l'ordre de déclaration (slots et clés réservées)
+    _keys: Tuple[str, ...] = ()
+
+    def __init__(self, values: Dict[str, Any]):
+        extra = {}
+        for key, value in values.items():
+            if key in self._fields:
+                object.__setattr__(self, key, value)
+            else:
+                extra[key] = value
+        object.__setattr__(self, "__extra__", extra)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"Configuration figée: impossible de modifier '{key}'")
+
+    def __delattr__(self, key):
+        raise AttributeError(f"Configuration figée: impossible de supprimer '{key}'")
+
+    def __getattr__(self, key):
+        # Appelé uniquement si l'attribut n'est pas un slot
+        extra = object.__getattribute__(self, "__extra__")
+        if key in extra:
+            return extra[key]
+        raise AttributeError(f"L'attribut '{key}' n'existe pas")
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            return getattr(self, key)
+        try:
+            return self.__extra__[key]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        if self._keys:
+            return list(self._keys)
+        return list(self._fields) + list(self.__extra__)
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self._fields) + len(self.__extra__)
+
+    def __contains__(self, key) -> bool:
+        return key in self._fields or key in self.__extra__
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenConfig):
+            return self.items() == other.items()
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(tuple(self.items()))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Reconvertit le nœud figé en dictionnaire Python standard."""
+        return {key: _thaw(value) for key, value in self.items()}
+
+    def __repr__(self):
+        content = ", ".join(f"{key}={self[key]!r}" for key in self.keys())
+        return f"{type(self).__name__}({content})"
+
+
+# Cache des classes générées, une par forme de nœud
+_FROZEN_CLASSES: Dict[Tuple[str, ...], type] = {}
+
+
+def _frozen_class(keys: Tuple[str, ...]) -> type:
+    """Retourne (en la générant si besoin) la classe à slots pour ces clés."""
+    cls = _FROZEN_CLASSES.get(keys)
+    if cls is None:
+        fields = tuple(
+            key for key in keys
+            if key.isidentifier() and not key.startswith("__") and not hasattr(FrozenConfig, key)
+        )
+        cls = type("FrozenNode", (FrozenConfig,), {"__slots__": fields, "_fields": fields, "_keys": keys})
+        _FROZEN_CLASSES[keys] = cls
+    return cls
+
+
+def _freeze_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        keys = tuple(str(key) for key in value)
+        cls = _frozen_class(keys)
+        return cls({str(key): _freeze_value(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze_value(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, FrozenConfig):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def freeze(cfg: Any, resolve: bool = True, intern: bool = False) -> Any:
+    """Compile une configuration en arbre d'objets figés à ``__slots__``.
+
+    Args:
+        cfg: DictConfig, ListConfig ou conteneur Python à figer
+        resolve: Résoudre les interpolations avant de figer
+        intern: Partager les sous-arbres et chaînes identiques avec les
+            autres configurations figées du processus (voir ``intern.py``)
+
+    Returns:
+        FrozenConfig (ou tuple pour une liste) en lecture seule
+    """
+    if isinstance(cfg, (DictConfig, ListConfig)):
+        cfg = OmegaConf.to_container(cfg, resolve=resolve)
+    if intern:
+        from .intern import intern as intern_tree
+        return intern_tree(cfg)
+    return _freeze_value(cfg)
@@ -0,0 +1,162 @@
+import math
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from .frozen import FrozenConfig, _frozen_class
+
+# Taille maximale de la table du processus (nœuds, chaînes)
+MAX_NODES = 100_000
+MAX_STRINGS = 100_000
+
+
+def _sizeof(node: Any) -> int:
+    if isinstance(node, FrozenConfig):
+        return sys.getsizeof(node) + sys.getsizeof(node.__extra__)
+    return sys.getsizeof(node)
+
+
+class InternPool:
+    """Table de hash-consing des sous-arbres figés et des chaînes.
+
+    Deux sous-arbres identiques (mêmes clés dans le même ordre, mêmes
+    valeurs) figés par la même table sont un seul et même objet, quel que
+    soit le lecteur, l'environnement ou le locataire d'origine. Les clés et
+    les valeurs textuelles sont internées de la même façon.
+
+    Les enfants étant eux-mêmes internés, la clé d'un nœud est formée de
+    l'identité de ses enfants: la recherche est en O(taille du nœud), sans
+    comparer les sous-arbres en profondeur. Un nœud conservé garde ses
+    enfants en vie: les identités de sa clé ne peuvent pas être réutilisées.
+
+    La table est bornée (LRU): au-delà de ``max_nodes`` nœuds ou
+    ``max_strings`` chaînes, les moins récemment demandés sont oubliés. Les
+    arbres déjà figés restent valides; un sous-arbre oublié puis figé à
+    nouveau n'est simplement plus partagé avec les précédents. Les tuples et
+    les chaînes n'acceptant pas de référence faible, la table ne peut pas
+    se contenter de valeurs faibles.
+    """
+
+    def __init__(self, max_nodes: Optional[int] = MAX_NODES, max_strings: Optional[int] = MAX_STRINGS):
+        """Initialise une table.
+
+        Args:
+            max_nodes: Nombre maximal de nœuds conservés (None: sans limite)
+            max_strings: Nombre maximal de chaînes conservées (None: sans limite)
+        """
+        self.max_nodes = max_nodes
+        self.max_strings = max_strings
+        self._nodes: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._strings: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.nodes_requested = 0
+        self.nodes_evicted = 0
+        self.bytes_requested = 0
+        self.bytes_unique = 0
+
+    def intern(self, value: Any) -> Any:
+        """Fige et interne un conteneur Python (dict -> FrozenConfig, list -> tuple)."""
+        with self._lock:
+            return self._intern(value)
+
+    def _string(self, value: str) -> str:
+        strings = self._strings
+        interned = strings.get(value)
+        if interned is not None:
+            strings.move_to_end(value)
+            return interned
+        strings[value] = value
+        if self.max_strings is not None and len(strings) > self.max_strings:
+            strings.popitem(last=False)
+        return value
+
+    def _identity(self, child: Any) -> Any:
+        if isinstance(child, (FrozenConfig, tuple, str)):
+            return id(child)
+        if isinstance(child, float):
+            # 0.0 == -0.0: le signe distingue les deux zéros
+            return float, child, math.copysign(1, child)
+        # Scalaires: 1, 1.0 et True sont distincts
+        return type(child), child
+
+    def _intern(self, value: Any) -> Any:
+        if isinstance(value, str):
+            return self._string(value)
+        if isinstance(value, dict):
+            keys = tuple(self._string(str(key)) for key in value)
+            children = tuple(self._intern(child) for child in value.values())
+            key = ("d", keys, tuple(self._identity(child) for child in children))
+            return self._node(key, lambda: _frozen_class(keys)(dict(zip(keys, children))))
+        if isinstance(value, (list, tuple)):
+            children = tuple(self._intern(child) for child in value)
+            key = ("l", tuple(self._identity(child) for child in children))
+            return self._node(key, lambda: children)
+        return value
+
+    def _node(self, key: tuple, build) -> Any:
+        nodes = self._nodes
+        node = nodes.get(key)
+        if node is None:
+            node = nodes[key] = build()
+            self.bytes_unique += _sizeof(node)
+            if self.max_nodes is not None and len(nodes) > self.max_nodes:
+                _, evicted = nodes.popitem(last=False)
+                self.bytes_unique -= _sizeof(evicted)
+                self.nodes_evicted += 1
+        else:
+            nodes.move_to_end(key)
+        self.nodes_requested += 1
+        self.bytes_requested += _sizeof(node)
+        return node
+
+    def memory_report(self) -> Dict[str, Any]:
+        """Retourne l'état de la table et la mémoire économisée.
+
+        Returns:
+            dict: ``nodes_requested`` (nœuds figés demandés), ``nodes_unique``
+            (nœuds conservés), ``nodes_evicted`` (nœuds oubliés, table pleine),
+            ``bytes_requested`` / ``bytes_unique`` (taille des nœuds sans /
+            avec partage), ``bytes_saved``, ``dedup_ratio``,
+            ``strings`` et ``string_bytes`` (chaînes internées), ``table_bytes``
+            (coût de la table elle-même)
+        """
+        with self._lock:
+            table = sys.getsizeof(self._nodes) + sum(sys.getsizeof(key) for key in self._nodes)
+            return {
+                "nodes_requested": self.nodes_requested,
+                "nodes_unique": len(self._nodes),
+                "nodes_evicted": self.nodes_evicted,
+                "bytes_requested": self.bytes_requested,
+                "bytes_unique": self.bytes_unique,
+                "bytes_saved": self.bytes_requested - self.bytes_unique,
+                "dedup_ratio": round(self.nodes_requested / len(self._nodes), 2) if self._nodes else 1.0,
+                "strings": len(self._strings),
+                "string_bytes": sum(sys.getsizeof(value) for value in self._strings),
+                "table_bytes": table + sys.getsizeof(self._strings),
+            }
+
+    def clear(self):
+        """Vide la table (les arbres déjà figés restent valides)."""
+        with self._lock:
+            self._nodes.clear()
+            self._strings.clear()
+            self.nodes_requested = self.nodes_evicted = self.bytes_requested = self.bytes_unique = 0
+
+
+# Table partagée par tous les lecteurs du processus (bornée, voir InternPool)
+POOL = InternPool()
+
+
+def intern(value: Any) -> Any:
+    """Fige et interne un conteneur Python dans la table du processus."""
+    return POOL.intern(value)
+
+
+def memory_report() -> Dict[str, Any]:
+    """Rapport mémoire de la table du processus (voir ``InternPool.memory_report``)."""
+    return POOL.memory_report()
+
+
+def clear_interned():
+    """Vide la table du processus."""
+    POOL.clear()
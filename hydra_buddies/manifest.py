@@ -0,0 +1,215 @@
+import atexit
+import os
+import stat
+import threading
+import time
+from typing import Dict, List, Optional
+from .cache import YAML_EXTENSIONS, cache_dir, cache_path, load_json, save_json
+
+MANIFEST_VERSION = 1
+MANIFEST_FILENAME = "manifest.json"
+
+# Délai pendant lequel un répertoire déjà vérifié n'est pas re-vérifié
+# (0: un stat du répertoire à chaque recherche, sans le relister)
+CHECK_INTERVAL = 0.0
+
+# Un répertoire modifié depuis moins de 2 s est relisté à la vérification
+# suivante (dates de modification grossières sur certains systèmes de fichiers)
+RACY_WINDOW_NS = 2_000_000_000
+
+_MANIFESTS: Dict[str, "Manifest"] = {}
+_MANIFESTS_LOCK = threading.Lock()
+
+
+class Manifest:
+    """Inventaire persistant des répertoires et fichiers d'un arbre de configuration.
+
+    Chaque répertoire est listé une fois puis conservé (sur disque, dans
+    ``.buddy-cache``) avec sa date de modification: tant qu'elle ne change
+    pas, ses fichiers et sous-répertoires ne sont pas relus. Un répertoire
+    n'est listé qu'à la première recherche qui le traverse; ensuite, sa
+    validation coûte un seul ``stat`` (au plus un par ``CHECK_INTERVAL``).
+
+    L'inventaire ne suit que l'existence des fichiers, pas leur contenu.
+    """
+
+    def __init__(self, root: str, persist: bool = True):
+        """Charge l'inventaire enregistré (sans le valider).
+
+        Args:
+            root: Répertoire racine (ex: ``.hydra-conf``)
+            persist: Enregistrer l'inventaire dans ``.buddy-cache`` à la sortie
+        """
+        self.root = os.path.abspath(root)
+        self.persist = persist
+        self._lock = threading.RLock()
+        # Répertoire relatif ("" pour la racine) -> [mtime_ns, fichiers, sous-répertoires]
+        self._entries: Dict[str, list] = {}
+        self._checked: Dict[str, float] = {}
+        self._dirty = False
+        self._registered = False
+        self.listings = 0
+        if persist:
+            data = load_json(os.path.join(cache_dir(self.root), MANIFEST_FILENAME), {})
+            if data.get("version") == MANIFEST_VERSION and data.get("root") == self.root:
+                self._entries = data.get("entries", {})
+
+    def _relative(self, path: str) -> Optional[str]:
+        """Chemin relatif à la racine, ou None s'il est en dehors."""
+        if os.path.isabs(path):
+            path = os.path.relpath(path, self.root)
+            if path == os.curdir:
+                return ""
+            if path.startswith(os.pardir):
+                return None
+        return path.replace(os.sep, "/").strip("/")
+
+    def _listing(self, reldir: str) -> Optional[list]:
+        """Entrée d'un répertoire, validée par sa date de modification."""
+        with self._lock:
+            entry = self._entries.get(reldir)
+            now = time.monotonic()
+            checked = self._checked.get(reldir)
+            if checked is not None and now - checked < CHECK_INTERVAL:
+                return entry
+            directory = os.path.join(self.root, *reldir.split("/")) if reldir else self.root
+            try:
+                info = os.stat(directory)
+            except OSError:
+                info = None
+            if info is None or not stat.S_ISDIR(info.st_mode):
+                if reldir in self._entries:
+                    del self._entries[reldir]
+                    self._mark_dirty()
+                entry = None
+            elif entry is None or entry[0] != info.st_mtime_ns:
+                files, dirs = [], []
+                with os.scandir(directory) as scan:
+                    for item in scan:
+                        (dirs if item.is_dir() else files).append(item.name)
+                mtime = info.st_mtime_ns
+                if time.time_ns() - mtime < RACY_WINDOW_NS:
+                    # Modifié à l'instant: une écriture dans la même unité de
+                    # temps ne changerait pas la date, relister la prochaine fois
+                    mtime = -1
+                entry = self._entries[reldir] = [mtime, sorted(files), sorted(dirs)]
+                self.listings += 1
+                self._mark_dirty()
+            self._checked[reldir] = now
+            return entry
+
+    def _split(self, relpath: str):
+        if "/" in relpath:
+            return relpath.rsplit("/", 1)
+        return "", relpath
+
+    def isdir(self, path: str) -> bool:
+        """Équivalent de ``os.path.isdir`` (chemin relatif à la racine ou absolu)."""
+        relpath = self._relative(path)
+        if relpath is None:
+            return os.path.isdir(path)
+        if relpath == "":
+            return self._listing("") is not None
+        parent, name = self._split(relpath)
+        entry = self._listing(parent)
+        return entry is not None and name in entry[2]
+
+    def isfile(self, path: str) -> bool:
+        """Équivalent de ``os.path.isfile`` (chemin relatif à la racine ou absolu)."""
+        relpath = self._relative(path)
+        if relpath is None:
+            return os.path.isfile(path)
+        if relpath == "":
+            return False
+        parent, name = self._split(relpath)
+        entry = self._listing(parent)
+        return entry is not None and name in entry[1]
+
+    def exists(self, path: str) -> bool:
+        """Équivalent de ``os.path.exists``."""
+        return self.isfile(path) or self.isdir(path)
+
+    def listdir(self, path: str = "") -> List[str]:
+        """Fichiers d'un répertoire (liste vide s'il n'existe pas)."""
+        relpath = self._relative(path)
+        if relpath is None:
+            return sorted(name for name in os.listdir(path) if os.path.isfile(os.path.join(path, name)))
+        entry = self._listing(relpath)
+        return list(entry[1]) if entry else []
+
+    def _walk(self):
+        """Parcourt les sous-répertoires non cachés: ``(répertoire relatif, entrée)``."""
+        pending = [""]
+        while pending:
+            reldir = pending.pop()
+            entry = self._listing(reldir)
+            if entry is None:
+                continue
+            if reldir:
+                yield reldir, entry
+            pending.extend(f"{reldir}/{name}" if reldir else name
+                           for name in entry[2] if not name.startswith("."))
+
+    def groups(self) -> List[str]:
+        """Tous les sous-répertoires (groupes et sous-groupes), hors répertoires cachés."""
+        return sorted(reldir for reldir, _ in self._walk())
+
+    def options(self, group: str) -> List[str]:
+        """Options d'un groupe: noms des fichiers YAML sans extension."""
+        return sorted(os.path.splitext(name)[0] for name in self.listdir(group)
+                      if name.endswith(YAML_EXTENSIONS))
+
+    def find(self, filename: str) -> List[str]:
+        """Chemins relatifs des fichiers ``filename`` présents dans les groupes."""
+        return sorted(f"{reldir}/{filename}" for reldir, entry in self._walk() if filename in entry[1])
+
+    def invalidate(self, path: str = ""):
+        """Force la re-vérification d'un répertoire (et de ses parents) à la prochaine recherche.
+
+        À appeler après avoir créé ou supprimé des fichiers dans l'arbre.
+        """
+        relpath = self._relative(path)
+        with self._lock:
+            if relpath is None or relpath == "":
+                self._checked.clear()
+                return
+            parts = relpath.split("/")
+            for index in range(len(parts) + 1):
+                self._checked.pop("/".join(parts[:index]), None)
+
+    def _mark_dirty(self):
+        self._dirty = True
+        if self.persist and not self._registered:
+            # Une seule écriture par processus, à la sortie
+            self._registered = True
+            atexit.register(self.save)
+
+    def save(self):
+        """Enregistre l'inventaire s'il a changé."""
+        with self._lock:
+            if not self._dirty or not self.persist or not os.path.isdir(self.root):
+                return
+            try:
+                save_json(cache_path(self.root, MANIFEST_FILENAME),
+                          {"version": MANIFEST_VERSION, "root": self.root, "entries": self._entries})
+            except OSError:
+                return
+            self._dirty = False
+
+
+def get_manifest(root: str, persist: bool = True) -> Manifest:
+    """Retourne l'inventaire partagé d'un répertoire (chargé au premier appel)."""
+    root = os.path.abspath(root)
+    manifest = _MANIFESTS.get(root)
+    if manifest is None:
+        with _MANIFESTS_LOCK:
+            manifest = _MANIFESTS.get(root)
+            if manifest is None:
+                manifest = _MANIFESTS[root] = Manifest(root, persist=persist)
+    return manifest
+
+
+def clear_manifests():
+    """Oublie les inventaires chargés dans le processus (les fichiers restent)."""
+    with _MANIFESTS_LOCK:
+        _MANIFESTS.clear()
@@ -0,0 +1,71 @@
+import re
+from typing import Any, Iterable, Set
+from .deps import DependencyGraph, _flatten, normalize_key
+
+# Noms de clés considérés comme sensibles, où qu'ils apparaissent
+SECRET_KEY_PATTERN = re.compile(r"(password|passwd|secret|token|private_key|api_key|access_key|salt)$", re.IGNORECASE)
+# Valeur lue par le résolveur des fournisseurs de secrets: ${secret:...}
+SECRET_RESOLVER_PATTERN = re.compile(r"\$\{\s*secret\s*:")
+MASK = "***"
+
+
+def secret_paths(data: Any) -> Set[str]:
+    """Retourne les chemins feuilles sensibles d'une configuration non résolue.
+
+    Args:
+        data: Configuration sous forme de dictionnaire Python, non résolue
+    """
+    return secret_leaves(_flatten(data))
+
+
+def secret_leaves(leaves: Iterable) -> Set[str]:
+    """Retourne les chemins sensibles parmi des feuilles ``(chemin normalisé, valeur brute)``.
+
+    Sont sensibles les feuilles de la section ``secrets`` (aussi sous leur
+    forme promue à la racine par ``TheReader._promote_secrets``), celles
+    dont la valeur utilise le résolveur ``${secret:...}``, et toute
+    interpolation qui mène, même indirectement, à une valeur sensible.
+    Les chemins sont normalisés (``a.b.0``, voir ``deps.normalize_key``).
+    """
+    paths: Set[str] = set()
+    interpolated = []
+    for path, value in leaves:
+        if path.startswith("secrets."):
+            paths.add(path)
+            paths.add(path[len("secrets."):])
+        if isinstance(value, str) and "${" in value:
+            interpolated.append((path, value))
+            if SECRET_RESOLVER_PATTERN.search(value):
+                paths.add(path)
+        elif SECRET_KEY_PATTERN.search(path.rsplit(".", 1)[-1]):
+            paths.add(path)
+
+    if interpolated and paths:
+        graph = DependencyGraph.from_leaves(interpolated)
+        for path in list(paths):
+            paths |= graph.dependents(path)
+    return paths
+
+
+def is_secret(path: str, known_secrets: Iterable[str] = ()) -> bool:
+    """Indique si la valeur au chemin donné doit être masquée.
+
+    Args:
+        path: Chemin de la valeur (``a.b[0]`` ou ``a.b.0``)
+        known_secrets: Chemins retournés par ``secret_paths``; les valeurs
+            situées sous un chemin sensible (interpolation d'une section) le sont aussi
+    """
+    if path == "secrets" or path.startswith("secrets."):
+        return True
+    key = re.split(r"[.\[]", path)[-1]
+    if SECRET_KEY_PATTERN.search(key):
+        return True
+    if known_secrets:
+        parts = normalize_key(path).split(".")
+        return any(".".join(parts[:index]) in known_secrets for index in range(len(parts), 0, -1))
+    return False
+
+
+def mask(value: Any) -> Any:
+    """Masque une valeur feuille (les valeurs nulles restent visibles)."""
+    return None if value is None else MASK
@@ -0,0 +1,110 @@
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+from omegaconf import OmegaConf
+
+# État propre à chaque processus du pool (initialisé une seule fois par worker)
+_WORKER: Dict[str, Any] = {}
+
+
+def content_hash(data: Any) -> str:
+    """Empreinte stable d'une configuration (dictionnaire Python)."""
+    payload = json.dumps(data, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def iter_combinations(groups: Optional[Dict[str, Sequence[str]]] = None,
+                      overrides: Optional[Sequence[str]] = None) -> Iterator[List[str]]:
+    """Produit toutes les combinaisons d'options de groupes.
+
+    Args:
+        groups: Options par groupe, ex: ``{"database": ["dev", "prod"]}``
+        overrides: Overrides communs ajoutés à chaque combinaison
+
+    Yields:
+        list: Overrides Hydra d'une combinaison, ex: ``["database=dev"]``
+    """
+    groups = groups or {}
+    names = list(groups)
+    for options in itertools.product(*(groups[name] for name in names)):
+        yield [f"{name}={option}" for name, option in zip(names, options)] + list(overrides or [])
+
+
+def _init_worker(config_dir: str):
+    """Prépare la session de composition une fois pour toute la durée de vie du worker."""
+    from .session import get_session
+
+    _WORKER["session"] = get_session(config_dir)
+    _WORKER["bases"] = {}
+
+
+def _compose(config_name: str, overrides: List[str]):
+    """Lecteur d'une combinaison, dérivé du lecteur de base du worker.
+
+    La configuration de base est composée une fois par worker; chaque
+    combinaison en dérive par ``with_overrides``: les overrides de groupes
+    passent par le cache de composition, les overrides de valeurs sont
+    appliqués comme un delta.
+    """
+    from .buddies import TheReader
+
+    bases = _WORKER["bases"]
+    base = bases.get(config_name)
+    if base is None:
+        session = _WORKER["session"]
+        base = bases[config_name] = TheReader.from_cfg(session.compose(config_name), config_name, session.root)
+    return base.with_overrides(overrides) if overrides else base
+
+
+def _run_task(task) -> Dict[str, Any]:
+    config_name, overrides, resolve, with_output = task
+    result = {"config": config_name, "overrides": overrides, "hash": None, "error": None}
+    try:
+        reader = _compose(config_name, overrides)
+        data = OmegaConf.to_container(reader.cfg, resolve=resolve)
+        result["hash"] = content_hash(data)
+        if with_output:
+            result["output"] = data
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def run_matrix(config_names: Sequence[str], groups: Optional[Dict[str, Sequence[str]]] = None,
+               overrides: Optional[Sequence[str]] = None, config_dir: Optional[str] = None,
+               processes: Optional[int] = None, resolve: bool = True,
+               with_output: bool = False) -> Iterator[Dict[str, Any]]:
+    """Compose toutes les combinaisons de configurations dans un pool de processus.
+
+    Chaque worker prépare une seule session de composition pour le répertoire
+    de configuration, puis compose les combinaisons qui lui sont confiées. Les
+    résultats sont renvoyés au fil de l'eau, dans l'ordre d'achèvement.
+
+    Args:
+        config_names: Noms des configurations à composer
+        groups: Options par groupe à combiner (produit cartésien)
+        overrides: Overrides communs à toutes les combinaisons
+        config_dir: Répertoire de configuration (défaut: .hydra-conf du répertoire courant)
+        processes: Nombre de workers (défaut: nombre de CPU)
+        resolve: Résoudre les interpolations
+        with_output: Inclure la configuration obtenue dans chaque résultat
+
+    Yields:
+        dict: ``config``, ``overrides``, ``hash``, ``error`` (et ``output``)
+    """
+    config_dir = os.path.abspath(config_dir or os.path.join(os.getcwd(), '.hydra-conf'))
+    tasks = [
+        (config_name, combination, resolve, with_output)
+        for config_name in config_names
+        for combination in iter_combinations(groups, overrides)
+    ]
+    if not tasks:
+        return
+
+    processes = min(processes or os.cpu_count() or 1, len(tasks))
+    with multiprocessing.Pool(processes, initializer=_init_worker, initargs=(config_dir,)) as pool:
+        for result in pool.imap_unordered(_run_task, tasks):
+            yield result
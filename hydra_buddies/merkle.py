@@ -0,0 +1,175 @@
+import hashlib
+import json
+from typing import Any, Iterable, List, Optional, Union
+from omegaconf import DictConfig, ListConfig, OmegaConf
+
+# Valeur absente (clé supprimée), distincte de None
+MISSING = object()
+
+
+class HashedNode:
+    """Nœud d'un arbre de Merkle: empreinte du sous-arbre et enfants.
+
+    ``kind`` vaut ``"d"`` (dictionnaire), ``"l"`` (liste) ou ``None`` (feuille).
+    Les nœuds ne sont jamais modifiés: une mise à jour recrée uniquement les
+    nœuds du chemin concerné et partage le reste de l'arbre.
+    """
+
+    __slots__ = ("digest", "children", "kind")
+
+    def __init__(self, digest: bytes, children=None, kind: Optional[str] = None):
+        self.digest = digest
+        self.children = children
+        self.kind = kind
+
+
+def _combine(kind: str, children: dict) -> bytes:
+    digest = hashlib.blake2b(kind.encode("ascii"), digest_size=16)
+    if kind == "d":
+        # Clés triées: l'empreinte ne dépend pas de l'ordre de composition
+        encoded = sorted((json.dumps(key, default=str), child) for key, child in children.items())
+        for key, child in encoded:
+            digest.update(key.encode("utf-8") + b"\0" + child.digest)
+    else:
+        for index in range(len(children)):
+            digest.update(children[index].digest)
+    return digest.digest()
+
+
+def hash_tree(value: Any) -> HashedNode:
+    """Calcule l'empreinte de chaque sous-arbre d'un conteneur Python.
+
+    Deux sous-arbres de même empreinte sont identiques: une comparaison peut
+    les ignorer en O(1) sans les parcourir.
+    """
+    if isinstance(value, dict):
+        children = {key: hash_tree(item) for key, item in value.items()}
+        return HashedNode(_combine("d", children), children, "d")
+    if isinstance(value, list):
+        children = {index: hash_tree(item) for index, item in enumerate(value)}
+        return HashedNode(_combine("l", children), children, "l")
+    payload = json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+    return HashedNode(hashlib.blake2b(b"v" + payload, digest_size=16).digest())
+
+
+def split_path(path: Union[str, Iterable, None]) -> List:
+    """Découpe un chemin pointé (``"database.replicas.0"``) en composantes."""
+    if path is None or path == "":
+        return []
+    if isinstance(path, str):
+        return path.split(".")
+    return list(path)
+
+
+def _child_key(node: HashedNode, part):
+    if node.kind == "l":
+        if not str(part).isdigit():
+            raise KeyError(part)
+        return int(part)
+    if part not in node.children and str(part).isdigit() and int(part) in node.children:
+        return int(part)
+    return part
+
+
+def _replace(node: Optional[HashedNode], parts: list, value) -> Optional[HashedNode]:
+    if not parts:
+        return None if value is MISSING else hash_tree(value)
+    if node is None or node.kind is None:
+        if value is MISSING:
+            return node
+        # Chemin inexistant: créer les dictionnaires intermédiaires
+        node = HashedNode(b"", {}, "d")
+
+    key = _child_key(node, parts[0])
+    children = dict(node.children)
+    child = _replace(children.get(key), parts[1:], value)
+    if child is not None:
+        children[key] = child
+    elif key in children:
+        del children[key]
+        if node.kind == "l":
+            children = dict(enumerate(children[index] for index in sorted(children)))
+    return HashedNode(_combine(node.kind, children), children, node.kind)
+
+
+class MerkleTree:
+    """Arbre de Merkle d'une configuration, mis à jour par chemin.
+
+    Attributes:
+        root: Nœud racine
+        source: Objet de configuration dont l'arbre est l'empreinte
+        pristine: ``True`` si l'arbre correspond à la configuration telle que
+            chargée (aucune modification locale depuis)
+    """
+
+    __slots__ = ("root", "source", "pristine")
+
+    def __init__(self, root: HashedNode, source: Any = None, pristine: bool = True):
+        self.root = root
+        self.source = source
+        self.pristine = pristine
+
+    @classmethod
+    def build(cls, data: Any, source: Any = None) -> "MerkleTree":
+        """Construit l'arbre complet d'un conteneur Python."""
+        return cls(hash_tree(data), source)
+
+    def node(self, path=None) -> HashedNode:
+        """Retourne le nœud au chemin donné.
+
+        Raises:
+            KeyError: Si le chemin n'existe pas
+        """
+        node = self.root
+        for part in split_path(path):
+            if node.kind is None:
+                raise KeyError(path)
+            node = node.children[_child_key(node, part)]
+        return node
+
+    def fingerprint(self, path=None) -> str:
+        """Empreinte hexadécimale de l'arbre ou d'un sous-arbre."""
+        return self.node(path).digest.hex()
+
+    def updated(self, path, value: Any = MISSING, source: Any = None,
+                pristine: bool = False) -> "MerkleTree":
+        """Retourne un nouvel arbre où seule la valeur au chemin donné change.
+
+        Seuls les nœuds le long du chemin sont recalculés; l'arbre courant
+        n'est pas modifié.
+
+        Args:
+            path: Chemin pointé ou liste de composantes
+            value: Nouvelle valeur (``MISSING`` pour une suppression)
+            source: Configuration correspondant au nouvel arbre
+            pristine: Le nouvel arbre correspond-il à une configuration chargée
+        """
+        root = _replace(self.root, split_path(path), value)
+        if root is None:
+            root = hash_tree({})
+        return MerkleTree(root, self.source if source is None else source, pristine)
+
+
+def config_value(cfg: Any, path) -> Any:
+    """Lit la valeur brute (interpolations non résolues) d'une configuration.
+
+    Returns:
+        Conteneur Python ou valeur feuille, ``MISSING`` si le chemin n'existe pas
+    """
+    node = cfg
+    for part in split_path(path):
+        if isinstance(node, ListConfig):
+            if not str(part).isdigit() or int(part) >= len(node):
+                return MISSING
+            node = node._get_node(int(part))
+        elif isinstance(node, DictConfig):
+            if node._is_none() or node._is_missing():
+                return MISSING
+            node = node._get_node(part, throw_on_missing_key=False)
+            if node is None:
+                return MISSING
+        else:
+            return MISSING
+    if isinstance(node, (DictConfig, ListConfig)):
+        return None if node._is_none() else OmegaConf.to_container(node, resolve=False)
+    return node._value()
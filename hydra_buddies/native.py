@@ -0,0 +1,870 @@
+import os
+import re
+import threading
+import warnings
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+import yaml
+from omegaconf import DictConfig, OmegaConf, flag_override, open_dict
+from omegaconf._utils import get_yaml_loader
+from .manifest import get_manifest
+
+# En-tête de package: ``# @package database`` (lu dans les premières lignes du fichier)
+HEADER_PATTERN = re.compile(r"^\s*#\s*@(\S+)\s+(\S+)\s*$")
+HEADER_START = re.compile(r"^\s*#\s*@")
+
+# Groupes et clés de la configuration propre à Hydra, sans objet pour le moteur natif
+HYDRA_PREFIXES = ("hydra/", "hydra.")
+
+# Override: ``[~|+|++]clé[@package][=valeur]``
+OVERRIDE_PATTERN = re.compile(r"^\s*(~|\+\+|\+)?([A-Za-z_$/][\w$./\-]*)(?:@([\w$.\-:]*))?\s*(?:=(.*))?$", re.S)
+FUNCTION_NAME_PATTERN = re.compile(r"^[A-Za-z_]\w*\s*$")
+# Caractères admis hors guillemets et séquences d'échappement (OverrideLexer.g4 de Hydra)
+UNQUOTED_PATTERN = re.compile(r"[A-Za-z0-9_/\-\\+.$%*@?|: \t]")
+ESCAPED_CHARS = "\\()[]{}:=, \t"
+INT_PATTERN = re.compile(r"^[+-]?(?:0|[1-9][0-9_]*)$")
+FLOAT_PATTERN = re.compile(r"^[+-]?(?:(?:\d[\d_]*)?\.\d[\d_]*(?:[eE][+-]?\d+)?|\d[\d_]*\.(?:[eE][+-]?\d+)?|\d[\d_]*[eE][+-]?\d+|inf|nan)$",
+                           re.I)
+
+
+class CompositionError(ValueError):
+    """Composition impossible (liste des defaults, overrides)."""
+
+
+class MissingConfigError(CompositionError):
+    """Fichier de configuration introuvable dans les racines."""
+
+
+class ResultDefault(NamedTuple):
+    """Entrée de la liste des defaults résolue (mêmes champs que celle de Hydra)."""
+    config_path: str
+    package: str
+    parent: Optional[str] = None
+    is_self: bool = False
+    primary: bool = False
+    override_key: Optional[str] = None
+
+
+class Override:
+    """Override analysé: ``database=prod``, ``+api.retry=3``, ``~database.port``..."""
+
+    __slots__ = ("type", "key_or_group", "package", "_value", "input_line")
+
+    def __init__(self, type: str, key_or_group: str, package: Optional[str], value: Any, input_line: str):
+        self.type = type
+        self.key_or_group = key_or_group
+        self.package = package
+        self._value = value
+        self.input_line = input_line
+
+    def value(self) -> Any:
+        return self._value
+
+    def is_sweep_override(self) -> bool:
+        # Les balayages sont refusés à l'analyse
+        return False
+
+    def is_delete(self) -> bool:
+        return self.type == "delete"
+
+    def is_add(self) -> bool:
+        return self.type == "add"
+
+    def is_force_add(self) -> bool:
+        return self.type == "force_add"
+
+    def key_element(self) -> str:
+        """Clé de l'override dans la liste des defaults (``groupe[@package]``)."""
+        return self.key_or_group if self.package is None else f"{self.key_or_group}@{self.package}"
+
+    def __repr__(self):
+        return f"Override({self.input_line!r})"
+
+
+class _ValueParser:
+    """Analyse la valeur d'un override (grammaire des overrides Hydra, sans balayages)."""
+
+    def __init__(self, text: str, line: str):
+        self.text = text
+        self.line = line
+        self.pos = 0
+
+    def error(self, message: str) -> CompositionError:
+        return CompositionError(f"Override '{self.line}': {message}")
+
+    def skip(self):
+        while self.pos < len(self.text) and self.text[self.pos] in " \t":
+            self.pos += 1
+
+    def parse(self) -> Any:
+        if not self.text.strip():
+            return ""
+        value = self.element(",")
+        self.skip()
+        if self.pos < len(self.text):
+            if self.text[self.pos] == ",":
+                raise self.error("les balayages (a,b,...) ne sont pas pris en charge par le moteur natif")
+            raise self.error(f"caractère inattendu '{self.text[self.pos]}'")
+        return value
+
+    def element(self, stops: str) -> Any:
+        self.skip()
+        if self.pos >= len(self.text):
+            raise self.error("valeur manquante")
+        char = self.text[self.pos]
+        if char == "[":
+            return self.sequence()
+        if char == "{":
+            return self.mapping()
+        if char in "'\"":
+            return self.quoted()
+        return self.primitive(stops)
+
+    def sequence(self) -> list:
+        self.pos += 1
+        items = []
+        self.skip()
+        if self.text.startswith("]", self.pos):
+            self.pos += 1
+            return items
+        while True:
+            items.append(self.element(",]"))
+            self.skip()
+            if self.text.startswith(",", self.pos):
+                self.pos += 1
+            elif self.text.startswith("]", self.pos):
+                self.pos += 1
+                return items
+            else:
+                raise self.error("']' attendu")
+
+    def mapping(self) -> dict:
+        self.pos += 1
+        items = {}
+        self.skip()
+        if self.text.startswith("}", self.pos):
+            self.pos += 1
+            return items
+        while True:
+            self.skip()
+            key = self.primitive(":", convert=False)
+            if not self.text.startswith(":", self.pos):
+                raise self.error("':' attendu")
+            self.pos += 1
+            items[key] = self.element(",}")
+            self.skip()
+            if self.text.startswith(",", self.pos):
+                self.pos += 1
+            elif self.text.startswith("}", self.pos):
+                self.pos += 1
+                return items
+            else:
+                raise self.error("'}' attendu")
+
+    def quoted(self) -> str:
+        quote = self.text[self.pos]
+        self.pos += 1
+        chars = []
+        while self.pos < len(self.text):
+            char = self.text[self.pos]
+            if char == "\\" and self.text.startswith(quote, self.pos + 1):
+                chars.append(quote)
+                self.pos += 2
+                continue
+            if char == quote:
+                self.pos += 1
+                return "".join(chars)
+            chars.append(char)
+            self.pos += 1
+        raise self.error("chaîne non terminée")
+
+    def primitive(self, stops: str, convert: bool = True) -> Any:
+        """Valeur non quotée: mêmes caractères que Hydra, interpolations conservées.
+
+        Args:
+            stops: Caractères qui terminent la valeur (hors interpolation)
+            convert: Convertir en booléen, nombre ou None (faux pour une clé de dictionnaire)
+        """
+        text = self.text
+        chars: List[str] = []
+        # Longueur sans les espaces finaux non échappés (supprimés comme par Hydra)
+        kept = 0
+        while self.pos < len(text):
+            char = text[self.pos]
+            if char == "\\" and self.pos + 1 < len(text) and text[self.pos + 1] in ESCAPED_CHARS:
+                chars.append(text[self.pos + 1])
+                self.pos += 2
+                kept = len(chars)
+                continue
+            if text.startswith("${", self.pos):
+                # Interpolation: jusqu'à la première '}', sans imbrication (comme Hydra)
+                end = text.find("}", self.pos + 2)
+                if not convert:
+                    raise self.error("interpolation non autorisée dans une clé de dictionnaire")
+                if end == -1:
+                    raise self.error("interpolation non terminée")
+                if end == self.pos + 2:
+                    raise self.error("interpolation vide")
+                chars.append(text[self.pos:end + 1])
+                self.pos = end + 1
+                kept = len(chars)
+                continue
+            if char in stops:
+                break
+            if char == "(" and FUNCTION_NAME_PATTERN.match("".join(chars)):
+                raise self.error("les fonctions (choice, range, int...) ne sont pas prises en charge par le moteur natif")
+            if not UNQUOTED_PATTERN.match(char):
+                raise self.error(f"caractère '{char}' non autorisé hors guillemets: quoter la valeur")
+            chars.append(char)
+            self.pos += 1
+            if char not in " \t":
+                kept = len(chars)
+        raw = "".join(chars[:kept])
+        if not convert:
+            return raw
+        lowered = raw.lower()
+        if lowered == "null":
+            return None
+        if lowered in ("true", "false"):
+            return lowered == "true"
+        if INT_PATTERN.match(raw):
+            return int(raw.replace("_", ""))
+        if FLOAT_PATTERN.match(raw):
+            return float(raw.replace("_", ""))
+        return raw
+
+
+def parse_override(line: str) -> Override:
+    """Analyse un override Hydra sans importer Hydra.
+
+    Raises:
+        CompositionError: Override mal formé, balayage ou fonction
+    """
+    match = OVERRIDE_PATTERN.match(line)
+    if not match:
+        raise CompositionError(f"Override mal formé: '{line}'")
+    prefix, key, package, text = match.groups()
+    kind = {"~": "delete", "+": "add", "++": "force_add"}.get(prefix or "", "change")
+    if text is None:
+        if kind != "delete":
+            raise CompositionError(f"Override mal formé: '{line}' (valeur manquante)")
+        value = None
+    else:
+        value = _ValueParser(text, line).parse()
+    return Override(kind, key, package, value, line)
+
+
+def _is_hydra(key: str) -> bool:
+    return key == "hydra" or key.lstrip("/").startswith(HYDRA_PREFIXES)
+
+
+class _Entry:
+    """Élément d'une liste des defaults: groupe (``database: prod``) ou configuration (``db/base``).
+
+    Calque les règles de Hydra pour les chemins relatifs au groupe parent,
+    les packages (``@pkg``, en-têtes ``# @package``, ``_global_``,
+    ``_here_``) et les clés d'override.
+    """
+
+    __slots__ = ("group", "value", "package", "optional", "override", "external_append",
+                 "primary", "parent_base_dir", "parent_package", "package_header", "deleted")
+
+    def __init__(self, value: Any, group: Optional[str] = None, package: Optional[str] = None,
+                 optional: bool = False, override: bool = False, external_append: bool = False,
+                 primary: bool = False):
+        self.group = group
+        self.value = value
+        self.package = "" if package == "_here_" else package
+        self.optional = optional
+        self.override = override
+        self.external_append = external_append
+        self.primary = primary
+        self.parent_base_dir: Optional[str] = None
+        self.parent_package: Optional[str] = None
+        self.package_header: Optional[str] = None
+        self.deleted = False
+
+    def copy(self) -> "_Entry":
+        entry = _Entry.__new__(_Entry)
+        for name in _Entry.__slots__:
+            setattr(entry, name, getattr(self, name))
+        return entry
+
+    @property
+    def is_self(self) -> bool:
+        return self.value == "_self_"
+
+    def update_parent(self, base_dir: str, package: str):
+        self.parent_base_dir = base_dir
+        self.parent_package = package
+        if self.package is not None and "_group_" in self.package:
+            self.package = "_global_." + self.package.replace("_group_", self.default_package())
+
+    def _relative_group(self) -> str:
+        if self.group is not None:
+            return self.group.lstrip("/")
+        path = self.value.lstrip("/")
+        return path.rsplit("/", 1)[0] if "/" in path else ""
+
+    def group_path(self) -> str:
+        if self.group is not None:
+            absolute = self.group.startswith("/")
+        else:
+            absolute = self.value.startswith("/")
+        relative = self._relative_group()
+        if absolute or not self.parent_base_dir:
+            return relative
+        return f"{self.parent_base_dir}/{relative}" if relative else self.parent_base_dir
+
+    def name(self) -> Optional[str]:
+        if self.group is not None:
+            return self.value
+        return self.value.rsplit("/", 1)[-1]
+
+    def config_path(self) -> str:
+        if self.group is not None:
+            return f"{self.group_path()}/{self.value}"
+        path = self.value.lstrip("/")
+        if self.value.startswith("/") or not self.parent_base_dir:
+            return path
+        return f"{self.parent_base_dir}/{path}"
+
+    def default_package(self) -> str:
+        return self.group_path().replace("/", ".")
+
+    def set_package_header(self, header: Optional[str]):
+        if header is None:
+            return
+        # Un en-tête est toujours absolu
+        if header != "_global_" and not header.startswith("_global_."):
+            header = "_global_" if header == "" else f"_global_.{header}"
+        self.package_header = header
+
+    def final_package(self, use_header: bool = True) -> str:
+        package = self.package if self.package is not None or not use_header else self.package_header
+        if package is None:
+            package = self._relative_group().replace("/", ".")
+        parent = self.parent_package
+        if not parent:
+            result = package
+        elif package == "":
+            result = parent
+        else:
+            result = f"{parent}.{package}"
+        index = result.rfind("_global_")
+        return result if index == -1 else result[index + len("_global_") + 1:]
+
+    def override_key(self) -> str:
+        default, final = self.default_package(), self.final_package(use_header=False)
+        key = self.group_path()
+        if default != final:
+            key = f"{key}@{final or '_global_'}"
+        return key
+
+    def is_missing(self) -> bool:
+        return isinstance(self.value, str) and self.name() == "???"
+
+    def is_interpolation(self) -> bool:
+        return isinstance(self.value, str) and "${" in self.value
+
+    def __repr__(self):
+        return f"_Entry(group={self.group!r}, value={self.value!r}, package={self.package!r})"
+
+
+class _Node:
+    __slots__ = ("entry", "children", "parent")
+
+    def __init__(self, entry: _Entry, parent: Optional["_Node"] = None):
+        self.entry = entry
+        self.children: Optional[list] = None
+        self.parent = parent
+
+
+class _Overrides:
+    """Choix de groupes imposés (overrides externes, puis mots-clés ``override``)."""
+
+    def __init__(self, session: "NativeSession", overrides: List[Override]):
+        self.choices: Dict[str, Any] = {}
+        # clé -> [externe, configuration contenant l'override, utilisé]
+        self.metadata: Dict[str, list] = {}
+        self.appended: List[_Entry] = []
+        self.config_overrides: List[Override] = []
+        self.deletions: Dict[str, list] = {}
+        self.known: Dict[str, Optional[str]] = {}
+        self.known_per_group: Dict[str, set] = {}
+        for override in overrides:
+            if _is_hydra(override.key_or_group):
+                # Vise le nœud hydra, retiré de toute façon du résultat
+                continue
+            value = override.value()
+            if isinstance(value, dict) or not session.group_exists(override.key_or_group):
+                self.config_overrides.append(override)
+            elif override.is_force_add():
+                raise CompositionError(f"force-add de groupes non pris en charge: '{override.input_line}'")
+            elif override.is_delete():
+                if value is not None and not isinstance(value, str):
+                    raise CompositionError(f"La suppression d'un groupe attend un nom d'option: '{override.input_line}'")
+                self.deletions[override.key_element()] = [value, False]
+            elif not isinstance(value, (str, list)):
+                raise CompositionError(
+                    f"Un override de groupe attend un nom ou une liste, reçu {type(value).__name__}")
+            elif override.is_add():
+                self.appended.append(_Entry(value, group=override.key_or_group, package=override.package,
+                                            external_append=True))
+            else:
+                key = override.key_element()
+                self.choices[key] = value
+                self.metadata[key] = [True, None, False]
+
+    def add(self, parent_path: str, entry: _Entry):
+        key = entry.override_key()
+        if key not in self.choices:
+            self.choices[key] = entry.value
+            self.metadata[key] = [False, parent_path, False]
+
+    def apply(self, entry: _Entry):
+        key = entry.override_key()
+        if entry.group is not None and key in self.choices:
+            entry.value = self.choices[key]
+            self.metadata[key][2] = True
+
+    def set_known(self, entry: _Entry):
+        if entry.group is None:
+            return
+        key = entry.override_key()
+        name = entry.name() if isinstance(entry.value, str) or entry.value is None else None
+        if key not in self.known:
+            self.known[key] = name
+        elif self.known[key] != name:
+            raise CompositionError(
+                f"Plusieurs valeurs pour {key}. Pour la remplacer, utiliser 'override {key}: {self.known[key]}'")
+        self.known_per_group.setdefault(entry.group_path(), set()).add(key)
+
+    def is_deleted(self, entry: _Entry) -> bool:
+        if entry.group is None:
+            return False
+        deletion = self.deletions.get(entry.override_key())
+        return deletion is not None and (deletion[0] is None or deletion[0] == entry.name())
+
+    def ensure_used(self):
+        for key, (external, parent_path, used) in self.metadata.items():
+            if used:
+                continue
+            choices = sorted(self.known_per_group.get(key.split("@")[0], ()))
+            if len(choices) > 1:
+                message = f"Override impossible de '{key}'. Vouliez-vous remplacer l'un de {', '.join(choices)} ?"
+            elif choices:
+                message = f"Override impossible de '{key}'. Vouliez-vous remplacer {choices[0]} ?"
+            else:
+                message = f"Override impossible de '{key}': absent de la liste des defaults."
+            if parent_path is not None:
+                message = f"Dans '{parent_path}': {message}"
+            if external:
+                message += f"\nPour l'ajouter à la liste des defaults: +{key}={self.choices[key]}"
+            raise CompositionError(message)
+        for key, (name, used) in self.deletions.items():
+            if not used:
+                described = f"{key}={name}" if name is not None else key
+                raise CompositionError(f"Suppression impossible de '{described}': absent de la liste des defaults")
+
+
+def parse_config(text: str, config_path: str) -> Tuple[Any, list, Optional[str]]:
+    """Analyse le texte d'un fichier de configuration.
+
+    Args:
+        text: Contenu YAML
+        config_path: Chemin de la configuration (messages d'erreur)
+
+    Returns:
+        tuple: (contenu sans ``defaults``, entrées brutes de ``defaults``, en-tête ``# @package``)
+
+    Raises:
+        CompositionError: En-tête ou liste des defaults invalide
+    """
+    header = None
+    # Comme Hydra: l'en-tête s'arrête à la première ligne qui n'est pas ``# @clé valeur``
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        match = HEADER_PATTERN.match(line)
+        if not match:
+            if HEADER_START.match(line):
+                raise CompositionError(f"En-tête invalide dans '{config_path}': {line.strip()!r} "
+                                       "(format attendu: # @clé valeur)")
+            break
+        if match.group(1) == "package":
+            header = match.group(2)
+    data = yaml.load(text, Loader=get_yaml_loader())
+    defaults = []
+    if isinstance(data, dict) and "defaults" in data:
+        defaults = data.pop("defaults")
+        if not isinstance(defaults, list):
+            raise CompositionError(f"Liste des defaults invalide dans '{config_path}': une liste est attendue")
+    return data, defaults, header
+
+
+class _Loaded(NamedTuple):
+    """Fichier YAML analysé: contenu (sans ``defaults``), liste des defaults, en-tête de package."""
+    data: Any
+    defaults: List[_Entry]
+    header: Optional[str]
+    stamp: tuple
+
+
+class NativeSession:
+    """Composition sans Hydra, pour les racines d'un lecteur (``TheReader(engine="native")``).
+
+    Implémente la sémantique de la liste des defaults utilisée par nos
+    configurations: groupes et sous-groupes, ``_self_``, ``override``,
+    ``optional``, listes d'options, defaults imbriqués (chemins relatifs
+    ou absolus), packages ``@pkg`` et en-têtes ``# @package``, ainsi que
+    les overrides ``groupe=option``, ``+groupe=option``, ``~groupe`` et
+    ``[+|++|~]clé=valeur``. Ni ``GlobalHydra``, ni le chemin de recherche
+    de Hydra, ni les groupes ``hydra/`` (job, logging) ne sont chargés.
+
+    Les interpolations dans la liste des defaults, les balayages et les
+    schémas du ``ConfigStore`` ne sont pas pris en charge
+    (``CompositionError``). Chaque fichier YAML n'est analysé qu'une fois
+    tant que sa date et sa taille ne changent pas.
+    """
+
+    def __init__(self, root: str, extra_roots: Sequence[str] = ()):
+        self.roots = tuple(os.path.abspath(path) for path in (root, *extra_roots))
+        self._lock = threading.Lock()
+        self._files: Dict[str, _Loaded] = {}
+
+    @property
+    def root(self) -> str:
+        return self.roots[0]
+
+    # --- Dépôt de fichiers -------------------------------------------------
+
+    def _find(self, config_path: str) -> Optional[str]:
+        relpath = config_path if config_path.endswith(".yaml") else f"{config_path}.yaml"
+        for root in self.roots:
+            if get_manifest(root).isfile(relpath):
+                return os.path.join(root, *relpath.split("/"))
+        return None
+
+    def group_exists(self, group: str) -> bool:
+        return any(get_manifest(root).isdir(group) for root in self.roots)
+
+    def group_options(self, group: str) -> List[str]:
+        """Liste les options disponibles pour un groupe."""
+        options = set()
+        for root in self.roots:
+            options.update(name[:-len(".yaml")] for name in get_manifest(root).listdir(group)
+                           if name.endswith(".yaml"))
+        return sorted(options)
+
+    def list_groups(self, parent: str = "") -> List[str]:
+        """Liste les sous-groupes d'un groupe."""
+        groups = set()
+        for root in self.roots:
+            manifest = get_manifest(root)
+            if manifest.isdir(parent):
+                groups.update(group.rsplit("/", 1)[-1] for group in manifest.groups()
+                              if (group.rsplit("/", 1)[0] if "/" in group else "") == parent)
+        return sorted(groups)
+
+    def _load(self, config_path: str) -> Optional[_Loaded]:
+        path = self._find(config_path)
+        if path is None:
+            return None
+        info = os.stat(path)
+        stamp = (path, info.st_mtime_ns, info.st_size)
+        loaded = self._files.get(config_path)
+        if loaded is not None and loaded.stamp == stamp:
+            return loaded
+        with open(path, "r", encoding="utf-8") as f:
+            data, raw, header = parse_config(f.read(), config_path)
+        defaults = [self._entry(config_path, item) for item in raw]
+        loaded = self._files[config_path] = _Loaded(data, defaults, header, stamp)
+        return loaded
+
+    @staticmethod
+    def _entry(config_path: str, item: Any) -> _Entry:
+        if isinstance(item, str):
+            path, _, package = item.partition("@")
+            return _Entry(path, package=package.split(":")[0] if "@" in item else None)
+        if not isinstance(item, dict) or len(item) != 1:
+            raise CompositionError(f"Dans '{config_path}': entrée de defaults invalide {item!r}")
+        (key, value), = item.items()
+        words = key.split(" ")
+        group, keywords = words[-1], words[:-1]
+        group, _, package = group.partition("@")
+        if value is not None and not isinstance(value, (str, list)):
+            raise CompositionError(f"Dans '{config_path}': valeur de defaults non prise en charge "
+                                   f"({type(value).__name__})")
+        return _Entry(value, group=group, package=package.split(":")[0] if "@" in key else None,
+                      optional="optional" in keywords, override="override" in keywords)
+
+    # --- Liste des defaults -----------------------------------------------
+
+    def _missing(self, node: _Node):
+        entry = node.entry
+        if entry.primary:
+            raise MissingConfigError(f"Configuration principale '{entry.config_path()}' introuvable dans {list(self.roots)}")
+        message = f"Configuration '{entry.config_path()}' introuvable"
+        if entry.group is not None:
+            options = self.group_options(entry.group_path())
+            if options:
+                message += f" (options de '{entry.group_path()}': {', '.join(options)})"
+        if node.parent is not None:
+            message = f"Dans '{node.parent.entry.config_path()}': {message}"
+        raise MissingConfigError(message)
+
+    def _expand(self, node: _Node, overrides: _Overrides, is_root: bool):
+        parent = node.entry
+        if is_root:
+            parent.update_parent("", "")
+        if parent.value is not None and not parent.is_missing():
+            loaded = self._load(parent.config_path())
+            if loaded is not None:
+                parent.set_package_header(loaded.header)
+        if overrides.is_deleted(parent):
+            parent.deleted = True
+            overrides.deletions[parent.override_key()][1] = True
+            return
+        overrides.set_known(parent)
+        if parent.value is None:
+            return
+        if parent.is_missing():
+            options = self.group_options(parent.group_path())
+            raise CompositionError(f"'{parent.override_key()}' doit être choisi, ex: {parent.override_key()}=<OPTION>"
+                                   f"\nOptions disponibles: {', '.join(options)}")
+        if parent.is_interpolation():
+            raise CompositionError(f"'{parent.config_path()}': interpolation dans la liste des defaults "
+                                   "non prise en charge par le moteur natif")
+        loaded = self._load(parent.config_path())
+        if loaded is None:
+            if parent.optional:
+                parent.deleted = True
+                return
+            self._missing(node)
+
+        # Entrées de la configuration de Hydra (``override hydra/job_logging: disabled``)
+        defaults = [entry.copy() for entry in loaded.defaults
+                    if not (entry.group is not None and _is_hydra(entry.group))]
+        if defaults or (is_root and overrides.appended):
+            self._validate_self(parent, defaults, loaded.data)
+        if is_root:
+            defaults.extend(entry.copy() for entry in overrides.appended)
+
+        # Mots-clés override: enregistrés avant l'expansion des enfants
+        seen_override = None
+        for entry in defaults:
+            if entry.is_self:
+                continue
+            entry.update_parent(parent.group_path(), parent.final_package())
+            if seen_override is not None and not (entry.override or entry.external_append):
+                raise CompositionError(
+                    f"Dans {parent.config_path()}: l'override '{seen_override.override_key()} : "
+                    f"{seen_override.name()}' précède '{entry.override_key()}: {entry.name()}'. "
+                    "Les overrides doivent être à la fin de la liste des defaults")
+            if entry.group is not None and entry.override:
+                seen_override = entry
+                overrides.add(parent.config_path(), entry)
+
+        children = []
+        # Ordre inverse (comme Hydra): les overrides des derniers éléments l'emportent
+        for entry in reversed(defaults):
+            if entry.is_self:
+                entry.update_parent(parent.parent_base_dir, parent.package if parent.package is not None
+                                    else parent.package_header)
+                children.append(entry)
+                continue
+            if entry.override:
+                continue
+            entry.update_parent(parent.group_path(), parent.final_package())
+            overrides.apply(entry)
+            if entry.group is not None and isinstance(entry.value, list):
+                for item in reversed(entry.value):
+                    option = _Entry(f"{entry.group}/{item}", package=entry.package, optional=entry.optional)
+                    option.update_parent(parent.group_path(), parent.final_package())
+                    children.append(self._child(option, node, overrides))
+            else:
+                children.append(self._child(entry, node, overrides))
+        if children:
+            node.children = list(reversed(children))
+
+    def _child(self, entry: _Entry, parent: _Node, overrides: _Overrides):
+        node = _Node(entry, parent)
+        self._expand(node, overrides, is_root=False)
+        return node if node.children is not None else entry
+
+    @staticmethod
+    def _validate_self(parent: _Entry, defaults: List[_Entry], data: Any):
+        selves = [entry for entry in defaults if entry.is_self]
+        if len(selves) > 1:
+            raise CompositionError(f"_self_ présent plusieurs fois dans {parent.config_path()}")
+        has_non_override = any(not entry.override for entry in defaults)
+        if (not selves and has_non_override) or not defaults:
+            has_content = isinstance(data, dict) and any(
+                key != "defaults" and value != "???" for key, value in data.items())
+            if parent.primary and has_content and has_non_override:
+                warnings.warn(f"Dans '{parent.config_path()}': la liste des defaults ne contient pas `_self_` "
+                              "(ajouté à la fin)", UserWarning, stacklevel=2)
+            defaults.append(_Entry("_self_"))
+
+    def _flatten(self, node: _Node, output: List[ResultDefault]):
+        def visit(tree: Optional[_Node], entry: _Entry):
+            if entry.deleted or entry.value is None or entry.is_missing():
+                return
+            if entry.is_self:
+                owner = tree.entry
+                parent = tree.parent.entry.config_path() if tree.parent is not None else None
+                output.append(ResultDefault(owner.config_path(), owner.final_package(), parent,
+                                            True, owner.primary))
+            else:
+                output.append(ResultDefault(entry.config_path(), entry.final_package(),
+                                            tree.entry.config_path() if tree is not None else None,
+                                            False, entry.primary,
+                                            entry.override_key() if entry.group is not None else None))
+
+        if not node.children:
+            visit(node.parent, node.entry)
+            return
+        for child in node.children:
+            if isinstance(child, _Entry):
+                visit(node, child)
+            else:
+                self._flatten(child, output)
+
+    def _defaults(self, config_name: str, overrides: List[Override]) -> Tuple[List[ResultDefault], List[Override]]:
+        state = _Overrides(self, overrides)
+        root = _Node(_Entry(config_name, primary=True))
+        root.entry.update_parent("", "")
+        if self._find(config_name) is None:
+            self._missing(root)
+        self._expand(root, state, is_root=True)
+        result: List[ResultDefault] = []
+        self._flatten(root, result)
+        keys = set()
+        for default in result:
+            if not default.is_self and default.override_key is not None:
+                if default.override_key in keys:
+                    raise CompositionError(f"{default.override_key} apparaît plusieurs fois dans la liste des defaults")
+                keys.add(default.override_key)
+        state.ensure_used()
+        return result, state.config_overrides
+
+    # --- API commune avec ComposeSession -----------------------------------
+
+    def parse_overrides(self, overrides: Sequence[str]) -> List[Override]:
+        """Analyse des overrides (équivalent de ``OverridesParser.parse_overrides``)."""
+        return [parse_override(line) for line in overrides]
+
+    def defaults_list(self, config_name: str, overrides: Optional[List[str]] = None) -> List[ResultDefault]:
+        """Retourne la liste des defaults résolue (ordre de fusion Hydra)."""
+        with self._lock:
+            return self._defaults(config_name, self.parse_overrides(overrides or []))[0]
+
+    def load_default(self, default: ResultDefault) -> DictConfig:
+        """Charge une entrée de la liste des defaults, placée sous son package.
+
+        Returns:
+            DictConfig: Configuration de l'entrée (ex: ``{database: {...}}``)
+        """
+        with self._lock:
+            loaded = self._load(default.config_path)
+        if loaded is None:
+            raise MissingConfigError(f"Configuration '{default.config_path}' introuvable")
+        data = loaded.data if loaded.data is not None else {}
+        # Imbrication en dictionnaires simples: un seul OmegaConf.create, sans copie du nœud
+        for key in reversed(default.package.split(".") if default.package else ()):
+            data = {key: data}
+        return OmegaConf.create(data)
+
+    def compose(self, config_name: str, overrides: Optional[List[str]] = None,
+                return_hydra_config: bool = False) -> DictConfig:
+        """Compose une configuration, équivalent à ``ComposeSession.compose``.
+
+        Args:
+            config_name: Nom de la configuration
+            overrides: Overrides (groupes et valeurs)
+            return_hydra_config: Non pris en charge (aucun nœud ``hydra`` n'est composé)
+
+        Returns:
+            DictConfig: Configuration composée (mode struct)
+
+        Raises:
+            CompositionError: Liste des defaults ou override invalide
+            MissingConfigError: Configuration introuvable
+        """
+        if return_hydra_config:
+            raise CompositionError("Le moteur natif ne compose pas le nœud 'hydra'")
+        with self._lock:
+            defaults, config_overrides = self._defaults(config_name, self.parse_overrides(overrides or []))
+        cfg = OmegaConf.create()
+        with flag_override(cfg, "no_deepcopy_set_nodes", True):
+            for default in defaults:
+                try:
+                    cfg.merge_with(self.load_default(default))
+                except CompositionError:
+                    raise
+                except Exception as e:
+                    raise CompositionError(f"Dans '{default.config_path}': {type(e).__name__} "
+                                           f"pendant la composition:\n{e}") from e
+        if "hydra" in cfg:
+            del cfg["hydra"]
+        OmegaConf.set_struct(cfg, True)
+        self.apply_overrides(config_overrides, cfg)
+        return cfg
+
+    @staticmethod
+    def apply_overrides(overrides: List[Override], cfg: DictConfig):
+        """Applique des overrides de valeurs (équivalent de ``_apply_overrides_to_config``)."""
+        for override in overrides:
+            if override.package is not None:
+                raise CompositionError(f"L'override {override.input_line} vise un groupe "
+                                       f"'{override.key_or_group}' qui n'existe pas")
+            key, value = override.key_or_group, override.value()
+            try:
+                if override.is_delete():
+                    current = OmegaConf.select(cfg, key, throw_on_missing=False)
+                    if current is None:
+                        raise CompositionError(f"Suppression impossible: '{key}' n'existe pas")
+                    if value is not None and value != current:
+                        raise CompositionError(f"Suppression impossible: '{key}' vaut {current} et non {value}")
+                    head, _, last = key.rpartition(".")
+                    with open_dict(cfg):
+                        node = OmegaConf.select(cfg, head) if head else cfg
+                        del node[last]
+                elif override.is_add():
+                    if OmegaConf.select(cfg, key, throw_on_missing=False) is None or isinstance(value, (dict, list)):
+                        OmegaConf.update(cfg, key, value, merge=True, force_add=True)
+                    else:
+                        raise CompositionError(
+                            f"Ajout impossible: '{key}' existe déjà. Retirer le + ('{override.input_line[1:]}') "
+                            f"ou utiliser ++ ('+{override.input_line}')")
+                elif override.is_force_add():
+                    OmegaConf.update(cfg, key, value, merge=True, force_add=True)
+                else:
+                    try:
+                        OmegaConf.update(cfg, key, value, merge=True)
+                    except (AttributeError, KeyError) as e:
+                        raise CompositionError(f"Override impossible de '{key}'.\n"
+                                               f"Pour l'ajouter à la configuration: +{override.input_line}") from e
+            except CompositionError:
+                raise
+            except Exception as e:
+                raise CompositionError(f"Erreur en appliquant l'override {override.input_line}: {e}") from e
+
+    def provenance(self, config_name: str, overrides: Optional[List[str]] = None) -> Dict[str, str]:
+        """Indique pour chaque clé feuille le fichier qui l'a définie en dernier."""
+        sources: Dict[str, str] = {}
+
+        def collect(data, prefix, source):
+            if isinstance(data, dict):
+                for key, value in data.items():
+                    collect(value, f"{prefix}.{key}" if prefix else str(key), source)
+            elif prefix:
+                sources[prefix] = source
+
+        for default in self.defaults_list(config_name, overrides):
+            loaded = OmegaConf.to_container(self.load_default(default), resolve=False)
+            collect(loaded, "", default.config_path)
+        return sources
+
+    def __repr__(self):
+        return f"NativeSession(roots={list(self.roots)!r})"
@@ -0,0 +1,383 @@
+import json
+import os
+import re
+import threading
+import time
+import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from omegaconf import OmegaConf
+
+RESOLVER_NAME = "secret"
+DEFAULT_PROVIDER = "default"
+# ${secret:db/master,password}, ${secret:'vault:db/master#password'}
+SECRET_PATTERN = re.compile(r"\$\{\s*secret\s*:([^${}]*)\}")
+
+_PROVIDERS: Dict[str, "SecretCache"] = {}
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+class SecretNotFoundError(KeyError):
+    """Secret absent du fournisseur."""
+
+
+class SecretProvider:
+    """Source de secrets interrogée par le résolveur ``${secret:...}``.
+
+    Les sous-classes implémentent ``fetch_many``: tous les secrets demandés
+    sont récupérés en un seul aller-retour. Un secret est identifié par un
+    chemin (``db/master``) et vaut un scalaire ou un dictionnaire de champs.
+    """
+
+    def fetch_many(self, paths: List[str]) -> Dict[str, Any]:
+        """Récupère plusieurs secrets; les chemins inconnus sont absents du résultat."""
+        raise NotImplementedError
+
+    def fetch(self, path: str) -> Any:
+        values = self.fetch_many([path])
+        if path not in values:
+            raise SecretNotFoundError(path)
+        return values[path]
+
+
+class FileKeystore(SecretProvider):
+    """Trousseau de secrets stocké dans un fichier JSON ou YAML local.
+
+    Format: ``{"db/master": {"user": "admin", "password": "..."}}``. Le
+    fichier n'est relu que s'il a été modifié.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        self._data: Dict[str, Any] = {}
+        self._stamp = None
+
+    def _load(self) -> Dict[str, Any]:
+        stat = os.stat(self.path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp != self._stamp:
+            with open(self.path, "r", encoding="utf-8") as f:
+                if self.path.endswith((".yaml", ".yml")):
+                    import yaml
+                    data = yaml.safe_load(f) or {}
+                else:
+                    data = json.load(f)
+            self._data, self._stamp = data, stamp
+        return self._data
+
+    def fetch_many(self, paths: List[str]) -> Dict[str, Any]:
+        data = self._load()
+        return {path: data[path] for path in paths if path in data}
+
+
+class HttpVault(SecretProvider):
+    """Client d'un coffre HTTP façon Vault (voir ``VaultStandIn``).
+
+    Un seul ``POST {url}/v1/secrets`` de corps ``{"paths": [...]}`` par lot;
+    la réponse est ``{"data": {chemin: valeur}}``.
+    """
+
+    def __init__(self, url: str, token: Optional[str] = None, timeout: float = 5.0):
+        self.url = url.rstrip("/")
+        self.token = token
+        self.timeout = timeout
+
+    def fetch_many(self, paths: List[str]) -> Dict[str, Any]:
+        request = urllib.request.Request(
+            f"{self.url}/v1/secrets",
+            data=json.dumps({"paths": list(paths)}).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        if self.token:
+            request.add_header("X-Vault-Token", self.token)
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read().decode("utf-8")).get("data", {})
+
+
+class VaultStandIn:
+    """Coffre HTTP local servant un dictionnaire ou un ``FileKeystore``.
+
+    Remplace un vrai coffre en développement et dans les tests::
+
+        with VaultStandIn({"db/master": {"password": "s3cret"}}) as vault:
+            register_provider(HttpVault(vault.url))
+
+    Attributes:
+        requests: Nombre de requêtes (allers-retours) reçues
+    """
+
+    def __init__(self, secrets: Any, host: str = "127.0.0.1", port: int = 0,
+                 token: Optional[str] = None):
+        self.secrets = secrets
+        self.token = token
+        self.requests = 0
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                stand_in.requests += 1
+                if self.path != "/v1/secrets":
+                    return self._reply(404, {"errors": ["not found"]})
+                if stand_in.token and self.headers.get("X-Vault-Token") != stand_in.token:
+                    return self._reply(403, {"errors": ["permission denied"]})
+                length = int(self.headers.get("Content-Length") or 0)
+                paths = json.loads(self.rfile.read(length) or b"{}").get("paths", [])
+                source = stand_in.secrets
+                if isinstance(source, SecretProvider):
+                    data = source.fetch_many(paths)
+                else:
+                    data = {path: source[path] for path in paths if path in source}
+                self._reply(200, {"data": data})
+
+            def _reply(self, status, body):
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "VaultStandIn":
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="buddy-secrets")
+        return _EXECUTOR
+
+
+class SecretCache:
+    """Cache mémoire à durée de vie (TTL) devant un fournisseur de secrets.
+
+    Un secret lu après ``refresh_ahead * ttl`` est servi depuis le cache et
+    rafraîchi en arrière-plan, en un seul lot avec les autres secrets dans
+    le même cas; un secret expiré est relu avant d'être servi.
+    """
+
+    def __init__(self, provider: SecretProvider, ttl: float = 300.0, refresh_ahead: float = 0.8,
+                 clock: Callable[[], float] = time.monotonic):
+        """Initialise le cache.
+
+        Args:
+            provider: Fournisseur interrogé
+            ttl: Durée de vie d'un secret en secondes
+            refresh_ahead: Fraction du TTL à partir de laquelle le rafraîchissement démarre
+            clock: Horloge monotone (remplaçable dans les tests)
+        """
+        self.provider = provider
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self.clock = clock
+        self._entries: Dict[str, Tuple[Any, float]] = {}
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def load(self, paths: Iterable[str]) -> Dict[str, Any]:
+        """Récupère un lot de secrets (un aller-retour) et les met en cache."""
+        paths = sorted(set(paths))
+        values = self.provider.fetch_many(paths) if paths else {}
+        fetched_at = self.clock()
+        with self._lock:
+            for path, value in values.items():
+                self._entries[path] = (value, fetched_at)
+        return values
+
+    def _submit(self, paths: List[str]) -> Optional[Future]:
+        """Lance le chargement en arrière-plan des chemins qui ne sont pas déjà en cours."""
+        with self._lock:
+            paths = [path for path in paths if path not in self._inflight]
+            if not paths:
+                return None
+            future = _executor().submit(self.load, paths)
+            for path in paths:
+                self._inflight[path] = future
+
+        def done(_):
+            with self._lock:
+                for path in paths:
+                    if self._inflight.get(path) is future:
+                        del self._inflight[path]
+
+        future.add_done_callback(done)
+        return future
+
+    def prefetch(self, paths: Iterable[str]) -> Optional[Future]:
+        """Précharge en arrière-plan, en un seul lot, les secrets absents ou à rafraîchir."""
+        now = self.clock()
+        with self._lock:
+            missing = [path for path in set(paths)
+                       if path not in self._entries
+                       or now - self._entries[path][1] >= self.ttl * self.refresh_ahead]
+        return self._submit(sorted(missing))
+
+    def get(self, path: str) -> Any:
+        """Retourne un secret, depuis le cache si possible.
+
+        Raises:
+            SecretNotFoundError: Si le fournisseur ne connaît pas ce chemin
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            pending = self._inflight.get(path)
+        if entry is not None:
+            age = self.clock() - entry[1]
+            if age < self.ttl:
+                if age >= self.ttl * self.refresh_ahead:
+                    self._refresh()
+                return entry[0]
+        if pending is not None:
+            # Préchargement en cours: l'attendre plutôt que refaire un aller-retour
+            try:
+                pending.result()
+            except Exception:
+                pass
+            with self._lock:
+                entry = self._entries.get(path)
+            if entry is not None and self.clock() - entry[1] < self.ttl:
+                return entry[0]
+        values = self.load([path])
+        if path not in values:
+            raise SecretNotFoundError(path)
+        return values[path]
+
+    def _refresh(self):
+        now = self.clock()
+        with self._lock:
+            stale = [path for path, (_, fetched_at) in self._entries.items()
+                     if now - fetched_at >= self.ttl * self.refresh_ahead]
+        self._submit(sorted(stale))
+
+    def wait(self, timeout: Optional[float] = None):
+        """Attend la fin des chargements en arrière-plan."""
+        with self._lock:
+            futures = set(self._inflight.values())
+        for future in futures:
+            try:
+                future.result(timeout)
+            except Exception:
+                pass
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def parse_reference(reference: str, field: Optional[str] = None) -> Tuple[str, str, Optional[str]]:
+    """Décompose ``[fournisseur:]chemin[#champ]`` en ``(fournisseur, chemin, champ)``."""
+    name, sep, path = reference.strip().partition(":")
+    if not sep:
+        name, path = DEFAULT_PROVIDER, name
+    path, sep, inline = path.partition("#")
+    return name.strip(), path.strip(), (field if field is not None else inline if sep else None)
+
+
+def _resolve(reference: str, field: Optional[str] = None) -> Any:
+    name, path, field = parse_reference(reference, field)
+    cache = _PROVIDERS.get(name)
+    if cache is None:
+        raise KeyError(f"Aucun fournisseur de secrets '{name}' enregistré")
+    value = cache.get(path)
+    if field:
+        if not isinstance(value, dict) or field not in value:
+            raise SecretNotFoundError(f"{path}#{field}")
+        value = value[field]
+    return value
+
+
+def register_provider(provider: SecretProvider, name: str = DEFAULT_PROVIDER,
+                      ttl: float = 300.0, refresh_ahead: float = 0.8) -> SecretCache:
+    """Enregistre un fournisseur et le résolveur ``${secret:...}``.
+
+    Args:
+        provider: Fournisseur de secrets
+        name: Nom utilisé comme préfixe (``${secret:'vault:db/master#password'}``)
+        ttl: Durée de vie des secrets en cache, en secondes
+        refresh_ahead: Fraction du TTL à partir de laquelle le rafraîchissement démarre
+
+    Returns:
+        SecretCache: Cache associé au fournisseur
+    """
+    if not OmegaConf.has_resolver(RESOLVER_NAME):
+        OmegaConf.register_new_resolver(RESOLVER_NAME, _resolve, use_cache=False)
+    cache = _PROVIDERS[name] = SecretCache(provider, ttl=ttl, refresh_ahead=refresh_ahead)
+    return cache
+
+
+def unregister_provider(name: str = DEFAULT_PROVIDER):
+    _PROVIDERS.pop(name, None)
+
+
+def clear_providers():
+    """Oublie tous les fournisseurs (le résolveur reste enregistré)."""
+    _PROVIDERS.clear()
+
+
+def has_providers() -> bool:
+    return bool(_PROVIDERS)
+
+
+def _arguments(expression: str) -> List[str]:
+    return [arg.strip().strip("'\"") for arg in expression.split(",")]
+
+
+def secret_references(data: Any) -> Set[Tuple[str, str]]:
+    """Retourne les ``(fournisseur, chemin)`` référencés par une configuration non résolue."""
+    found: Set[Tuple[str, str]] = set()
+    if isinstance(data, dict):
+        for value in data.values():
+            found |= secret_references(value)
+    elif isinstance(data, list):
+        for value in data:
+            found |= secret_references(value)
+    elif isinstance(data, str) and "secret" in data:
+        for expression in SECRET_PATTERN.findall(data):
+            name, path, _ = parse_reference(_arguments(expression)[0])
+            if path:
+                found.add((name, path))
+    return found
+
+
+def prefetch(data: Any) -> List[Future]:
+    """Précharge en arrière-plan tous les secrets référencés, un lot par fournisseur.
+
+    Args:
+        data: Configuration non résolue (conteneur Python)
+
+    Returns:
+        list: Chargements lancés (le résolveur les attend au besoin)
+    """
+    by_provider: Dict[str, List[str]] = {}
+    for name, path in secret_references(data):
+        if name in _PROVIDERS:
+            by_provider.setdefault(name, []).append(path)
+    futures = [_PROVIDERS[name].prefetch(paths) for name, paths in sorted(by_provider.items())]
+    return [future for future in futures if future is not None]
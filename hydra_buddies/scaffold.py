@@ -0,0 +1,187 @@
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Template fourni avec le paquet (rendu nativement, sans cookiecutter)
+TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "templates", "hydra_conf")
+
+# Seules les substitutions simples {{ cookiecutter.nom }} sont compilées
+VARIABLE_PATTERN = re.compile(r"\{\{\s*cookiecutter\.(\w+)\s*\}\}")
+UNSUPPORTED_PATTERN = re.compile(r"\{%|\{#|\{\{(?!\s*cookiecutter\.\w+\s*\}\})")
+
+GITIGNORE_LINE = ".hydra-conf/secrets/*\n"
+
+_COMPILED: Dict[str, "CompiledTemplate"] = {}
+_COMPILED_LOCK = threading.Lock()
+
+
+class UnsupportedTemplate(ValueError):
+    """Template qui exige cookiecutter (blocs Jinja, filtres, hooks...)."""
+
+
+def _segments(text: str, source: str) -> Tuple[Any, ...]:
+    """Découpe un texte en parties littérales (str) et variables (tuple ``(nom,)``)."""
+    if UNSUPPORTED_PATTERN.search(text):
+        raise UnsupportedTemplate(f"Syntaxe Jinja non prise en charge dans {source}")
+    parts: List[Any] = []
+    position = 0
+    for match in VARIABLE_PATTERN.finditer(text):
+        if match.start() > position:
+            parts.append(text[position:match.start()])
+        parts.append((match.group(1),))
+        position = match.end()
+    if position < len(text):
+        parts.append(text[position:])
+    return tuple(parts)
+
+
+def _render(segments: Tuple[Any, ...], context: Dict[str, Any]) -> str:
+    return "".join(part if isinstance(part, str) else str(context[part[0]]) for part in segments)
+
+
+class CompiledTemplate:
+    """Template cookiecutter compilé une fois en liste de fichiers à écrire.
+
+    Le répertoire racine ``{{cookiecutter.xxx}}`` du template est omis: son
+    contenu est écrit directement dans le répertoire cible, comme le faisait
+    ``buddy init`` après rendu par cookiecutter. Chemins et contenus sont
+    découpés en parties littérales et variables; le rendu n'est plus qu'une
+    concaténation.
+    """
+
+    def __init__(self, template_dir: str):
+        self.template_dir = os.path.abspath(template_dir)
+        if os.path.isdir(os.path.join(self.template_dir, "hooks")):
+            raise UnsupportedTemplate(f"Hooks cookiecutter dans {self.template_dir}")
+        with open(os.path.join(self.template_dir, "cookiecutter.json"), "r") as f:
+            self.defaults: Dict[str, Any] = json.load(f)
+        roots = [name for name in os.listdir(self.template_dir) if VARIABLE_PATTERN.fullmatch(name)]
+        if len(roots) != 1:
+            raise UnsupportedTemplate(f"Répertoire racine du template introuvable dans {self.template_dir}")
+        root = os.path.join(self.template_dir, roots[0])
+
+        self.files: List[Tuple[Tuple[Any, ...], Any]] = []
+        for directory, _, names in os.walk(root):
+            for name in sorted(names):
+                source = os.path.join(directory, name)
+                relative = os.path.relpath(source, root).replace(os.sep, "/")
+                path = _segments(relative, relative)
+                with open(source, "rb") as f:
+                    content = f.read()
+                try:
+                    text = content.decode("utf-8")
+                except UnicodeDecodeError:
+                    # Fichier binaire: copié tel quel
+                    self.files.append((path, content))
+                else:
+                    self.files.append((path, _segments(text, relative)))
+
+    def context(self, **values: Any) -> Dict[str, Any]:
+        """Valeurs par défaut de ``cookiecutter.json`` complétées par ``values``."""
+        return {**self.defaults, **values}
+
+    def render(self, target: str, context: Optional[Dict[str, Any]] = None) -> List[str]:
+        """Écrit les fichiers du template dans ``target``.
+
+        Args:
+            target: Répertoire cible (créé si besoin)
+            context: Variables du template (défaut: ``project_name`` = nom du répertoire)
+
+        Returns:
+            list: Chemins des fichiers écrits
+        """
+        target = os.path.abspath(target)
+        context = context or self.context(project_name=os.path.basename(target))
+        written = []
+        for path, content in self.files:
+            destination = os.path.join(target, *_render(path, context).split("/"))
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            if isinstance(content, bytes):
+                with open(destination, "wb") as f:
+                    f.write(content)
+            else:
+                with open(destination, "w", encoding="utf-8", newline="") as f:
+                    f.write(_render(content, context))
+            written.append(destination)
+        return written
+
+
+def compile_template(template_dir: str = TEMPLATE_DIR) -> CompiledTemplate:
+    """Retourne le template compilé (une seule fois par processus).
+
+    Raises:
+        UnsupportedTemplate: Si le template exige cookiecutter
+    """
+    template_dir = os.path.abspath(template_dir)
+    with _COMPILED_LOCK:
+        template = _COMPILED.get(template_dir)
+        if template is None:
+            template = _COMPILED[template_dir] = CompiledTemplate(template_dir)
+    return template
+
+
+def ensure_gitignore(target: str):
+    """Ajoute les secrets au ``.gitignore`` du répertoire cible."""
+    gitignore_path = os.path.join(target, ".gitignore")
+    if os.path.exists(gitignore_path):
+        with open(gitignore_path, "r") as f:
+            if GITIGNORE_LINE in f.readlines():
+                return
+        with open(gitignore_path, "a") as f:
+            f.write(GITIGNORE_LINE)
+    else:
+        with open(gitignore_path, "w") as f:
+            f.write(GITIGNORE_LINE)
+
+
+def scaffold(target: str, template: Optional[CompiledTemplate] = None) -> List[str]:
+    """Crée ``target/.hydra-conf`` à partir du template fourni.
+
+    Raises:
+        FileExistsError: Si un répertoire de configuration existe déjà
+    """
+    target = os.path.abspath(target)
+    if os.path.exists(os.path.join(target, ".hydra-conf")):
+        raise FileExistsError(f"Un répertoire de configuration existe déjà: {target}")
+    written = (template or compile_template()).render(target)
+    ensure_gitignore(target)
+    return written
+
+
+def scaffold_many(targets: Iterable[str], jobs: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Crée un répertoire de configuration dans chaque cible, en parallèle.
+
+    Le template est compilé une seule fois pour toutes les cibles; une cible
+    en échec n'interrompt pas les autres.
+
+    Args:
+        targets: Répertoires cibles
+        jobs: Nombre de threads d'écriture (défaut: choix de ``ThreadPoolExecutor``)
+
+    Returns:
+        list: Un résultat ``{"target", "files", "error"}`` par cible, dans l'ordre
+    """
+    template = compile_template()
+
+    def run(target):
+        try:
+            return {"target": target, "files": len(scaffold(target, template)), "error": None}
+        except OSError as e:
+            return {"target": target, "files": 0, "error": str(e)}
+
+    with ThreadPoolExecutor(jobs) as pool:
+        # Une cible répétée n'est écrite qu'une fois
+        return list(pool.map(run, dict.fromkeys(targets)))
+
+
+def read_targets(lines: Iterable[str]) -> List[str]:
+    """Lit une liste de répertoires cibles (un par ligne, ``#`` pour les commentaires)."""
+    targets = []
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            targets.append(line)
+    return targets
@@ -0,0 +1,439 @@
+import dataclasses
+import enum
+import threading
+import typing
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from omegaconf import DictConfig, ListConfig
+
+try:
+    import attr
+except ImportError:  # attrs est optionnel
+    attr = None
+
+# Valeur obligatoire non renseignée (``???`` d'OmegaConf)
+MISSING = "???"
+
+_SCHEMAS: Dict[str, type] = {}
+_COMPILED: Dict[type, "CompiledSchema"] = {}
+_COMPILED_LOCK = threading.RLock()
+
+# Champ sans valeur par défaut
+_REQUIRED = object()
+
+
+class SchemaError(ValueError):
+    """Valeurs de configuration non conformes aux schémas de leurs groupes."""
+
+    def __init__(self, errors: List[Tuple[str, str]]):
+        self.errors = errors
+        described = "\n".join(f"  {path}: {message}" for path, message in errors)
+        super().__init__(f"Configuration non conforme ({len(errors)} erreur(s)):\n{described}")
+
+
+def _is_interpolation(value: Any) -> bool:
+    return isinstance(value, str) and "${" in value
+
+
+def _describe(value: Any) -> str:
+    text = repr(value)
+    if len(text) > 40:
+        text = text[:37] + "..."
+    return f"{type(value).__name__} {text}"
+
+
+def raw_value(node: Any) -> Any:
+    """Contenu brut d'un nœud OmegaConf (interpolations et ``???`` conservés).
+
+    Équivalent de ``OmegaConf.to_container(node, resolve=False)``, en lisant
+    directement le contenu des nœuds (plusieurs fois plus rapide).
+    """
+    content = node._content if isinstance(node, (DictConfig, ListConfig)) else None
+    if isinstance(content, dict):
+        return {key: raw_value(child) for key, child in content.items()}
+    if isinstance(content, list):
+        return [raw_value(child) for child in content]
+    return node._value()
+
+
+def is_schema(schema: Any) -> bool:
+    """Indique si ``schema`` est une classe dataclass ou attrs."""
+    if not isinstance(schema, type):
+        return False
+    return dataclasses.is_dataclass(schema) or (attr is not None and attr.has(schema))
+
+
+def _fields(schema: type) -> List[Tuple[str, Any, Any]]:
+    """Champs d'un schéma: ``(nom, type, défaut)``, le défaut étant une fabrique ou ``_REQUIRED``."""
+    hints = typing.get_type_hints(schema)
+    fields = []
+    if dataclasses.is_dataclass(schema):
+        for field in dataclasses.fields(schema):
+            if not field.init:
+                continue
+            if field.default is not dataclasses.MISSING:
+                default = (lambda value=field.default: value)
+            elif field.default_factory is not dataclasses.MISSING:
+                default = field.default_factory
+            else:
+                default = _REQUIRED
+            fields.append((field.name, hints.get(field.name, Any), default))
+        return fields
+    for field in attr.fields(schema):
+        if not field.init:
+            continue
+        if isinstance(field.default, attr.Factory):
+            default = field.default.factory
+        elif field.default is not attr.NOTHING:
+            default = (lambda value=field.default: value)
+        else:
+            default = _REQUIRED
+        fields.append((field.name, hints.get(field.name, field.type or Any), default))
+    return fields
+
+
+# Chaque type est compilé en deux fonctions ``(check, convert)``:
+#   check(valeur, chemin, erreurs)            -> ajoute les erreurs, sans rien construire
+#   convert(valeur, chemin, erreurs) -> valeur   convertie (instances, enums, tuples)
+# ``check`` accepte les interpolations non résolues, ``convert`` reçoit des valeurs résolues
+# et convertit les chaînes numériques ou booléennes qu'elles ont produites.
+
+def _compile_type(tp: Any) -> Tuple[Callable, Callable]:
+    if tp is Any or tp is object:
+        def check(value, path, errors):
+            pass
+
+        def convert(value, path, errors):
+            return value
+        return check, convert
+
+    if tp is bool:
+        return _scalar(lambda value: type(value) is bool, "booléen attendu", None, _parse_bool)
+    if tp is int:
+        return _scalar(lambda value: type(value) is int, "entier attendu", None, int)
+    if tp is float:
+        return _scalar(lambda value: type(value) in (float, int), "nombre attendu", float, float)
+    if tp is str:
+        return _scalar(lambda value: type(value) is str, "chaîne attendue", None, None)
+
+    if isinstance(tp, type) and issubclass(tp, enum.Enum):
+        members = tp.__members__
+
+        def check(value, path, errors):
+            if not isinstance(value, tp) and not (isinstance(value, str) and value in members):
+                errors.append((path, f"une valeur parmi {list(members)} attendue, reçu {_describe(value)}"))
+
+        def convert(value, path, errors):
+            if isinstance(value, tp):
+                return value
+            if isinstance(value, str) and value in members:
+                return members[value]
+            check(value, path, errors)
+            return value
+        return _skipping(check), convert
+
+    if is_schema(tp):
+        return compile_schema(tp)._functions
+
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+
+    if origin is typing.Union:
+        nullable = type(None) in args
+        arms = [_compile_type(arg) for arg in args if arg is not type(None)]
+        if len(arms) == 1:
+            inner_check, inner_convert = arms[0]
+        else:
+            inner_check, inner_convert = _union(arms, tp)
+
+        def check(value, path, errors):
+            if value is None and nullable:
+                return
+            inner_check(value, path, errors)
+
+        def convert(value, path, errors):
+            if value is None and nullable:
+                return None
+            return inner_convert(value, path, errors)
+        return check, convert
+
+    if origin in (list, tuple, typing.get_origin(typing.Sequence)) or tp in (list, tuple):
+        if origin is tuple and args and args[-1] is not Ellipsis:
+            return _fixed_tuple([_compile_type(arg) for arg in args])
+        item_check, item_convert = _compile_type(args[0] if args else Any)
+        factory = tuple if tuple in (origin, tp) else list
+
+        def check(value, path, errors):
+            if not isinstance(value, (list, tuple)):
+                errors.append((path, f"liste attendue, reçu {_describe(value)}"))
+                return
+            for index, item in enumerate(value):
+                item_check(item, f"{path}[{index}]", errors)
+
+        def convert(value, path, errors):
+            if not isinstance(value, (list, tuple)):
+                check(value, path, errors)
+                return value
+            return factory(item_convert(item, f"{path}[{index}]", errors) for index, item in enumerate(value))
+        return _skipping(check), convert
+
+    if origin in (dict, typing.get_origin(typing.Mapping)) or tp is dict:
+        item_check, item_convert = _compile_type(args[1] if len(args) == 2 else Any)
+
+        def check(value, path, errors):
+            if not isinstance(value, dict):
+                errors.append((path, f"dictionnaire attendu, reçu {_describe(value)}"))
+                return
+            for key, item in value.items():
+                item_check(item, f"{path}.{key}", errors)
+
+        def convert(value, path, errors):
+            if not isinstance(value, dict):
+                check(value, path, errors)
+                return value
+            return {key: item_convert(item, f"{path}.{key}", errors) for key, item in value.items()}
+        return _skipping(check), convert
+
+    if getattr(typing, "Literal", None) is not None and origin is typing.Literal:
+        allowed = args
+
+        def check(value, path, errors):
+            if value not in allowed:
+                errors.append((path, f"une valeur parmi {list(allowed)} attendue, reçu {_describe(value)}"))
+
+        def convert(value, path, errors):
+            check(value, path, errors)
+            return value
+        return _skipping(check), convert
+
+    raise TypeError(f"Type non pris en charge par les schémas: {tp!r}")
+
+
+def _skipping(check: Callable) -> Callable:
+    """Enveloppe ``check``: interpolations ignorées, valeurs ``???`` signalées."""
+    def skipping(value, path, errors):
+        if value == MISSING:
+            errors.append((path, "valeur obligatoire manquante (???)"))
+        elif not _is_interpolation(value):
+            check(value, path, errors)
+    return skipping
+
+
+def _parse_bool(value: str) -> bool:
+    lowered = value.strip().lower()
+    if lowered in ("true", "yes", "on", "1"):
+        return True
+    if lowered in ("false", "no", "off", "0"):
+        return False
+    raise ValueError(value)
+
+
+def _scalar(accepts: Callable, expected: str, cast: Optional[Callable],
+            parse: Optional[Callable]) -> Tuple[Callable, Callable]:
+    def check(value, path, errors):
+        if not accepts(value):
+            errors.append((path, f"{expected}, reçu {_describe(value)}"))
+
+    def convert(value, path, errors):
+        if accepts(value):
+            return cast(value) if cast is not None else value
+        if parse is not None and type(value) is str:
+            # Valeur résolue depuis une interpolation (``oc.env`` retourne des chaînes)
+            try:
+                return parse(value)
+            except ValueError:
+                pass
+        check(value, path, errors)
+        return value
+    return _skipping(check), convert
+
+
+def _union(arms: List[Tuple[Callable, Callable]], tp: Any) -> Tuple[Callable, Callable]:
+    def check(value, path, errors):
+        for arm_check, _ in arms:
+            attempt: List[Tuple[str, str]] = []
+            arm_check(value, path, attempt)
+            if not attempt:
+                return
+        errors.append((path, f"{tp} attendu, reçu {_describe(value)}"))
+
+    def convert(value, path, errors):
+        for arm_check, arm_convert in arms:
+            attempt: List[Tuple[str, str]] = []
+            arm_check(value, path, attempt)
+            if not attempt:
+                return arm_convert(value, path, errors)
+        check(value, path, errors)
+        return value
+    return _skipping(check), convert
+
+
+def _fixed_tuple(items: List[Tuple[Callable, Callable]]) -> Tuple[Callable, Callable]:
+    def check(value, path, errors):
+        if not isinstance(value, (list, tuple)) or len(value) != len(items):
+            errors.append((path, f"liste de {len(items)} éléments attendue, reçu {_describe(value)}"))
+            return
+        for index, ((item_check, _), item) in enumerate(zip(items, value)):
+            item_check(item, f"{path}[{index}]", errors)
+
+    def convert(value, path, errors):
+        if not isinstance(value, (list, tuple)) or len(value) != len(items):
+            check(value, path, errors)
+            return value
+        return tuple(item_convert(item, f"{path}[{index}]", errors)
+                     for index, ((_, item_convert), item) in enumerate(zip(items, value)))
+    return _skipping(check), convert
+
+
+class CompiledSchema:
+    """Schéma (dataclass ou attrs) compilé en fonctions de validation et de conversion.
+
+    Les types des champs sont analysés une seule fois, à la compilation:
+    valider une section revient ensuite à appeler une fonction par champ,
+    sans passer par les nœuds structurés d'OmegaConf.
+    """
+
+    def __init__(self, schema: type):
+        if not is_schema(schema):
+            raise TypeError(f"{schema!r} n'est ni une dataclass ni une classe attrs")
+        self.schema = schema
+        # Fonctions provisoires: un schéma récursif se référence pendant sa compilation
+        self._functions = (self._check, self._convert)
+        self._fields: List[Tuple[str, Callable, Callable, Any]] = []
+        self._names = frozenset()
+        # Vrai une fois les champs compilés (voir compile_schema)
+        self._built = False
+
+    def _build(self):
+        fields = _fields(self.schema)
+        self._names = frozenset(name for name, _, _ in fields)
+        self._fields = [(name, *_compile_type(tp), default) for name, tp, default in fields]
+        self._built = True
+
+    def _check(self, value, path, errors):
+        if value == MISSING:
+            errors.append((path, "valeur obligatoire manquante (???)"))
+            return
+        if _is_interpolation(value):
+            return
+        if not isinstance(value, dict):
+            errors.append((path, f"section {self.schema.__name__} attendue, reçu {_describe(value)}"))
+            return
+        prefix = f"{path}." if path else ""
+        for name, check, _, default in self._fields:
+            if name in value:
+                check(value[name], prefix + name, errors)
+            elif default is _REQUIRED:
+                errors.append((prefix + name, "champ obligatoire manquant"))
+        if len(value) > len(self._names) or not self._names.issuperset(value):
+            for key in value:
+                if key not in self._names:
+                    errors.append((prefix + str(key), f"clé inconnue du schéma {self.schema.__name__}"))
+
+    def _convert(self, value, path, errors):
+        if not isinstance(value, dict):
+            self._check(value, path, errors)
+            return value
+        prefix = f"{path}." if path else ""
+        kwargs = {}
+        for name, check, convert, default in self._fields:
+            if name in value:
+                kwargs[name] = convert(value[name], prefix + name, errors)
+            elif default is _REQUIRED:
+                errors.append((prefix + name, "champ obligatoire manquant"))
+        for key in value:
+            if key not in self._names:
+                errors.append((prefix + str(key), f"clé inconnue du schéma {self.schema.__name__}"))
+        if errors:
+            return value
+        return self.schema(**kwargs)
+
+    def errors(self, value: Any, path: str = "") -> List[Tuple[str, str]]:
+        """Retourne les erreurs d'une section non résolue (interpolations ignorées).
+
+        Args:
+            value: Section (conteneur Python, ``resolve=False``)
+            path: Chemin de la section, préfixe des chemins d'erreur
+
+        Returns:
+            list: ``(chemin, message)`` pour chaque valeur non conforme
+        """
+        errors: List[Tuple[str, str]] = []
+        self._check(value, path, errors)
+        return errors
+
+    def validate(self, value: Any, path: str = ""):
+        """Valide une section non résolue.
+
+        Raises:
+            SchemaError: Si la section n'est pas conforme
+        """
+        errors = self.errors(value, path)
+        if errors:
+            raise SchemaError(errors)
+
+    def convert(self, value: Any, path: str = "") -> Any:
+        """Construit une instance du schéma à partir d'une section résolue.
+
+        Les champs absents prennent leur valeur par défaut, les sections
+        imbriquées deviennent des instances de leur schéma et les chaînes
+        des enums leurs membres.
+
+        Raises:
+            SchemaError: Si la section n'est pas conforme
+        """
+        errors: List[Tuple[str, str]] = []
+        instance = self._convert(value, path, errors)
+        if errors:
+            raise SchemaError(errors)
+        return instance
+
+
+def compile_schema(schema: type) -> CompiledSchema:
+    """Retourne le schéma compilé (une seule compilation par classe et par processus).
+
+    Sans verrou, seul un schéma entièrement compilé est retourné. Un schéma
+    en cours de compilation n'est visible que du thread qui le compile
+    (verrou réentrant), pour les références récursives; les autres threads
+    attendent la fin de sa compilation.
+    """
+    compiled = _COMPILED.get(schema)
+    if compiled is None or not compiled._built:
+        with _COMPILED_LOCK:
+            compiled = _COMPILED.get(schema)
+            if compiled is None:
+                compiled = CompiledSchema(schema)
+                # Enregistré avant la compilation des champs (schémas récursifs)
+                _COMPILED[schema] = compiled
+                try:
+                    compiled._build()
+                except Exception:
+                    del _COMPILED[schema]
+                    raise
+    return compiled
+
+
+def register_schema(group: str, schema: type):
+    """Associe un schéma à un groupe (ex: ``"database"`` ou ``"api.retry"``) pour tous les lecteurs.
+
+    Le schéma est compilé immédiatement: un type de champ non pris en charge
+    est signalé à l'enregistrement plutôt qu'au chargement.
+
+    Args:
+        group: Chemin pointé de la section validée
+        schema: Classe dataclass ou attrs
+    """
+    compile_schema(schema)
+    _SCHEMAS[group] = schema
+
+
+def unregister_schema(group: str):
+    _SCHEMAS.pop(group, None)
+
+
+def clear_schemas():
+    """Oublie tous les schémas enregistrés."""
+    _SCHEMAS.clear()
+
+
+def registered_schemas() -> Dict[str, type]:
+    return dict(_SCHEMAS)
@@ -0,0 +1,262 @@
+import fnmatch
+import os
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+from omegaconf import OmegaConf
+from .cache import YAML_EXTENSIONS, cache_path, load_json, save_json, scan_files
+from .masking import is_secret, mask, secret_paths
+from .session import get_session
+
+INDEX_VERSION = 1
+INDEX_FILENAME = "search.json"
+KINDS = ("key", "value", "ref")
+
+# Références d'interpolation: ${api.private_key}, ${oc.env:HOME}
+INTERPOLATION_PATTERN = re.compile(r"\$\{([^${}]+)\}")
+SEGMENT_PATTERN = re.compile(r"[^.\[\]:,/\s]+")
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Index chargés dans le processus, par fichier d'index (voir get_index)
+_INDEXES: Dict[str, "SearchIndex"] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def _references(value: Any, secret: bool = False) -> List[str]:
+    if not isinstance(value, str) or "${" not in value:
+        return []
+    refs = [ref.strip() for ref in INTERPOLATION_PATTERN.findall(value)]
+    if secret:
+        # ${oc.env:VAR,défaut}: la valeur par défaut peut être un secret
+        refs = [ref.split(",", 1)[0] for ref in refs]
+    return refs
+
+
+def _terms(text: str) -> set:
+    """Termes indexés: texte complet, segments de chemin et mots."""
+    text = text.lower()
+    segments = SEGMENT_PATTERN.findall(text)
+    return {text, *segments, *WORD_PATTERN.findall(text)}
+
+
+def _flatten(data: Any, prefix: str = ""):
+    if isinstance(data, dict):
+        for key, value in data.items():
+            yield from _flatten(value, f"{prefix}.{key}" if prefix else str(key))
+    elif isinstance(data, list):
+        for index, value in enumerate(data):
+            yield from _flatten(value, f"{prefix}[{index}]")
+    elif prefix:
+        yield prefix, data
+
+
+class SearchIndex:
+    """Index inversé persistant des configurations composées d'un répertoire.
+
+    Chaque configuration principale (fichier YAML à la racine) est composée
+    puis indexée par chemin de clé, valeur et référence d'interpolation. Une
+    configuration n'est recomposée que si l'un des fichiers qu'elle utilise a
+    changé. Les valeurs sensibles ne sont jamais écrites sur disque.
+    """
+
+    def __init__(self, config_dir: str, index_path: Optional[str] = None):
+        """Charge l'index existant (sans le mettre à jour).
+
+        Args:
+            config_dir: Répertoire de configuration
+            index_path: Fichier d'index (défaut: dans ``.buddy-cache``)
+        """
+        self.config_dir = os.path.abspath(config_dir)
+        self.index_path = index_path or cache_path(self.config_dir, INDEX_FILENAME)
+        self.stamp = _stamp(self.index_path)
+        data = load_json(self.index_path, {})
+        if data.get("version") != INDEX_VERSION or data.get("root") != self.config_dir:
+            data = {}
+        self.files: Dict[str, list] = data.get("files", {})
+        self.configs: Dict[str, dict] = data.get("configs", {})
+        self.terms: Dict[str, list] = data.get("terms", {})
+
+    def update(self) -> List[str]:
+        """Réindexe les configurations affectées par des fichiers modifiés.
+
+        Returns:
+            list: Noms des configurations recomposées
+        """
+        files = scan_files(self.config_dir, self.files)
+        changed = {
+            path for path in set(files) | set(self.files)
+            if path not in files or path not in self.files or files[path][2] != self.files[path][2]
+        }
+        primaries = sorted({
+            os.path.splitext(path)[0] for path in files
+            if "/" not in path and path.endswith(YAML_EXTENSIONS)
+        })
+
+        digests = {path: entry[2] for path, entry in files.items()}
+        reindexed = []
+        for name in list(self.configs):
+            if name not in primaries:
+                self._remove_terms(name, self.configs.pop(name))
+                reindexed.append(name)
+        for name in primaries:
+            indexed = self.configs.get(name)
+            if indexed is not None:
+                deps = indexed["deps"]
+                if deps is None:
+                    # Composition en échec: réessayer dès qu'un fichier change
+                    if not changed:
+                        continue
+                elif all(digests.get(path) == digest for path, digest in deps.items()):
+                    continue
+                # Seuls les termes des configurations recomposées sont remplacés
+                self._remove_terms(name, indexed)
+            self.configs[name] = self._index_config(name, digests)
+            self._add_terms(name, self.configs[name])
+            reindexed.append(name)
+
+        self.files = files
+        if reindexed or changed:
+            self.save()
+        return reindexed
+
+    def _index_config(self, name: str, digests: Dict[str, str]) -> dict:
+        session = get_session(self.config_dir)
+        try:
+            cfg = session.compose(name)
+            sources = session.provenance(name)
+            deps = {}
+            for default in session.defaults_list(name):
+                for extension in YAML_EXTENSIONS:
+                    relpath = f"{default.config_path}{extension}"
+                    if relpath in digests:
+                        deps[relpath] = digests[relpath]
+        except Exception as e:
+            return {"deps": None, "entries": [], "error": str(e)}
+
+        data = OmegaConf.to_container(cfg, resolve=False)
+        secrets = secret_paths(data)
+        entries = []
+        for path, value in _flatten(data):
+            secret = is_secret(path, secrets)
+            refs = _references(value, secret)
+            if secret:
+                value = mask(value)
+            entries.append([path, value, refs, sources.get(path)])
+        return {"deps": deps, "entries": entries, "error": None}
+
+    @staticmethod
+    def _postings(name: str, indexed: dict):
+        """Termes d'une configuration indexée et leurs entrées ``[config, position, type]``."""
+        for position, (path, value, refs, _source) in enumerate(indexed["entries"]):
+            for term in _terms(path):
+                yield term, [name, position, "key"]
+            if value is not None and not isinstance(value, (dict, list)):
+                for term in _terms(str(value)):
+                    yield term, [name, position, "value"]
+            for ref in refs:
+                for term in _terms(ref):
+                    yield term, [name, position, "ref"]
+
+    def _add_terms(self, name: str, indexed: dict):
+        terms = self.terms
+        for term, posting in self._postings(name, indexed):
+            terms.setdefault(term, []).append(posting)
+
+    def _remove_terms(self, name: str, indexed: dict):
+        terms = self.terms
+        for term in {term for term, _ in self._postings(name, indexed)}:
+            postings = [posting for posting in terms.get(term, ()) if posting[0] != name]
+            if postings:
+                terms[term] = postings
+            else:
+                terms.pop(term, None)
+
+    def save(self):
+        """Écrit l'index sur disque."""
+        save_json(self.index_path, {
+            "version": INDEX_VERSION,
+            "root": self.config_dir,
+            "files": self.files,
+            "configs": self.configs,
+            "terms": self.terms,
+        })
+        self.stamp = _stamp(self.index_path)
+
+    def search(self, pattern: str, kinds: Iterable[str] = KINDS,
+               configs: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Recherche un motif dans l'index.
+
+        Sans joker, le motif est cherché comme terme exact (chemin complet,
+        segment de chemin, valeur ou référence, insensible à la casse). Avec
+        des jokers (``*``, ``?``), il est comparé au vocabulaire de l'index.
+        Un motif ``${api.private_key}`` ne cherche que les références à
+        ``api.private_key``.
+
+        Args:
+            pattern: Terme ou motif glob
+            kinds: Types de correspondances (``key``, ``value``, ``ref``)
+            configs: Restreindre à ces configurations
+
+        Returns:
+            list: Correspondances ``{config, path, kind, value, refs, source}``
+        """
+        kinds = set(kinds)
+        query = pattern.strip()
+        if query.startswith("${") and query.endswith("}"):
+            query = query[2:-1]
+            kinds &= {"ref"}
+        query = query.lower()
+
+        if any(char in query for char in "*?["):
+            matched = [term for term in self.terms if fnmatch.fnmatchcase(term, query)]
+        else:
+            matched = [query] if query in self.terms else []
+
+        configs = set(configs) if configs is not None else None
+        seen = set()
+        results = []
+        for term in matched:
+            for name, position, kind in self.terms[term]:
+                if kind not in kinds or (configs is not None and name not in configs):
+                    continue
+                if (name, position, kind) in seen:
+                    continue
+                seen.add((name, position, kind))
+                path, value, refs, source = self.configs[name]["entries"][position]
+                results.append({
+                    "config": name, "path": path, "kind": kind,
+                    "value": value, "refs": refs, "source": source,
+                })
+        results.sort(key=lambda result: (result["config"], result["path"], result["kind"]))
+        return results
+
+    def errors(self) -> Dict[str, str]:
+        """Configurations qui n'ont pas pu être composées."""
+        return {name: indexed["error"] for name, indexed in self.configs.items() if indexed["error"]}
+
+
+def _stamp(path: str) -> Optional[tuple]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def get_index(config_dir: str, index_path: Optional[str] = None) -> SearchIndex:
+    """Retourne l'index d'un répertoire, chargé une seule fois par processus.
+
+    Le fichier d'index n'est relu que s'il a été modifié par un autre
+    processus depuis le dernier chargement ou la dernière écriture.
+
+    Args:
+        config_dir: Répertoire de configuration
+        index_path: Fichier d'index (défaut: dans ``.buddy-cache``)
+    """
+    config_dir = os.path.abspath(config_dir)
+    index_path = index_path or cache_path(config_dir, INDEX_FILENAME)
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(index_path)
+        if index is None or index.config_dir != config_dir or index.stamp != _stamp(index_path):
+            index = _INDEXES[index_path] = SearchIndex(config_dir, index_path)
+        return index
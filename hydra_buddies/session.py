@@ -0,0 +1,321 @@
+import os
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
+from omegaconf import DictConfig, OmegaConf, open_dict
+
+# Protège la création des sessions (découverte des plugins Hydra, registre)
+_REGISTRY_LOCK = threading.Lock()
+_SESSIONS: Dict[tuple, "ComposeSession"] = {}
+
+# Versions de Hydra (majeure.mineure) dont les API privées utilisées par
+# ComposeSession ont été vérifiées (voir _private_loader)
+SUPPORTED_HYDRA = ("1.1", "1.2", "1.3")
+PRIVATE_METHODS = ("_load_single_config", "_apply_overrides_to_config")
+
+# Résolveurs enregistrés par hydra.core.utils.setup_globals
+HYDRA_RESOLVERS = ("now", "hydra", "python_version")
+
+# Réglage version_base le temps des compositions en cours (voir _version_base)
+_BASE_LOCK = threading.Lock()
+_BASE_STATE = {"users": 0, "saved": None}
+
+
+@lru_cache(maxsize=None)
+def _private_loader():
+    """Retourne ``ConfigLoaderImpl`` si ses API privées sont utilisables, sinon None.
+
+    Seul point d'accès aux méthodes privées de Hydra: elles ne sont utilisées
+    que pour une version vérifiée (``SUPPORTED_HYDRA``) qui les expose encore.
+    Sinon ``ComposeSession`` compose par ``hydra.compose`` et délègue le
+    chargement des fichiers et les overrides de valeurs au moteur natif.
+    """
+    import hydra
+
+    if ".".join(hydra.__version__.split(".")[:2]) not in SUPPORTED_HYDRA:
+        return None
+    try:
+        from hydra._internal.config_loader_impl import ConfigLoaderImpl
+    except ImportError:
+        return None
+    if not all(callable(getattr(ConfigLoaderImpl, name, None)) for name in PRIVATE_METHODS):
+        return None
+    return ConfigLoaderImpl
+
+
+@contextmanager
+def _version_base():
+    """Compose avec ``version_base=None`` puis rétablit le réglage de l'appelant.
+
+    Le réglage de Hydra est global: il est posé par la première composition
+    en cours et rétabli quand la dernière se termine.
+    """
+    from hydra import version
+
+    with _BASE_LOCK:
+        if _BASE_STATE["users"] == 0:
+            _BASE_STATE["saved"] = version.VersionBase.instance().getbase()
+            version.setbase(None)
+        _BASE_STATE["users"] += 1
+    try:
+        yield
+    finally:
+        with _BASE_LOCK:
+            _BASE_STATE["users"] -= 1
+            if _BASE_STATE["users"] == 0:
+                # Affectation directe: setbase refuse la valeur "non précisée" de Hydra
+                version.VersionBase.instance().version_base = _BASE_STATE["saved"]
+
+
+def _setup_resolvers():
+    """Enregistre les résolveurs de Hydra (``now``, ``hydra``...) s'ils sont absents.
+
+    Contrairement à ``setup_globals`` appelé sans condition, des résolveurs
+    déjà enregistrés sous ces noms (par Hydra ou par l'application) sont conservés.
+    """
+    from hydra.core.utils import setup_globals
+
+    if not any(OmegaConf.has_resolver(name) for name in HYDRA_RESOLVERS):
+        setup_globals()
+
+# Moteurs de composition: Hydra, composition native sans Hydra (voir native.py),
+# ou composition native depuis un bundle (voir bundle.py)
+ENGINES = ("hydra", "native", "bundle")
+
+
+class ComposeSession:
+    """Session de composition Hydra attachée à un ensemble de racines.
+
+    Contrairement à ``hydra.initialize``, la session ne touche ni au singleton
+    ``GlobalHydra`` ni au répertoire courant: chaque session possède son propre
+    chemin de recherche et son propre dépôt de configurations, construits une
+    seule fois. Plusieurs sessions (racines différentes) peuvent donc composer
+    en parallèle dans le même processus. Le réglage ``version_base`` de
+    l'appelant est rétabli après chaque composition.
+
+    Si les API privées de Hydra ne sont pas vérifiées pour la version
+    installée (voir ``_private_loader``), la session compose par
+    ``hydra.compose`` et s'appuie sur le moteur natif pour le reste.
+    """
+
+    def __init__(self, root: str, extra_roots: Sequence[str] = ()):
+        """Initialise une session.
+
+        Args:
+            root: Répertoire principal de configuration
+            extra_roots: Répertoires de recherche supplémentaires
+        """
+        self.roots = tuple(os.path.abspath(path) for path in (root, *extra_roots))
+        self._lock = threading.Lock()
+        self._native = None
+        self.loader = None
+
+        loader_class = _private_loader()
+        with _REGISTRY_LOCK:
+            _setup_resolvers()
+            if loader_class is None:
+                return
+            from hydra._internal.utils import create_config_search_path
+
+            search_path = create_config_search_path(self.roots[0])
+            for path in self.roots[1:]:
+                search_path.append("buddy", path)
+            self.loader = loader_class(config_search_path=search_path)
+
+    @property
+    def root(self) -> str:
+        return self.roots[0]
+
+    @property
+    def native(self):
+        """Session native sur les mêmes racines (repli sans API privées de Hydra)."""
+        if self._native is None:
+            from .native import NativeSession
+            self._native = NativeSession(self.roots[0], self.roots[1:])
+        return self._native
+
+    def _compose_public(self, config_name: str, overrides: List[str]) -> DictConfig:
+        # Repli par l'API publique: GlobalHydra est restauré par initialize_config_dir
+        from hydra import compose, initialize_config_dir
+
+        if self.roots[1:]:
+            paths = ",".join(f"'file://{path}'" for path in self.roots[1:])
+            overrides = [*overrides, f"hydra.searchpath=[{paths}]"]
+        with _REGISTRY_LOCK, initialize_config_dir(config_dir=self.roots[0], version_base=None):
+            return compose(config_name, overrides=overrides, return_hydra_config=True)
+
+    def compose(self, config_name: str, overrides: Optional[List[str]] = None,
+                return_hydra_config: bool = False) -> DictConfig:
+        """Compose une configuration, équivalent à ``hydra.compose``.
+
+        Args:
+            config_name: Nom de la configuration
+            overrides: Overrides Hydra
+            return_hydra_config: Conserver le nœud ``hydra`` dans le résultat
+
+        Returns:
+            DictConfig: Configuration composée
+        """
+        from hydra.types import RunMode
+
+        if self.loader is None:
+            with _version_base():
+                cfg = self._compose_public(config_name, list(overrides or []))
+        else:
+            with self._lock, _version_base():
+                cfg = self.loader.load_configuration(
+                    config_name=config_name,
+                    overrides=list(overrides or []),
+                    run_mode=RunMode.RUN,
+                    from_shell=False,
+                )
+        if not return_hydra_config and "hydra" in cfg:
+            with open_dict(cfg):
+                del cfg["hydra"]
+        return cfg
+
+    def parse_overrides(self, overrides: Sequence[str]) -> list:
+        """Analyse des overrides avec le parseur de Hydra."""
+        from hydra.core.override_parser.overrides_parser import OverridesParser
+
+        return OverridesParser.create().parse_overrides(overrides=list(overrides))
+
+    @staticmethod
+    def apply_overrides(overrides: list, cfg: DictConfig):
+        """Applique des overrides de valeurs déjà analysés à une configuration."""
+        loader_class = _private_loader()
+        if loader_class is None:
+            from .native import NativeSession
+            NativeSession.apply_overrides(overrides, cfg)
+        else:
+            loader_class._apply_overrides_to_config(overrides, cfg)
+
+    def defaults_list(self, config_name: str, overrides: Optional[List[str]] = None) -> list:
+        """Retourne la liste des defaults résolue (ordre de fusion Hydra).
+
+        Les entrées internes à Hydra (``hydra/...``) sont exclues.
+        """
+        from hydra.types import RunMode
+
+        if self.loader is None:
+            return self.native.defaults_list(config_name, overrides)
+        with self._lock, _version_base():
+            defaults = self.loader.compute_defaults_list(config_name, list(overrides or []), RunMode.RUN)
+        return [
+            default for default in defaults.defaults
+            if default.config_path is not None
+            and not default.config_path.startswith("hydra/")
+            and not (default.package or "").startswith("hydra")
+        ]
+
+    def load_default(self, default) -> DictConfig:
+        """Charge une entrée de la liste des defaults, placée sous son package.
+
+        Args:
+            default: Entrée retournée par ``defaults_list``
+
+        Returns:
+            DictConfig: Configuration de l'entrée (ex: ``{database: {...}}``)
+        """
+        from hydra._internal.config_repository import CachingConfigRepository
+
+        if self.loader is None:
+            return self.native.load_default(default)
+        with self._lock, _version_base():
+            repo = CachingConfigRepository(self.loader.repository)
+            return self.loader._load_single_config(default=default, repo=repo).config
+
+    def provenance(self, config_name: str, overrides: Optional[List[str]] = None) -> Dict[str, str]:
+        """Indique pour chaque clé feuille le fichier qui l'a définie en dernier.
+
+        Args:
+            config_name: Nom de la configuration
+            overrides: Overrides Hydra
+
+        Returns:
+            dict: Chemin pointé -> fichier source (ex: ``"database/prod"``)
+        """
+        from hydra._internal.config_repository import CachingConfigRepository
+
+        sources: Dict[str, str] = {}
+
+        def collect(data, prefix, source):
+            if isinstance(data, dict):
+                for key, value in data.items():
+                    if not prefix and key == "defaults":
+                        continue
+                    collect(value, f"{prefix}.{key}" if prefix else str(key), source)
+            elif prefix:
+                sources[prefix] = source
+
+        if self.loader is None:
+            return self.native.provenance(config_name, overrides)
+        defaults = self.defaults_list(config_name, overrides)
+        with self._lock, _version_base():
+            repo = CachingConfigRepository(self.loader.repository)
+            for default in defaults:
+                loaded = self.loader._load_single_config(default=default, repo=repo)
+                collect(OmegaConf.to_container(loaded.config, resolve=False), "", default.config_path)
+        return sources
+
+    def list_groups(self, parent: str = "") -> List[str]:
+        """Liste les groupes de configuration (scan réutilisé entre les appels)."""
+        if self.loader is None:
+            return self.native.list_groups(parent)
+        return self.loader.list_groups(parent)
+
+    def group_options(self, group: str) -> List[str]:
+        """Liste les options disponibles pour un groupe."""
+        if self.loader is None:
+            return self.native.group_options(group)
+        return self.loader.get_group_options(group)
+
+    def group_exists(self, group: str) -> bool:
+        """Indique si un groupe existe dans l'une des racines."""
+        from .manifest import get_manifest
+
+        return any(get_manifest(root).isdir(group) for root in self.roots)
+
+    def __repr__(self):
+        return f"ComposeSession(roots={list(self.roots)!r})"
+
+
+def get_session(root: str, extra_roots: Sequence[str] = (), engine: str = "hydra") -> ComposeSession:
+    """Retourne la session partagée pour ces racines (créée au premier appel).
+
+    Args:
+        root: Répertoire principal de configuration
+        extra_roots: Répertoires de recherche supplémentaires
+        engine: ``"hydra"``, ``"native"`` (``NativeSession``, même interface, sans Hydra)
+            ou ``"bundle"`` (``BundleSession``: ``root`` est un fichier écrit par ``buddy bundle``)
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Moteur de composition inconnu: {engine!r} (attendu: {', '.join(ENGINES)})")
+    roots = tuple(os.path.abspath(path) for path in (root, *extra_roots))
+    key = (engine, roots)
+    session = _SESSIONS.get(key)
+    if session is not None and engine == "bundle" and session.bundle.is_replaced():
+        # Bundle reconstruit: nouvelle session sur le nouveau fichier (autre empreinte)
+        with _REGISTRY_LOCK:
+            if _SESSIONS.get(key) is session:
+                del _SESSIONS[key]
+        session = None
+    if session is None:
+        if engine == "native":
+            from .native import NativeSession
+            session = NativeSession(roots[0], roots[1:])
+        elif engine == "bundle":
+            from .bundle import BundleSession
+            session = BundleSession(roots[0], roots[1:])
+        else:
+            session = ComposeSession(roots[0], roots[1:])
+        with _REGISTRY_LOCK:
+            session = _SESSIONS.setdefault(key, session)
+    return session
+
+
+def clear_sessions():
+    """Oublie toutes les sessions (leurs dépôts seront reconstruits)."""
+    with _REGISTRY_LOCK:
+        _SESSIONS.clear()
@@ -0,0 +1,412 @@
+import mmap
+import os
+import struct
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional
+from omegaconf import OmegaConf, DictConfig
+
+# Format binaire en lecture seule, navigable sans désérialisation complète:
+#   en-tête: MAGIC, version (u8), offset de la racine (u32), taille totale (u32)
+#   nœud dict:  b'd', n (u32), n * (offset clé, offset valeur), n * index trié
+#   nœud liste: b'l', n (u32), n * offset valeur
+#   scalaires:  b's' longueur + utf-8, b'i' int64, b'I' grand entier (texte),
+#               b'f' float64, b'b' booléen (u8), b'n' None
+MAGIC = b"BUDY"
+VERSION = 1
+HEADER = struct.Struct("<4sBII")
+U32 = struct.Struct("<I")
+PAIR = struct.Struct("<II")
+
+
+class _Encoder:
+    """Sérialise un conteneur Python dans le format partagé."""
+
+    def __init__(self):
+        self.buffer = bytearray(HEADER.size)
+        self.strings: Dict[str, int] = {}
+
+    def _string(self, value: str) -> int:
+        # Les chaînes identiques (clés répétées notamment) ne sont écrites qu'une fois
+        offset = self.strings.get(value)
+        if offset is None:
+            data = value.encode("utf-8")
+            offset = len(self.buffer)
+            self.buffer += b"s" + U32.pack(len(data)) + data
+            self.strings[value] = offset
+        return offset
+
+    def encode(self, value: Any) -> int:
+        if isinstance(value, str):
+            return self._string(value)
+        if isinstance(value, dict):
+            entries = [(self._string(str(key)), self.encode(item)) for key, item in value.items()]
+            keys = [str(key) for key in value]
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            offset = len(self.buffer)
+            self.buffer += b"d" + U32.pack(len(entries))
+            for entry in entries:
+                self.buffer += PAIR.pack(*entry)
+            for index in order:
+                self.buffer += U32.pack(index)
+            return offset
+        if isinstance(value, (list, tuple)):
+            items = [self.encode(item) for item in value]
+            offset = len(self.buffer)
+            self.buffer += b"l" + U32.pack(len(items))
+            for item in items:
+                self.buffer += U32.pack(item)
+            return offset
+
+        offset = len(self.buffer)
+        if value is None:
+            self.buffer += b"n"
+        elif isinstance(value, bool):
+            self.buffer += b"b" + bytes([value])
+        elif isinstance(value, int):
+            if -2**63 <= value < 2**63:
+                self.buffer += b"i" + struct.pack("<q", value)
+            else:
+                data = str(value).encode()
+                self.buffer += b"I" + U32.pack(len(data)) + data
+        elif isinstance(value, float):
+            self.buffer += b"f" + struct.pack("<d", value)
+        else:
+            return self._string(str(value))
+        return offset
+
+    def finish(self, root: int) -> bytes:
+        HEADER.pack_into(self.buffer, 0, MAGIC, VERSION, root, len(self.buffer))
+        return bytes(self.buffer)
+
+
+def encode_config(data: Any) -> bytes:
+    """Sérialise un conteneur Python (dict, list, scalaires) dans le format partagé."""
+    encoder = _Encoder()
+    return encoder.finish(encoder.encode(data))
+
+
+def _decode_scalar(buf, offset: int) -> Any:
+    tag = buf[offset:offset + 1]
+    if tag == b"s" or tag == b"I":
+        (length,) = U32.unpack_from(buf, offset + 1)
+        text = str(buf[offset + 5:offset + 5 + length], "utf-8")
+        return int(text) if tag == b"I" else text
+    if tag == b"i":
+        return struct.unpack_from("<q", buf, offset + 1)[0]
+    if tag == b"f":
+        return struct.unpack_from("<d", buf, offset + 1)[0]
+    if tag == b"b":
+        return bool(buf[offset + 1])
+    if tag == b"n":
+        return None
+    raise ValueError(f"Nœud inconnu à l'offset {offset}: {tag!r}")
+
+
+def _node(buf, offset: int) -> Any:
+    tag = buf[offset:offset + 1]
+    if tag == b"d":
+        return SharedNode(buf, offset)
+    if tag == b"l":
+        return SharedList(buf, offset)
+    return _decode_scalar(buf, offset)
+
+
+class SharedNode:
+    """Vue paresseuse d'un dictionnaire dans le tampon partagé.
+
+    Aucune donnée n'est copiée: chaque accès lit directement le tampon
+    (recherche dichotomique sur les clés triées).
+    """
+
+    __slots__ = ("_buf", "_offset", "_count")
+
+    def __init__(self, buf, offset: int):
+        self._buf = buf
+        self._offset = offset
+        (self._count,) = U32.unpack_from(buf, offset + 1)
+
+    def _key(self, index: int) -> str:
+        key_offset, _ = PAIR.unpack_from(self._buf, self._offset + 5 + index * PAIR.size)
+        return _decode_scalar(self._buf, key_offset)
+
+    def _value(self, index: int) -> Any:
+        _, value_offset = PAIR.unpack_from(self._buf, self._offset + 5 + index * PAIR.size)
+        return _node(self._buf, value_offset)
+
+    def _find(self, key: str) -> int:
+        order = self._offset + 5 + self._count * PAIR.size
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            (index,) = U32.unpack_from(self._buf, order + middle * U32.size)
+            current = self._key(index)
+            if current == key:
+                return index
+            if current < key:
+                low = middle + 1
+            else:
+                high = middle
+        return -1
+
+    def __getitem__(self, key: str) -> Any:
+        index = self._find(str(key))
+        if index < 0:
+            raise KeyError(key)
+        return self._value(index)
+
+    def __getattr__(self, key: str) -> Any:
+        if key.startswith("_"):
+            raise AttributeError(key)
+        index = self._find(key)
+        if index < 0:
+            raise AttributeError(f"L'attribut '{key}' n'existe pas")
+        return self._value(index)
+
+    def __setattr__(self, key, value):
+        if key in SharedNode.__slots__:
+            object.__setattr__(self, key, value)
+        else:
+            raise AttributeError(f"Configuration partagée en lecture seule: '{key}'")
+
+    def __setitem__(self, key, value):
+        raise TypeError(f"Configuration partagée en lecture seule: '{key}'")
+
+    def __contains__(self, key) -> bool:
+        return self._find(str(key)) >= 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        index = self._find(str(key))
+        return self._value(index) if index >= 0 else default
+
+    def keys(self) -> List[str]:
+        return [self._key(index) for index in range(self._count)]
+
+    def items(self):
+        return [(self._key(index), self._value(index)) for index in range(self._count)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Matérialise le nœud en dictionnaire Python standard."""
+        return {key: _materialize(value) for key, value in self.items()}
+
+    def __repr__(self):
+        return f"SharedNode({self.to_dict()!r})"
+
+
+class SharedList:
+    """Vue paresseuse d'une liste dans le tampon partagé."""
+
+    __slots__ = ("_buf", "_offset", "_count")
+
+    def __init__(self, buf, offset: int):
+        self._buf = buf
+        self._offset = offset
+        (self._count,) = U32.unpack_from(buf, offset + 1)
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        (value_offset,) = U32.unpack_from(self._buf, self._offset + 5 + index * U32.size)
+        return _node(self._buf, value_offset)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        return (self[index] for index in range(self._count))
+
+    def to_list(self) -> List[Any]:
+        return [_materialize(item) for item in self]
+
+    def __repr__(self):
+        return f"SharedList({self.to_list()!r})"
+
+
+def _materialize(value: Any) -> Any:
+    if isinstance(value, SharedNode):
+        return value.to_dict()
+    if isinstance(value, SharedList):
+        return value.to_list()
+    return value
+
+
+class SharedSnapshot:
+    """Instantané publié par ``TheReader.publish``.
+
+    Garde la mémoire partagée (ou le fichier) ouverte tant que le processus
+    publiant en a besoin. ``name`` ou ``path`` suffisent pour s'y attacher
+    depuis un autre processus avec ``SharedReader.attach``.
+    """
+
+    def __init__(self, name: Optional[str] = None, path: Optional[str] = None,
+                 shm: Optional[shared_memory.SharedMemory] = None, size: int = 0):
+        self.name = name
+        self.path = path
+        self.size = size
+        self._shm = shm
+
+    def attach(self) -> "SharedReader":
+        """Ouvre une vue sur l'instantané dans le processus courant."""
+        return SharedReader.attach(name=self.name, path=self.path)
+
+    def close(self):
+        if self._shm is not None:
+            self._shm.close()
+            self._shm = None
+
+    def unlink(self):
+        """Libère définitivement la mémoire partagée ou supprime le fichier."""
+        if self.name is not None:
+            shm = self._shm or shared_memory.SharedMemory(name=self.name)
+            shm.unlink()
+            shm.close()
+            self._shm = None
+        elif self.path is not None and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.unlink()
+
+
+def publish(cfg: Any, name: Optional[str] = None, path: Optional[str] = None,
+            resolve: bool = True) -> SharedSnapshot:
+    """Publie une configuration dans la mémoire partagée ou un fichier mmap.
+
+    Args:
+        cfg: DictConfig ou dictionnaire à publier
+        name: Nom du segment de mémoire partagée (généré si omis)
+        path: Fichier cible; si fourni, le fichier remplace la mémoire partagée
+        resolve: Résoudre les interpolations avant publication
+
+    Returns:
+        SharedSnapshot: Poignée sur l'instantané publié
+    """
+    if isinstance(cfg, DictConfig):
+        cfg = OmegaConf.to_container(cfg, resolve=resolve)
+    data = encode_config(cfg)
+
+    if path is not None:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        return SharedSnapshot(path=path, size=len(data))
+
+    shm = shared_memory.SharedMemory(name=name, create=True, size=len(data))
+    shm.buf[:len(data)] = data
+    return SharedSnapshot(name=shm.name, shm=shm, size=len(data))
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    try:
+        # Python >= 3.13: ne pas laisser le resource_tracker détruire le segment
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        from multiprocessing import resource_tracker
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+class SharedReader:
+    """Lecteur en lecture seule sur un instantané partagé.
+
+    Offre la même navigation que TheReader (attributs, ``[]``, ``walk``,
+    context manager) sans copier la configuration dans le processus.
+    """
+
+    def __init__(self, buf, handle=None):
+        if len(buf) < HEADER.size:
+            raise ValueError("Tampon de configuration partagée invalide")
+        magic, version, root, size = HEADER.unpack_from(buf, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Tampon de configuration partagée invalide")
+        self._handle = handle
+        self._buf = buf
+        self.cfg = _node(buf, root)
+        self.context = []
+        self.cursor = self.cfg
+
+    @classmethod
+    def attach(cls, name: Optional[str] = None, path: Optional[str] = None) -> "SharedReader":
+        """S'attache à un instantané publié, sans copie.
+
+        Args:
+            name: Nom du segment de mémoire partagée
+            path: Fichier publié (ouvert en mmap lecture seule)
+        """
+        if path is not None:
+            with open(path, "rb") as f:
+                handle = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return cls(memoryview(handle), handle)
+        if name is None:
+            raise ValueError("Indiquer 'name' ou 'path' pour s'attacher à un instantané")
+        shm = _attach_shared_memory(name)
+        return cls(shm.buf, shm)
+
+    def close(self):
+        """Détache la vue (les nœuds obtenus deviennent inutilisables)."""
+        handle, self._handle = self._handle, None
+        buf, self._buf = self._buf, None
+        self.cfg = self.cursor = None
+        if isinstance(handle, mmap.mmap):
+            # La vue sur le mmap doit être libérée avant sa fermeture
+            buf.release()
+        if handle is not None:
+            handle.close()
+
+    def __call__(self, *args: Any, **kwds: Any) -> Any:
+        return self.cursor if self.context else self.cfg
+
+    def start(self) -> None:
+        self.context = []
+        self.cursor = self.cfg
+
+    def walk(self, *args: str) -> "SharedReader":
+        for key in args:
+            self.cursor = self.cursor[key]
+        self.context.extend(args)
+        return self
+
+    def get(self, key: str) -> Any:
+        return self.cursor[key]
+
+    def __getitem__(self, key: str) -> Any:
+        return self.cursor[key]
+
+    def __getattr__(self, key: str) -> Any:
+        if key.startswith("_") or key in ("cfg", "cursor", "context"):
+            raise AttributeError(key)
+        cursor = self.cursor
+        if key in cursor:
+            return cursor[key]
+        raise AttributeError(f"L'attribut '{key}' n'existe pas")
+
+    def __contains__(self, key) -> bool:
+        return key in self.cursor
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.start()
+
+    def get_cfg(self):
+        return self.cfg
+
+    def get_resolved_config(self) -> Dict[str, Any]:
+        """Matérialise l'instantané complet en dictionnaire (copie locale)."""
+        return _materialize(self.cfg)
+
+    def __repr__(self):
+        return f"SharedReader({_materialize(self.cfg)!r})"
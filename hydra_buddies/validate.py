@@ -0,0 +1,240 @@
+import hashlib
+import multiprocessing
+import os
+from typing import Any, Dict, List, Optional
+from omegaconf import DictConfig, ListConfig, OmegaConf
+from .cache import cache_path, load_json, save_json, scan_files, tree_digest
+from .deps import ENV_PATTERN, DependencyGraph, normalize_key
+
+CACHE_VERSION = 2
+CACHE_FILENAME = "validate.json"
+
+# État propre à chaque processus du pool (initialisé une seule fois par worker)
+_WORKER: Dict[str, Any] = {}
+
+
+def _diagnostic(unit: dict, severity: str, code: str, message: str,
+                path: Optional[str] = None, file: Optional[str] = None) -> dict:
+    return {
+        "unit": unit["id"],
+        "config": unit["config"],
+        "overrides": unit["overrides"],
+        "severity": severity,
+        "code": code,
+        "path": path,
+        "file": file,
+        "message": message.strip().splitlines()[0] if message.strip() else message,
+    }
+
+
+def _check_interpolations(node, prefix: str = ""):
+    """Produit ``(chemin, exception)`` pour chaque interpolation non résoluble."""
+    keys = range(len(node)) if isinstance(node, ListConfig) else node.keys()
+    for key in keys:
+        path = f"{prefix}[{key}]" if isinstance(node, ListConfig) else (f"{prefix}.{key}" if prefix else str(key))
+        if OmegaConf.is_interpolation(node, key):
+            try:
+                node[key]
+            except Exception as e:
+                yield path, e
+            continue
+        child = node._get_node(key)
+        if isinstance(child, (DictConfig, ListConfig)) and not child._is_none() and not child._is_missing():
+            yield from _check_interpolations(child, path)
+
+
+def _init_worker(config_dir: str):
+    """Prépare la session de composition une fois pour toute la durée de vie du worker."""
+    from .session import get_session
+
+    _WORKER["session"] = get_session(config_dir)
+
+
+def _validate_unit(unit: dict) -> dict:
+    """Valide une unité: composition, entrées defaults et interpolations."""
+    from hydra.errors import MissingConfigException
+
+    from .buddies import TheReader
+
+    session = _WORKER["session"]
+    result = {"id": unit["id"], "deps": None, "env": [], "defaults": [], "diagnostics": []}
+    try:
+        # Même configuration que celle vue par TheReader (secrets promus)
+        cfg = TheReader.from_cfg(session.compose(unit["config"], unit["overrides"]),
+                                 unit["config"], session.root).cfg
+        defaults = session.defaults_list(unit["config"], unit["overrides"])
+    except MissingConfigException as e:
+        result["diagnostics"].append(_diagnostic(unit, "error", "missing-default", str(e)))
+        return result
+    except Exception as e:
+        result["diagnostics"].append(_diagnostic(unit, "error", "compose-error", f"{type(e).__name__}: {e}"))
+        return result
+
+    result["deps"] = [f"{default.config_path}.yaml" for default in defaults]
+    result["defaults"] = [[default.config_path, default.override_key] for default in defaults]
+    raw = OmegaConf.to_yaml(cfg)
+    result["env"] = sorted(set(ENV_PATTERN.findall(raw)))
+    if not unit["interpolations"]:
+        return result
+
+    # Les cycles sont signalés une fois, sans les erreurs de résolution qu'ils entraînent
+    graph = DependencyGraph.build(OmegaConf.to_container(cfg, resolve=False))
+    cycles = graph.cycles()
+    affected = set()
+    for cycle in cycles:
+        affected.update(cycle)
+        for member in cycle:
+            affected |= graph.dependents(member)
+    failures = [(path, error) for path, error in _check_interpolations(cfg)
+                if normalize_key(path) not in affected]
+
+    if cycles or failures:
+        sources = session.provenance(unit["config"], unit["overrides"])
+        for cycle in cycles:
+            source = sources.get(cycle[0]) or sources.get(f"secrets.{cycle[0]}")
+            result["diagnostics"].append(_diagnostic(
+                unit, "error", "interpolation-cycle", " -> ".join(cycle + cycle[:1]),
+                path=cycle[0], file=f"{source}.yaml" if source else None,
+            ))
+        for path, error in failures:
+            message = str(error)
+            if "Environment variable" in message:
+                severity, code = "warning", "env-unset"
+            else:
+                severity, code = "error", "dangling-interpolation"
+            source = sources.get(path) or sources.get(f"secrets.{path}")
+            result["diagnostics"].append(_diagnostic(
+                unit, severity, code, message, path=path,
+                file=f"{source}.yaml" if source else None,
+            ))
+    return result
+
+
+def _env_digest(names: List[str]) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for name in names:
+        value = os.environ.get(name)
+        digest.update(f"{name}={'' if value is None else value}\0{value is None}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class Validator:
+    """Validation incrémentale d'un répertoire de configuration complet.
+
+    Les unités validées sont les configurations principales (fichiers YAML à
+    la racine) et chaque option de groupe, composée dans le contexte d'une
+    configuration principale qui sélectionne ce groupe. Le résultat de chaque
+    unité est conservé avec l'empreinte des fichiers dont elle dépend: une
+    nouvelle exécution ne revalide que les unités touchées.
+    """
+
+    def __init__(self, config_dir: str, use_cache: bool = True):
+        """Initialise le validateur.
+
+        Args:
+            config_dir: Répertoire de configuration
+            use_cache: Réutiliser les résultats des exécutions précédentes
+        """
+        self.config_dir = os.path.abspath(config_dir)
+        self.cache_file = cache_path(self.config_dir, CACHE_FILENAME)
+        data = load_json(self.cache_file, {}) if use_cache else {}
+        if data.get("version") != CACHE_VERSION or data.get("root") != self.config_dir:
+            data = {}
+        self.files: Dict[str, list] = data.get("files", {})
+        self.results: Dict[str, dict] = data.get("units", {})
+        self.revalidated: List[str] = []
+
+    def _is_fresh(self, result: Optional[dict], files: Dict[str, list], tree: str) -> bool:
+        if result is None:
+            return False
+        if result["deps"] is None:
+            # Composition en échec: dépend de l'ensemble du répertoire
+            if result.get("tree") != tree:
+                return False
+        elif result.get("digests") != [files[path][2] if path in files else None for path in result["deps"]]:
+            return False
+        return result.get("env_digest") == _env_digest(result["env"])
+
+    def _run(self, units: List[dict], files: Dict[str, list], tree: str, processes: Optional[int]):
+        pending = [unit for unit in units if not self._is_fresh(self.results.get(unit["id"]), files, tree)]
+        if not pending:
+            return
+
+        def store(result):
+            result["tree"] = tree
+            result["digests"] = [files[path][2] if path in files else None for path in result["deps"] or []]
+            result["env_digest"] = _env_digest(result["env"])
+            self.results[result["id"]] = result
+            self.revalidated.append(result["id"])
+
+        processes = min(processes or os.cpu_count() or 1, len(pending))
+        if processes <= 1:
+            _init_worker(self.config_dir)
+            for unit in pending:
+                store(_validate_unit(unit))
+            return
+        with multiprocessing.Pool(processes, initializer=_init_worker, initargs=(self.config_dir,)) as pool:
+            for result in pool.imap_unordered(_validate_unit, pending):
+                store(result)
+
+    def run(self, processes: Optional[int] = None) -> List[dict]:
+        """Valide le répertoire et retourne les diagnostics.
+
+        Args:
+            processes: Nombre de workers (défaut: nombre de CPU, 1 = sans pool)
+
+        Returns:
+            list: Diagnostics ``{unit, config, overrides, severity, code, path, file, message}``
+        """
+        self.revalidated = []
+        files = scan_files(self.config_dir, self.files)
+        tree = tree_digest(files)
+        primaries = sorted(os.path.splitext(path)[0] for path in files if "/" not in path)
+        options = sorted(os.path.splitext(path)[0] for path in files if "/" in path)
+
+        # 1. Configurations principales
+        primary_units = [
+            {"id": name, "config": name, "overrides": [], "interpolations": True}
+            for name in primaries
+        ]
+        self._run(primary_units, files, tree, processes)
+
+        # 2. Options de groupes non couvertes par les configurations principales
+        covered, selectors = set(), {}
+        for name in primaries:
+            for config_path, override_key in self.results[name]["defaults"]:
+                covered.add(config_path)
+                if override_key:
+                    selectors.setdefault(override_key, name)
+        option_units = []
+        for option in options:
+            if option in covered:
+                continue
+            group, choice = option.rsplit("/", 1)
+            if group in selectors:
+                option_units.append({"id": option, "config": selectors[group],
+                                     "overrides": [f"{group}={choice}"], "interpolations": True})
+            else:
+                # Groupe jamais sélectionné: la composition seule est vérifiable
+                option_units.append({"id": option, "config": option, "overrides": [],
+                                     "interpolations": False})
+        self._run(option_units, files, tree, processes)
+
+        units = {unit["id"] for unit in primary_units + option_units}
+        self.results = {key: value for key, value in self.results.items() if key in units}
+        self.files = files
+        save_json(self.cache_file, {
+            "version": CACHE_VERSION,
+            "root": self.config_dir,
+            "files": files,
+            "units": self.results,
+        })
+        # Une erreur d'un fichier partagé n'est signalée qu'une fois
+        diagnostics, seen = [], set()
+        for unit in primary_units + option_units:
+            for diagnostic in self.results[unit["id"]]["diagnostics"]:
+                key = (diagnostic["code"], diagnostic["path"], diagnostic["file"], diagnostic["message"])
+                if diagnostic["file"] is None or key not in seen:
+                    seen.add(key)
+                    diagnostics.append(diagnostic)
+        return diagnostics
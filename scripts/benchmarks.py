@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+Benchmarks de performance pour hydra-buddies.
+"""
+
+import os
+import tempfile
+import timeit
+import click
+import yaml
+
+# Configuration représentative du template (api, database, logging)
+SAMPLE_CONFIG = {
+    "project": {"name": "bench", "version": "0.1.0"},
+    "api": {
+        "url": "http://api.example.com",
+        "key": "default_key",
+        "timeout": 30,
+        "retry": {"max_attempts": 3, "delay": 1},
+    },
+    "database": {
+        "host": "localhost",
+        "port": 5432,
+        "credentials": {"username": "user", "password": "default_password"},
+    },
+    "logging": {
+        "version": 1,
+        "loggers": {"app": {"level": "INFO", "handlers": ["console", "file"]}},
+    },
+}
+
+
+def make_reader(data=None):
+    """Crée un TheReader dans un répertoire temporaire contenant la configuration"""
+    from hydra_buddies import TheReader
+
+    tmp_dir = tempfile.mkdtemp(prefix="buddy-bench-")
+    config_dir = os.path.join(tmp_dir, ".hydra-conf")
+    os.makedirs(config_dir)
+    with open(os.path.join(config_dir, "config.yaml"), "w") as f:
+        yaml.safe_dump(data or SAMPLE_CONFIG, f)
+
+    prev_dir = os.getcwd()
+    os.chdir(tmp_dir)
+    try:
+        return TheReader("config")
+    finally:
+        os.chdir(prev_dir)
+
+
+def report(title, results, number):
+    """Affiche les temps par accès en nanosecondes"""
+    click.echo(f"\n{title} ({number} itérations)")
+    click.echo("-" * 50)
+    for name, seconds in results:
+        click.echo(f"{name:<30} {seconds / number * 1e9:10.1f} ns/accès")
+
+
+@click.group()
+def cli():
+    """Benchmarks hydra-buddies"""
+    pass
+
+
+@cli.command()
+@click.option('--number', '-n', default=100000, help="Nombre d'accès mesurés")
+def freeze(number):
+    """Compare l'accès DictConfig, TheReader et reader.freeze()"""
+    reader = make_reader()
+    cfg = reader.cfg
+    frozen = reader.freeze()
+
+    results = [
+        ("DictConfig", timeit.timeit(lambda: cfg.api.retry.max_attempts, number=number)),
+        ("TheReader", timeit.timeit(lambda: reader.api.retry.max_attempts, number=number)),
+        ("reader.freeze()", timeit.timeit(lambda: frozen.api.retry.max_attempts, number=number)),
+    ]
+    report("Accès cfg.api.retry.max_attempts", results, number)
+
+
+@cli.command()
+@click.option('--number', '-n', default=100000, help="Nombre d'accès mesurés")
+def path(number):
+    """Compare split + walk(), resolve() et un accesseur compilé reader.path()"""
+    reader = make_reader()
+    accessor = reader.path("api.retry.max_attempts")
+    bundle = reader.paths("api.url", "api.timeout", "database.host", "database.port")
+
+    def walk():
+        # Ancienne commande get: découpage et parcours à chaque lecture
+        keys = "api.retry.max_attempts".split(".")
+        with reader:
+            reader.walk(*keys[:-1])
+            return reader[keys[-1]]
+
+    results = [
+        ("split + walk()", timeit.timeit(walk, number=number)),
+        ("resolve()", timeit.timeit(lambda: reader.resolve("api.retry.max_attempts"), number=number)),
+        ("reader.path()", timeit.timeit(accessor, number=number)),
+        ("reader.paths() (4 clés)", timeit.timeit(bundle, number=number)),
+    ]
+    report("Accès api.retry.max_attempts", results, number)
+
+
+def make_roots(count, groups=5):
+    """Crée plusieurs racines de configuration indépendantes"""
+    base = tempfile.mkdtemp(prefix="buddy-bench-roots-")
+    roots = []
+    for index in range(count):
+        root = os.path.join(base, f"service_{index}", ".hydra-conf")
+        defaults = ["_self_"]
+        for group in range(groups):
+            os.makedirs(os.path.join(root, f"group_{group}"))
+            for option in ("default", "prod"):
+                with open(os.path.join(root, f"group_{group}", f"{option}.yaml"), "w") as f:
+                    yaml.safe_dump({"name": f"{option}_{index}", "values": list(range(10))}, f)
+            defaults.append({f"group_{group}": "default"})
+        with open(os.path.join(root, "config.yaml"), "w") as f:
+            yaml.safe_dump({"defaults": defaults, "project": {"name": f"service_{index}"}}, f)
+        roots.append(root)
+    return roots
+
+
+@cli.command()
+@click.option('--roots', '-r', 'root_count', default=8, help='Nombre de racines de configuration')
+@click.option('--rounds', default=5, help='Compositions par racine')
+@click.option('--threads', '-t', default=4, help='Threads pour les sessions')
+def sessions(root_count, rounds, threads):
+    """Compare le débit multi-racines: GlobalHydra vs sessions de composition"""
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    import hydra
+    from hydra.core.global_hydra import GlobalHydra
+    from hydra_buddies.session import get_session
+
+    roots = make_roots(root_count)
+    total = root_count * rounds
+
+    # Approche historique: réinitialiser le singleton global pour chaque racine
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for root in roots:
+            GlobalHydra.instance().clear()
+            hydra.initialize_config_dir(config_dir=root, version_base=None)
+            hydra.compose(config_name="config", overrides=["group_0=prod"])
+    GlobalHydra.instance().clear()
+    legacy = time.perf_counter() - start
+
+    def compose(root):
+        for _ in range(rounds):
+            get_session(root).compose("config", ["group_0=prod"])
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(compose, roots))
+    session_time = time.perf_counter() - start
+
+    click.echo(f"\nComposition multi-racines ({root_count} racines x {rounds} compositions)")
+    click.echo("-" * 50)
+    click.echo(f"{'GlobalHydra (série)':<30} {total / legacy:10.1f} compositions/s")
+    click.echo(f"{'ComposeSession (threads)':<30} {total / session_time:10.1f} compositions/s")
+
+
+@cli.command()
+@click.option('--targets', '-t', 'count', default=50, help='Nombre de répertoires à initialiser')
+def init(count):
+    """Compare buddy init via cookiecutter et le rendu natif (--many)"""
+    import shutil
+    import time
+    from cookiecutter.main import cookiecutter
+    from hydra_buddies.scaffold import TEMPLATE_DIR, scaffold_many
+
+    base = tempfile.mkdtemp(prefix="buddy-bench-init-")
+    targets = [os.path.join(base, "cookiecutter", f"service_{index}") for index in range(count)]
+
+    start = time.perf_counter()
+    for target in targets:
+        os.makedirs(target)
+        cookiecutter(TEMPLATE_DIR, output_dir=target, no_input=True,
+                     extra_context={"project_name": os.path.basename(target)})
+    legacy = time.perf_counter() - start
+
+    targets = [os.path.join(base, "native", f"service_{index}") for index in range(count)]
+    start = time.perf_counter()
+    scaffold_many(targets)
+    native = time.perf_counter() - start
+    shutil.rmtree(base)
+
+    click.echo(f"\nInitialisation de {count} répertoires de configuration")
+    click.echo("-" * 50)
+    click.echo(f"{'cookiecutter':<30} {legacy / count * 1e3:10.2f} ms/répertoire")
+    click.echo(f"{'rendu natif (--many)':<30} {native / count * 1e3:10.2f} ms/répertoire")
+
+
+@cli.command(name='intern')
+@click.option('--tenants', '-t', default=200, help='Nombre de configurations (environnements, locataires)')
+def intern_(tenants):
+    """Compare la mémoire de N lecteurs, N configurations figées et N configurations internées"""
+    import gc
+    import tracemalloc
+    from omegaconf import OmegaConf
+    from hydra_buddies.frozen import freeze
+    from hydra_buddies.intern import InternPool
+
+    def variant(index):
+        # Configurations qui ne diffèrent que par quelques valeurs
+        data = yaml.safe_load(yaml.safe_dump(SAMPLE_CONFIG))
+        data["project"]["name"] = f"tenant_{index}"
+        data["database"]["host"] = f"db{index % 3}.example.com"
+        data["logging"]["loggers"] = {f"svc{n}": {"level": "INFO", "handlers": ["console", "file"]}
+                                      for n in range(20)}
+        return data
+
+    def measure(build):
+        gc.collect()
+        tracemalloc.start()
+        kept = [build(index) for index in range(tenants)]
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del kept
+        return size
+
+    pool = InternPool()
+    results = [
+        ("DictConfig", measure(lambda i: OmegaConf.create(variant(i)))),
+        ("freeze()", measure(lambda i: freeze(variant(i)))),
+        ("freeze(intern=True)", measure(lambda i: pool.intern(variant(i)))),
+    ]
+    click.echo(f"\nMémoire de {tenants} configurations")
+    click.echo("-" * 50)
+    for name, size in results:
+        click.echo(f"{name:<30} {size / 1024:10.1f} Kio")
+    click.echo("")
+    for key, value in pool.memory_report().items():
+        click.echo(f"{key:<30} {value:>10}")
+
+
+@cli.command()
+@click.option('--services', '-s', default=200, help='Nombre de sections validées')
+@click.option('--rounds', default=5, help='Chargements mesurés')
+def schema(services, rounds):
+    """Mesure le coût de la validation par schémas compilés sur une grande configuration"""
+    import dataclasses
+    import time
+    from typing import Dict, List, Optional
+    from omegaconf import OmegaConf
+    from hydra_buddies import TheReader
+    from hydra_buddies.schema import compile_schema
+
+    @dataclasses.dataclass
+    class Retry:
+        max_attempts: int = 3
+        delay: float = 1.0
+
+    @dataclasses.dataclass
+    class Service:
+        url: str
+        port: int
+        timeout: float = 30.0
+        enabled: bool = True
+        tags: List[str] = dataclasses.field(default_factory=list)
+        limits: Dict[str, int] = dataclasses.field(default_factory=dict)
+        retry: Retry = dataclasses.field(default_factory=Retry)
+        owner: Optional[str] = None
+
+    data = {"project": {"name": "bench"}}
+    for index in range(services):
+        data[f"service_{index}"] = {
+            "url": f"http://svc{index}.example.com", "port": 8000 + index, "timeout": 2.5,
+            "enabled": index % 2 == 0, "tags": ["a", "b", "c"], "limits": {"rps": 100, "burst": 20},
+            "retry": {"max_attempts": 5, "delay": 0.5}, "owner": "${project.name}",
+        }
+    schemas = {f"service_{index}": Service for index in range(services)}
+    reader = make_reader(data)
+
+    def load(**kwargs):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            TheReader("config", path=reader.primary_path, **kwargs)
+        return (time.perf_counter() - start) / rounds
+
+    plain = load()
+    validated = load(schemas=schemas)
+
+    raw = OmegaConf.to_container(reader.cfg, resolve=False)
+    compiled = compile_schema(Service)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for group in schemas:
+            compiled.errors(raw[group], group)
+    compiled_time = (time.perf_counter() - start) / rounds
+
+    # Équivalent OmegaConf: fusion de chaque section dans sa configuration structurée
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for group in schemas:
+            OmegaConf.merge(OmegaConf.structured(Service), reader.cfg[group])
+    structured_time = (time.perf_counter() - start) / rounds
+
+    click.echo(f"\nValidation de {services} sections ({rounds} chargements)")
+    click.echo("-" * 50)
+    click.echo(f"{'TheReader sans schéma':<30} {plain * 1e3:10.2f} ms/chargement")
+    click.echo(f"{'TheReader avec schémas':<30} {validated * 1e3:10.2f} ms/chargement")
+    click.echo(f"{'surcoût':<30} {(validated - plain) / plain * 100:10.1f} %")
+    click.echo(f"{'schémas compilés seuls':<30} {compiled_time * 1e3:10.2f} ms")
+    click.echo(f"{'OmegaConf.structured + merge':<30} {structured_time * 1e3:10.2f} ms")
+
+
+@cli.command()
+@click.option('--runs', '-r', default=5, help='Démarrages à froid mesurés par moteur')
+@click.option('--number', '-n', default=200, help='Compositions mesurées à chaud')
+def startup(runs, number):
+    """Compare le démarrage à froid et la composition des moteurs hydra et native"""
+    import shutil
+    import subprocess
+    import sys
+    import time
+    from hydra_buddies.scaffold import scaffold
+    from hydra_buddies.session import get_session
+
+    base = tempfile.mkdtemp(prefix="buddy-bench-startup-")
+    scaffold(base)
+    root = os.path.join(base, ".hydra-conf")
+    script = ("import sys; from hydra_buddies import TheReader; "
+              "TheReader('config', engine=sys.argv[1]).database.host; "
+              "print(any(m == 'hydra' or m.startswith('hydra.') for m in sys.modules))")
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [os.getcwd(), os.environ.get("PYTHONPATH")]))}
+
+    click.echo(f"\nDémarrage à froid: import + composition ({runs} processus)")
+    click.echo("-" * 50)
+    for engine in ("hydra", "native"):
+        start = time.perf_counter()
+        for _ in range(runs):
+            output = subprocess.run([sys.executable, "-c", script, engine], cwd=base, env=env,
+                                    capture_output=True, text=True, check=True).stdout
+        elapsed = (time.perf_counter() - start) / runs
+        imported = "hydra importé" if output.strip() == "True" else "sans hydra"
+        click.echo(f"{engine:<30} {elapsed * 1e3:10.1f} ms  ({imported})")
+
+    click.echo(f"\nComposition à chaud ({number} compositions)")
+    click.echo("-" * 50)
+    for engine in ("hydra", "native"):
+        session = get_session(root, engine=engine)
+        session.compose("config", ["database=default"])
+        start = time.perf_counter()
+        for _ in range(number):
+            session.compose("config", ["database=default"])
+        elapsed = (time.perf_counter() - start) / number
+        click.echo(f"{engine:<30} {elapsed * 1e3:10.2f} ms/composition")
+    shutil.rmtree(base)
+
+
+@cli.command()
+@click.option('--groups', '-g', default=40, help='Groupes sélectionnés par la configuration principale')
+@click.option('--runs', '-r', default=5, help='Démarrages à froid mesurés par source')
+def bundle(groups, runs):
+    """Compare le démarrage à froid depuis le répertoire (hydra, native) et depuis un bundle"""
+    import shutil
+    import subprocess
+    import sys
+    import time
+    from hydra_buddies.bundle import build_bundle
+
+    base = tempfile.mkdtemp(prefix="buddy-bench-bundle-")
+    root = os.path.join(base, ".hydra-conf")
+    defaults = []
+    for index in range(groups):
+        group = f"service_{index}"
+        os.makedirs(os.path.join(root, group))
+        for option in ("default", "dev", "prod"):
+            data = yaml.safe_load(yaml.safe_dump(SAMPLE_CONFIG["api"]))
+            data["url"] = f"http://{group}.{option}.example.com"
+            data["database"] = "${database.host}"
+            with open(os.path.join(root, group, f"{option}.yaml"), "w") as f:
+                yaml.safe_dump(data, f)
+        defaults.append({group: "default"})
+    with open(os.path.join(root, "config.yaml"), "w") as f:
+        yaml.safe_dump({"defaults": defaults + ["_self_"], "database": SAMPLE_CONFIG["database"]}, f)
+    summary = build_bundle(root, os.path.join(base, "config.bundle"))
+
+    script = ("import sys; from hydra_buddies import TheReader; "
+              "reader = TheReader('config', path=sys.argv[1], engine=sys.argv[2], lazy=sys.argv[3] == 'lazy'); "
+              "reader.service_0.url")
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [os.getcwd(), os.environ.get("PYTHONPATH")]))}
+    cases = [
+        ("répertoire (hydra)", root, "hydra", "full"),
+        ("répertoire (native)", root, "native", "full"),
+        ("bundle", summary["path"], "bundle", "full"),
+        ("bundle (lazy)", summary["path"], "bundle", "lazy"),
+    ]
+
+    click.echo(f"\nDémarrage à froid: {summary['files']} fichiers, bundle de {summary['size'] / 1024:.1f} Kio "
+               f"({runs} processus)")
+    click.echo("-" * 50)
+    for name, path, engine, mode in cases:
+        start = time.perf_counter()
+        for _ in range(runs):
+            subprocess.run([sys.executable, "-c", script, path, engine, mode], cwd=base, env=env, check=True,
+                           capture_output=True)
+        elapsed = (time.perf_counter() - start) / runs
+        click.echo(f"{name:<30} {elapsed * 1e3:10.1f} ms")
+    shutil.rmtree(base)
+
+
+@cli.command()
+@click.option('--services', '-s', default=500, help='Sections de la configuration')
+@click.option('--number', '-n', default=20, help='Configurations dérivées mesurées')
+def overrides(services, number):
+    """Compare les reconstructions possibles d'une configuration dérivée par override de valeur"""
+    import copy
+    from omegaconf import OmegaConf
+
+    data = {f"service_{index}": yaml.safe_load(yaml.safe_dump(SAMPLE_CONFIG)) for index in range(services)}
+    data["train"] = {"lr": 0.1, "label": "${service_0.project.name}"}
+    reader = make_reader(data)
+    base = reader.cfg
+    reader.with_overrides(["train.lr=0.01"])
+
+    def rebuild(build):
+        def run():
+            cfg = build()
+            OmegaConf.set_readonly(cfg, None)
+            cfg.train.lr = 0.01
+        return run
+
+    # Chaque nœud référence son parent: pas de partage de sous-arbre possible
+    # entre la base et la configuration dérivée, l'arbre entier est reconstruit
+    results = [
+        ("copy.deepcopy", timeit.timeit(rebuild(lambda: copy.deepcopy(base)), number=number)),
+        ("OmegaConf.create(container)", timeit.timeit(
+            rebuild(lambda: OmegaConf.create(OmegaConf.to_container(base))), number=number)),
+        ("OmegaConf.merge(base, delta)", timeit.timeit(
+            lambda: OmegaConf.merge(base, {"train": {"lr": 0.01}}), number=number)),
+        ("with_overrides (en cache)", timeit.timeit(
+            lambda: reader.with_overrides(["train.lr=0.01"]), number=number)),
+    ]
+    click.echo(f"\nConfiguration dérivée, {services} sections ({number} itérations)")
+    click.echo("-" * 50)
+    for name, seconds in results:
+        click.echo(f"{name:<30} {seconds / number * 1e3:10.2f} ms")
+
+
+def main():
+    """Point d'entrée principal du script"""
+    cli()
+
+
+if __name__ == "__main__":
+    main()
@@ -17,4 +17,24 @@ def clean_environment():
     
     # Restaure les variables d'environnement
     for key, value in env_backup.items():
-        os.environ[key] = value 
\ No newline at end of file
+        os.environ[key] = value 
+
+@pytest.fixture(autouse=True)
+def compose_cache():
+    """Vide le cache des compositions, partagé par tout le processus, autour de chaque test"""
+    from hydra_buddies.buddies import clear_compose_cache
+
+    clear_compose_cache()
+    yield
+    clear_compose_cache()
+
+@pytest.fixture
+def make_reader():
+    """Fabrique un TheReader à partir d'un dictionnaire, sans passer par Hydra"""
+    from omegaconf import OmegaConf
+    from hydra_buddies import TheReader
+
+    def factory(data, cfg_name="config"):
+        return TheReader.from_cfg(OmegaConf.create(data), cfg_name)
+
+    return factory
@@ -0,0 +1,48 @@
+import os
+import pytest
+from omegaconf import OmegaConf
+
+CONFIG = {
+    "database": {"host": "localhost", "port": 5432, "replicas": ["r1", "r2"]},
+    "api": {"url": "http://${database.host}:${database.port}", "token": "${oc.env:API_TOKEN,none}"},
+}
+
+def test_path_accessor(make_reader):
+    """Test qu'un accesseur compilé relit la valeur seulement si la configuration change"""
+    reader = make_reader(CONFIG)
+    url = reader.path("api.url")
+    replica = reader.path("database.replicas[1]")
+    assert url() == "http://localhost:5432"
+    assert replica() == "r2"
+    assert url() is url()
+
+    reader["database"]["port"] = 6543
+    assert url() == "http://localhost:5432"   # écriture directe: non suivie
+    reader["database"] = {"host": "db", "port": 1}
+    assert url() == "http://db:1"
+
+    reader.cfg = OmegaConf.create({"api": {"url": "autre"}})
+    assert url() == "autre"
+
+    with pytest.raises(KeyError):
+        reader.path("database.missing")
+    with pytest.raises(ValueError):
+        reader.path("database..host")
+
+def test_path_bundle(make_reader, monkeypatch):
+    """Test l'extraction groupée, les préfixes virtuels et refresh_env()"""
+    reader = make_reader(CONFIG)
+    reader.add_prefix("dev")
+    port = reader.path("database.port")
+    bundle = reader.paths("dev.api.url", port, "api.token")
+    assert bundle() == ("http://localhost:5432", 5432, "none")
+    assert bundle.as_dict() == {"dev.api.url": "http://localhost:5432",
+                                "database.port": 5432, "api.token": "none"}
+
+    monkeypatch.setenv("API_TOKEN", "secret")
+    assert bundle()[2] == "none"
+    assert reader.refresh_env() == ["api.token"]
+    assert bundle()[2] == "secret"
+
+    with pytest.raises(ValueError):
+        make_reader(CONFIG).paths(port)
@@ -0,0 +1,60 @@
+import json
+import pytest
+from click.testing import CliRunner
+from hydra_buddies.batch import ReaderPool, parse_request, run_batch
+from hydra_buddies.cli import cli
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Crée un projet minimal et s'y place"""
+    config_dir = tmp_path / ".hydra-conf"
+    config_dir.mkdir()
+    (config_dir / "config.yaml").write_text("project:\n  name: test\nurl: http://${project.name}\n")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+def test_parse_request():
+    """Test les lignes texte, JSON, ignorées et invalides"""
+    assert parse_request("buddy get default 'a b'") == {"id": None, "argv": ["get", "default", "a b"]}
+    assert parse_request('{"id": 3, "command": "get", "args": ["default", 1]}') == \
+        {"id": 3, "argv": ["get", "default", "1"]}
+    assert parse_request("  # commentaire") is None
+    assert parse_request("") is None
+    with pytest.raises(ValueError):
+        parse_request('{"args": []}')
+    with pytest.raises(ValueError):
+        parse_request("get 'ouvert")
+
+def test_run_batch_shares_readers(project):
+    """Test que les commandes partagent les lecteurs et que les erreurs restent isolées"""
+    pool = ReaderPool()
+    lines = [
+        "get default url",
+        '{"id": "n", "command": "get", "args": ["default", "project.name"]}',
+        "read inconnue",
+        "read config --hash",
+        "batch",
+    ]
+    results = list(run_batch(cli, lines, pool=pool))
+    assert [result["line"] for result in results] == [1, 2, 3, 4, 5]
+    assert results[0]["output"] == "http://test\n"
+    assert results[1]["id"] == "n" and results[1]["output"] == "test\n"
+    assert results[2]["exit_code"] == 1 and "inconnue" in results[2]["error"]
+    assert results[3]["exit_code"] == 0 and results[3]["output"].strip()
+    assert results[4]["exit_code"] == 2
+    # Un seul lecteur pour la configuration par défaut
+    assert pool.misses == 2 and pool.hits == 2
+
+    stopped = list(run_batch(cli, ["read inconnue", "get default url"], fail_fast=True))
+    assert len(stopped) == 1
+
+def test_batch_command(project):
+    """Test la commande batch sur l'entrée standard"""
+    result = CliRunner().invoke(cli, ["batch"], input="get default url\nread inconnue\n")
+    assert result.exit_code == 1
+    lines = [json.loads(line) for line in result.output.splitlines()]
+    assert [line["exit_code"] for line in lines] == [0, 1]
+
+    result = CliRunner().invoke(cli, ["batch", "--text"], input="get default project.name\n")
+    assert result.exit_code == 0
+    assert result.output == "test\n"
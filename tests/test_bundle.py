@@ -0,0 +1,110 @@
+import pytest
+from click.testing import CliRunner
+from hydra_buddies import TheReader
+from hydra_buddies.bundle import Bundle, build_bundle
+from hydra_buddies.cli import cli
+from hydra_buddies.native import CompositionError
+from hydra_buddies.session import clear_sessions, get_session
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Crée un projet avec secrets, groupes, en-tête de package et fichiers invalides"""
+    config_dir = tmp_path / ".hydra-conf"
+    for group in ("database", "api", "secrets"):
+        (config_dir / group).mkdir(parents=True)
+    (config_dir / "config.yaml").write_text(
+        "defaults:\n  - secrets/login\n  - _self_\n  - database: default\n  - api: default\n"
+        "  - override hydra/job_logging: disabled\n\nproject:\n  name: bundled\n"
+    )
+    (config_dir / "broken.yaml").write_text("defaults:\n  - api: invalid\nproject: [\n")
+    (config_dir / "secrets" / "login.yaml").write_text("database:\n  password: secret\n")
+    (config_dir / "database" / "default.yaml").write_text("host: localhost\nport: 5432\n")
+    (config_dir / "database" / "prod.yaml").write_text("# @package database\nhost: prod.example.com\nport: 5433\n")
+    (config_dir / "api" / "default.yaml").write_text("url: http://${database.host}:${database.port}\n")
+    (config_dir / "api" / "invalid.yaml").write_text("url: [\n")
+    monkeypatch.chdir(tmp_path)
+    clear_sessions()
+    yield tmp_path
+    clear_sessions()
+
+def test_reader_from_bundle(project):
+    """Test qu'un lecteur sur le bundle compose comme sur le répertoire"""
+    summary = build_bundle(".hydra-conf", "config.bundle")
+    assert summary["files"] == 6 and summary["configs"] == ["config"]
+    assert summary["excluded"] == ["secrets/login"]
+    assert "broken" in summary["errors"]
+
+    for overrides in ([], ["database=prod"], ["api.url=x", "+extra.key=1"]):
+        expected = TheReader("config", overrides=overrides)
+        reader = TheReader("config", overrides=overrides, path="config.bundle")
+        assert reader.engine == "bundle"
+        assert reader.resolve() == expected.resolve()
+        assert reader.provenance() == expected.provenance()
+
+    # Mode différé: seuls les fichiers des groupes consultés sont décodés
+    clear_sessions()
+    reader = TheReader("config", path="config.bundle", lazy=True)
+    session = reader.session
+    assert set(session._files) == {"config", "secrets/login"}
+    assert reader.database.host == "localhost"
+    assert set(session._files) == {"config", "secrets/login", "database/default"}
+
+def test_bundle_errors_and_staleness(project):
+    """Test les fichiers invalides, la détection des sources modifiées et les fichiers non-bundle"""
+    build_bundle(".hydra-conf", "config.bundle")
+    session = get_session("config.bundle", engine="bundle")
+    assert session.group_options("api") == ["default", "invalid"]
+    assert session.list_groups() == ["api", "database", "secrets"]
+    with pytest.raises(CompositionError, match="api/invalid"):
+        session.compose("config", ["api=invalid"])
+    with pytest.raises(CompositionError):
+        TheReader("broken", path="config.bundle")
+
+    bundle = Bundle("config.bundle")
+    assert not bundle.is_stale()
+    (project / ".hydra-conf" / "database" / "default.yaml").write_text("host: changed\n")
+    assert bundle.is_stale()
+    bundle.close()
+
+    (project / "plain.bin").write_bytes(b"not a bundle")
+    with pytest.raises(ValueError):
+        Bundle("plain.bin")
+
+def test_bundle_command(project):
+    """Test buddy bundle et buddy bundle --check"""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["bundle", "-o", "app.bundle"])
+    assert result.exit_code == 0, result.output
+    assert "6 fichiers, 1 configurations" in result.output
+    assert "1 fichiers de secrets exclus" in result.output
+
+    result = runner.invoke(cli, ["bundle", "-o", "app.bundle", "--check"])
+    assert result.exit_code == 0 and "à jour" in result.output
+    (project / ".hydra-conf" / "database" / "staging.yaml").write_text("host: staging\n")
+    result = runner.invoke(cli, ["bundle", "-o", "app.bundle", "--check"])
+    assert result.exit_code == 1 and "à reconstruire" in result.output
+
+    result = runner.invoke(cli, ["export", "config", "-p", "app.bundle", "-f", "jsonl", "-r"])
+    assert result.exit_code == 0, result.output
+    assert '"path": "api.url", "value": "http://localhost:5432"' in result.output
+
+def test_bundle_secrets_and_rebuild(project):
+    """Test l'exclusion des secrets et la relecture d'un bundle reconstruit"""
+    build_bundle(".hydra-conf", "config.bundle")
+    assert b"password: secret" not in (project / "config.bundle").read_bytes()
+    assert "secrets/login" not in Bundle("config.bundle").files
+    assert TheReader("config", path="config.bundle").database.password == "secret"
+
+    # Bundle reconstruit: nouvelle session, compositions du cache non réutilisées
+    (project / ".hydra-conf" / "database" / "default.yaml").write_text("host: rebuilt\nport: 1\n")
+    summary = build_bundle(".hydra-conf", "config.bundle", include_secrets=True)
+    assert summary["files"] == 7 and summary["excluded"] == []
+    (project / ".hydra-conf" / "secrets" / "login.yaml").unlink()
+    reader = TheReader("config", path="config.bundle")
+    assert reader.database.host == "rebuilt" and reader.database.password == "secret"
+
+    # Secrets exclus et source absente: erreur explicite
+    build_bundle(".hydra-conf", "config.bundle")
+    (project / ".hydra-conf" / "database" / "prod.yaml").unlink()
+    with pytest.raises(CompositionError, match="secrets"):
+        TheReader("config", path="config.bundle", overrides=["database=default"])
@@ -91,6 +91,15 @@ def test_list_keys_command(runner, temp_project):
         # Database sera dans l'output uniquement si on charge correctement les defaults
         # mais notre mock ne le fait pas pour ce test, donc on ne teste pas cette assertion 
 
+def test_list_keys_relative_path(runner, temp_project):
+    """Test list-keys avec un --path relatif au répertoire courant"""
+    init_result = runner.invoke(cli, ["init"])
+    assert init_result.exit_code == 0, f"Erreur d'initialisation: {init_result.output}"
+
+    result = runner.invoke(cli, ["list-keys", "config", "--resolve", "--path", ".hydra-conf", "--values"])
+    assert result.exit_code == 0, f"Erreur de list-keys: {result.output}"
+    assert "database.host" in result.output
+
 def test_add_config_command(runner, temp_project):
     """Test la commande add-config"""
     # D'abord initialiser
@@ -0,0 +1,180 @@
+import importlib.util
+import os
+import pytest
+from hydra_buddies.compiler import generate_module, compile_module, source_fingerprint
+
+CONFIG = {
+    "project": {"name": "test-project", "version": "0.1.0"},
+    "database": {
+        "host": "localhost",
+        "port": 5432,
+        "master": {"password": "${oc.env:DB_MASTER_PASSWORD,master_password}"},
+        "credentials": {"password": "${database.master.password}"},
+        "url": "postgres://${database.host}:${database.port}",
+    },
+    "handlers": ["console", "file"],
+}
+
+@pytest.fixture
+def config_dir(tmp_path):
+    """Crée un répertoire de configuration source pour l'empreinte"""
+    config_dir = tmp_path / ".hydra-conf"
+    config_dir.mkdir()
+    (config_dir / "config.yaml").write_text("project:\n  name: test-project\n")
+    return config_dir
+
+def load_module(path):
+    spec = importlib.util.spec_from_file_location("settings_generated", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def test_compiled_values(make_reader, config_dir, tmp_path):
+    """Test les constantes du module généré"""
+    output = tmp_path / "settings_generated.py"
+    compile_module(make_reader(CONFIG), str(output), config_dir=str(config_dir))
+    settings = load_module(output)
+
+    assert settings.PROJECT["name"] == "test-project"
+    assert settings.DATABASE["port"] == 5432
+    assert settings.DATABASE["url"] == "postgres://localhost:5432"
+    assert settings.HANDLERS == ("console", "file")
+    assert settings.CONFIG["database"] is settings.DATABASE
+    with pytest.raises(TypeError):
+        settings.DATABASE["host"] = "other"
+
+def test_secrets_read_from_environment(make_reader, config_dir, tmp_path, monkeypatch):
+    """Test que les secrets deviennent des lectures de os.environ"""
+    source = generate_module(make_reader(CONFIG), str(config_dir))
+    assert "master_password'" in source
+    assert "os.environ.get('DB_MASTER_PASSWORD', 'master_password')" in source
+
+    monkeypatch.setenv("DB_MASTER_PASSWORD", "s3cret")
+    output = tmp_path / "settings_env.py"
+    output.write_text(source)
+    settings = load_module(output)
+    assert settings.DATABASE["credentials"]["password"] == "s3cret"
+    assert "s3cret" not in output.read_text()
+
+def test_literal_secrets_read_from_environment(make_reader, config_dir, tmp_path, monkeypatch):
+    """Test que les secrets écrits en clair ne sont jamais recopiés dans le module"""
+    from omegaconf import OmegaConf
+
+    OmegaConf.register_new_resolver("buddy_upper", lambda value: value.upper(), replace=True)
+    config = {
+        "db": {"host": "localhost", "password": "hunter2", "copy": "${db.password}"},
+        "secrets": {"api": {"token": "t0ken"}},
+        "token": 12345,
+        "shout": "${buddy_upper:${db.password}}",
+    }
+    output = tmp_path / "settings_literal.py"
+    compile_module(make_reader(config), str(output), stub=True, config_dir=str(config_dir))
+    source = output.read_text()
+    assert "hunter2" not in source and "t0ken" not in source and "12345" not in source
+    assert "os.environ['DB_PASSWORD']" in source
+    assert "TOKEN: str" in (tmp_path / "settings_literal.pyi").read_text()
+
+    monkeypatch.setenv("DB_PASSWORD", "from-env")
+    monkeypatch.setenv("API_TOKEN", "api-env")
+    monkeypatch.setenv("TOKEN", "root-env")
+    settings = load_module(output)
+    assert settings.DB == {"host": "localhost", "password": "from-env", "copy": "from-env"}
+    assert settings.SECRETS["api"]["token"] == settings.API["token"] == "api-env"
+    assert settings.TOKEN == "root-env"
+    assert settings.SHOUT == "FROM-ENV"
+
+def test_runtime_config_is_minimal(make_reader, config_dir, tmp_path, monkeypatch):
+    """Test que _RAW ne contient que ce que lit _resolve"""
+    from omegaconf import OmegaConf
+
+    OmegaConf.register_new_resolver("buddy_upper", lambda value: value.upper(), replace=True)
+    config = {
+        "api": {"name": "${buddy_upper:${api.base}}", "base": "${project.name}", "port": 80},
+        "project": {"name": "demo", "owner": "me"},
+        "hosts": ["${buddy_upper:${servers.1}}", "plain"],
+        "servers": ["a", "b"],
+        "secrets": {"db": {"password": "hunter2"}},
+        "unused": {"blob": "x" * 100},
+    }
+    output = tmp_path / "settings_minimal.py"
+    compile_module(make_reader(config), str(output), config_dir=str(config_dir))
+    source = output.read_text()
+    raw = next(line for line in source.splitlines() if line.startswith("_RAW = "))
+    assert raw == ("_RAW = {'api': {'name': '${buddy_upper:${api.base}}', 'base': '${project.name}'}, "
+                   "'project': {'name': 'demo'}, 'hosts': ['${buddy_upper:${servers.1}}', 'plain'], "
+                   "'servers': ['a', 'b']}")
+    assert "hunter2" not in source and "x" * 100 in source
+
+    monkeypatch.setenv("DB_PASSWORD", "from-env")
+    settings = load_module(output)
+    assert settings.API["name"] == "DEMO" and settings.HOSTS == ("B", "plain")
+
+def test_template_import_without_omegaconf(tmp_path):
+    """Test que le module compilé du template s'importe sans OmegaConf ni _RAW"""
+    import subprocess
+    import sys
+    from hydra_buddies import TheReader
+    from hydra_buddies.scaffold import scaffold
+
+    scaffold(str(tmp_path))
+    config_dir = str(tmp_path / ".hydra-conf")
+    output = tmp_path / "settings_generated.py"
+    compile_module(TheReader("config", path=config_dir), str(output), config_dir=config_dir)
+    source = output.read_text()
+    assert "_RAW" not in source and "_resolve(" not in source
+    assert "os.environ.get('RABBITMQ_PASSWORD', 'guest')" in source
+
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, settings_generated as s; "
+         "print('omegaconf' in sys.modules, s.LOGGING['loggers']['app']['credentials']['password'])"],
+        cwd=str(tmp_path), env={**os.environ, "RABBITMQ_PASSWORD": "from-env"},
+        capture_output=True, text=True, check=True,
+    )
+    assert result.stdout.split() == ["False", "from-env"]
+
+def test_stale_detection(make_reader, config_dir, tmp_path):
+    """Test la détection d'un module obsolète par empreinte"""
+    output = tmp_path / "settings_generated.py"
+    compile_module(make_reader(CONFIG), str(output), config_dir=str(config_dir))
+    settings = load_module(output)
+
+    assert settings.__fingerprint__ == source_fingerprint(str(config_dir), "config")
+    assert not settings.is_stale()
+    (config_dir / "config.yaml").write_text("project:\n  name: changed\n")
+    assert settings.is_stale()
+
+def test_stub_generation(make_reader, config_dir, tmp_path):
+    """Test la génération du fichier .pyi"""
+    output = tmp_path / "settings_generated.py"
+    written = compile_module(make_reader(CONFIG), str(output), stub=True, config_dir=str(config_dir))
+    stub = tmp_path / "settings_generated.pyi"
+    assert str(stub) in written
+    assert "DATABASE: Mapping[str, Any]" in stub.read_text()
+
+def test_runtime_interpolations(make_reader, config_dir, tmp_path, monkeypatch):
+    """Test que les interpolations non traduites sont résolues à l'import, jamais figées"""
+    from omegaconf import OmegaConf
+
+    OmegaConf.register_new_resolver("buddy_upper", lambda value: value.upper(), replace=True)
+    config = {
+        "api": {
+            "host": "${oc.env:API_HOST,${oc.env:API_FALLBACK,localhost}}",
+            "name": "${buddy_upper:${oc.env:API_NAME,service}}",
+            "url": "http://${api.host}",
+            "sibling": "${.url}",
+        },
+    }
+    monkeypatch.setenv("API_FALLBACK", "build.example.com")
+    monkeypatch.setenv("API_NAME", "build")
+    output = tmp_path / "settings_runtime.py"
+    compile_module(make_reader(config), str(output), config_dir=str(config_dir))
+    source = output.read_text()
+    assert "build" not in source
+
+    monkeypatch.setenv("API_FALLBACK", "run.example.com")
+    monkeypatch.setenv("API_NAME", "run")
+    settings = load_module(output)
+    assert settings.API["host"] == "run.example.com"
+    assert settings.API["name"] == "RUN"
+    assert settings.API["url"] == "http://run.example.com"
+    assert settings.API["sibling"] == "http://run.example.com"
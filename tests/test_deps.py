@@ -0,0 +1,131 @@
+import pytest
+from hydra_buddies.deps import DependencyGraph, InterpolationCycleError, references
+
+CONFIG = {
+    "services": {"rabbitmq": {"username": "guest", "password": "${oc.env:RABBITMQ_PASSWORD,guest}"}},
+    "logging": {"credentials": {
+        "username": "${services.rabbitmq.username}",
+        "password": "${services.rabbitmq.password}",
+    }},
+    "database": {
+        "readonly": {"username": "reader"},
+        "credentials": {"username": "${database.readonly.username}", "label": "${.username}"},
+    },
+    "audit": {"sink": "${logging.credentials}", "urls": ["amqp://${logging.credentials.username}@host"]},
+    "project": {"name": "test"},
+}
+
+def test_references():
+    """Test l'extraction des clés référencées"""
+    assert references("${a.b[0].c}") == {"a.b.0.c"}
+    assert references("${.sibling}", "x.y.z") == {"x.y.sibling"}
+    assert references("${..other}", "x.y.z") == {"x.other"}
+    assert references("${oc.select:a.b,default}") == {"a.b"}
+    assert references("${oc.env:HOME} ${oc.env:X,${a}}") == {"a"}
+    assert references("plain") == set()
+
+def test_dependents_and_order():
+    """Test les dépendants transitifs et l'ordre topologique"""
+    graph = DependencyGraph.build(CONFIG)
+    assert graph.dependents("services.rabbitmq.password") == {
+        "logging.credentials.password", "audit.sink",
+    }
+    assert graph.dependents("services") == {
+        "logging.credentials.username", "logging.credentials.password", "audit.sink", "audit.urls.0",
+    }
+    assert graph.dependencies("database.credentials.label") == {"database.credentials.username"}
+
+    order = graph.order()
+    assert set(order) == set(graph.references)
+    assert order.index("database.credentials.username") < order.index("database.credentials.label")
+    assert order.index("logging.credentials.password") < order.index("audit.sink")
+
+def test_cycles():
+    """Test la détection des cycles avant toute résolution"""
+    graph = DependencyGraph.build({"a": "${b}", "b": {"c": "${a}"}, "d": "${d}", "e": "${a}"})
+    assert graph.cycles() == [["a", "b.c"], ["d"]]
+    with pytest.raises(InterpolationCycleError) as info:
+        graph.order()
+    assert info.value.cycles == [["a", "b.c"], ["d"]]
+
+    graph.update("b", {"c": 1})
+    graph.update("d", "ok")
+    assert graph.order() == ["a", "e"]
+
+def test_cycles_deep_chain():
+    """Test la détection des cycles sur une chaîne plus longue que la limite de récursion"""
+    import sys
+
+    depth = sys.getrecursionlimit() * 2
+    leaves = {f"k{i}": f"${{k{i + 1}}}" for i in range(depth)}
+    leaves[f"k{depth}"] = "${k0}"
+    graph = DependencyGraph.from_leaves(leaves.items())
+    cycle, = graph.cycles()
+    assert len(cycle) == depth + 1
+
+    leaves[f"k{depth}"] = "end"
+    assert DependencyGraph.from_leaves(leaves.items()).cycles() == []
+
+def test_reader_targeted_invalidation(make_reader):
+    """Test que __setitem__ n'invalide que les valeurs dépendantes"""
+    reader = make_reader(CONFIG)
+    assert reader.dependents("services.rabbitmq.username") == [
+        "audit.sink", "audit.urls.0", "logging.credentials.username",
+    ]
+    assert reader.resolve("logging.credentials.username") == "guest"
+    assert reader.resolve("audit.urls.0") == "amqp://guest@host"
+    assert reader.resolve("database.credentials.label") == "reader"
+    cache = reader._resolution[1]
+
+    with reader.walk("services"):
+        reader["rabbitmq"] = {"username": "admin", "password": "secret"}
+
+    assert "database.credentials.label" in cache
+    assert "logging.credentials.username" not in cache
+    assert reader.resolve("logging.credentials.username") == "admin"
+    assert reader.resolve("audit.urls.0") == "amqp://admin@host"
+    assert reader.resolve("audit.sink") == {"username": "admin", "password": "secret"}
+
+def test_cycle_warning_at_load(tmp_path):
+    """Test que les cycles sont signalés au chargement"""
+    from hydra_buddies import TheReader
+
+    config_dir = tmp_path / ".hydra-conf"
+    config_dir.mkdir()
+    (config_dir / "config.yaml").write_text("a: ${b}\nb: ${a}\nc: 1\n")
+    with pytest.warns(UserWarning, match="a -> b -> a"):
+        reader = TheReader("config", path=str(config_dir))
+    assert reader.resolve("c") == 1
+
+def test_environment_of():
+    """Test les variables d'environnement lues, même indirectement"""
+    graph = DependencyGraph.build(CONFIG)
+    assert graph.environment == {"services.rabbitmq.password": {"RABBITMQ_PASSWORD"}}
+    assert graph.environment_of("audit.sink") == {"RABBITMQ_PASSWORD"}
+    assert graph.environment_of("logging") == {"RABBITMQ_PASSWORD"}
+    assert graph.environment_of("audit.urls") == set()
+    assert graph.env_dependents(["RABBITMQ_PASSWORD"]) == {
+        "services.rabbitmq.password", "logging.credentials.password", "audit.sink",
+    }
+
+def test_refresh_env(make_reader, monkeypatch):
+    """Test que seules les valeurs dont une variable a changé sont réévaluées"""
+    monkeypatch.delenv("RABBITMQ_PASSWORD", raising=False)
+    reader = make_reader(CONFIG)
+    full = reader.resolve()
+    assert reader.resolve("audit.sink")["password"] == "guest"
+    assert reader.resolve("database.credentials.label") == "reader"
+    assert reader.refresh_env() == []
+
+    monkeypatch.setenv("RABBITMQ_PASSWORD", "secret")
+    assert reader.refresh_env() == ["", "audit.sink"]
+    assert reader.resolve("audit.sink")["password"] == "secret"
+    updated = reader.resolve()
+    assert updated["logging"]["credentials"]["password"] == "secret"
+    # Les sections indépendantes de la variable sont partagées avec l'ancien instantané
+    assert updated["database"] is full["database"]
+    assert full["services"]["rabbitmq"]["password"] == "guest"
+
+    # Sans refresh_env, une valeur périmée est réévaluée à la lecture
+    monkeypatch.setenv("RABBITMQ_PASSWORD", "other")
+    assert reader.resolve("services.rabbitmq.password") == "other"
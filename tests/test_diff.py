@@ -0,0 +1,75 @@
+import json
+import pytest
+from click.testing import CliRunner
+from hydra_buddies import TheReader
+from hydra_buddies.cli import cli
+from hydra_buddies.diff import diff_trees, hash_tree
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Crée un projet avec des groupes dev/prod et une section secrets"""
+    config_dir = tmp_path / ".hydra-conf"
+    (config_dir / "database").mkdir(parents=True)
+    (config_dir / "secrets").mkdir()
+    (config_dir / "config.yaml").write_text(
+        "defaults:\n  - secrets/login\n  - _self_\n  - database: dev\n\n"
+        "project:\n  name: test-project\n"
+    )
+    (config_dir / "secrets" / "login.yaml").write_text("login:\n  password: hunter2\n")
+    (config_dir / "database" / "dev.yaml").write_text("host: localhost\nport: 5432\n")
+    (config_dir / "database" / "prod.yaml").write_text(
+        "host: production.database.com\nport: 5432\nreplicas: [a, b]\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+def test_identical_subtrees_are_skipped():
+    """Test que seules les branches modifiées apparaissent"""
+    old = {"a": {"x": 1, "y": [1, 2]}, "b": {"deep": {"z": 1}}}
+    new = {"a": {"x": 2, "y": [1, 3]}, "b": {"deep": {"z": 1}}, "c": True}
+    assert hash_tree(old["b"]).digest == hash_tree(new["b"]).digest
+
+    changes = {change["path"]: change for change in diff_trees(old, new)}
+    assert set(changes) == {"a.x", "a.y[1]", "c"}
+    assert changes["a.x"]["change"] == "changed"
+    assert (changes["a.y[1]"]["old"], changes["a.y[1]"]["new"]) == (2, 3)
+    assert changes["c"]["change"] == "added"
+    assert diff_trees(old, old) == []
+
+def test_secrets_are_masked():
+    """Test le masquage des secrets et des clés sensibles"""
+    old = {"secrets": {"login": {"user": "bob"}}, "login": {"user": "bob"}, "api": {"token": "abc"}}
+    new = {"secrets": {"login": {"user": "eve"}}, "login": {"user": "eve"}, "api": {"token": "def"}}
+    changes = diff_trees(old, new)
+    assert {change["path"] for change in changes} == {"secrets.login.user", "login.user", "api.token"}
+    assert all(change["old"] == change["new"] == "***" for change in changes)
+
+    unmasked = diff_trees(old, new, mask_secrets=False)
+    assert {change["new"] for change in unmasked} == {"eve", "def"}
+
+def test_reader_diff_with_provenance(project):
+    """Test la comparaison de deux lecteurs avec la provenance des valeurs"""
+    dev = TheReader("config")
+    prod = TheReader("config", overrides=["database=prod", "database.port=6543"])
+    changes = {change["path"]: change for change in dev.diff(prod)}
+
+    assert set(changes) == {"database.host", "database.port", "database.replicas"}
+    assert changes["database.host"]["old_source"] == "database/dev"
+    assert changes["database.host"]["new_source"] == "database/prod"
+    assert changes["database.port"]["new_source"] == "override:database.port=6543"
+    assert changes["database.replicas"] == {
+        "path": "database.replicas", "change": "added", "old": None, "new": ["a", "b"],
+        "old_source": None, "new_source": "database/prod",
+    }
+
+def test_diff_command(project):
+    """Test la commande diff: lignes JSON et code de sortie"""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["diff", "config", "config", "-B", "database=prod"])
+    assert result.exit_code == 1
+    paths = [json.loads(line)["path"] for line in result.output.splitlines()]
+    assert paths == ["database.host", "database.replicas"]
+
+    result = runner.invoke(cli, ["diff", "config", "config"])
+    assert result.exit_code == 0
+    assert result.output == ""
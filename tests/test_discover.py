@@ -0,0 +1,84 @@
+import json
+import os
+import pytest
+from click.testing import CliRunner
+from hydra_buddies.cli import cli
+from hydra_buddies.discover import IgnoreRules, discover
+
+@pytest.fixture
+def monorepo(tmp_path, monkeypatch):
+    """Crée un dépôt contenant plusieurs services et s'y place"""
+    for name in ("alpha", "beta", "gamma"):
+        config_dir = tmp_path / "services" / name / ".hydra-conf"
+        config_dir.mkdir(parents=True)
+        (config_dir / "config.yaml").write_text(f"project:\n  name: {name}\n")
+    for pruned in ("node_modules/pkg", "ignored/svc", ".venv/lib", "services/gamma/build"):
+        (tmp_path / pruned / ".hydra-conf").mkdir(parents=True)
+    (tmp_path / ".gitignore").write_text("# dépendances\nignored/\n")
+    (tmp_path / "services" / ".gitignore").write_text("/gamma\n!gamma\n")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+def test_ignore_rules():
+    """Test les motifs .gitignore appliqués aux répertoires"""
+    rules = IgnoreRules().extended("", ["logs", "/out", "docs/**/tmp", "*.egg-info/", "!keep"])
+    rules = rules.extended("apps", ["local/"])
+    assert rules.ignored("logs") and rules.ignored("a/b/logs")
+    assert rules.ignored("out") and not rules.ignored("a/out")
+    assert rules.ignored("docs/tmp") and rules.ignored("docs/x/y/tmp")
+    assert rules.ignored("pkg.egg-info")
+    assert rules.ignored("apps/local") and not rules.ignored("local")
+    assert not rules.ignored("keep")
+
+def test_discover_and_cache(monorepo):
+    """Test la découverte des racines, l'élagage et le cache du parcours"""
+    expected = [str(monorepo / "services" / name / ".hydra-conf") for name in ("alpha", "beta", "gamma")]
+    assert discover(str(monorepo), jobs=4) == expected
+    cache = json.loads((monorepo / ".buddy-cache" / "roots.json").read_text())
+    assert "node_modules" not in cache["entries"] and "ignored" not in cache["entries"]
+
+    (monorepo / "services" / "delta" / ".hydra-conf").mkdir(parents=True)
+    assert len(discover(str(monorepo))) == 4
+    assert len(discover(str(monorepo), use_cache=False)) == 4
+
+def test_all_roots(monorepo):
+    """Test --all-roots et la commande discover"""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["get", "default", "project.name", "--all-roots", "--root-jobs", "1"])
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == [
+        f"==> {os.path.join('services', name, '.hydra-conf')} <==" if index % 2 == 0 else name
+        for name in ("alpha", "beta", "gamma") for index in range(2)
+    ]
+
+    result = runner.invoke(cli, ["read", "inconnue", "--all-roots", "--root-jobs", "2"])
+    assert result.exit_code == 1
+
+    result = runner.invoke(cli, ["discover", "--json"])
+    assert [json.loads(line)["service"] for line in result.output.splitlines()[:3]] == \
+        ["services/alpha", "services/beta", "services/gamma"]
+
+def test_all_roots_output_paths(monorepo):
+    """Test que --all-roots écrit les fichiers de chaque racine dans son projet"""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["export", "config", "--output", "config.json", "--all-roots", "--root-jobs", "1"])
+    assert result.exit_code == 0, result.output
+    for name in ("alpha", "beta", "gamma"):
+        data = json.loads((monorepo / "services" / name / "config.json").read_text())
+        assert data["project"]["name"] == name
+    assert not (monorepo / "config.json").exists()
+
+    result = runner.invoke(cli, ["compile", "config", "--all-roots", "--root-jobs", "1"])
+    assert result.exit_code == 0, result.output
+    assert (monorepo / "services" / "beta" / "settings_generated.py").exists()
+
+    result = runner.invoke(cli, ["export", "config", "--output", str(monorepo / "all.json"), "--all-roots"])
+    assert result.exit_code == 2 and "--output" in result.output
+
+    result = runner.invoke(cli, ["diff", "config", "config", "--path-b", os.path.join("..", "alpha", ".hydra-conf"),
+                                 "--all-roots", "--root-jobs", "1"])
+    assert [line for line in result.output.splitlines() if not line.startswith("==>")] == [
+        json.dumps({"path": "project.name", "change": "changed", "old": name, "new": "alpha",
+                    "old_source": "config", "new_source": "config"}, ensure_ascii=False)
+        for name in ("beta", "gamma")
+    ]
@@ -0,0 +1,75 @@
+import io
+import json
+import pytest
+from click.testing import CliRunner
+from omegaconf import OmegaConf
+from hydra_buddies.cli import cli
+from hydra_buddies.export import dotenv_name, dotenv_value, export
+
+CONFIG = {
+    "secrets": {"db": {"password": "s3cret"}},
+    "db": {"password": "s3cret", "host": "localhost", "ports": [5432, 5433]},
+    "api": {"url": "http://${db.host}:${db.ports[0]}", "empty": {}},
+    "project": {"name": "it's ${db.host}", "debug": True, "note": None},
+}
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Crée un projet minimal et s'y place"""
+    config_dir = tmp_path / ".hydra-conf"
+    config_dir.mkdir()
+    (config_dir / "config.yaml").write_text("project:\n  name: test\n  token: abc\nurl: http://${project.name}\n")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+@pytest.mark.parametrize("resolve", [False, True])
+def test_json_matches_container(resolve):
+    """Test que l'export JSON en flux équivaut à la conversion complète"""
+    cfg = OmegaConf.create(CONFIG)
+    data = json.loads("".join(export(cfg, "json", resolve=resolve, mask_secrets=False)))
+    assert data == OmegaConf.to_container(cfg, resolve=resolve)
+
+def test_jsonl_masks_secrets():
+    """Test l'export d'une feuille par ligne, secrets masqués"""
+    cfg = OmegaConf.create(CONFIG)
+    lines = [json.loads(line) for line in "".join(export(cfg, "jsonl", resolve=True)).splitlines()]
+    values = {line["path"]: line["value"] for line in lines}
+    assert values["secrets.db.password"] == "***"
+    assert values["db.password"] == "***"
+    assert values["db.ports[1]"] == 5433
+    assert values["api.url"] == "http://localhost:5432"
+    assert values["api.empty"] == {}
+
+def test_dotenv():
+    """Test les noms et la mise entre quotes du format dotenv"""
+    assert dotenv_name("db.ports[0]", "APP_") == "APP_DB__PORTS__0"
+    assert dotenv_name("api.base-url") == "API__BASE_URL"
+    assert dotenv_value("localhost") == "localhost"
+    assert dotenv_value("${db.host}") == "'${db.host}'"
+    assert dotenv_value("it's\nhere") == '"it\'s\\nhere"'
+    assert dotenv_value(True) == "true"
+    assert dotenv_value(None) == ""
+
+    cfg = OmegaConf.create(CONFIG)
+    out = io.StringIO()
+    for chunk in export(cfg, "dotenv", resolve=True, mask_secrets=False):
+        out.write(chunk)
+    assert "PROJECT__NAME=\"it's localhost\"\n" in out.getvalue()
+
+def test_msgpack():
+    """Test l'export msgpack (dépendance optionnelle)"""
+    msgpack = pytest.importorskip("msgpack")
+    cfg = OmegaConf.create(CONFIG)
+    data = msgpack.unpackb(b"".join(export(cfg, "msgpack", mask_secrets=False)))
+    assert data == OmegaConf.to_container(cfg)
+
+@pytest.mark.filterwarnings("error::DeprecationWarning")
+def test_export_command(project):
+    """Test la commande export (sortie standard sans API dépréciée de click)"""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["export", "config", "-r"])
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == {"project": {"name": "test", "token": "***"}, "url": "http://test"}
+
+    result = runner.invoke(cli, ["export", "config", "-f", "dotenv", "--show-secrets", "-o", "project.name=x"])
+    assert result.stdout.splitlines() == ["PROJECT__NAME=x", "PROJECT__TOKEN=abc", "URL='http://${project.name}'"]
@@ -0,0 +1,91 @@
+import pytest
+from click.testing import CliRunner
+from hydra_buddies import TheReader
+from hydra_buddies.cli import cli
+from hydra_buddies.merkle import MerkleTree, hash_tree
+import hydra_buddies.merkle as merkle
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Crée un projet avec un répertoire .hydra-conf et s'y place"""
+    config_dir = tmp_path / ".hydra-conf"
+    (config_dir / "database").mkdir(parents=True)
+    (config_dir / "config.yaml").write_text(
+        "defaults:\n  - _self_\n  - database: default\n\n"
+        "project:\n  name: test-project\n"
+        "train:\n  lr: 0.1\n  layers: [64, 32]\n"
+    )
+    (config_dir / "database" / "default.yaml").write_text("host: localhost\nport: 5432\n")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+@pytest.fixture
+def rehashed(monkeypatch):
+    """Compte les feuilles rehachées par hash_tree"""
+    calls = []
+    original = merkle.hash_tree
+
+    def counting(value):
+        if not isinstance(value, (dict, list)):
+            calls.append(value)
+        return original(value)
+
+    monkeypatch.setattr(merkle, "hash_tree", counting)
+    return calls
+
+def test_fingerprint_is_order_independent():
+    """Test que l'empreinte ne dépend pas de l'ordre des clés"""
+    a = MerkleTree.build({"x": 1, "y": {"z": [1, 2]}})
+    b = MerkleTree.build({"y": {"z": [1, 2]}, "x": 1})
+    assert a.fingerprint() == b.fingerprint()
+    assert a.fingerprint("y.z") == hash_tree([1, 2]).digest.hex()
+    assert MerkleTree.build({"x": "1"}).fingerprint() != MerkleTree.build({"x": 1}).fingerprint()
+    with pytest.raises(KeyError):
+        a.fingerprint("y.missing")
+
+def test_update_matches_full_rebuild():
+    """Test que la mise à jour par chemin équivaut à une reconstruction"""
+    tree = MerkleTree.build({"a": {"b": 1, "c": [1, 2, 3]}, "d": 2})
+    updated = tree.updated("a.c.1", 5).updated("a.e", {"f": True}).updated("d", merkle.MISSING)
+    expected = {"a": {"b": 1, "c": [1, 5, 3], "e": {"f": True}}}
+    assert updated.fingerprint() == MerkleTree.build(expected).fingerprint()
+    # L'arbre d'origine est inchangé et partage les sous-arbres intacts
+    assert tree.fingerprint() == MerkleTree.build({"a": {"b": 1, "c": [1, 2, 3]}, "d": 2}).fingerprint()
+    assert updated.node("a.b") is tree.node("a.b")
+
+def test_reader_fingerprint_incremental(project, rehashed):
+    """Test que seules les valeurs modifiées sont rehachées"""
+    reader = TheReader("config")
+    root = reader.fingerprint()
+    database = reader.fingerprint("database")
+
+    rehashed.clear()
+    with reader.walk("train"):
+        reader["lr"] = 0.5
+    assert rehashed == [0.5]
+    assert reader.fingerprint() != root
+    assert reader.fingerprint("database") == database
+
+    derived = TheReader("config").with_overrides(["train.lr=0.5"])
+    assert derived.fingerprint() == reader.fingerprint()
+
+def test_with_overrides_derives_parent_tree(project, rehashed):
+    """Test que le lecteur dérivé réutilise l'arbre de son parent"""
+    base = TheReader("config")
+    base.fingerprint()
+
+    rehashed.clear()
+    derived = base.with_overrides(["database.port=6543", "+train.seed=3"])
+    assert sorted(map(str, rehashed)) == ["3", "6543"]
+    assert derived.fingerprint() == TheReader("config", overrides=["database.port=6543", "+train.seed=3"]).fingerprint()
+
+    # Un parent modifié localement n'est pas réutilisé
+    base["project"] = {"name": "other"}
+    assert base.with_overrides(["train.lr=1"]).fingerprint() == \
+        TheReader("config", overrides=["train.lr=1"]).fingerprint()
+
+def test_read_hash_command(project):
+    """Test l'option --hash de la commande read"""
+    result = CliRunner().invoke(cli, ["read", "config", "--hash"])
+    assert result.exit_code == 0
+    assert result.output.strip() == TheReader("config").fingerprint()
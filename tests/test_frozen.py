@@ -0,0 +1,73 @@
+import pytest
+from hydra_buddies import FrozenConfig
+
+CONFIG = {
+    "project": {"name": "test-project", "version": "0.1.0"},
+    "api": {
+        "url": "http://api.example.com",
+        "key": "${api.public_key}",
+        "public_key": "pub",
+        "retry": {"max_attempts": 3, "delay": 1},
+    },
+    "logging": {"handlers": {"file": {"class": "logging.FileHandler", "level-name": "INFO"}}},
+    "tags": ["a", {"b": 1}],
+}
+
+@pytest.fixture
+def frozen(make_reader):
+    return make_reader(CONFIG).freeze()
+
+def test_attribute_access(frozen):
+    """Test l'accès par attribut sur la configuration figée"""
+    assert isinstance(frozen, FrozenConfig)
+    assert frozen.api.retry.max_attempts == 3
+    assert frozen.api.key == "pub"
+    assert frozen["project"]["name"] == "test-project"
+
+def test_non_identifier_keys(frozen):
+    """Test les clés qui ne sont pas des identifiants Python"""
+    handler = frozen.logging.handlers.file
+    assert handler["class"] == "logging.FileHandler"
+    assert handler["level-name"] == "INFO"
+    assert "level-name" in handler
+
+def test_reserved_keys(make_reader):
+    """Test les clés qui portent le nom d'une méthode du nœud figé"""
+    frozen = make_reader({"db": {"keys": 1, "get": 2, "host": "localhost", "items": [3]}}).freeze()
+    db = frozen.db
+    assert db["keys"] == 1 and db["get"] == 2 and db["items"] == (3,)
+    assert callable(db.keys) and db.get("keys") == 1
+    assert db.host == "localhost"
+    assert db.to_dict() == {"keys": 1, "get": 2, "host": "localhost", "items": [3]}
+
+def test_declaration_order(make_reader):
+    """Test que keys() et items() suivent l'ordre de déclaration"""
+    frozen = make_reader({"db": {"keys": 1, "get": 2, "host": "localhost", "level-name": "INFO", "port": 5432}}).freeze()
+    assert frozen.db.keys() == ["keys", "get", "host", "level-name", "port"]
+    assert [key for key, _ in frozen.db.items()] == ["keys", "get", "host", "level-name", "port"]
+    assert list(frozen.db) == frozen.db.keys()
+
+def test_read_only(frozen):
+    """Test que la configuration figée est en lecture seule"""
+    with pytest.raises(AttributeError):
+        frozen.api.url = "http://other"
+    with pytest.raises(AttributeError):
+        frozen.api.unknown
+
+def test_lists_become_tuples(frozen):
+    """Test la conversion des listes en tuples"""
+    assert frozen.tags[0] == "a"
+    assert frozen.tags[1].b == 1
+    assert frozen.to_dict()["tags"] == ["a", {"b": 1}]
+
+def test_shared_classes(make_reader):
+    """Test que les nœuds de même forme partagent la même classe générée"""
+    first = make_reader(CONFIG).freeze()
+    second = make_reader(CONFIG).freeze()
+    assert type(first.api.retry) is type(second.api.retry)
+    assert first == second
+
+def test_unresolved(make_reader):
+    """Test le gel sans résolution des interpolations"""
+    frozen = make_reader(CONFIG).freeze(resolve=False)
+    assert frozen.api.key == "${api.public_key}"
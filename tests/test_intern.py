@@ -0,0 +1,74 @@
+from hydra_buddies.frozen import freeze
+from hydra_buddies.intern import InternPool, _sizeof
+
+BASE = {
+    "api": {"url": "http://api.example.com", "retry": {"max_attempts": 3, "delay": 1}},
+    "logging": {"handlers": ["console", "file"], "level": "INFO"},
+}
+
+def env(name, host):
+    return {**BASE, "database": {"host": host, "port": 5432, "name": name}}
+
+def test_identical_subtrees_are_shared():
+    """Test que les sous-arbres identiques sont un seul objet"""
+    pool = InternPool()
+    dev = pool.intern(env("dev", "localhost"))
+    prod = pool.intern(env("prod", "db.prod"))
+    assert dev.api is prod.api
+    assert dev.logging.handlers is prod.logging.handlers
+    assert dev.database is not prod.database
+    assert dev.database.port == prod.database.port
+    assert dev == freeze(env("dev", "localhost"))
+    assert pool.intern(env("dev", "localhost")) is dev
+
+def test_scalars_are_distinct_by_type():
+    """Test que 1, 1.0 et True ne sont pas confondus"""
+    pool = InternPool()
+    values = [pool.intern({"v": value}) for value in (1, 1.0, True)]
+    assert len({id(value) for value in values}) == 3
+    assert values[2].v is True
+
+def test_memory_report():
+    """Test le rapport mémoire"""
+    pool = InternPool()
+    for index in range(10):
+        pool.intern(env("tenant", f"db{index % 2}"))
+    report = pool.memory_report()
+    # Par config: racine, api, retry, logging, handlers, database
+    assert report["nodes_requested"] == 60
+    assert report["nodes_unique"] == 4 + 2 * 2
+    assert report["bytes_saved"] == report["bytes_requested"] - report["bytes_unique"] > 0
+    assert report["strings"] > 0
+
+    pool.clear()
+    assert pool.memory_report()["nodes_unique"] == 0
+
+def test_reader_freeze_intern(make_reader):
+    """Test freeze(intern=True) entre lecteurs d'environnements différents"""
+    dev = make_reader(env("dev", "localhost")).freeze(intern=True)
+    prod = make_reader(env("prod", "db.prod")).freeze(intern=True)
+    assert dev.api is prod.api
+    assert prod.database.host == "db.prod"
+
+def test_signed_zeros_are_distinct():
+    """Test que 0.0 et -0.0 ne sont pas confondus"""
+    pool = InternPool()
+    positive, negative = pool.intern({"v": 0.0}), pool.intern({"v": -0.0})
+    assert positive is not negative
+    assert str(negative.v) == "-0.0"
+    assert pool.intern([-0.0]) is not pool.intern([0.0])
+
+def test_bounded_pool():
+    """Test que la table oublie les nœuds les moins récemment demandés"""
+    pool = InternPool(max_nodes=3, max_strings=4)
+    first = pool.intern({"a": {"x": 1}})
+    for index in range(5):
+        pool.intern({"b": {"y": index}})
+    report = pool.memory_report()
+    assert report["nodes_unique"] == 3 and report["nodes_evicted"] == 9
+    assert report["strings"] <= 4
+    assert report["bytes_unique"] == sum(_sizeof(node) for node in pool._nodes.values())
+    # Les arbres figés restent valides, un sous-arbre oublié est figé à nouveau
+    again = pool.intern({"a": {"x": 1}})
+    assert again == first and again is not first
+    assert pool.intern({"a": {"x": 1}}) is again
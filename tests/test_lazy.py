@@ -0,0 +1,73 @@
+import pytest
+from omegaconf import OmegaConf
+from hydra_buddies import TheReader
+from hydra_buddies.session import ComposeSession
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Crée un projet dont un groupe ultérieur surcharge un groupe précédent"""
+    config_dir = tmp_path / ".hydra-conf"
+    for group in ("database", "api", "replica", "secrets"):
+        (config_dir / group).mkdir(parents=True)
+    (config_dir / "config.yaml").write_text(
+        "defaults:\n  - secrets/login\n  - database: default\n  - _self_\n"
+        "  - api: default\n  - replica: default\n\n"
+        "project:\n  name: test-project\n"
+        "database:\n  port: 6000\n"
+    )
+    (config_dir / "secrets" / "login.yaml").write_text("database:\n  password: secret\n")
+    (config_dir / "database" / "default.yaml").write_text("host: localhost\nport: 5432\n")
+    (config_dir / "database" / "prod.yaml").write_text("host: production.database.com\nport: 5432\n")
+    (config_dir / "api" / "default.yaml").write_text("url: http://${database.host}:${database.port}\n")
+    (config_dir / "replica" / "default.yaml").write_text("# @package database\nhost: replica\npool: 5\n")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Enregistre les entrées de defaults effectivement chargées"""
+    calls = []
+    original = ComposeSession.load_default
+
+    def counting_load(self, default):
+        calls.append(default.config_path)
+        return original(self, default)
+
+    monkeypatch.setattr(ComposeSession, "load_default", counting_load)
+    return calls
+
+@pytest.mark.parametrize("overrides", [[], ["database=prod", "database.port=1", "+api.timeout=3"]])
+def test_lazy_matches_eager(project, overrides):
+    """Test que la composition différée donne la même configuration, dans le même ordre"""
+    eager = OmegaConf.to_container(TheReader("config", overrides).cfg)
+    lazy = OmegaConf.to_container(TheReader("config", overrides, lazy=True).cfg)
+    assert lazy == eager
+    assert list(lazy) == list(eager)
+    assert list(lazy["database"]) == list(eager["database"])
+
+def test_groups_loaded_on_access(project, loads):
+    """Test que chaque groupe n'est chargé qu'au premier accès"""
+    reader = TheReader("config", lazy=True)
+    assert reader.pending_groups == ["database", "api"]
+    assert loads == ["secrets/login", "config"]
+
+    # Les deux entrées du groupe, fusionnées dans l'ordre de la liste des defaults
+    assert reader["database"].host == "replica"
+    assert reader.database.port == 6000
+    assert reader.database.password == "secret"
+    assert reader.pending_groups == ["api"]
+    assert loads[2:] == ["database/default", "replica/default"]
+
+    with reader.walk("api"):
+        assert reader["url"] == "http://replica:6000"
+    assert reader.pending_groups == []
+
+def test_references_load_dependencies(project):
+    """Test qu'un groupe chargé entraîne les groupes qu'il référence"""
+    reader = TheReader("config", lazy=True)
+    assert reader.api.url == "http://replica:6000"
+    assert reader.pending_groups == []
+
+    reader = TheReader("config", lazy=True)
+    reader.cfg
+    assert reader.pending_groups == []
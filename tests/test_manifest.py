@@ -0,0 +1,67 @@
+import os
+import pytest
+from hydra_buddies import manifest as manifest_module
+from hydra_buddies.cli import ConfigError, validate_remove_config
+from hydra_buddies.manifest import Manifest, clear_manifests
+
+def make_tree(root):
+    """Crée un arbre de configuration daté dans le passé (hors fenêtre de course)"""
+    files = ["config.yaml", "config_dev.yaml", "database/default.yaml", "database/dev.yaml",
+             "api/default.yaml", "api/v2/dev.yaml", "secrets/login.yaml"]
+    for relpath in files:
+        path = root / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("a: 1\n")
+    for directory, dirs, _ in os.walk(root):
+        for name in dirs:
+            os.utime(os.path.join(directory, name), (1_000_000, 1_000_000))
+    os.utime(root, (1_000_000, 1_000_000))
+
+def test_manifest_lookups_and_persistence(tmp_path):
+    """Test les recherches, l'enregistrement sur disque et la validation par date"""
+    root = tmp_path / ".hydra-conf"
+    make_tree(root)
+
+    manifest = Manifest(str(root))
+    assert manifest.groups() == ["api", "api/v2", "database", "secrets"]
+    assert manifest.options("database") == ["default", "dev"]
+    assert manifest.find("dev.yaml") == ["api/v2/dev.yaml", "database/dev.yaml"]
+    assert manifest.isfile(str(root / "secrets" / "login.yaml"))
+    assert manifest.isdir("api/v2") and not manifest.isfile("api/v2")
+    assert not manifest.exists("missing/default.yaml")
+    assert manifest.isfile(str(tmp_path / "elsewhere.yaml")) is False
+    manifest.save()
+    assert (tmp_path / ".buddy-cache" / "hydra-conf" / "manifest.json").exists()
+
+    # Un nouveau processus reprend l'inventaire sans rien relister
+    reloaded = Manifest(str(root))
+    assert reloaded.find("dev.yaml") == ["api/v2/dev.yaml", "database/dev.yaml"]
+    assert reloaded.listings == 0
+
+    # Seul le répertoire modifié est relisté
+    (root / "database" / "prod.yaml").write_text("a: 2\n")
+    assert reloaded.options("database") == ["default", "dev", "prod"]
+    assert reloaded.listings == 1
+
+def test_check_interval_and_invalidate(tmp_path, monkeypatch):
+    """Test qu'un répertoire vérifié n'est re-vérifié qu'après invalidate() ou le délai"""
+    monkeypatch.setattr(manifest_module, "CHECK_INTERVAL", 60.0)
+    root = tmp_path / ".hydra-conf"
+    make_tree(root)
+    manifest = Manifest(str(root), persist=False)
+    assert not manifest.isfile("database/prod.yaml")
+    (root / "database" / "prod.yaml").write_text("a: 2\n")
+    assert not manifest.isfile("database/prod.yaml")
+    manifest.invalidate("database/prod.yaml")
+    assert manifest.isfile("database/prod.yaml")
+
+def test_validate_remove_config_uses_manifest(tmp_path):
+    """Test la recherche des fichiers associés à une configuration"""
+    clear_manifests()
+    root = tmp_path / ".hydra-conf"
+    make_tree(root)
+    config_file, subconfig_files = validate_remove_config("dev", str(root))
+    assert config_file == str(root / "config_dev.yaml")
+    assert subconfig_files == [str(root / "api/v2/dev.yaml"), str(root / "database/dev.yaml")]
+    with pytest.raises(ConfigError):
+        validate_remove_config("prod", str(root))
@@ -0,0 +1,76 @@
+import json
+import pytest
+from click.testing import CliRunner
+from hydra_buddies.cli import cli
+from hydra_buddies.matrix import iter_combinations, run_matrix
+
+@pytest.fixture
+def config_dir(tmp_path):
+    """Crée un répertoire de configuration avec des groupes à combiner"""
+    config_dir = tmp_path / ".hydra-conf"
+    (config_dir / "database").mkdir(parents=True)
+    (config_dir / "api").mkdir()
+    (config_dir / "config.yaml").write_text(
+        "defaults:\n  - _self_\n  - database: default\n  - api: default\n\n"
+        "project:\n  name: test-project\n"
+    )
+    (config_dir / "database" / "default.yaml").write_text("host: localhost\nport: 5432\n")
+    (config_dir / "database" / "prod.yaml").write_text("host: production.database.com\nport: 5432\n")
+    (config_dir / "api" / "default.yaml").write_text("url: http://api.example.com\nhost: ${database.host}\n")
+    (config_dir / "api" / "broken.yaml").write_text("url: ${missing.key}\n")
+    return config_dir
+
+def test_iter_combinations():
+    """Test le produit cartésien des options de groupes"""
+    combinations = list(iter_combinations({"database": ["default", "prod"], "api": ["default"]}, ["+x=1"]))
+    assert combinations == [
+        ["database=default", "api=default", "+x=1"],
+        ["database=prod", "api=default", "+x=1"],
+    ]
+
+def test_run_matrix(config_dir):
+    """Test la composition parallèle des combinaisons"""
+    results = list(run_matrix(
+        ["config"], {"database": ["default", "prod"], "api": ["default", "broken"]},
+        config_dir=str(config_dir), processes=2, with_output=True,
+    ))
+    assert len(results) == 4
+
+    by_overrides = {tuple(result["overrides"]): result for result in results}
+    prod = by_overrides[("database=prod", "api=default")]
+    assert prod["error"] is None
+    assert prod["output"]["api"]["host"] == "production.database.com"
+    assert prod["hash"] != by_overrides[("database=default", "api=default")]["hash"]
+    assert by_overrides[("database=prod", "api=broken")]["error"] is not None
+
+def test_matrix_command(config_dir):
+    """Test la commande matrix"""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["matrix", "config", "-g", "database=default,prod", "--path", str(config_dir), "-j", "2"])
+    assert result.exit_code == 0, result.output
+    lines = [json.loads(line) for line in result.output.splitlines()]
+    assert sorted(line["overrides"][0] for line in lines) == ["database=default", "database=prod"]
+    assert all(line["hash"] for line in lines)
+
+    failing = runner.invoke(cli, ["matrix", "config", "-g", "api=broken", "--path", str(config_dir), "-j", "1"])
+    assert failing.exit_code == 1
+
+def test_worker_derives_cells_from_base(config_dir, monkeypatch):
+    """Test que le worker compose la base une fois et en dérive les combinaisons"""
+    from omegaconf import OmegaConf
+    from hydra_buddies import matrix
+    from hydra_buddies.session import get_session
+
+    matrix._init_worker(str(config_dir))
+    session = matrix._WORKER["session"]
+    calls = []
+    compose = session.compose
+    monkeypatch.setattr(session, "compose", lambda name, overrides=None: calls.append(overrides) or compose(name, overrides))
+
+    first = matrix._compose("config", ["database=prod", "+project.tier=1"])
+    second = matrix._compose("config", ["database=prod", "+project.tier=2"])
+    assert calls == [None, ["database=prod"]]
+    assert matrix._WORKER["bases"]["config"] is not first
+    expected = get_session(str(config_dir)).compose("config", ["database=prod", "+project.tier=2"])
+    assert OmegaConf.to_container(second.cfg) == OmegaConf.to_container(expected)
+    assert first.cfg.project.tier == 1
@@ -0,0 +1,178 @@
+import os
+import random
+import sys
+import subprocess
+import warnings
+import pytest
+import yaml
+from omegaconf import OmegaConf
+from hydra_buddies import TheReader
+from hydra_buddies.native import CompositionError, parse_override
+from hydra_buddies.session import get_session
+
+HEADERS = ["_global_", "_global_.shared", "custom.pkg", "_global_.custom"]
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+def content(rng, name, depth=0):
+    """Contenu aléatoire: scalaires, listes, sections et interpolations"""
+    data = {}
+    for index in range(rng.randint(1, 3)):
+        kind = rng.random()
+        key = f"k{rng.randint(0, 3)}"
+        if kind < 0.4:
+            data[key] = rng.randint(0, 99)
+        elif kind < 0.55:
+            data[key] = name
+        elif kind < 0.7:
+            data[key] = [rng.randint(0, 9), rng.randint(0, 9)]
+        elif kind < 0.8:
+            data[key] = f"${{oc.env:VAR_{index},{name}}}"
+        elif depth == 0:
+            data[key] = content(rng, name, depth + 1)
+        else:
+            data[key] = None
+    return data
+
+def generate(root, seed):
+    """Génère un arbre de configuration et une liste d'overrides aléatoires"""
+    rng = random.Random(seed)
+    groups = [f"g{index}" for index in range(rng.randint(2, 4))]
+    for group in groups:
+        for option in range(rng.randint(2, 3)):
+            lines = []
+            if rng.random() < 0.25:
+                lines.append(f"# @package {rng.choice(HEADERS)}")
+            nested = []
+            if rng.random() < 0.3:
+                for sub in range(2):
+                    write(root / group / "sub" / f"s{sub}.yaml", yaml.safe_dump(content(rng, f"{group}_s{sub}")))
+                nested.append(f"  - sub: s{rng.randint(0, 1)}")
+            # Référence absolue vers un groupe suivant (pas de cycle)
+            if rng.random() < 0.2 and group != groups[-1]:
+                other = rng.choice(groups[groups.index(group) + 1:])
+                nested.append(f"  - /{other}@nested_{group}: o0")
+            if nested:
+                position = rng.randint(0, len(nested))
+                if rng.random() < 0.8:
+                    nested.insert(position, "  - _self_")
+                lines.append("defaults:")
+                lines.extend(nested)
+            lines.extend(yaml.safe_dump(content(rng, f"{group}_o{option}"), sort_keys=False).splitlines())
+            write(root / group / f"o{option}.yaml", "\n".join(lines) + "\n")
+
+    entries = []
+    for group in rng.sample(groups, rng.randint(1, len(groups))):
+        style = rng.random()
+        if style < 0.55:
+            entries.append(f"  - {group}: o{rng.randint(0, 1)}")
+        elif style < 0.7:
+            entries.append(f"  - {group}@alias_{group}: o{rng.randint(0, 1)}")
+        elif style < 0.8:
+            entries.append(f"  - {group}/o1")
+        elif style < 0.9:
+            entries.append(f"  - {group}: [o0, o1]")
+        else:
+            entries.append(f"  - optional {group}: missing")
+    if rng.random() < 0.85:
+        entries.insert(rng.randint(0, len(entries)), "  - _self_")
+    overridden = [entry for entry in entries if entry.strip("- ").split(":")[0] in groups and ": o" in entry]
+    if overridden and rng.random() < 0.3:
+        entries.append(f"  - override {overridden[0].strip('- ').split(':')[0]}: o1")
+    primary = ["defaults:", *entries, "project:", "  name: generated", "  port: 8080"]
+    write(root / "config.yaml", "\n".join(primary) + "\n")
+
+    overrides = []
+    for _ in range(rng.randint(0, 3)):
+        group = rng.choice(groups)
+        overrides.append(rng.choice([
+            f"{group}=o{rng.randint(0, 2)}", f"+{group}@extra=o0", f"~{group}",
+            "project.port=9090", "+project.tags=[a,b]", "++project.name=forced",
+            "project.extra=1", "~project.port", "project={name: dict, port: 1}",
+        ]))
+    return overrides
+
+def compose_both(root, overrides):
+    """Compose avec Hydra et le moteur natif: (résultat ou erreur) pour chacun"""
+    results = []
+    for engine in ("hydra", "native"):
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                session = get_session(str(root), engine=engine)
+                cfg = session.compose("config", overrides)
+                defaults = [(d.config_path, d.package, d.is_self) for d in session.defaults_list("config", overrides)]
+            results.append((OmegaConf.to_container(cfg, resolve=False), defaults))
+        except Exception as e:
+            results.append(type(e).__name__)
+    return results
+
+@pytest.mark.parametrize("seed", range(60))
+def test_conformance_with_hydra(tmp_path, seed):
+    """Test que le moteur natif compose exactement comme Hydra (arbres générés)"""
+    root = tmp_path / ".hydra-conf"
+    overrides = generate(root, seed)
+    hydra_result, native_result = compose_both(root, overrides)
+    if isinstance(hydra_result, str):
+        # Même refus: configuration ou override invalide pour les deux moteurs
+        assert isinstance(native_result, str), (overrides, native_result)
+    else:
+        assert native_result == hydra_result, overrides
+
+def test_parse_override():
+    """Test l'analyse des overrides sans Hydra"""
+    override = parse_override("+db@backup=mysql")
+    assert (override.type, override.key_or_group, override.package, override.value()) == \
+        ("add", "db", "backup", "mysql")
+    assert parse_override("a.b={x: 1, y: [1, 2.5, null, 'q,r']}").value() == \
+        {"x": 1, "y": [1, 2.5, None, "q,r"]}
+    assert parse_override("a=${oc.env:HOME,/tmp}").value() == "${oc.env:HOME,/tmp}"
+    assert parse_override("~a.b").value() is None
+    assert parse_override("a=").value() == ""
+    for line in ("a=1,2", "a=choice(1,2)", "=1", "a"):
+        with pytest.raises(CompositionError):
+            parse_override(line)
+
+@pytest.mark.parametrize("value", [
+    "~", "a~b", "café", "a=b", "a#b", "a!b", "a;b", "a'b'", "x (y)", "a)b", "a]b", "a}", "a[0]",
+    "${a}~", "${oc.env:X,${a}}", "${a", "{k~: 1}", "{${a}: 1}", "[a~]", "{a: ~}",
+    "a\\b", "a\\,b", "a\\ ", "a\\", "a\\=b", "{a\\:b: 1}", "/tmp/x-y+z.%*@?|", "http://h:80/p",
+    " a b ", "${oc.env:X,~}", "a${b}c", "1_000", "-0.0", "$a", "'q~'", "[1, {a: null}]",
+])
+def test_override_values_conform_to_hydra(value):
+    """Test que les valeurs d'overrides sont acceptées ou refusées comme par Hydra"""
+    from hydra.core.override_parser.overrides_parser import OverridesParser
+
+    line = f"app.name={value}"
+    try:
+        expected = OverridesParser.create().parse_override(line).value()
+    except Exception:
+        with pytest.raises(CompositionError):
+            parse_override(line)
+    else:
+        assert repr(parse_override(line).value()) == repr(expected)
+
+def test_reader_native_engine(tmp_path, monkeypatch):
+    """Test TheReader(engine="native"): mêmes valeurs, lazy, et aucun import de Hydra"""
+    root = tmp_path / ".hydra-conf"
+    write(root / "config.yaml", "defaults:\n  - database: default\n  - _self_\n"
+                                "  - override hydra/job_logging: disabled\nproject:\n  name: native\n")
+    write(root / "database" / "default.yaml", "host: localhost\nport: 5432\n")
+    write(root / "database" / "prod.yaml", "# @package database\nhost: prod\nport: ${oc.env:DB_PORT,5433}\n")
+    monkeypatch.chdir(tmp_path)
+
+    overrides = ["database=prod", "project.name=other"]
+    hydra = TheReader("config", overrides=overrides)
+    native = TheReader("config", overrides=overrides, engine="native")
+    assert native.resolve() == hydra.resolve()
+    assert TheReader("config", overrides=overrides, engine="native", lazy=True).resolve() == hydra.resolve()
+
+    script = ("import sys; from hydra_buddies import TheReader; "
+              "reader = TheReader('config', engine='native'); "
+              "print(reader.database.host, any(m == 'hydra' or m.startswith('hydra.') for m in sys.modules))")
+    env = {**os.environ, "PYTHONPATH": os.path.dirname(os.path.dirname(os.path.abspath(__file__)))}
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True,
+                            check=True, env=env).stdout
+    assert output.split() == ["localhost", "False"]
@@ -0,0 +1,131 @@
+import pytest
+from hydra_buddies import TheReader
+from hydra_buddies.session import ComposeSession
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Crée un projet avec un répertoire .hydra-conf et s'y place"""
+    config_dir = tmp_path / ".hydra-conf"
+    (config_dir / "database").mkdir(parents=True)
+    (config_dir / "config.yaml").write_text(
+        "defaults:\n  - _self_\n  - database: default\n\n"
+        "project:\n  name: test-project\n"
+        "train:\n  lr: 0.1\n  epochs: 10\n"
+    )
+    (config_dir / "database" / "default.yaml").write_text("host: localhost\nport: 5432\n")
+    (config_dir / "database" / "prod.yaml").write_text("host: production.database.com\nport: 5432\n")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+@pytest.fixture
+def compose_calls(monkeypatch):
+    """Compte les compositions Hydra effectives"""
+    calls = []
+    original = ComposeSession.compose
+
+    def counting_compose(self, config_name, overrides=None, **kwargs):
+        calls.append(overrides)
+        return original(self, config_name, overrides, **kwargs)
+
+    monkeypatch.setattr(ComposeSession, "compose", counting_compose)
+    return calls
+
+def test_value_and_group_overrides(project):
+    """Test les overrides de groupes et de valeurs"""
+    reader = TheReader("config", overrides=["database=prod", "train.lr=0.01", "+train.seed=3"])
+    assert reader.database.host == "production.database.com"
+    assert reader.train.lr == 0.01
+    assert reader.train.seed == 3
+    assert reader.train.epochs == 10
+
+def test_sweep_reuses_base(project, compose_calls):
+    """Test qu'un balayage d'overrides de valeurs ne recompose pas"""
+    base = TheReader("config")
+    readers = [base.with_overrides([f"train.lr={lr}"]) for lr in (0.1, 0.01, 0.001)]
+    assert [reader.train.lr for reader in readers] == [0.1, 0.01, 0.001]
+    assert len(compose_calls) == 1
+
+    # Un override de groupe nécessite une seule nouvelle composition de base
+    prod = [base.with_overrides(["database=prod", f"train.epochs={n}"]) for n in (1, 2)]
+    assert [reader.train.epochs for reader in prod] == [1, 2]
+    assert len(compose_calls) == 2
+
+def test_overrides_do_not_leak(project):
+    """Test que les lecteurs dérivés n'altèrent ni la base ni le cache"""
+    base = TheReader("config")
+    derived = base.with_overrides(["train.lr=0.5"])
+    with derived.walk("train"):
+        derived["epochs"] = 99
+    assert base.with_overrides(["train.lr=0.5"]).train.epochs == 10
+    assert base.train.lr == 0.1
+    assert TheReader("config").train.epochs == 10
+    assert derived.overrides == ["train.lr=0.5"]
+
+def test_derived_configs_are_cached(project, compose_calls, monkeypatch):
+    """Test qu'un même jeu d'overrides de valeurs réutilise la configuration dérivée"""
+    from omegaconf import ReadonlyConfigError
+
+    applied = []
+    original = ComposeSession.apply_overrides
+    monkeypatch.setattr(ComposeSession, "apply_overrides",
+                        staticmethod(lambda overrides, cfg: applied.append(overrides) or original(overrides, cfg)))
+
+    base = TheReader("config")
+    first, second = (base.with_overrides(["train.lr=0.01"]) for _ in range(2))
+    assert first.cfg is second.cfg and first.train.lr == 0.01
+    assert len(applied) == 1 and len(compose_calls) == 1
+    with pytest.raises(ReadonlyConfigError):
+        first.cfg.train.lr = 0.5
+
+    # Autre jeu d'overrides: nouvelle copie de la base
+    assert base.with_overrides(["train.lr=0.01", "train.epochs=3"]).train.epochs == 3
+    assert len(applied) == 2
+
+def test_derived_cache_is_bounded(project, monkeypatch):
+    """Test que les configurations dérivées d'une base sont limitées (LRU)"""
+    import hydra_buddies.buddies as buddies
+
+    monkeypatch.setattr(buddies, "DERIVED_CACHE_SIZE", 2)
+    base = TheReader("config")
+    first = base.with_overrides(["train.epochs=1"])
+    base.with_overrides(["train.epochs=2"])
+    assert base.with_overrides(["train.epochs=1"]).cfg is first.cfg
+    base.with_overrides(["train.epochs=3"])
+    assert base.with_overrides(["train.epochs=2"]).cfg is not first.cfg
+    assert base.with_overrides(["train.epochs=1"]).cfg is not first.cfg
+
+def test_invalid_override(project):
+    """Test qu'un override invalide n'est pas ignoré silencieusement"""
+    with pytest.raises(Exception):
+        TheReader("config", overrides=["train.unknown=1"])
+
+def test_cache_follows_source_files(project, compose_calls):
+    """Test que le cache recompose après une modification des fichiers utilisés"""
+    assert TheReader("config").database.port == 5432
+    assert TheReader("config").database.port == 5432
+    assert len(compose_calls) == 1
+
+    (project / ".hydra-conf" / "database" / "default.yaml").write_text("host: localhost\nport: 6543\n")
+    assert TheReader("config").database.port == 6543
+    assert len(compose_calls) == 2
+
+    # Fichier d'un autre groupe: l'entrée reste valide
+    (project / ".hydra-conf" / "database" / "prod.yaml").write_text("host: other\nport: 1\n")
+    TheReader("config")
+    assert len(compose_calls) == 2
+
+def test_shared_base_copy_on_write(project):
+    """Test que la base partagée est en lecture seule et copiée à la première modification"""
+    from omegaconf import ReadonlyConfigError
+
+    first, second = TheReader("config"), TheReader("config")
+    assert first.cfg is second.cfg
+    with pytest.raises(ReadonlyConfigError):
+        first.cfg.train.epochs = 99
+
+    fingerprint = first.fingerprint()
+    with first.walk("train"):
+        first["epochs"] = 99
+    assert first.train.epochs == 99 and second.train.epochs == 10
+    assert first.fingerprint() != fingerprint == second.fingerprint()
+    assert first.cfg is not second.cfg
@@ -0,0 +1,46 @@
+import pytest
+from omegaconf import OmegaConf
+
+CONFIG = {
+    "database": {"host": "localhost", "port": 5432},
+    "api": {"url": "http://${database.host}"},
+    "app": {"name": "real"},
+}
+
+def test_virtual_prefix(make_reader):
+    """Test que les clés préfixées désignent les nœuds d'origine, sans copie"""
+    reader = make_reader(CONFIG)
+    before = OmegaConf.to_container(reader.cfg)
+
+    @reader.add_prefix("dev")
+    def setup():
+        return reader.dev.database.host
+
+    for _ in range(3):
+        assert setup() == "localhost"
+    assert setup.__name__ == "setup"
+    assert reader.prefixes == ["dev"]
+    assert OmegaConf.to_container(reader.cfg) == before
+
+    assert reader["dev.database"] is reader["database"]
+    assert reader["dev.api.url"] == "http://localhost"
+    assert reader.get("dev.database").port == 5432
+    with reader.walk("dev", "database"):
+        assert reader["port"] == 5432
+    with pytest.raises(KeyError):
+        reader["dev.database.missing"]
+
+def test_dotted_prefix_and_real_keys(make_reader):
+    """Test les préfixes pointés et la priorité des clés réelles"""
+    reader = make_reader(CONFIG)
+    reader.add_prefix("eu.prod")
+    reader.add_prefix("app")
+    reader.add_prefix("eu.prod")
+    assert reader.prefixes == ["eu.prod", "app"]
+
+    assert reader.eu.prod.database.port == 5432
+    assert reader["eu"]["prod"]["api"]["url"] == "http://localhost"
+    # "app" est une vraie clé de la configuration
+    assert reader.app.name == "real"
+    with pytest.raises(AttributeError):
+        reader.eu.staging
@@ -0,0 +1,126 @@
+import json
+import pytest
+from omegaconf import OmegaConf
+from hydra_buddies import TheReader
+from hydra_buddies.providers import (
+    FileKeystore, HttpVault, SecretCache, SecretProvider, VaultStandIn,
+    clear_providers, register_provider, secret_references,
+)
+
+SECRETS = {
+    "db/master": {"user": "admin", "password": "s3cret"},
+    "api/token": "t0ken",
+}
+
+@pytest.fixture(autouse=True)
+def providers():
+    """Isole les fournisseurs enregistrés par chaque test"""
+    clear_providers()
+    yield
+    clear_providers()
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Crée un projet dont les secrets viennent d'un fournisseur"""
+    config_dir = tmp_path / ".hydra-conf"
+    (config_dir / "secrets").mkdir(parents=True)
+    (config_dir / "config.yaml").write_text(
+        "defaults:\n  - secrets/login\n  - _self_\n\n"
+        "api:\n  token: ${secret:api/token}\n"
+    )
+    (config_dir / "secrets" / "login.yaml").write_text(
+        "database:\n"
+        "  user: ${secret:db/master,user}\n"
+        "  password: ${secret:'default:db/master#password'}\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+class CountingProvider(SecretProvider):
+    def __init__(self):
+        self.calls = []
+        self.version = 1
+
+    def fetch_many(self, paths):
+        self.calls.append(list(paths))
+        return {path: f"v{self.version}" for path in paths}
+
+def test_file_keystore_resolver(tmp_path):
+    """Test le résolveur ${secret:...} sur un trousseau fichier"""
+    keystore = tmp_path / "keystore.json"
+    keystore.write_text(json.dumps(SECRETS))
+    register_provider(FileKeystore(str(keystore)))
+    cfg = OmegaConf.create({
+        "user": "${secret:db/master,user}",
+        "password": "${secret:'db/master#password'}",
+        "url": "https://${secret:api/token}@host",
+    })
+    assert OmegaConf.to_container(cfg, resolve=True) == {
+        "user": "admin", "password": "s3cret", "url": "https://t0ken@host",
+    }
+    assert secret_references(OmegaConf.to_container(cfg)) == {
+        ("default", "db/master"), ("default", "api/token"),
+    }
+
+def test_prefetch_single_round_trip(project):
+    """Test que tous les secrets d'une configuration arrivent en un seul aller-retour"""
+    with VaultStandIn(SECRETS, token="root") as vault:
+        register_provider(HttpVault(vault.url, token="root"))
+        reader = TheReader("config")
+        assert reader.resolve("database") == {"user": "admin", "password": "s3cret"}
+        assert reader.resolve("api.token") == "t0ken"
+        assert vault.requests == 1
+
+def test_ttl_and_background_refresh():
+    """Test le cache TTL: rafraîchissement anticipé en arrière-plan puis expiration"""
+    now = [0.0]
+    provider = CountingProvider()
+    cache = SecretCache(provider, ttl=10, refresh_ahead=0.5, clock=lambda: now[0])
+
+    assert cache.get("a") == "v1"
+    assert cache.get("b") == "v1"
+    assert len(provider.calls) == 2
+
+    # Après la moitié du TTL: valeur servie du cache, lot rafraîchi en arrière-plan
+    provider.version = 2
+    now[0] = 6
+    assert cache.get("a") == "v1"
+    cache.wait()
+    assert provider.calls[-1] == ["a", "b"]
+    assert cache.get("b") == "v2"
+
+    # Expiré: relu avant d'être servi
+    provider.version = 3
+    now[0] = 30
+    assert cache.get("a") == "v3"
+
+def test_resolver_secrets_are_masked(tmp_path, make_reader):
+    """Test que ${secret:...} et les valeurs qui y mènent restent masqués (export, diff, compilation)"""
+    from hydra_buddies.compiler import generate_module
+    from hydra_buddies.diff import diff_trees
+    from hydra_buddies.export import export
+    from hydra_buddies.masking import secret_paths
+
+    keystore = tmp_path / "keystore.json"
+    keystore.write_text(json.dumps(SECRETS))
+    register_provider(FileKeystore(str(keystore)))
+    config = {
+        "vault": {"user": "${secret:db/master,user}", "host": "db.local"},
+        "database": {"dsn": "pg://${vault.user}@${vault.host}", "login": "${database.dsn}", "all": "${vault}"},
+    }
+    reader = make_reader(config)
+    assert secret_paths(config) == {"vault.user", "database.dsn", "database.login", "database.all"}
+
+    lines = [json.loads(line) for line in "".join(export(reader.cfg, "jsonl", resolve=True)).splitlines()]
+    values = {line["path"]: line["value"] for line in lines}
+    assert values == {"vault.user": "***", "vault.host": "db.local", "database.dsn": "***",
+                      "database.login": "***", "database.all.user": "***", "database.all.host": "***"}
+
+    other = make_reader({**config, "vault": {**config["vault"], "host": "db.prod"}})
+    changes = {change["path"]: change for change in reader.diff(other, resolve=True)}
+    assert changes["database.dsn"]["new"] == "***" and changes["vault.host"]["new"] == "db.prod"
+
+    source = generate_module(reader, config_dir=str(tmp_path))
+    assert "admin" not in source
+    # Seule la valeur ${secret:...} est résolue à l'import, ses références la lisent
+    assert "_resolve('vault.user')" in source and "_resolve('database.dsn')" not in source
@@ -0,0 +1,52 @@
+import os
+import pytest
+from click.testing import CliRunner
+from hydra_buddies.cli import cli
+from hydra_buddies.scaffold import TEMPLATE_DIR, CompiledTemplate, UnsupportedTemplate, scaffold_many
+
+def read_tree(root):
+    """Retourne {chemin relatif: contenu} pour tous les fichiers d'un répertoire"""
+    tree = {}
+    for directory, _, names in os.walk(root):
+        for name in names:
+            path = os.path.join(directory, name)
+            with open(path, "rb") as f:
+                tree[os.path.relpath(path, root)] = f.read()
+    return tree
+
+def test_native_render_matches_cookiecutter(tmp_path):
+    """Test que le rendu natif produit exactement les fichiers de cookiecutter"""
+    from cookiecutter.main import cookiecutter
+
+    cookiecutter(TEMPLATE_DIR, output_dir=str(tmp_path / "ref"), no_input=True,
+                 extra_context={"project_name": "service"})
+    CompiledTemplate(TEMPLATE_DIR).render(str(tmp_path / "service"))
+
+    expected = read_tree(tmp_path / "ref" / "service")
+    assert read_tree(tmp_path / "service") == expected
+    assert b"name: service" in expected[os.path.join(".hydra-conf", "config.yaml")]
+
+def test_unsupported_template(tmp_path):
+    """Test qu'un template utilisant Jinja au-delà des substitutions est refusé"""
+    root = tmp_path / "template" / "{{cookiecutter.project_name}}"
+    root.mkdir(parents=True)
+    (tmp_path / "template" / "cookiecutter.json").write_text('{"project_name": "x"}')
+    (root / "config.yaml").write_text("name: {{ cookiecutter.project_name | upper }}\n")
+    with pytest.raises(UnsupportedTemplate):
+        CompiledTemplate(str(tmp_path / "template"))
+
+def test_init_many(tmp_path):
+    """Test buddy init --many: cibles en parallèle, erreurs isolées"""
+    (tmp_path / "existing" / ".hydra-conf").mkdir(parents=True)
+    targets = [str(tmp_path / f"svc_{index}") for index in range(5)]
+    results = scaffold_many(targets + [targets[0]], jobs=4)
+    assert [result["target"] for result in results] == targets
+    assert all(result["error"] is None and result["files"] == 12 for result in results)
+    assert (tmp_path / "svc_3" / ".gitignore").read_text() == ".hydra-conf/secrets/*\n"
+
+    listing = tmp_path / "targets.txt"
+    listing.write_text(f"# cibles\n{tmp_path / 'svc_new'}\n{tmp_path / 'existing'}\n")
+    result = CliRunner().invoke(cli, ["init", "--many", str(listing)])
+    assert result.exit_code == 1
+    assert "1 répertoires de configuration initialisés, 1 en échec" in result.output
+    assert (tmp_path / "svc_new" / ".hydra-conf" / "config.yaml").exists()
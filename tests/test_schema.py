@@ -0,0 +1,144 @@
+import dataclasses
+import enum
+import attr
+import pytest
+from typing import Dict, List, Optional, Tuple
+from hydra_buddies import TheReader
+from hydra_buddies.schema import SchemaError, clear_schemas, compile_schema, register_schema
+
+class Mode(enum.Enum):
+    fast = 1
+    safe = 2
+
+@dataclasses.dataclass
+class Database:
+    host: str
+    port: int = 5432
+    password: Optional[str] = None
+
+@attr.s(auto_attribs=True)
+class Retry:
+    max_attempts: int = 3
+    delay: float = 1.0
+
+@attr.s(auto_attribs=True)
+class Api:
+    url: str
+    timeout: float
+    mode: Mode = Mode.safe
+    retry: Retry = attr.Factory(Retry)
+    tags: List[str] = attr.Factory(list)
+
+@dataclasses.dataclass
+class Node:
+    name: str
+    children: List["Node"] = dataclasses.field(default_factory=list)
+    bounds: Tuple[int, int] = (0, 0)
+    limits: Dict[str, int] = dataclasses.field(default_factory=dict)
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Crée un projet dont les groupes database et api ont un schéma"""
+    config_dir = tmp_path / ".hydra-conf"
+    for group in ("database", "api", "secrets"):
+        (config_dir / group).mkdir(parents=True)
+    (config_dir / "config.yaml").write_text(
+        "defaults:\n  - secrets/login\n  - database: default\n  - api: default\n  - _self_\n"
+    )
+    (config_dir / "secrets" / "login.yaml").write_text("database:\n  password: secret\n")
+    (config_dir / "database" / "default.yaml").write_text("host: localhost\nport: 5432\n")
+    (config_dir / "database" / "broken.yaml").write_text("port: '5432'\nuser: admin\n")
+    (config_dir / "api" / "default.yaml").write_text(
+        "url: http://${database.host}:${database.port}\ntimeout: ${oc.env:API_TIMEOUT,30}\n"
+        "mode: fast\nretry:\n  max_attempts: 5\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    yield tmp_path
+    clear_schemas()
+
+def test_compiled_schema():
+    """Test la validation et la conversion d'un schéma compilé (récursif, conteneurs)"""
+    compiled = compile_schema(Node)
+    assert compile_schema(Node) is compiled
+    node = compiled.convert({"name": "root", "children": [{"name": "leaf", "bounds": [1, 2]}],
+                             "limits": {"rps": 10}})
+    assert node.children[0] == Node("leaf", bounds=(1, 2))
+    assert node.limits == {"rps": 10}
+
+    errors = compiled.errors({"name": 3, "children": [{"bounds": [1]}], "limits": {"rps": "???"},
+                              "extra": True}, "tree")
+    assert errors == [
+        ("tree.name", "chaîne attendue, reçu int 3"),
+        ("tree.children[0].name", "champ obligatoire manquant"),
+        ("tree.children[0].bounds", "liste de 2 éléments attendue, reçu list [1]"),
+        ("tree.limits.rps", "valeur obligatoire manquante (???)"),
+        ("tree.extra", "clé inconnue du schéma Node"),
+    ]
+    # Interpolations vérifiées à la conversion seulement
+    assert compiled.errors({"name": "${other.name}"}) == []
+
+def test_reader_validates_at_load(project):
+    """Test que les erreurs de toutes les sections sont signalées au chargement"""
+    register_schema("database", Database)
+    with pytest.raises(SchemaError) as info:
+        TheReader("config", overrides=["database=broken", "api.retry.max_attempts=many"],
+                  schemas={"api": Api})
+    assert info.value.errors == [
+        ("database.host", "champ obligatoire manquant"),
+        ("database.port", "entier attendu, reçu str '5432'"),
+        ("database.user", "clé inconnue du schéma Database"),
+        ("api.retry.max_attempts", "entier attendu, reçu str 'many'"),
+    ]
+
+    # Mode différé: chaque groupe est validé à son chargement
+    reader = TheReader("config", overrides=["database=broken"], lazy=True)
+    with pytest.raises(SchemaError):
+        reader.database
+
+def test_typed(project, monkeypatch):
+    """Test la conversion des sections résolues en instances"""
+    monkeypatch.setenv("API_TIMEOUT", "2.5")
+    reader = TheReader("config", schemas={"database": Database, "api": Api})
+    assert reader.typed("database") == Database("localhost", 5432, "secret")
+    api = reader.typed("api")
+    assert api.url == "http://localhost:5432" and api.timeout == 2.5
+    assert api.mode is Mode.fast and api.retry == Retry(max_attempts=5)
+    with pytest.raises(KeyError):
+        reader.typed("project")
+
+def test_compile_schema_concurrent(monkeypatch):
+    """Test qu'un autre thread n'obtient jamais un schéma en cours de compilation"""
+    import threading
+    import time
+    from hydra_buddies import schema as schema_module
+
+    @dataclasses.dataclass
+    class Slow:
+        name: str
+        port: int = 0
+
+    fields = schema_module._fields
+
+    def slow_fields(tp):
+        time.sleep(0.05)
+        return fields(tp)
+
+    monkeypatch.setattr(schema_module, "_fields", slow_fields)
+    builder = threading.Thread(target=compile_schema, args=(Slow,))
+    builder.start()
+    while Slow not in schema_module._COMPILED:
+        time.sleep(0.001)
+    compiled = compile_schema(Slow)
+    builder.join()
+    assert compiled._built
+    assert compiled.errors({"name": 1}) == [("name", "chaîne attendue, reçu int 1")]
+
+def test_update_path_validates(project, tmp_path):
+    """Test que update_path valide les schémas de la nouvelle configuration"""
+    other = tmp_path / "other"
+    (other / "database").mkdir(parents=True)
+    (other / "config.yaml").write_text("defaults:\n  - database: default\n  - _self_\n")
+    (other / "database" / "default.yaml").write_text("host: localhost\nport: none\n")
+    reader = TheReader("config", schemas={"database": Database})
+    with pytest.raises(SchemaError):
+        reader.update_path(str(other))
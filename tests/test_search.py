@@ -0,0 +1,119 @@
+import json
+import os
+import pytest
+from click.testing import CliRunner
+from hydra_buddies.cli import cli
+from hydra_buddies.search import SearchIndex, get_index
+from hydra_buddies.session import ComposeSession
+
+@pytest.fixture
+def config_dir(tmp_path):
+    """Crée un répertoire avec deux configurations principales"""
+    config_dir = tmp_path / ".hydra-conf"
+    (config_dir / "api").mkdir(parents=True)
+    (config_dir / "secrets").mkdir()
+    (config_dir / "config.yaml").write_text(
+        "defaults:\n  - secrets/keys\n  - _self_\n  - api: default\n\n"
+        "project:\n  name: test-project\n"
+    )
+    (config_dir / "batch.yaml").write_text("worker:\n  timeout: 5\n")
+    (config_dir / "api" / "default.yaml").write_text("timeout: 30\nkey: ${secrets.api.private_key}\n")
+    (config_dir / "secrets" / "keys.yaml").write_text(
+        "api:\n  private_key: ${oc.env:API_PRIVATE_KEY,hunter2}\n"
+    )
+    return config_dir
+
+@pytest.fixture
+def compose_calls(monkeypatch):
+    """Compte les compositions Hydra effectives"""
+    calls = []
+    original = ComposeSession.compose
+
+    def counting_compose(self, config_name, overrides=None, **kwargs):
+        calls.append(config_name)
+        return original(self, config_name, overrides, **kwargs)
+
+    monkeypatch.setattr(ComposeSession, "compose", counting_compose)
+    return calls
+
+def test_search_keys_values_and_refs(config_dir):
+    """Test la recherche par clé, valeur et référence avec provenance"""
+    index = SearchIndex(str(config_dir))
+    assert index.update() == ["batch", "config"]
+
+    hits = index.search("timeout")
+    assert [(hit["config"], hit["path"], hit["source"]) for hit in hits] == [
+        ("batch", "worker.timeout", "batch"),
+        ("config", "api.timeout", "api/default"),
+    ]
+    assert [hit["path"] for hit in index.search("${secrets.api.private_key}")] == ["api.key"]
+    assert [hit["path"] for hit in index.search("test-*", kinds=["value"])] == ["project.name"]
+    assert index.search("timeout", configs=["batch"])[0]["value"] == 5
+
+def test_secrets_are_not_persisted(config_dir):
+    """Test que ni les secrets ni leurs valeurs par défaut ne sont écrits"""
+    index = SearchIndex(str(config_dir))
+    index.update()
+    with open(index.index_path) as f:
+        assert "hunter2" not in f.read()
+    hit, = index.search("private_key", kinds=["key"])
+    assert hit["value"] == "***"
+    assert hit["refs"] == ["oc.env:API_PRIVATE_KEY"]
+
+def test_incremental_update(config_dir, compose_calls):
+    """Test que seules les configurations affectées sont recomposées"""
+    SearchIndex(str(config_dir)).update()
+    assert sorted(compose_calls) == ["batch", "config"]
+
+    compose_calls.clear()
+    index = SearchIndex(str(config_dir))
+    assert index.update() == []
+    assert compose_calls == []
+
+    api_file = config_dir / "api" / "default.yaml"
+    api_file.write_text("timeout: 60\nretries: 3\n")
+    os.utime(api_file, ns=(1, 1))
+    assert index.update() == ["config"]
+    assert compose_calls == ["config"]
+    assert index.search("timeout", configs=["config"])[0]["value"] == 60
+    assert index.search("${secrets.api.private_key}") == []
+
+def test_search_command(config_dir):
+    """Test la commande search et son code de sortie"""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["search", "timeout", "-p", str(config_dir), "--json"])
+    assert result.exit_code == 0
+    assert [json.loads(line)["path"] for line in result.output.splitlines()] == [
+        "worker.timeout", "api.timeout",
+    ]
+    result = runner.invoke(cli, ["search", "nothing-here", "-p", str(config_dir)])
+    assert result.exit_code == 1
+
+def test_terms_updated_incrementally(config_dir, tmp_path):
+    """Test que seuls les termes des configurations recomposées changent"""
+    index = SearchIndex(str(config_dir))
+    index.update()
+    (config_dir / "batch.yaml").write_text("worker:\n  retries: 2\n")
+    (config_dir / "extra.yml").write_text("extra:\n  timeout: 7\n")
+    assert index.update() == ["batch", "extra"]
+
+    rebuilt = SearchIndex(str(config_dir), index_path=str(tmp_path / "rebuilt.json"))
+    rebuilt.update()
+    assert {term: sorted(postings) for term, postings in index.terms.items()} == \
+        {term: sorted(postings) for term, postings in rebuilt.terms.items()}
+    # Configuration .yml détectée: signalée si le moteur ne peut pas la composer
+    assert "extra" in index.configs
+    assert [hit["config"] for hit in index.search("retries")] == ["batch"]
+
+def test_index_loaded_once(config_dir):
+    """Test que l'index est partagé dans le processus et relu s'il change sur disque"""
+    index = get_index(str(config_dir))
+    index.update()
+    assert get_index(str(config_dir)) is index
+
+    other = SearchIndex(str(config_dir))
+    (config_dir / "batch.yaml").write_text("worker:\n  retries: 2\n")
+    other.update()
+    reloaded = get_index(str(config_dir))
+    assert reloaded is not index
+    assert reloaded.search("retries")[0]["config"] == "batch"
@@ -0,0 +1,106 @@
+import os
+import threading
+import pytest
+from hydra.core.global_hydra import GlobalHydra
+from hydra_buddies import TheReader
+from hydra_buddies.session import ComposeSession, get_session
+
+def make_root(base, name):
+    """Crée une racine de configuration indépendante"""
+    root = base / name / ".hydra-conf"
+    (root / "database").mkdir(parents=True)
+    (root / "config.yaml").write_text(
+        f"defaults:\n  - _self_\n  - database: default\n\nproject:\n  name: {name}\n"
+    )
+    (root / "database" / "default.yaml").write_text(f"host: {name}.local\n")
+    (root / "database" / "prod.yaml").write_text(f"host: {name}.prod\n")
+    return root
+
+def test_session_compose(tmp_path):
+    """Test la composition sans état global ni changement de répertoire"""
+    root = make_root(tmp_path, "alpha")
+    cwd = os.getcwd()
+    session = ComposeSession(str(root))
+
+    cfg = session.compose("config", ["database=prod"])
+    assert cfg.database.host == "alpha.prod"
+    assert "hydra" not in cfg
+    assert session.group_options("database") == ["default", "prod"]
+    assert os.getcwd() == cwd
+    assert not GlobalHydra().is_initialized()
+
+def test_readers_for_different_roots_coexist(tmp_path):
+    """Test deux lecteurs sur des racines différentes"""
+    alpha = TheReader("config", path=str(make_root(tmp_path, "alpha")))
+    beta = TheReader("config", path=str(make_root(tmp_path, "beta")))
+    assert alpha.project.name == "alpha"
+    assert beta.database.host == "beta.local"
+    assert alpha.with_overrides(["database=prod"]).database.host == "alpha.prod"
+    assert os.path.isabs(alpha.get_config_dir())
+
+def test_shared_session_per_root(tmp_path):
+    """Test que la session (et son scan du dépôt) est réutilisée par racine"""
+    root = str(make_root(tmp_path, "alpha"))
+    assert get_session(root) is get_session(root)
+    assert get_session(root) is not get_session(str(make_root(tmp_path, "beta")))
+
+def test_concurrent_compose(tmp_path):
+    """Test la composition concurrente depuis plusieurs threads"""
+    roots = {name: str(make_root(tmp_path, name)) for name in ("alpha", "beta", "gamma")}
+    results, errors = {}, []
+
+    def worker(name, root):
+        try:
+            for _ in range(5):
+                cfg = get_session(root).compose("config", ["database=prod"])
+                assert cfg.database.host == f"{name}.prod"
+            results[name] = cfg.project.name
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=item) for item in roots.items()]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert results == {name: name for name in roots}
+
+def test_caller_version_base_preserved(tmp_path):
+    """Test que la composition ne modifie pas le version_base de l'appelant"""
+    from hydra import version
+    from packaging.version import Version
+
+    instance = version.VersionBase.instance()
+    previous = instance.getbase()
+    try:
+        version.setbase("1.2")
+        session = ComposeSession(str(make_root(tmp_path, "alpha")))
+        assert session.compose("config").database.host == "alpha.local"
+        assert session.provenance("config")["database.host"] == "database/default"
+        assert instance.getbase() == Version("1.2")
+    finally:
+        instance.version_base = previous
+
+def test_public_api_fallback(tmp_path, monkeypatch):
+    """Test le repli sur hydra.compose quand les API privées ne sont pas vérifiées"""
+    import hydra
+    from hydra_buddies import session as session_module
+
+    session_module._private_loader.cache_clear()
+    monkeypatch.setattr(hydra, "__version__", "9.0.0")
+    try:
+        assert session_module._private_loader() is None
+        extra = tmp_path / "extra"
+        (extra / "database").mkdir(parents=True)
+        (extra / "database" / "remote.yaml").write_text("host: remote\n")
+        session = ComposeSession(str(make_root(tmp_path, "alpha")), [str(extra)])
+        assert session.loader is None
+        assert session.compose("config", ["database=remote"]).database.host == "remote"
+        assert session.group_options("database") == ["default", "prod", "remote"]
+        assert not GlobalHydra().is_initialized()
+
+        reader = TheReader.from_cfg(session.compose("config"), "config", session.root)
+        assert reader.with_overrides(["database.host=other"]).database.host == "other"
+    finally:
+        session_module._private_loader.cache_clear()
@@ -0,0 +1,80 @@
+import multiprocessing
+import pytest
+from hydra_buddies import SharedReader
+
+CONFIG = {
+    "project": {"name": "test-project", "version": "0.1.0"},
+    "api": {
+        "key": "${api.public_key}",
+        "public_key": "pub",
+        "timeout": 30,
+        "ratio": 0.5,
+        "enabled": True,
+        "proxy": None,
+        "retry": {"max_attempts": 3, "delay": 1},
+    },
+    "handlers": ["console", {"name": "file", "level": "INFO"}],
+}
+
+@pytest.fixture
+def snapshot(make_reader):
+    snapshot = make_reader(CONFIG).publish()
+    yield snapshot
+    snapshot.unlink()
+
+def read_in_worker(name, queue):
+    reader = SharedReader.attach(name=name)
+    queue.put(reader.api.retry.max_attempts)
+    reader.close()
+
+def test_navigation(snapshot):
+    """Test la navigation dans l'instantané partagé"""
+    reader = snapshot.attach()
+    assert reader.project.name == "test-project"
+    assert reader["api"]["key"] == "pub"
+    assert reader.api.ratio == 0.5
+    assert reader.api.enabled is True
+    assert reader.api.proxy is None
+    assert reader.handlers[1].level == "INFO"
+    assert list(reader.api.keys())[:2] == ["key", "public_key"]
+    with reader.walk("api", "retry") as r:
+        assert r.max_attempts == 3
+    assert reader.project.version == "0.1.0"
+    reader.close()
+
+def test_read_only(snapshot):
+    """Test que l'instantané est en lecture seule"""
+    reader = snapshot.attach()
+    with pytest.raises(TypeError):
+        reader.api["timeout"] = 10
+    with pytest.raises(AttributeError):
+        reader.api.missing
+    reader.close()
+
+def test_materialize(snapshot):
+    """Test la matérialisation complète de l'instantané"""
+    reader = snapshot.attach()
+    resolved = reader.get_resolved_config()
+    assert resolved["handlers"] == ["console", {"name": "file", "level": "INFO"}]
+    assert resolved["api"]["retry"] == {"max_attempts": 3, "delay": 1}
+    reader.close()
+
+def test_mmap_file(make_reader, tmp_path):
+    """Test la publication dans un fichier mmap"""
+    path = str(tmp_path / "config.buddy")
+    snapshot = make_reader(CONFIG).publish(path=path)
+    reader = SharedReader.attach(path=path)
+    assert reader.api.retry.delay == 1
+    reader.close()
+    snapshot.unlink()
+    assert not (tmp_path / "config.buddy").exists()
+
+def test_worker_process(snapshot):
+    """Test l'accès depuis un autre processus"""
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=read_in_worker, args=(snapshot.name, queue))
+    process.start()
+    assert queue.get(timeout=30) == 3
+    process.join(timeout=30)
+    assert process.exitcode == 0
@@ -0,0 +1,84 @@
+import json
+import os
+import pytest
+from click.testing import CliRunner
+from hydra_buddies.cli import cli
+from hydra_buddies.validate import Validator
+
+@pytest.fixture
+def config_dir(tmp_path):
+    """Crée un répertoire avec une option invalide et une configuration cassée"""
+    config_dir = tmp_path / ".hydra-conf"
+    (config_dir / "database").mkdir(parents=True)
+    (config_dir / "secrets").mkdir()
+    (config_dir / "config.yaml").write_text(
+        "defaults:\n  - secrets/login\n  - _self_\n  - database: default\n\n"
+        "project:\n  name: test-project\n"
+    )
+    (config_dir / "broken.yaml").write_text("defaults:\n  - database: missing\n")
+    (config_dir / "secrets" / "login.yaml").write_text("db:\n  user: admin\n")
+    (config_dir / "database" / "default.yaml").write_text("host: localhost\nuser: ${db.user}\n")
+    (config_dir / "database" / "prod.yaml").write_text("host: ${project.host}\n")
+    return config_dir
+
+def touch(path, content):
+    path.write_text(content)
+    os.utime(path, ns=(1, 1))
+
+def test_diagnostics(config_dir):
+    """Test les diagnostics: default manquant et interpolation orpheline"""
+    diagnostics = Validator(str(config_dir)).run(processes=1)
+    found = {(d["unit"], d["code"], d["path"], d["file"]) for d in diagnostics}
+    assert found == {
+        ("broken", "missing-default", None, None),
+        ("database/prod", "dangling-interpolation", "database.host", "database/prod.yaml"),
+    }
+    prod = next(d for d in diagnostics if d["unit"] == "database/prod")
+    assert prod["overrides"] == ["database=prod"]
+    assert prod["message"] == "Interpolation key 'project.host' not found"
+
+def test_incremental_revalidation(config_dir):
+    """Test que seules les unités touchées par un fichier modifié sont revalidées"""
+    validator = Validator(str(config_dir))
+    validator.run(processes=1)
+    assert sorted(validator.revalidated) == ["broken", "config", "database/prod"]
+
+    validator = Validator(str(config_dir))
+    assert len(validator.run(processes=1)) == 2
+    assert validator.revalidated == []
+
+    touch(config_dir / "database" / "prod.yaml", "host: ${project.name}\n")
+    validator = Validator(str(config_dir))
+    diagnostics = validator.run(processes=1)
+    # broken dépend de tout le répertoire tant qu'elle ne compose pas
+    assert sorted(validator.revalidated) == ["broken", "database/prod"]
+    assert [d["unit"] for d in diagnostics] == ["broken"]
+
+def test_parallel_matches_serial(config_dir):
+    """Test que le pool de processus produit les mêmes diagnostics"""
+    serial = Validator(str(config_dir), use_cache=False).run(processes=1)
+    parallel = Validator(str(config_dir), use_cache=False).run(processes=2)
+    assert parallel == serial
+
+def test_validate_command(config_dir):
+    """Test la commande validate: JSON et code de sortie"""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["validate", "-p", str(config_dir), "-j", "1", "--json"])
+    assert result.exit_code == 1
+    units = [json.loads(line)["unit"] for line in result.stdout.splitlines()]
+    assert units == ["broken", "database/prod"]
+
+    (config_dir / "broken.yaml").unlink()
+    touch(config_dir / "database" / "prod.yaml", "host: prod\n")
+    result = runner.invoke(cli, ["validate", "-p", str(config_dir), "-j", "1"])
+    assert result.exit_code == 0
+
+def test_interpolation_cycle(config_dir):
+    """Test qu'un cycle est signalé une seule fois, sans erreurs en cascade"""
+    touch(config_dir / "database" / "default.yaml",
+          "host: ${database.alias}\nalias: ${database.host}\nurl: db://${database.host}\n")
+    diagnostics = Validator(str(config_dir), use_cache=False).run(processes=1)
+    config = [d for d in diagnostics if d["unit"] == "config"]
+    assert [(d["code"], d["message"], d["file"]) for d in config] == [
+        ("interpolation-cycle", "database.alias -> database.host -> database.alias", "database/default.yaml"),
+    ]